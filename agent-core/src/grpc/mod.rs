@@ -1,16 +1,21 @@
 //! gRPC server implementing the AgentService from agent.proto.
 //!
 //! Wraps the DecisionCascade behind a tokio Mutex for safe
-//! concurrent access from tonic's async handlers.
+//! concurrent access from tonic's async handlers. StreamTick runs one
+//! task per stream and answers each GameState with exactly the Action
+//! the unary Tick would have returned.
 
 use std::sync::Arc;
-use tokio::sync::Mutex;
+use tokio::sync::{mpsc, Mutex};
 
 use tonic::{Request, Response, Status};
 
 use crate::cascade::{CascadeConfig, DecisionCascade};
 use crate::game;
 
+mod stream;
+use stream::{answer_in_order, ReceiverStream};
+
 pub mod proto {
     tonic::include_proto!("clau_doom.agent");
 }
@@ -55,16 +60,26 @@ fn parse_cascade_mode(mode: &str) -> Option<CascadeConfig> {
     }
 }
 
-/// gRPC server wrapping the DecisionCascade engine.
-pub struct AgentServer {
+/// Max in-flight actions per StreamTick stream before the task waits
+/// for the client to read.
+const STREAM_BUFFER: usize = 16;
+
+/// Decision state shared by Tick and every StreamTick task.
+#[derive(Clone)]
+struct Decider {
     cascade: Arc<Mutex<DecisionCascade>>,
-    /// Default config used when per-request override is not provided.
-    default_config: CascadeConfig,
     health_threshold: f32,
     opensearch_url: String,
     seed: u64,
 }
 
+/// gRPC server wrapping the DecisionCascade engine.
+pub struct AgentServer {
+    decider: Decider,
+    /// Default config used when per-request override is not provided.
+    default_config: CascadeConfig,
+}
+
 impl AgentServer {
     pub fn new(
         cascade: DecisionCascade,
@@ -74,23 +89,21 @@ impl AgentServer {
         seed: u64,
     ) -> Self {
         Self {
-            cascade: Arc::new(Mutex::new(cascade)),
+            decider: Decider {
+                cascade: Arc::new(Mutex::new(cascade)),
+                health_threshold,
+                opensearch_url,
+                seed,
+            },
             default_config,
-            health_threshold,
-            opensearch_url,
-            seed,
         }
     }
 }
 
-#[tonic::async_trait]
-impl AgentService for AgentServer {
-    async fn tick(
-        &self,
-        request: Request<ProtoGameState>,
-    ) -> Result<Response<ProtoAction>, Status> {
-        let proto_state = request.into_inner();
-        let game_state = proto_to_game_state(&proto_state);
+impl Decider {
+    /// Decide one frame (shared by Tick and StreamTick).
+    async fn decide(&self, proto_state: &ProtoGameState) -> Result<ProtoAction, Status> {
+        let game_state = proto_to_game_state(proto_state);
 
         // Per-request cascade_mode override for DOE flexibility.
         let decision = if !proto_state.cascade_mode.is_empty() {
@@ -114,15 +127,24 @@ impl AgentService for AgentServer {
             cascade.decide(&game_state).await
         };
 
-        let action = ProtoAction {
+        Ok(ProtoAction {
             action_type: action_to_proto(decision.action),
             decision_level: decision.decision_level as i32,
             latency_ms: decision.latency_ns as f32 / 1_000_000.0,
             confidence: decision.confidence,
             rule_matched: decision.rule_matched.unwrap_or_default(),
-        };
+        })
+    }
+}
 
-        Ok(Response::new(action))
+#[tonic::async_trait]
+impl AgentService for AgentServer {
+    async fn tick(
+        &self,
+        request: Request<ProtoGameState>,
+    ) -> Result<Response<ProtoAction>, Status> {
+        let proto_state = request.into_inner();
+        self.decider.decide(&proto_state).await.map(Response::new)
     }
 
     type StreamTickStream = futures_core::stream::BoxStream<
@@ -130,13 +152,33 @@ impl AgentService for AgentServer {
         Result<ProtoAction, Status>,
     >;
 
+    /// One long-lived stream per episode: answers frames in order until the
+    /// client half-closes. The first error is sent and ends the stream.
     async fn stream_tick(
         &self,
-        _request: Request<tonic::Streaming<ProtoGameState>>,
+        request: Request<tonic::Streaming<ProtoGameState>>,
     ) -> Result<Response<Self::StreamTickStream>, Status> {
-        Err(Status::unimplemented(
-            "StreamTick not yet implemented; use unary Tick RPC",
-        ))
+        let inbound = Arc::new(Mutex::new(request.into_inner()));
+        let decider = self.decider.clone();
+        let (tx, rx) = mpsc::channel(STREAM_BUFFER);
+
+        tokio::spawn(answer_in_order(
+            move || {
+                let inbound = inbound.clone();
+                async move {
+                    let mut inbound = inbound.lock().await;
+                    let message = inbound.message().await;
+                    message
+                }
+            },
+            move |proto_state: ProtoGameState| {
+                let decider = decider.clone();
+                async move { decider.decide(&proto_state).await }
+            },
+            tx,
+        ));
+
+        Ok(Response::new(Box::pin(ReceiverStream::new(rx))))
     }
 }
 
@@ -187,6 +229,97 @@ mod tests {
         assert_eq!(gs.tick, 100);
     }
 
+    fn test_server() -> AgentServer {
+        let cascade = DecisionCascade::new(
+            CascadeConfig::rule_only(),
+            0.3,
+            "http://localhost:9200".into(),
+            42,
+            ":memory:",
+        );
+        AgentServer::new(
+            cascade,
+            CascadeConfig::rule_only(),
+            0.3,
+            "http://localhost:9200".into(),
+            42,
+        )
+    }
+
+    fn frame(tick: u32, cascade_mode: &str) -> ProtoGameState {
+        ProtoGameState {
+            health: 100 - tick as i32,
+            ammo: 50,
+            enemies_visible: (tick % 3) as i32,
+            tick,
+            cascade_mode: cascade_mode.into(),
+            ..Default::default()
+        }
+    }
+
+    /// Drive the StreamTick decision path over a frame sequence, as
+    /// stream_tick does for a tonic::Streaming inbound.
+    async fn stream_actions(
+        server: &AgentServer,
+        frames: Vec<ProtoGameState>,
+    ) -> Vec<Result<ProtoAction, Status>> {
+        use futures_core::Stream;
+        use std::pin::Pin;
+
+        let inbound = Arc::new(Mutex::new(frames.into_iter()));
+        let decider = server.decider.clone();
+        let (tx, rx) = mpsc::channel(STREAM_BUFFER);
+        tokio::spawn(answer_in_order(
+            move || {
+                let inbound = inbound.clone();
+                async move {
+                    let next = inbound.lock().await.next();
+                    Ok::<_, Status>(next)
+                }
+            },
+            move |state: ProtoGameState| {
+                let decider = decider.clone();
+                async move { decider.decide(&state).await }
+            },
+            tx,
+        ));
+        let mut stream = ReceiverStream::new(rx);
+        let mut out = Vec::new();
+        while let Some(item) = std::future::poll_fn(|cx| Pin::new(&mut stream).poll_next(cx)).await
+        {
+            out.push(item);
+        }
+        out
+    }
+
+    #[tokio::test]
+    async fn test_stream_tick_matches_unary_tick() {
+        let frames: Vec<_> = (0..30).map(|t| frame(t, "")).collect();
+        let streamed = stream_actions(&test_server(), frames.clone()).await;
+
+        let unary = test_server();
+        assert_eq!(streamed.len(), frames.len());
+        for (state, action) in frames.into_iter().zip(streamed) {
+            let expected = unary.tick(Request::new(state)).await.unwrap().into_inner();
+            let action = action.unwrap();
+            assert_eq!(action.action_type, expected.action_type);
+            assert_eq!(action.decision_level, expected.decision_level);
+            assert_eq!(action.rule_matched, expected.rule_matched);
+        }
+    }
+
+    #[tokio::test]
+    async fn test_stream_tick_ends_on_invalid_mode() {
+        let frames = vec![frame(0, ""), frame(1, "bogus"), frame(2, "")];
+        let streamed = stream_actions(&test_server(), frames).await;
+        assert_eq!(streamed.len(), 2);
+        assert!(streamed[0].is_ok());
+        assert_eq!(
+            streamed[1].as_ref().unwrap_err().code(),
+            tonic::Code::InvalidArgument
+        );
+    }
+
     #[test]
     fn test_parse_cascade_mode() {
         let random = parse_cascade_mode("random").unwrap();
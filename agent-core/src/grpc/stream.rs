@@ -0,0 +1,151 @@
+//! Transport-independent core of the StreamTick RPC.
+//!
+//! `answer_in_order` reads requests one at a time, answers each before
+//! reading the next (every action feeds the client's next state) and
+//! forwards the answers into an mpsc channel that `ReceiverStream` exposes
+//! as the response stream. Kept free of tonic types so the stream
+//! semantics can be tested on their own.
+
+use std::future::Future;
+use std::pin::Pin;
+use std::task::{Context, Poll};
+
+use tokio::sync::mpsc;
+
+/// Response stream fed by a per-stream task (avoids a tokio-stream dependency).
+pub struct ReceiverStream<T> {
+    rx: mpsc::Receiver<T>,
+}
+
+impl<T> ReceiverStream<T> {
+    pub fn new(rx: mpsc::Receiver<T>) -> Self {
+        Self { rx }
+    }
+}
+
+impl<T> futures_core::Stream for ReceiverStream<T> {
+    type Item = T;
+
+    fn poll_next(mut self: Pin<&mut Self>, cx: &mut Context<'_>) -> Poll<Option<T>> {
+        self.rx.poll_recv(cx)
+    }
+}
+
+/// Answer every inbound request in order until the client half-closes.
+///
+/// `next` yields `Ok(Some(request))`, `Ok(None)` at half-close, or an
+/// error. The first error (from `next` or `answer`) is forwarded and ends
+/// the stream; a dropped receiver (client gone) ends it silently.
+pub async fn answer_in_order<Req, Resp, E, Next, NextFut, Answer, AnswerFut>(
+    mut next: Next,
+    answer: Answer,
+    tx: mpsc::Sender<Result<Resp, E>>,
+) where
+    Next: FnMut() -> NextFut,
+    NextFut: Future<Output = Result<Option<Req>, E>>,
+    Answer: Fn(Req) -> AnswerFut,
+    AnswerFut: Future<Output = Result<Resp, E>>,
+{
+    loop {
+        let result = match next().await {
+            Ok(Some(request)) => answer(request).await,
+            Ok(None) => break,
+            Err(error) => Err(error),
+        };
+        let failed = result.is_err();
+        if tx.send(result).await.is_err() || failed {
+            break;
+        }
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use futures_core::Stream;
+    use std::collections::VecDeque;
+    use std::sync::{Arc, Mutex};
+
+    async fn next_item<S: Stream + Unpin>(stream: &mut S) -> Option<S::Item> {
+        std::future::poll_fn(|cx| Pin::new(&mut *stream).poll_next(cx)).await
+    }
+
+    type Answers = ReceiverStream<Result<u32, String>>;
+
+    /// Spawn the per-stream task over a scripted inbound sequence.
+    fn spawn_stream(
+        inbound: Vec<Result<Option<u32>, String>>,
+        buffer: usize,
+    ) -> (Answers, Arc<Mutex<Vec<u32>>>) {
+        let inbound = Arc::new(Mutex::new(VecDeque::from(inbound)));
+        let answered = Arc::new(Mutex::new(Vec::new()));
+        let seen = answered.clone();
+        let (tx, rx) = mpsc::channel(buffer);
+        tokio::spawn(answer_in_order(
+            move || {
+                let item = inbound.lock().unwrap().pop_front().unwrap_or(Ok(None));
+                async move { item }
+            },
+            move |request: u32| {
+                seen.lock().unwrap().push(request);
+                async move {
+                    if request == 0 {
+                        Err(format!("bad frame {request}"))
+                    } else {
+                        Ok(request * 10)
+                    }
+                }
+            },
+            tx,
+        ));
+        (ReceiverStream::new(rx), answered)
+    }
+
+    #[tokio::test(flavor = "multi_thread", worker_threads = 2)]
+    async fn test_answers_in_order_until_half_close() {
+        let inbound = (1..=40).map(|i| Ok(Some(i))).collect();
+        let (mut stream, answered) = spawn_stream(inbound, 4);
+        let mut out = Vec::new();
+        while let Some(item) = next_item(&mut stream).await {
+            out.push(item.unwrap());
+        }
+        assert_eq!(out, (1..=40).map(|i| i * 10).collect::<Vec<_>>());
+        assert_eq!(answered.lock().unwrap().len(), 40);
+    }
+
+    #[tokio::test]
+    async fn test_first_error_is_sent_and_ends_stream() {
+        let inbound = vec![Ok(Some(1)), Ok(Some(0)), Ok(Some(2))];
+        let (mut stream, answered) = spawn_stream(inbound, 4);
+        assert_eq!(next_item(&mut stream).await, Some(Ok(10)));
+        assert_eq!(
+            next_item(&mut stream).await,
+            Some(Err("bad frame 0".into()))
+        );
+        assert_eq!(next_item(&mut stream).await, None);
+        assert_eq!(*answered.lock().unwrap(), vec![1, 0]);
+    }
+
+    #[tokio::test]
+    async fn test_inbound_error_is_forwarded() {
+        let inbound = vec![Ok(Some(1)), Err("reset by peer".into())];
+        let (mut stream, _) = spawn_stream(inbound, 4);
+        assert_eq!(next_item(&mut stream).await, Some(Ok(10)));
+        assert_eq!(
+            next_item(&mut stream).await,
+            Some(Err("reset by peer".into()))
+        );
+        assert_eq!(next_item(&mut stream).await, None);
+    }
+
+    #[tokio::test]
+    async fn test_dropped_receiver_stops_task() {
+        let inbound = (1..=1000).map(|i| Ok(Some(i))).collect();
+        let (mut stream, answered) = spawn_stream(inbound, 1);
+        assert_eq!(next_item(&mut stream).await, Some(Ok(10)));
+        drop(stream);
+        tokio::time::sleep(std::time::Duration::from_millis(20)).await;
+        // At most the buffered answer and the one blocked on send
+        assert!(answered.lock().unwrap().len() <= 3);
+    }
+}
@@ -47,6 +47,12 @@ from __future__ import annotations
 import random
 from collections import deque
 
+from glue.strategy_index import (
+    OpenSearchRetriever,
+    QueryCache,
+    StrategyRetriever,
+    query_key,
+)
 from glue.vizdoom_bridge import (
     ACTION_ATTACK,
     ACTION_MOVE_LEFT,
@@ -311,9 +317,14 @@ class Burst3Action:
     Groups attacks into short bursts followed by lateral repositioning.
     Tests whether concentrated fire windows improve kill efficiency
     compared to random movement mixing.
+
+    With plan=True the remaining attack ticks of a burst are returned as one
+    (ACTION_ATTACK, repeat_count) plan for EpisodeRunner frame skipping
+    (L0 rules are then only checked at burst boundaries).
     """
 
-    def __init__(self) -> None:
+    def __init__(self, plan: bool = False) -> None:
+        self.plan = plan
         self._rng: random.Random = random.Random(0)
         self._tick: int = 0
 
@@ -321,7 +332,7 @@ class Burst3Action:
         self._rng = random.Random(hash(seed))
         self._tick = 0
 
-    def __call__(self, state: GameState) -> int:
+    def __call__(self, state: GameState) -> int | tuple[int, int]:
         # L0 emergency rules
         if state.health < 20:
             return ACTION_MOVE_LEFT
@@ -329,6 +340,12 @@ class Burst3Action:
             return ACTION_MOVE_LEFT
 
         cycle_pos = self._tick % 4  # 0,1,2 = attack; 3 = move
+
+        if cycle_pos < 3 and self.plan:
+            repeat = 3 - cycle_pos
+            self._tick += repeat
+            return ACTION_ATTACK, repeat
+
         self._tick += 1
 
         if cycle_pos < 3:
@@ -1012,6 +1029,10 @@ class GenomeAction:
 
         if stagnation_window > 0 and ticks_since_last_kill >= stagnation_window:
           action = TURN  # Force reorientation
+
+    With plan=True (non-adaptive genomes only) the attack phase is returned as
+    one (ATTACK, repeat_count) plan for EpisodeRunner frame skipping. plan is
+    an execution option, not a gene: it does not enter the RNG seed hash.
     """
 
     def __init__(
@@ -1024,7 +1045,10 @@ class GenomeAction:
         stagnation_window: int = 0,
         attack_probability: float = 0.75,
         adaptive_enabled: bool = False,
+        plan: bool = False,
     ) -> None:
+        self.plan = plan
+
         # Genome parameters
         self.burst_length = burst_length
         self.turn_direction = turn_direction
@@ -1070,7 +1094,7 @@ class GenomeAction:
         self._stagnant_ticks = 0
         self._turn_alternator = 0
 
-    def __call__(self, state: GameState) -> int:
+    def __call__(self, state: GameState) -> int | tuple[int, int]:
         # Track ticks and kills for stagnation detection
         if self.adaptive_enabled and self.stagnation_window > 0:
             if state.kills > self._last_kills:
@@ -1109,6 +1133,11 @@ class GenomeAction:
         cycle_length = self.burst_length + self.turn_count
         cycle_pos = self._tick % cycle_length
 
+        if cycle_pos < self.burst_length and self.plan and not self.adaptive_enabled:
+            repeat = self.burst_length - cycle_pos
+            self._tick += repeat
+            return ACTION_ATTACK, repeat
+
         self._tick += 1
 
         if cycle_pos < self.burst_length:
@@ -1133,96 +1162,50 @@ class GenomeAction:
             return self._rng.choice([ACTION_MOVE_LEFT, ACTION_MOVE_RIGHT])
 
 
-class L2RagAction:
-    """L2 strategy document retrieval action function for DOE-022.
-
-    Mirrors agent-core/src/rag/mod.rs logic in Python.
-    Queries OpenSearch for matching strategy documents via term matching
-    on situation_tags, scores them, and selects the best action.
+class _L2RetrievalMixin:
+    """Cached strategy-document retrieval shared by the L2 action functions.
 
-    Fallback: burst_3 pattern (best known L0+L1 strategy from DOE-020).
+    Queries go through ``retriever`` (OpenSearch by default, or an
+    in-process LocalStrategyIndex) and are memoized in ``query_cache``
+    across episodes; invalidate_query_caches() drops them on re-seed.
     """
 
-    def __init__(self, opensearch_url="http://opensearch:9200", index_name="strategies_high", k=5):
+    def _init_retrieval(self, opensearch_url, index_name, k, retriever, query_cache):
         self.opensearch_url = opensearch_url
         self.index_name = index_name
         self.k = k
+        if retriever is None:
+            retriever = OpenSearchRetriever(opensearch_url, index_name)
+        self.retriever = retriever
+        self.query_cache = query_cache if query_cache is not None else QueryCache()
         self.weights = {"similarity": 0.4, "confidence": 0.4, "recency": 0.2}
+        self._reset_retrieval_metrics()
 
-        # Burst3 fallback state
-        self._rng = random.Random(0)
-        self._tick = 0
-
-        # L2 metrics tracking
-        self.l2_decisions = 0
-        self.l2_total_decisions = 0
-        self.l2_latencies = []
-
-        # HTTP session for connection pooling
-        import urllib.request
-        self._session = None
-
-    def reset(self, seed=0):
-        """Reset state between episodes."""
-        self._rng = random.Random(hash(seed))
-        self._tick = 0
-        self.l2_decisions = 0
-        self.l2_total_decisions = 0
+    def _reset_retrieval_metrics(self):
         self.l2_latencies = []
-
-    def derive_situation_tags(self, state):
-        """Mirror derive_situation_tags() from rag/mod.rs lines 54-79."""
-        tags = []
-        if state.health < 30:
-            tags.append("low_health")
-        elif state.health >= 80:
-            tags.append("full_health")
-        if state.ammo < 10:
-            tags.append("low_ammo")
-        elif state.ammo >= 50:
-            tags.append("ammo_abundant")
-        if state.enemies_visible >= 3:
-            tags.append("multi_enemy")
-        elif state.enemies_visible == 1:
-            tags.append("single_enemy")
-        return tags
+        self.l2_cache_hits = 0
+        self.l2_cache_misses = 0
 
     def query_opensearch(self, tags):
-        """Execute OpenSearch term-match query. Returns list of docs or empty list."""
-        import json
+        """Retrieve matching strategy documents. Returns list of docs or empty list."""
         import time
-        import urllib.request
-        import urllib.error
-
-        query_body = {
-            "size": self.k,
-            "query": {
-                "bool": {
-                    "should": [{"term": {"situation_tags": tag}} for tag in tags],
-                    "minimum_should_match": 1,
-                    "filter": [
-                        {"term": {"metadata.retired": False}},
-                        {"range": {"quality.trust_score": {"gte": 0.3}}}
-                    ]
-                }
-            }
-        }
-
-        url = f"{self.opensearch_url}/{self.index_name}/_search"
-        data = json.dumps(query_body).encode("utf-8")
 
         start = time.monotonic()
+        key = query_key(self.index_name, tags, self.k)
         try:
-            req = urllib.request.Request(url, data=data, headers={"Content-Type": "application/json"}, method="POST")
-            with urllib.request.urlopen(req, timeout=0.08) as resp:
-                result = json.loads(resp.read())
+            hits = self.query_cache.get(key)
+            if hits is not None:
+                self.l2_cache_hits += 1
+            else:
+                self.l2_cache_misses += 1
+                hits = self.retriever.search(tags, self.k)
+                self.query_cache.put(key, hits)
         except Exception:
             return []
         finally:
             elapsed_ms = (time.monotonic() - start) * 1000
             self.l2_latencies.append(elapsed_ms)
 
-        hits = result.get("hits", {}).get("hits", [])
         docs = []
         for hit in hits:
             source = hit.get("_source", {})
@@ -1246,6 +1229,60 @@ class L2RagAction:
             + self.weights["recency"] * doc.get("recency", 0)
         )
 
+
+class L2RagAction(_L2RetrievalMixin):
+    """L2 strategy document retrieval action function for DOE-022.
+
+    Mirrors agent-core/src/rag/mod.rs logic in Python.
+    Queries OpenSearch for matching strategy documents via term matching
+    on situation_tags, scores them, and selects the best action.
+
+    Fallback: burst_3 pattern (best known L0+L1 strategy from DOE-020).
+    """
+
+    def __init__(
+        self,
+        opensearch_url="http://opensearch:9200",
+        index_name="strategies_high",
+        k=5,
+        retriever: StrategyRetriever | None = None,
+        query_cache: QueryCache | None = None,
+    ):
+        self._init_retrieval(opensearch_url, index_name, k, retriever, query_cache)
+
+        # Burst3 fallback state
+        self._rng = random.Random(0)
+        self._tick = 0
+
+        # L2 metrics tracking
+        self.l2_decisions = 0
+        self.l2_total_decisions = 0
+
+    def reset(self, seed=0):
+        """Reset state between episodes."""
+        self._rng = random.Random(hash(seed))
+        self._tick = 0
+        self.l2_decisions = 0
+        self.l2_total_decisions = 0
+        self._reset_retrieval_metrics()
+
+    def derive_situation_tags(self, state):
+        """Mirror derive_situation_tags() from rag/mod.rs lines 54-79."""
+        tags = []
+        if state.health < 30:
+            tags.append("low_health")
+        elif state.health >= 80:
+            tags.append("full_health")
+        if state.ammo < 10:
+            tags.append("low_ammo")
+        elif state.ammo >= 50:
+            tags.append("ammo_abundant")
+        if state.enemies_visible >= 3:
+            tags.append("multi_enemy")
+        elif state.enemies_visible == 1:
+            tags.append("single_enemy")
+        return tags
+
     def tactic_to_action(self, tactic):
         """Map tactic string to action index (mirrors rag/mod.rs lines 82-91)."""
         if tactic.startswith("retreat") or tactic.startswith("kite"):
@@ -1292,7 +1329,79 @@ class L2RagAction:
         return self._burst3_fallback(state)
 
 
-class L2MetaStrategyAction:
+class _L2PrefetchMixin:
+    """Background L2 retrieval for the meta-strategy selectors.
+
+    With ``prefetch=True`` the selector no longer queries on the tick
+    (every QUERY_INTERVAL ticks). Instead, whenever the situation tags
+    change, query_opensearch() for the new tags runs on a single background
+    thread while the policy keeps delegating to its current strategy; the
+    result is applied on the first tick after it arrives. At most one query
+    is in flight; tags that change meanwhile are queried next.
+
+    Staleness metrics:
+        l2_decision_staleness: per decision, ticks since the situation the
+            current strategy was selected for was observed.
+        l2_result_delays: per applied result, ticks from issue to apply.
+
+    Results arrive asynchronously, so switch ticks depend on retrieval
+    latency; episodes are not bit-reproducible in this mode.
+    """
+
+    def _init_prefetch(self, prefetch):
+        self.prefetch = prefetch
+        self._executor = None
+        self._pending = None
+        self._pending_tick = 0
+        self._requested_tags = None
+        self._strategy_tick = 0
+        self.l2_decision_staleness = []
+        self.l2_result_delays = []
+
+    def _reset_prefetch(self):
+        if self._pending is not None:
+            # Let the in-flight query finish so it cannot touch the new episode's metrics
+            self._pending.result()
+            self._pending = None
+        self._requested_tags = None
+        self._strategy_tick = 0
+        self.l2_decision_staleness = []
+        self.l2_result_delays = []
+
+    def _poll_prefetch(self, state):
+        """Apply an arrived result, then issue a query if the tags changed."""
+        if self._pending is not None and self._pending.done():
+            docs = self._pending.result()
+            self._pending = None
+            self.l2_query_count += 1
+            self.l2_result_delays.append(self._tick - self._pending_tick)
+            self._strategy_tick = self._pending_tick
+            self._apply_docs(docs)
+
+        if self._pending is None:
+            tags = self.derive_situation_tags(state)
+            if tags and tags != self._requested_tags:
+                if self._executor is None:
+                    from concurrent.futures import ThreadPoolExecutor
+
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=1, thread_name_prefix="l2-prefetch"
+                    )
+                self._requested_tags = tags
+                self._pending_tick = self._tick
+                self._pending = self._executor.submit(self.query_opensearch, tags)
+
+        self.l2_decision_staleness.append(self._tick - self._strategy_tick)
+
+    def close(self):
+        """Stop the prefetch thread (if any)."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+            self._pending = None
+
+
+class L2MetaStrategyAction(_L2RetrievalMixin, _L2PrefetchMixin):
     """L2 meta-strategy selector for DOE-024.
 
     Queries OpenSearch for meta-strategy documents.
@@ -1304,15 +1413,22 @@ class L2MetaStrategyAction:
     - L2MetaStrategyAction: query -> strategy name -> delegate to L1 function (PRESERVES L1)
 
     Query caching: re-evaluates strategy every QUERY_INTERVAL ticks (default 35 = 1/sec).
+    With prefetch=True, re-evaluates in the background whenever the situation
+    tags change instead (see _L2PrefetchMixin).
     Fallback: burst_3 when no documents match or OpenSearch unavailable.
     """
     QUERY_INTERVAL = 35  # Re-evaluate strategy once per second (35 fps)
 
-    def __init__(self, opensearch_url="http://opensearch:9200", index_name="strategies_meta", k=5):
-        self.opensearch_url = opensearch_url
-        self.index_name = index_name
-        self.k = k
-        self.weights = {"similarity": 0.4, "confidence": 0.4, "recency": 0.2}
+    def __init__(
+        self,
+        opensearch_url="http://opensearch:9200",
+        index_name="strategies_meta",
+        k=5,
+        retriever: StrategyRetriever | None = None,
+        query_cache: QueryCache | None = None,
+        prefetch: bool = False,
+    ):
+        self._init_retrieval(opensearch_url, index_name, k, retriever, query_cache)
 
         # L1 strategy delegates
         self.strategies = {
@@ -1326,16 +1442,17 @@ class L2MetaStrategyAction:
         self.l2_query_count = 0
         self.l2_strategy_switches = 0
         self.strategy_ticks = {"burst_3": 0, "adaptive_kill": 0}
-        self.l2_latencies = []
+        self._init_prefetch(prefetch)
 
     def reset(self, seed=0):
         """Reset state between episodes."""
+        self._reset_prefetch()
         self._tick = 0
         self.current_strategy = "burst_3"
         self.l2_query_count = 0
         self.l2_strategy_switches = 0
         self.strategy_ticks = {"burst_3": 0, "adaptive_kill": 0}
-        self.l2_latencies = []
+        self._reset_retrieval_metrics()
         # Reset L1 strategies
         for s in self.strategies.values():
             s.reset(seed)
@@ -1362,65 +1479,6 @@ class L2MetaStrategyAction:
             tags.append("low_kills")
         return tags
 
-    def query_opensearch(self, tags):
-        """Execute OpenSearch term-match query. Returns list of docs or empty list."""
-        import json
-        import time
-        import urllib.request
-        import urllib.error
-
-        query_body = {
-            "size": self.k,
-            "query": {
-                "bool": {
-                    "should": [{"term": {"situation_tags": tag}} for tag in tags],
-                    "minimum_should_match": 1,
-                    "filter": [
-                        {"term": {"metadata.retired": False}},
-                        {"range": {"quality.trust_score": {"gte": 0.3}}}
-                    ]
-                }
-            }
-        }
-
-        url = f"{self.opensearch_url}/{self.index_name}/_search"
-        data = json.dumps(query_body).encode("utf-8")
-
-        start = time.monotonic()
-        try:
-            req = urllib.request.Request(url, data=data, headers={"Content-Type": "application/json"}, method="POST")
-            with urllib.request.urlopen(req, timeout=0.08) as resp:
-                result = json.loads(resp.read())
-        except Exception:
-            return []
-        finally:
-            elapsed_ms = (time.monotonic() - start) * 1000
-            self.l2_latencies.append(elapsed_ms)
-
-        hits = result.get("hits", {}).get("hits", [])
-        docs = []
-        for hit in hits:
-            source = hit.get("_source", {})
-            score = hit.get("_score", 0.0)
-            docs.append({
-                "doc_id": source.get("doc_id", ""),
-                "situation_tags": source.get("situation_tags", []),
-                "decision": source.get("decision", {}),
-                "quality": source.get("quality", {}),
-                "similarity": min(score / self.k, 1.0),
-                "confidence": source.get("quality", {}).get("trust_score", 0.5),
-                "recency": 0.8,
-            })
-        return docs
-
-    def score_document(self, doc):
-        """Score document: similarity*0.4 + confidence*0.4 + recency*0.2"""
-        return (
-            self.weights["similarity"] * doc.get("similarity", 0)
-            + self.weights["confidence"] * doc.get("confidence", 0)
-            + self.weights["recency"] * doc.get("recency", 0)
-        )
-
     def _update_strategy(self, state):
         """Query OpenSearch and update current strategy selection."""
         tags = self.derive_situation_tags(state)
@@ -1429,7 +1487,10 @@ class L2MetaStrategyAction:
 
         docs = self.query_opensearch(tags)
         self.l2_query_count += 1
+        self._apply_docs(docs)
 
+    def _apply_docs(self, docs):
+        """Switch to the top document's strategy."""
         if docs:
             best = max(docs, key=self.score_document)
             strategy_name = best.get("decision", {}).get("strategy", "burst_3")
@@ -1444,8 +1505,10 @@ class L2MetaStrategyAction:
         # Track strategy distribution
         self.strategy_ticks[self.current_strategy] = self.strategy_ticks.get(self.current_strategy, 0) + 1
 
-        # L2: Re-evaluate strategy every QUERY_INTERVAL ticks
-        if self._tick % self.QUERY_INTERVAL == 0:
+        # L2: Re-evaluate strategy every QUERY_INTERVAL ticks (or in the background)
+        if self.prefetch:
+            self._poll_prefetch(state)
+        elif self._tick % self.QUERY_INTERVAL == 0:
             self._update_strategy(state)
 
         # Delegate to selected L1 strategy (preserves full L1 pattern)
@@ -1481,23 +1544,29 @@ class RandomSelectAction:
         return self.strategies[choice](state)
 
 
-class L2MetaStrategy5Action:
+class L2MetaStrategy5Action(_L2RetrievalMixin, _L2PrefetchMixin):
     """L2 meta-strategy selector for 5-action space (DOE-026).
 
     Queries OpenSearch strategies_meta_5action index for situation-aware
     strategy selection among top 5-action strategies from DOE-025.
 
     Delegates to: survival_burst, random_5, dodge_burst_3.
-    Query interval: 35 ticks (1 second) — re-evaluates periodically.
+    Query interval: 35 ticks (1 second) — re-evaluates periodically,
+    or in the background on tag changes with prefetch=True.
     Fallback: survival_burst (best from DOE-025).
     """
     QUERY_INTERVAL = 35
 
-    def __init__(self, opensearch_url="http://opensearch:9200", index_name="strategies_meta_5action", k=5):
-        self.opensearch_url = opensearch_url
-        self.index_name = index_name
-        self.k = k
-        self.weights = {"similarity": 0.4, "confidence": 0.4, "recency": 0.2}
+    def __init__(
+        self,
+        opensearch_url="http://opensearch:9200",
+        index_name="strategies_meta_5action",
+        k=5,
+        retriever: StrategyRetriever | None = None,
+        query_cache: QueryCache | None = None,
+        prefetch: bool = False,
+    ):
+        self._init_retrieval(opensearch_url, index_name, k, retriever, query_cache)
 
         self.strategies = {
             "survival_burst": SurvivalBurstAction(),
@@ -1510,16 +1579,17 @@ class L2MetaStrategy5Action:
         self.l2_query_count = 0
         self.l2_strategy_switches = 0
         self.strategy_ticks = {"survival_burst": 0, "random_5": 0, "dodge_burst_3": 0}
-        self.l2_latencies = []
+        self._init_prefetch(prefetch)
 
     def reset(self, seed=0):
         """Reset state between episodes."""
+        self._reset_prefetch()
         self._tick = 0
         self.current_strategy = "survival_burst"
         self.l2_query_count = 0
         self.l2_strategy_switches = 0
         self.strategy_ticks = {"survival_burst": 0, "random_5": 0, "dodge_burst_3": 0}
-        self.l2_latencies = []
+        self._reset_retrieval_metrics()
         for s in self.strategies.values():
             s.reset(seed)
 
@@ -1540,62 +1610,6 @@ class L2MetaStrategy5Action:
             tags.append("single_enemy")
         return tags
 
-    def query_opensearch(self, tags):
-        """Execute OpenSearch term-match query."""
-        import json
-        import time
-        import urllib.request
-
-        query_body = {
-            "size": self.k,
-            "query": {
-                "bool": {
-                    "should": [{"term": {"situation_tags": tag}} for tag in tags],
-                    "minimum_should_match": 1,
-                    "filter": [
-                        {"term": {"metadata.retired": False}},
-                        {"range": {"quality.trust_score": {"gte": 0.3}}}
-                    ]
-                }
-            }
-        }
-
-        url = f"{self.opensearch_url}/{self.index_name}/_search"
-        data = json.dumps(query_body).encode("utf-8")
-
-        start = time.monotonic()
-        try:
-            req = urllib.request.Request(url, data=data, headers={"Content-Type": "application/json"}, method="POST")
-            with urllib.request.urlopen(req, timeout=0.08) as resp:
-                result = json.loads(resp.read())
-        except Exception:
-            return []
-        finally:
-            elapsed_ms = (time.monotonic() - start) * 1000
-            self.l2_latencies.append(elapsed_ms)
-
-        hits = result.get("hits", {}).get("hits", [])
-        docs = []
-        for hit in hits:
-            source = hit.get("_source", {})
-            score = hit.get("_score", 0.0)
-            docs.append({
-                "doc_id": source.get("doc_id", ""),
-                "decision": source.get("decision", {}),
-                "similarity": min(score / self.k, 1.0),
-                "confidence": source.get("quality", {}).get("trust_score", 0.5),
-                "recency": 0.8,
-            })
-        return docs
-
-    def score_document(self, doc):
-        """Score document: similarity*0.4 + confidence*0.4 + recency*0.2"""
-        return (
-            self.weights["similarity"] * doc.get("similarity", 0)
-            + self.weights["confidence"] * doc.get("confidence", 0)
-            + self.weights["recency"] * doc.get("recency", 0)
-        )
-
     def _update_strategy(self, state):
         """Query OpenSearch and update current strategy selection."""
         tags = self.derive_situation_tags(state)
@@ -1604,7 +1618,10 @@ class L2MetaStrategy5Action:
 
         docs = self.query_opensearch(tags)
         self.l2_query_count += 1
+        self._apply_docs(docs)
 
+    def _apply_docs(self, docs):
+        """Switch to the top document's strategy."""
         if docs:
             best = max(docs, key=self.score_document)
             strategy_name = best.get("decision", {}).get("strategy", "survival_burst")
@@ -1617,7 +1634,9 @@ class L2MetaStrategy5Action:
         self._tick += 1
         self.strategy_ticks[self.current_strategy] = self.strategy_ticks.get(self.current_strategy, 0) + 1
 
-        if self._tick % self.QUERY_INTERVAL == 0:
+        if self.prefetch:
+            self._poll_prefetch(state)
+        elif self._tick % self.QUERY_INTERVAL == 0:
             self._update_strategy(state)
 
         return self.strategies[self.current_strategy](state)
@@ -1711,11 +1730,15 @@ class BurstCycleAction:
     Attack ratio is exactly 50% regardless of burst_length.
     Movement ticks use uniform random selection from TURN_LEFT(0), TURN_RIGHT(1),
     MOVE_LEFT(2), MOVE_RIGHT(3).
+
+    With plan=True the attack phase is returned as one (4, repeat_count) plan
+    for EpisodeRunner frame skipping.
     """
 
-    def __init__(self, burst_length: int = 3):
+    def __init__(self, burst_length: int = 3, plan: bool = False):
         self.burst_length = burst_length
         self.cycle_length = burst_length * 2  # attack phase + move phase
+        self.plan = plan
         self._tick = 0
         self._rng = None
 
@@ -1737,6 +1760,13 @@ class BurstCycleAction:
 
         # Determine phase within cycle
         phase_position = self._tick % self.cycle_length
+
+        if phase_position < self.burst_length and self.plan:
+            # Attack phase as a single plan
+            repeat = self.burst_length - phase_position
+            self._tick += repeat
+            return 4, repeat
+
         self._tick += 1
 
         if phase_position < self.burst_length:
@@ -0,0 +1,262 @@
+"""Declarative registry of DOE action functions.
+
+Each ``RunConfig.action_type`` resolves to an ActionSpec: a registry kind
+plus constructor parameters. Specs are small, hashable and picklable, and
+``encode()`` to a short JSON string (``["ar",{"attack_ratio":0.5}]``) that a
+worker process can turn back into the same policy with ``decode()``.
+
+Registry entries name their target as ``"module:attribute"`` and are only
+imported when first built, so resolving specs (e.g. for --help, dry runs or
+the parent of an EpisodePool) never imports the policy modules.
+
+get_policy() builds each distinct (spec, strategy_docs) once per process,
+compiled via glue.policy_compiler where supported, and returns the same
+instance for every run with identical parameters. Policies are reset with
+the episode seed before every episode, so sharing is safe.
+
+Action types:
+    - exact names, e.g. ``burst_3``, ``l2_meta_select``
+    - parametric names: ``ar_<pct>``, ``cycle_<len>``,
+      ``burst3_threshold_<hp>``
+    - ``genome`` / ``genome5`` take ``run.genome_params``
+    - anything else builds FullAgentAction from the run's
+      memory_weight / strength_weight
+"""
+
+from __future__ import annotations
+
+import importlib
+import json
+import logging
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+OPENSEARCH_URL = "http://opensearch:9200"
+DEFAULT_KIND = "full_agent"
+
+_ACTIONS = "glue.action_functions"
+
+
+@dataclass(frozen=True)
+class ActionEntry:
+    """How to build one kind of action function.
+
+    Attributes:
+        target: ``"module:attribute"`` of the class or plain function.
+        kwargs: Fixed constructor arguments.
+        instantiate: False for plain functions (used as-is).
+        l2_index: Strategy index an L2 policy retrieves from; the policy
+            gets an in-process retriever when strategy documents are given.
+    """
+
+    target: str
+    kwargs: tuple[tuple[str, Any], ...] = ()
+    instantiate: bool = True
+    l2_index: Optional[str] = None
+
+
+def _entry(attr: str, **kwargs: Any) -> ActionEntry:
+    return ActionEntry(f"{_ACTIONS}:{attr}", tuple(sorted(kwargs.items())))
+
+
+def _l2_entry(attr: str, index_name: str) -> ActionEntry:
+    return ActionEntry(
+        f"{_ACTIONS}:{attr}",
+        (("index_name", index_name), ("k", 5), ("opensearch_url", OPENSEARCH_URL)),
+        l2_index=index_name,
+    )
+
+
+ACTION_REGISTRY: dict[str, ActionEntry] = {
+    "random": ActionEntry(f"{_ACTIONS}:random_action", instantiate=False),
+    "rule_only": ActionEntry(f"{_ACTIONS}:rule_only_action", instantiate=False),
+    "l0_memory": _entry("L0MemoryAction"),
+    "l0_strength": _entry("L0StrengthAction"),
+    "full_agent": _entry("FullAgentAction"),
+    "sweep_lr": _entry("SweepLRAction"),
+    "burst_1": _entry("Burst1Action"),
+    "burst_3": _entry("Burst3Action"),
+    "burst_5": _entry("Burst5Action"),
+    "burst_7": _entry("Burst7Action"),
+    "burst3_threshold": _entry("Burst3ThresholdAction"),
+    "random_5": _entry("Random5Action"),
+    "random_7": _entry("Random7Action"),
+    "random_9": _entry("Random9Action"),
+    "strafe_burst_3": _entry("StrafeBurst3Action"),
+    "smart_5": _entry("Smart5Action"),
+    "adaptive_5": _entry("Adaptive5Action"),
+    "dodge_burst_3": _entry("DodgeBurst3Action"),
+    "survival_burst": _entry("SurvivalBurstAction"),
+    "compound_attack_turn": _entry("CompoundAttackTurnAction"),
+    "compound_burst_3": _entry("CompoundBurst3Action"),
+    "attack_only": _entry("AttackOnlyAction"),
+    "forward_attack": _entry("ForwardAttackAction"),
+    "adaptive_kill": _entry("AdaptiveKillAction"),
+    "aggressive_adaptive": _entry("AggressiveAdaptiveAction"),
+    "genome": _entry("GenomeAction"),
+    "genome5": _entry("Genome5Action"),
+    "l2_rag_good": _l2_entry("L2RagAction", "strategies_high"),
+    "l2_rag_random": _l2_entry("L2RagAction", "strategies_low"),
+    "l2_meta_select": _l2_entry("L2MetaStrategyAction", "strategies_meta"),
+    "l2_meta_5action": _l2_entry("L2MetaStrategy5Action", "strategies_meta_5action"),
+    "random_select": _entry("RandomSelectAction"),
+    "random_rotation_5": _entry("RandomRotation5Action"),
+    "ar": _entry("AttackRatioAction"),
+    "cycle": _entry("BurstCycleAction"),
+    "rand50_raw": _entry("AttackRatioActionRaw", attack_ratio=0.5),
+    "attack_ovr": _entry("PureAttackAction", health_override=True),
+    "attack_raw": _entry("PureAttackAction", health_override=False),
+    "forward_biased_7": _entry("ForwardBiased7Action"),
+    "strafe_dodge_7": _entry("StrafeDodge7Action"),
+    "burst_advance_7": _entry("BurstAdvance7Action"),
+    "adaptive_aggression_7": _entry("AdaptiveAggression7Action"),
+}
+
+# Parametric action types: prefix -> (registry kind, parser of the suffix)
+_PARAMETRIC: dict[str, tuple[str, Callable[[str], dict[str, Any]]]] = {
+    "burst3_threshold_": ("burst3_threshold", lambda s: {"health_threshold": int(s)}),
+    "ar_": ("ar", lambda s: {"attack_ratio": int(s) / 100.0}),
+    "cycle_": ("cycle", lambda s: {"burst_length": int(s)}),
+}
+_PARAMETRIC_KINDS = frozenset(kind for kind, _ in _PARAMETRIC.values())
+
+
+@dataclass(frozen=True)
+class ActionSpec:
+    """A registry kind plus its constructor parameters (sorted items).
+
+    Parameter values are JSON scalars (numbers, strings, booleans).
+    """
+
+    kind: str
+    params: tuple[tuple[str, Any], ...] = ()
+
+    @classmethod
+    def of(cls, kind: str, **params: Any) -> "ActionSpec":
+        if kind not in ACTION_REGISTRY:
+            raise KeyError(f"Unknown action kind: {kind!r}")
+        return cls(kind, tuple(sorted(params.items())))
+
+    def encode(self) -> str:
+        """Compact JSON form, e.g. ``["ar",{"attack_ratio":0.5}]``."""
+        return json.dumps([self.kind, dict(self.params)], separators=(",", ":"))
+
+    @classmethod
+    def decode(cls, text: str) -> "ActionSpec":
+        kind, params = json.loads(text)
+        return cls.of(kind, **params)
+
+
+def spec_for_action_type(
+    action_type: str,
+    memory_weight: float = 0.5,
+    strength_weight: float = 0.5,
+    genome_params: Optional[dict] = None,
+) -> ActionSpec:
+    """Resolve an ``action_type`` string (plus run parameters) to a spec."""
+    if action_type in ("genome", "genome5"):
+        return ActionSpec.of(action_type, **(genome_params or {}))
+    if (
+        action_type in ACTION_REGISTRY
+        and action_type != DEFAULT_KIND
+        and action_type not in _PARAMETRIC_KINDS
+    ):
+        return ActionSpec.of(action_type)
+    for prefix, (kind, parse) in _PARAMETRIC.items():
+        if action_type.startswith(prefix):
+            return ActionSpec.of(kind, **parse(action_type[len(prefix):]))
+    # "full_agent" and unrecognised types
+    return ActionSpec.of(
+        DEFAULT_KIND, memory_weight=memory_weight, strength_weight=strength_weight
+    )
+
+
+def spec_for_run(run: Any) -> ActionSpec:
+    """ActionSpec of a RunConfig."""
+    return spec_for_action_type(
+        getattr(run, "action_type", DEFAULT_KIND),
+        memory_weight=run.memory_weight,
+        strength_weight=run.strength_weight,
+        genome_params=getattr(run, "genome_params", None),
+    )
+
+
+def _resolve(target: str) -> Any:
+    module, _, attr = target.partition(":")
+    return getattr(importlib.import_module(module), attr)
+
+
+def build_action(
+    spec: Union[ActionSpec, str], strategy_docs: Optional[Path] = None
+) -> Any:
+    """A new, uncompiled action function for ``spec`` (or its encoding).
+
+    With ``strategy_docs``, L2 policies retrieve from an in-process index
+    loaded from ``<strategy_docs>/<index_name>.json`` instead of OpenSearch.
+    """
+    if isinstance(spec, str):
+        spec = ActionSpec.decode(spec)
+    entry = ACTION_REGISTRY[spec.kind]
+    target = _resolve(entry.target)
+    if not entry.instantiate:
+        return target
+    kwargs = dict(entry.kwargs)
+    kwargs.update(spec.params)
+    if entry.l2_index is not None:
+        kwargs["retriever"] = local_retriever(strategy_docs, entry.l2_index)
+    return target(**kwargs)
+
+
+def get_policy(
+    spec: Union[ActionSpec, str], strategy_docs: Optional[Path] = None
+) -> Any:
+    """Shared, compiled action function for ``spec`` in this process."""
+    if isinstance(spec, str):
+        spec = ActionSpec.decode(spec)
+    return _cached_policy(spec, None if strategy_docs is None else Path(strategy_docs))
+
+
+@lru_cache(maxsize=None)
+def _cached_policy(spec: ActionSpec, strategy_docs: Optional[Path]) -> Any:
+    from glue.policy_compiler import compile_policy
+
+    return compile_policy(build_action(spec, strategy_docs))
+
+
+def policy_for_run(run: Any, strategy_docs: Optional[Path] = None) -> Any:
+    """get_policy() for a RunConfig; picklable as an EpisodePool factory."""
+    return get_policy(spec_for_run(run), strategy_docs)
+
+
+def close_policy(action_fn: Any) -> None:
+    """Release background resources of a policy (e.g. an L2 prefetch thread).
+
+    Policies are shared per process (get_policy), so this only stops threads
+    they restart on demand; the policy stays usable.
+    """
+    close = getattr(action_fn, "close", None)
+    if close is not None:
+        close()
+
+
+def local_retriever(strategy_docs: Optional[Path], index_name: str) -> Any:
+    """In-process index for ``index_name``, or None to query OpenSearch."""
+    if strategy_docs is None:
+        return None
+    return load_strategy_index(Path(strategy_docs) / f"{index_name}.json")
+
+
+@lru_cache(maxsize=None)
+def load_strategy_index(path: Path) -> Any:
+    """Load each strategy document file once per process."""
+    from glue.strategy_index import LocalStrategyIndex
+
+    if not path.exists():
+        raise FileNotFoundError(f"Strategy document file not found: {path}")
+    index = LocalStrategyIndex.from_json(path)
+    logger.info("Loaded %d strategy documents from %s", len(index), path)
+    return index
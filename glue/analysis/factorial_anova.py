@@ -0,0 +1,705 @@
+"""N-way factorial and response-surface ANOVA from DuckDB aggregates.
+
+Every linear model of a designed experiment predicts one value per design
+cell (a combination of factor levels), so all of its sums of squares are
+functions of per-cell sufficient statistics:
+
+    n_c, mean_c, M2_c = sum (y - mean_c)^2
+
+    RSS(X)      = sum_c n_c (mean_c - x_c b)^2  +  sum_c M2_c
+                  (weighted least squares on the cell means, weights n_c)
+    pure error  = sum_c M2_c                     df = N - cells
+    lack of fit = RSS(X) - pure error            df = cells - rank(X)
+
+Type III (or sequential Type I) term sums of squares are RSS differences
+between nested cell-level fits, so a model over millions of episodes costs
+one GROUP BY in DuckDB plus a least-squares problem with one row per cell.
+load_cells() pushes the aggregation down (conditions are mapped to cells
+in SQL, so runs sharing a condition label, e.g. blocked center points,
+pool into one cell) and also returns the higher central power sums, the
+per-cell min / max and the Brown-Forsythe deviations |y - median_c| that
+the residual diagnostics need:
+
+    normality       Jarque-Bera on the model residuals; their 3rd / 4th
+                    power sums follow from M2..M4 and the cell offsets
+    equal variance  Levene (median-centered, as scipy.stats.levene)
+    outliers        |studentized residual| > 3: max from the cell min / max,
+                    counted with one filtered query only when it exceeds 3
+
+Models:
+
+    factorial   categorical factors in sum-to-zero coding with all
+                interactions up to ``max_order``. With center points (every
+                numeric factor at the midpoint of two factorial levels) a
+                single-df curvature term is added and tested against pure
+                error.
+    rsm         numeric factors coded to [-1, 1]: linear, two-factor
+                interaction and quadratic terms (second-order response
+                surface); aliased columns (e.g. the quadratics of a 2^k
+                design with one center cell) are dropped and reported.
+
+Factor levels come from condition labels such as
+``memory=0.7_strength=0.9`` (the doe_design default) or from an explicit
+condition -> {factor: level} mapping.
+"""
+from __future__ import annotations
+
+import itertools
+import re
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional, Sequence
+
+import numpy as np
+
+OUTLIER_THRESHOLD = 3.0
+
+
+# ---------------------------------------------------------------------------
+# Factor levels from condition labels
+# ---------------------------------------------------------------------------
+
+
+def _level_value(text: str) -> Any:
+    try:
+        return float(text)
+    except ValueError:
+        return text
+
+
+def parse_condition(condition: str, names: Optional[Sequence[str]] = None) -> dict[str, Any]:
+    """Factor levels of a ``name=value_name=value`` condition label.
+
+    Values may contain underscores; so may factor names when ``names`` is
+    given (otherwise only the first name may). Numeric values become floats.
+    Raises ValueError for labels that are not of this form.
+    """
+    if names:
+        first = later = "|".join(re.escape(name) for name in names)
+    else:
+        first, later = r"[A-Za-z]\w*?", r"[A-Za-z][A-Za-z0-9]*"
+    # name=value, the value running up to the next "_name=" or the end
+    tail = rf"=(.+?)(?:_(?=(?:{later})=)|$)"
+    leading, following = re.compile(rf"({first}){tail}"), re.compile(rf"({later}){tail}")
+    levels: dict[str, Any] = {}
+    pos = 0
+    while pos < len(condition):
+        found = (following if pos else leading).match(condition, pos)
+        if found is None or found.group(1) in levels:
+            raise ValueError(f"condition {condition!r} is not a name=value label")
+        levels[found.group(1)] = _level_value(found.group(2))
+        pos = found.end()
+    if not levels:
+        raise ValueError(f"condition {condition!r} is not a name=value label")
+    return levels
+
+
+def design_factors(
+    conditions: Sequence[str], names: Optional[Sequence[str]] = None
+) -> Optional[dict[str, dict[str, Any]]]:
+    """condition -> levels when every label parses with the same factors."""
+    parsed: dict[str, dict[str, Any]] = {}
+    for condition in conditions:
+        try:
+            parsed[condition] = parse_condition(condition, names)
+        except ValueError:
+            return None
+    if not parsed or len({tuple(sorted(levels)) for levels in parsed.values()}) != 1:
+        return None
+    return parsed
+
+
+# ---------------------------------------------------------------------------
+# Cell sufficient statistics
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class CellStats:
+    """Per-cell aggregates of one metric. Arrays are indexed by cell."""
+
+    metric: str
+    factors: list[str]
+    levels: list[tuple]  # factor levels of each cell
+    conditions: list[list[str]]  # condition labels pooled into each cell
+    n: np.ndarray
+    mean: np.ndarray
+    m2: np.ndarray  # central power sums sum (y - mean)^k
+    m3: np.ndarray
+    m4: np.ndarray
+    minimum: np.ndarray
+    maximum: np.ndarray
+    bf_mean: np.ndarray  # mean of |y - median| (Brown-Forsythe)
+    bf_m2: np.ndarray  # central sum of squares of |y - median|
+
+    @property
+    def total(self) -> int:
+        return int(self.n.sum())
+
+
+def _cell_index(
+    factors_by_condition: dict[str, dict[str, Any]],
+) -> tuple[list[str], list[tuple], list[list[str]], dict[str, int]]:
+    factors = list(next(iter(factors_by_condition.values())))
+    cells: dict[tuple, list[str]] = {}
+    for condition in sorted(factors_by_condition):
+        levels = factors_by_condition[condition]
+        if set(levels) != set(factors):
+            raise ValueError(f"condition {condition!r} does not set factors {factors}")
+        cells.setdefault(tuple(levels[f] for f in factors), []).append(condition)
+    keys = sorted(cells, key=lambda k: tuple((isinstance(v, str), v) for v in k))
+    index = {c: i for i, key in enumerate(keys) for c in cells[key]}
+    return factors, keys, [cells[k] for k in keys], index
+
+
+def _factor_map(
+    conditions: Sequence[str], factors: Optional[dict[str, dict[str, Any]]]
+) -> dict[str, dict[str, Any]]:
+    if factors is not None:
+        missing = sorted(set(conditions) - set(factors))
+        if missing:
+            raise ValueError(f"no factor levels for conditions {missing}")
+        return {c: dict(factors[c]) for c in conditions}
+    parsed = design_factors(conditions)
+    if parsed is None:
+        raise ValueError(
+            "condition labels do not encode factor levels; pass factors="
+        )
+    return parsed
+
+
+def cells_from_groups(
+    groups: dict[str, np.ndarray],
+    metric: str,
+    factors: Optional[dict[str, dict[str, Any]]] = None,
+) -> CellStats:
+    """CellStats from in-memory condition -> values (NaN dropped)."""
+    names, keys, pooled, index = _cell_index(_factor_map(list(groups), factors))
+    values = [np.concatenate([np.asarray(groups[c], dtype=float) for c in conds])
+              for conds in pooled]
+    values = [v[~np.isnan(v)] for v in values]
+
+    def per_cell(fn) -> np.ndarray:
+        return np.array([fn(v) for v in values], dtype=float)
+
+    dev = [np.abs(v - np.median(v)) for v in values]
+    return CellStats(
+        metric=metric,
+        factors=names,
+        levels=keys,
+        conditions=pooled,
+        n=per_cell(len),
+        mean=per_cell(np.mean),
+        m2=per_cell(lambda v: ((v - v.mean()) ** 2).sum()),
+        m3=per_cell(lambda v: ((v - v.mean()) ** 3).sum()),
+        m4=per_cell(lambda v: ((v - v.mean()) ** 4).sum()),
+        minimum=per_cell(np.min),
+        maximum=per_cell(np.max),
+        bf_mean=np.array([d.mean() for d in dev]),
+        bf_m2=np.array([((d - d.mean()) ** 2).sum() for d in dev]),
+    )
+
+
+_CELL_QUERY = """
+WITH cells AS (
+    SELECT unnest(?::VARCHAR[]) AS condition, unnest(?::INTEGER[]) AS cell
+),
+obs AS (
+    SELECT cells.cell, e.{metric}::DOUBLE AS y
+    FROM experiments e JOIN cells USING (condition)
+    WHERE e.experiment_id = ? AND e.{metric} IS NOT NULL
+),
+centers AS (
+    SELECT cell, avg(y) AS mean, median(y) AS med FROM obs GROUP BY cell
+)
+SELECT
+    cell,
+    count(*) AS n,
+    any_value(mean) AS mean,
+    sum((y - mean) ^ 2) AS m2,
+    sum((y - mean) ^ 3) AS m3,
+    sum((y - mean) ^ 4) AS m4,
+    min(y) AS minimum,
+    max(y) AS maximum,
+    avg(abs(y - med)) AS bf_mean,
+    var_pop(abs(y - med)) * count(*) AS bf_m2
+FROM obs JOIN centers USING (cell)
+GROUP BY cell
+ORDER BY cell
+"""
+
+
+def load_cells(
+    db_path: str,
+    experiment_id: str,
+    metric: str,
+    factors: Optional[dict[str, dict[str, Any]]] = None,
+) -> tuple[CellStats, Callable[[np.ndarray, np.ndarray], int]]:
+    """Aggregate one metric of an experiment into design cells in DuckDB.
+
+    Returns the CellStats and a function counting observations outside
+    per-cell [lower, upper] bounds (one filtered query per call).
+    """
+    import duckdb
+
+    con = duckdb.connect(db_path, read_only=True)
+    try:
+        conditions = [row[0] for row in con.execute(
+            "SELECT DISTINCT condition FROM experiments WHERE experiment_id = ?",
+            [experiment_id],
+        ).fetchall()]
+        if not conditions:
+            raise ValueError(f"no episodes for {experiment_id}")
+        names, keys, pooled, index = _cell_index(_factor_map(conditions, factors))
+        mapping = [list(index), list(index.values())]
+        fetched = con.execute(
+            _CELL_QUERY.format(metric=metric), [*mapping, experiment_id]
+        ).fetchnumpy()
+    finally:
+        con.close()
+
+    present = np.asarray(fetched["cell"], dtype=int)
+    if len(present) != len(keys):
+        # Cells whose metric is NULL for every episode
+        keys = [keys[i] for i in present]
+        pooled = [pooled[i] for i in present]
+        index = {c: i for i, conds in enumerate(pooled) for c in conds}
+        mapping = [list(index), list(index.values())]
+
+    def count_outside(lower: np.ndarray, upper: np.ndarray) -> int:
+        con = duckdb.connect(db_path, read_only=True)
+        try:
+            return con.execute(
+                f"""
+                WITH cells AS (
+                    SELECT unnest(?::VARCHAR[]) AS condition,
+                           unnest(?::DOUBLE[]) AS lower,
+                           unnest(?::DOUBLE[]) AS upper
+                )
+                SELECT count(*) FROM experiments e JOIN cells USING (condition)
+                WHERE e.experiment_id = ?
+                  AND (e.{metric} < cells.lower OR e.{metric} > cells.upper)
+                """,
+                [
+                    mapping[0],
+                    [float(lower[i]) for i in mapping[1]],
+                    [float(upper[i]) for i in mapping[1]],
+                    experiment_id,
+                ],
+            ).fetchone()[0]
+        finally:
+            con.close()
+
+    def column(name: str) -> np.ndarray:
+        return np.asarray(fetched[name], dtype=float)
+
+    cells = CellStats(
+        metric=metric,
+        factors=names,
+        levels=keys,
+        conditions=pooled,
+        **{name: column(name) for name in (
+            "n", "mean", "m2", "m3", "m4", "minimum", "maximum", "bf_mean", "bf_m2"
+        )},
+    )
+    return cells, count_outside
+
+
+def _groups_counter(
+    groups: dict[str, np.ndarray], cells: CellStats
+) -> Callable[[np.ndarray, np.ndarray], int]:
+    def count_outside(lower: np.ndarray, upper: np.ndarray) -> int:
+        total = 0
+        for i, conds in enumerate(cells.conditions):
+            for c in conds:
+                v = np.asarray(groups[c], dtype=float)
+                total += int(((v < lower[i]) | (v > upper[i])).sum())
+        return total
+    return count_outside
+
+
+# ---------------------------------------------------------------------------
+# Model matrices
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class _Design:
+    columns: np.ndarray  # (cells, p) model matrix, intercept first
+    names: list[str]  # column names
+    terms: list[tuple[str, list[int]]]  # source -> column indices
+    aliased: list[str] = field(default_factory=list)
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _center_cells(cells: CellStats) -> np.ndarray:
+    """Cells at the midpoint of a two-level numeric factorial."""
+    levels = np.array(cells.levels, dtype=object)
+    if not all(_is_number(v) for v in levels.ravel()):
+        return np.zeros(len(levels), dtype=bool)
+    values = levels.astype(float)
+    mid = (values.min(axis=0) + values.max(axis=0)) / 2
+    center = np.isclose(values, mid).all(axis=1)
+    corner = values[~center]
+    if not center.any() or not all(
+        len(np.unique(corner[:, j])) == 2 and not np.isclose(corner[:, j], mid[j]).any()
+        for j in range(values.shape[1])
+    ):
+        return np.zeros(len(levels), dtype=bool)
+    return center
+
+
+def _factorial_design(cells: CellStats, max_order: Optional[int]) -> _Design:
+    center = _center_cells(cells)
+    k = len(cells.factors)
+    blocks: list[np.ndarray] = []
+    block_names: list[list[str]] = []
+    for j, factor in enumerate(cells.factors):
+        observed = [cell[j] for cell, is_center in zip(cells.levels, center) if not is_center]
+        levels = sorted(set(observed), key=lambda v: (isinstance(v, str), v))
+        coded = np.zeros((len(cells.levels), max(len(levels) - 1, 0)))
+        for i, cell in enumerate(cells.levels):
+            if center[i]:
+                continue
+            position = levels.index(cell[j])
+            if position == len(levels) - 1:
+                coded[i] = -1.0
+            else:
+                coded[i, position] = 1.0
+        blocks.append(coded)
+        block_names.append([f"{factor}[S.{level:g}]" if _is_number(level)
+                            else f"{factor}[S.{level}]" for level in levels[:-1]])
+
+    columns = [np.ones((len(cells.levels), 1))]
+    names = ["Intercept"]
+    terms: list[tuple[str, list[int]]] = []
+    for order in range(1, (max_order or k) + 1):
+        for combo in itertools.combinations(range(k), order):
+            block = blocks[combo[0]]
+            labels = block_names[combo[0]]
+            for j in combo[1:]:
+                block = np.einsum("ci,cj->cij", block, blocks[j]).reshape(len(block), -1)
+                labels = [f"{a}:{b}" for a in labels for b in block_names[j]]
+            if not block.shape[1]:
+                continue
+            start = sum(c.shape[1] for c in columns)
+            terms.append((":".join(cells.factors[j] for j in combo),
+                          list(range(start, start + block.shape[1]))))
+            columns.append(block)
+            names.extend(labels)
+    if center.any():
+        start = sum(c.shape[1] for c in columns)
+        terms.append(("curvature", [start]))
+        columns.append(center[:, None].astype(float))
+        names.append("curvature")
+    return _Design(np.hstack(columns), names, terms)
+
+
+def _rsm_design(cells: CellStats) -> _Design:
+    try:
+        values = np.array(cells.levels, dtype=float)
+    except ValueError:
+        raise ValueError("rsm model needs numeric factor levels") from None
+    low, high = values.min(axis=0), values.max(axis=0)
+    half = np.where(high > low, (high - low) / 2, 1.0)
+    x = (values - (low + high) / 2) / half
+
+    candidates: list[tuple[str, np.ndarray]] = []
+    for j, factor in enumerate(cells.factors):
+        candidates.append((factor, x[:, j]))
+    for a, b in itertools.combinations(range(len(cells.factors)), 2):
+        candidates.append((f"{cells.factors[a]}:{cells.factors[b]}", x[:, a] * x[:, b]))
+    for j, factor in enumerate(cells.factors):
+        candidates.append((f"{factor}^2", x[:, j] ** 2))
+
+    # Keep columns that raise the rank; the rest are aliased
+    kept = np.ones((len(values), 1))
+    names = ["Intercept"]
+    terms: list[tuple[str, list[int]]] = []
+    aliased: list[str] = []
+    for name, column in candidates:
+        trial = np.column_stack([kept, column])
+        if np.linalg.matrix_rank(trial) > kept.shape[1]:
+            terms.append((name, [kept.shape[1]]))
+            kept = trial
+            names.append(name)
+        else:
+            aliased.append(name)
+    return _Design(kept, names, terms, aliased)
+
+
+# ---------------------------------------------------------------------------
+# ANOVA
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class AnovaTerm:
+    """One row of an ANOVA table."""
+
+    source: str
+    ss: float
+    df: int
+    ms: float
+    f: float = float("nan")
+    p: float = float("nan")
+    partial_eta_squared: float = float("nan")
+
+
+@dataclass
+class ResidualDiagnostics:
+    """Residual checks computed from the cell aggregates."""
+
+    skewness: float
+    excess_kurtosis: float
+    jarque_bera: float
+    normality_p: float
+    levene_w: float
+    levene_p: float
+    max_abs_studentized: float
+    n_outliers: int  # |studentized residual| > OUTLIER_THRESHOLD
+
+    @property
+    def normality_pass(self) -> bool:
+        return self.normality_p > 0.05
+
+    @property
+    def equal_variance_pass(self) -> bool:
+        return self.levene_p > 0.05
+
+
+@dataclass
+class FactorialAnova:
+    """ANOVA of one metric under a factorial or response-surface model."""
+
+    metric: str
+    model: str
+    typ: int
+    factors: list[str]
+    cells: CellStats
+    terms: list[AnovaTerm]
+    residual: AnovaTerm
+    lack_of_fit: Optional[AnovaTerm]
+    pure_error: AnovaTerm
+    total_ss: float
+    r_squared: float
+    coefficients: dict[str, float]
+    fitted: np.ndarray  # per-cell model predictions
+    aliased: list[str]
+    diagnostics: ResidualDiagnostics
+
+    def term(self, source: str) -> AnovaTerm:
+        for row in self.terms:
+            if row.source == source:
+                return row
+        raise KeyError(source)
+
+    def format_table(self) -> str:
+        """Markdown ANOVA table."""
+        lines = [
+            "| Source | SS | df | MS | F | p | partial eta2 |",
+            "|--------|----|----|----|---|---|--------------|",
+        ]
+        for row in self.terms:
+            lines.append(
+                f"| {row.source} | {row.ss:.3f} | {row.df} | {row.ms:.3f} | "
+                f"{row.f:.3f} | {row.p:.4f} | {row.partial_eta_squared:.3f} |"
+            )
+        if self.lack_of_fit is not None:
+            lof = self.lack_of_fit
+            lines.append(f"| Lack of fit | {lof.ss:.3f} | {lof.df} | {lof.ms:.3f} | "
+                         f"{lof.f:.3f} | {lof.p:.4f} | |")
+        pe = self.pure_error
+        if self.lack_of_fit is not None:
+            lines.append(f"| Pure error | {pe.ss:.3f} | {pe.df} | {pe.ms:.3f} | | | |")
+        res = self.residual
+        lines.append(f"| Residual | {res.ss:.3f} | {res.df} | {res.ms:.3f} | | | |")
+        lines.append(f"| Total | {self.total_ss:.3f} | {self.cells.total - 1} | | | | |")
+        return "\n".join(lines)
+
+
+def _weighted_rss(design: np.ndarray, cells: CellStats) -> tuple[float, np.ndarray, int]:
+    """Between-cell RSS of a weighted cell-means fit, coefficients, rank."""
+    w = np.sqrt(cells.n)
+    beta, _, rank, _ = np.linalg.lstsq(design * w[:, None], cells.mean * w, rcond=None)
+    resid = cells.mean - design @ beta
+    return float((cells.n * resid ** 2).sum()), beta, int(rank)
+
+
+def _diagnostics(
+    cells: CellStats,
+    fitted: np.ndarray,
+    design: np.ndarray,
+    mse: float,
+    count_outside: Optional[Callable[[np.ndarray, np.ndarray], int]],
+) -> ResidualDiagnostics:
+    from scipy import stats
+
+    n, total = cells.n, cells.total
+    # Residuals y - fitted = (y - mean_c) + delta_c, where sum (y - mean_c) = 0
+    delta = cells.mean - fitted
+    s2 = (cells.m2 + n * delta ** 2).sum()
+    s3 = (cells.m3 + 3 * delta * cells.m2 + n * delta ** 3).sum()
+    s4 = (cells.m4 + 4 * delta * cells.m3 + 6 * delta ** 2 * cells.m2 + n * delta ** 4).sum()
+    with np.errstate(divide="ignore", invalid="ignore"):
+        skew = (s3 / total) / (s2 / total) ** 1.5
+        kurt = (s4 / total) / (s2 / total) ** 2 - 3.0
+    jb = total / 6.0 * (skew ** 2 + kurt ** 2 / 4.0)
+    jb_p = float(stats.chi2.sf(jb, 2))
+
+    # Levene (median-centered): one-way ANOVA of z = |y - median_c|
+    k = len(n)
+    grand = (n * cells.bf_mean).sum() / total
+    between = (n * (cells.bf_mean - grand) ** 2).sum()
+    within = cells.bf_m2.sum()
+    if k > 1 and total > k and within > 0:
+        levene_w = float((total - k) / (k - 1) * between / within)
+        levene_p = float(stats.f.sf(levene_w, k - 1, total - k))
+    else:
+        levene_w, levene_p = float("nan"), float("nan")
+
+    # Studentized residuals r = e / sqrt(MSE (1 - h_c)), h_c = x_c' (X'WX)^+ x_c
+    xtwx = design.T @ (design * n[:, None])
+    leverage = np.einsum("ij,jk,ik->i", design, np.linalg.pinv(xtwx), design)
+    scale = np.sqrt(mse * np.clip(1.0 - leverage, 0.0, None))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        extreme = np.maximum(np.abs(cells.minimum - fitted), np.abs(cells.maximum - fitted))
+        studentized = np.where(scale > 0, extreme / scale, 0.0)
+    max_abs = float(studentized.max()) if len(studentized) else 0.0
+    n_outliers = 0
+    if max_abs > OUTLIER_THRESHOLD and count_outside is not None:
+        bound = OUTLIER_THRESHOLD * scale
+        n_outliers = int(count_outside(fitted - bound, fitted + bound))
+
+    return ResidualDiagnostics(
+        skewness=float(skew),
+        excess_kurtosis=float(kurt),
+        jarque_bera=float(jb),
+        normality_p=jb_p,
+        levene_w=levene_w,
+        levene_p=levene_p,
+        max_abs_studentized=max_abs,
+        n_outliers=n_outliers,
+    )
+
+
+def anova_from_cells(
+    cells: CellStats,
+    model: str = "factorial",
+    typ: int = 3,
+    max_order: Optional[int] = None,
+    count_outside: Optional[Callable[[np.ndarray, np.ndarray], int]] = None,
+) -> FactorialAnova:
+    """Fit a factorial or RSM model to cell aggregates and test its terms.
+
+    ``typ`` 3 tests each term given all others (marginal SS, sum-to-zero
+    coding); ``typ`` 1 adds terms sequentially in model order.
+    ``count_outside`` counts observations outside per-cell bounds for the
+    outlier check (None reports 0 outliers).
+    """
+    from scipy import stats
+
+    if typ not in (1, 3):
+        raise ValueError(f"typ must be 1 or 3, got {typ}")
+    if model == "factorial":
+        design = _factorial_design(cells, max_order)
+    elif model == "rsm":
+        design = _rsm_design(cells)
+    else:
+        raise ValueError(f"unknown model {model!r}")
+
+    total = cells.total
+    pure_ss = float(cells.m2.sum())
+    pure_df = total - len(cells.n)
+    grand = (cells.n * cells.mean).sum() / total
+    total_ss = pure_ss + float((cells.n * (cells.mean - grand) ** 2).sum())
+
+    between_ss, beta, rank = _weighted_rss(design.columns, cells)
+    fitted = design.columns @ beta
+    lof_df = len(cells.n) - rank
+    resid_ss = between_ss + pure_ss
+    resid_df = total - rank
+    mse = resid_ss / resid_df if resid_df > 0 else float("nan")
+
+    def rss_without(keep: list[int]) -> tuple[float, int]:
+        ss, _, r = _weighted_rss(design.columns[:, keep], cells)
+        return ss, r
+
+    rows: list[AnovaTerm] = []
+    all_columns = list(range(design.columns.shape[1]))
+    previous_ss, previous_rank = rss_without([0])
+    included = [0]
+    for source, cols in design.terms:
+        if typ == 3:
+            keep = [c for c in all_columns if c not in cols]
+            reduced_ss, reduced_rank = rss_without(keep)
+            ss, df = reduced_ss - between_ss, rank - reduced_rank
+        else:
+            included = included + cols
+            current_ss, current_rank = rss_without(included)
+            ss, df = previous_ss - current_ss, current_rank - previous_rank
+            previous_ss, previous_rank = current_ss, current_rank
+        ss = max(ss, 0.0)
+        row = AnovaTerm(source=source, ss=ss, df=df, ms=ss / df if df else float("nan"))
+        if df and resid_df > 0 and mse > 0:
+            row.f = row.ms / mse
+            row.p = float(stats.f.sf(row.f, df, resid_df))
+        if ss + resid_ss > 0:
+            row.partial_eta_squared = ss / (ss + resid_ss)
+        rows.append(row)
+
+    pure = AnovaTerm("Pure error", pure_ss, pure_df,
+                     pure_ss / pure_df if pure_df > 0 else float("nan"))
+    lack_of_fit = None
+    if lof_df > 0:
+        lack_of_fit = AnovaTerm("Lack of fit", between_ss, lof_df, between_ss / lof_df)
+        if pure_df > 0 and pure.ms > 0:
+            lack_of_fit.f = lack_of_fit.ms / pure.ms
+            lack_of_fit.p = float(stats.f.sf(lack_of_fit.f, lof_df, pure_df))
+
+    return FactorialAnova(
+        metric=cells.metric,
+        model=model,
+        typ=typ,
+        factors=list(cells.factors),
+        cells=cells,
+        terms=rows,
+        residual=AnovaTerm("Residual", resid_ss, resid_df, mse),
+        lack_of_fit=lack_of_fit,
+        pure_error=pure,
+        total_ss=total_ss,
+        r_squared=1.0 - resid_ss / total_ss if total_ss > 0 else float("nan"),
+        coefficients=dict(zip(design.names, beta.tolist())),
+        fitted=fitted,
+        aliased=design.aliased,
+        diagnostics=_diagnostics(cells, fitted, design.columns, mse, count_outside),
+    )
+
+
+def factorial_anova(
+    db_path: str,
+    experiment_id: str,
+    metric: str = "kill_rate",
+    model: str = "factorial",
+    factors: Optional[dict[str, dict[str, Any]]] = None,
+    typ: int = 3,
+    max_order: Optional[int] = None,
+) -> FactorialAnova:
+    """ANOVA of an experiment's metric, aggregated in DuckDB."""
+    cells, count_outside = load_cells(db_path, experiment_id, metric, factors)
+    return anova_from_cells(cells, model, typ, max_order, count_outside)
+
+
+def factorial_anova_groups(
+    groups: dict[str, np.ndarray],
+    metric: str = "kill_rate",
+    model: str = "factorial",
+    factors: Optional[dict[str, dict[str, Any]]] = None,
+    typ: int = 3,
+    max_order: Optional[int] = None,
+) -> FactorialAnova:
+    """ANOVA from in-memory condition -> values."""
+    cells = cells_from_groups(groups, metric, factors)
+    return anova_from_cells(cells, model, typ, max_order, _groups_counter(groups, cells))
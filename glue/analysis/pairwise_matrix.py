@@ -0,0 +1,240 @@
+"""All-pairs comparison matrices from group sufficient statistics.
+
+pairwise_comparison() runs Welch, Mann-Whitney, Cohen's d and a CI for one
+pair at a time, so an experiment with C conditions and M metrics costs
+C(C-1)/2 * M scipy calls. Every one of those statistics is a function of
+per-group quantities, so this module computes them once per metric:
+
+    n, mean, M2 (sum of squared deviations)  -> Welch t, df, CI, Cohen's d
+    value count table K (groups x distinct values)
+        U_ab   = K_a . (cumulative K_b below v + K_b / 2)   -> U = K @ L.T
+        ties_ab = sum_v (K_a + K_b)^3 - (K_a + K_b)         -> from K^3, K^2 @ K.T
+
+and derives the (C, C) statistic matrices with a handful of array
+operations plus one vectorized scipy distribution call per test. Results
+agree with pairwise_comparison() (scipy's asymptotic Mann-Whitney with tie
+and continuity correction; pairs that scipy would test exactly, fewer than
+9 episodes without ties, are delegated to scipy).
+
+load_experiment_columns() fetches every requested metric of an experiment
+in one columnar DuckDB query; per-metric groups (NULLs dropped) and
+complete-case rows are both derived from it.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+from glue.analysis.statistical_tests import PairwiseResult, holm_bonferroni
+
+
+@dataclass
+class ExperimentColumns:
+    """Episode rows of one experiment: condition labels and metric columns."""
+    conditions: np.ndarray  # (N,) condition of each episode
+    columns: dict[str, np.ndarray]  # metric -> (N,) float, NaN for NULL
+
+    def groups(self, metric: str) -> dict[str, np.ndarray]:
+        """condition -> non-NULL values of ``metric`` (sorted by condition)."""
+        values = self.columns[metric]
+        keep = ~np.isnan(values)
+        return _split(self.conditions[keep], values[keep])
+
+    def complete_rows(self, metrics: list[str]) -> dict[str, np.ndarray]:
+        """condition -> (n, len(metrics)) rows with every metric recorded."""
+        if not len(self.conditions):
+            return {}
+        matrix = np.column_stack([self.columns[m] for m in metrics])
+        keep = ~np.isnan(matrix).any(axis=1)
+        return _split(self.conditions[keep], matrix[keep])
+
+
+def _split(labels: np.ndarray, values: np.ndarray) -> dict[str, np.ndarray]:
+    if not len(labels):
+        return {}
+    order = np.argsort(labels, kind="stable")
+    labels, values = labels[order], values[order]
+    names, starts = np.unique(labels, return_index=True)
+    return {
+        str(name): chunk
+        for name, chunk in zip(names, np.split(values, starts[1:]))
+    }
+
+
+def load_experiment_columns(
+    db_path: str, experiment_id: str, metrics: list[str]
+) -> ExperimentColumns:
+    """Fetch all ``metrics`` of an experiment in one columnar query."""
+    import duckdb
+
+    columns = ", ".join(metrics)
+    con = duckdb.connect(db_path, read_only=True)
+    try:
+        fetched = con.execute(
+            f"SELECT condition, {columns} FROM experiments "
+            f"WHERE experiment_id = ? ORDER BY condition, episode_number",
+            [experiment_id],
+        ).fetchnumpy()
+    finally:
+        con.close()
+
+    return ExperimentColumns(
+        conditions=np.asarray(fetched["condition"], dtype=object).astype(str),
+        columns={
+            m: np.ma.filled(np.ma.asarray(fetched[m], dtype=float), np.nan)
+            for m in metrics
+        },
+    )
+
+
+@dataclass
+class PairwiseMatrix:
+    """Every pairwise comparison of one metric as (C, C) matrices.
+
+    Entry [i, j] compares conditions[i] (a) with conditions[j] (b).
+    """
+    metric: str
+    conditions: list[str]
+    n: np.ndarray
+    mean: np.ndarray
+    std: np.ndarray
+    t_statistic: np.ndarray
+    df_welch: np.ndarray
+    p_value_welch: np.ndarray
+    u_statistic: np.ndarray
+    p_value_mann_whitney: np.ndarray
+    cohens_d: np.ndarray
+    ci_lower: np.ndarray
+    ci_upper: np.ndarray
+    ci_level: float
+
+    def result(self, i: int, j: int) -> PairwiseResult:
+        return PairwiseResult(
+            condition_a=self.conditions[i],
+            condition_b=self.conditions[j],
+            metric=self.metric,
+            mean_a=float(self.mean[i]),
+            mean_b=float(self.mean[j]),
+            std_a=float(self.std[i]),
+            std_b=float(self.std[j]),
+            n_a=int(self.n[i]),
+            n_b=int(self.n[j]),
+            t_statistic=float(self.t_statistic[i, j]),
+            p_value_welch=float(self.p_value_welch[i, j]),
+            df_welch=float(self.df_welch[i, j]),
+            u_statistic=float(self.u_statistic[i, j]),
+            p_value_mann_whitney=float(self.p_value_mann_whitney[i, j]),
+            cohens_d=float(self.cohens_d[i, j]),
+            ci_lower=float(self.ci_lower[i, j]),
+            ci_upper=float(self.ci_upper[i, j]),
+            ci_level=self.ci_level,
+        )
+
+    def pairs(self) -> list[tuple[int, int]]:
+        """Upper-triangle index pairs in itertools.combinations order."""
+        rows, cols = np.triu_indices(len(self.conditions), k=1)
+        return list(zip(rows.tolist(), cols.tolist()))
+
+    def results(self) -> list[PairwiseResult]:
+        return [self.result(i, j) for i, j in self.pairs()]
+
+    def holm_significant(self, alpha: float = 0.05) -> np.ndarray:
+        """Symmetric boolean matrix: Welch p significant after Holm-Bonferroni."""
+        pairs = self.pairs()
+        flags = holm_bonferroni([self.p_value_welch[i, j] for i, j in pairs], alpha)
+        out = np.zeros((len(self.conditions),) * 2, dtype=bool)
+        for (i, j), flag in zip(pairs, flags):
+            out[i, j] = out[j, i] = flag
+        return out
+
+
+def pairwise_matrix(
+    groups: dict[str, np.ndarray], metric: str, ci_level: float = 0.95
+) -> PairwiseMatrix:
+    """All-pairs Welch / Mann-Whitney / Cohen's d / CI for one metric.
+
+    ``groups`` maps condition -> values; conditions are compared in sorted
+    order. Every group needs at least 2 values.
+    """
+    from scipy import special, stats
+
+    conditions = sorted(groups)
+    arrays = [np.asarray(groups[c], dtype=float) for c in conditions]
+    n = np.array([len(a) for a in arrays], dtype=float)
+    if (n < 2).any():
+        raise ValueError("every condition needs at least 2 observations")
+    mean = np.array([a.mean() for a in arrays])
+    m2 = np.array([((a - a.mean()) ** 2).sum() for a in arrays])
+    var = m2 / (n - 1)
+
+    na, nb = n[:, None], n[None, :]
+    va, vb = (var / n)[:, None], (var / n)[None, :]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # Welch t-test and Welch-Satterthwaite df
+        diff = mean[:, None] - mean[None, :]
+        se = np.sqrt(va + vb)
+        t = diff / se
+        den = va ** 2 / (na - 1) + vb ** 2 / (nb - 1)
+        df = np.where(den > 0, (va + vb) ** 2 / den, np.minimum(na, nb) - 1)
+        p_welch = 2 * stats.t.sf(np.abs(t), df)
+        t_crit = stats.t.ppf((1 + ci_level) / 2, df)
+
+        # Cohen's d (pooled SD)
+        pooled = np.sqrt((m2[:, None] + m2[None, :]) / (na + nb - 2))
+        d = np.where(pooled > 0, diff / pooled, 0.0)
+
+    # Mann-Whitney U from the value count table
+    values, inverse = np.unique(np.concatenate(arrays), return_inverse=True)
+    labels = np.repeat(np.arange(len(arrays)), n.astype(int))
+    counts = np.zeros((len(arrays), len(values)))
+    np.add.at(counts, (labels, inverse), 1.0)
+    below = np.cumsum(counts, axis=1) - counts
+    u = counts @ (below + 0.5 * counts).T
+    cube = (counts ** 3 - counts).sum(axis=1)
+    cross = (counts ** 2) @ counts.T
+    ties = cube[:, None] + cube[None, :] + 3 * (cross + cross.T)
+    total = na + nb
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sigma = np.sqrt(na * nb / 12 * ((total + 1) - ties / (total * (total - 1))))
+        z = (np.maximum(u, na * nb - u) - na * nb / 2 - 0.5) / sigma
+    p_mw = np.clip(2 * special.ndtr(-z), 0.0, 1.0)
+
+    # Pairs scipy tests exactly (small and tie-free): delegate
+    small = (na <= 8) | (nb <= 8)
+    tie_free = (cross + cross.T == 0) & (cube[:, None] == 0) & (cube[None, :] == 0)
+    for i, j in zip(*np.nonzero(small & tie_free)):
+        if i != j:
+            p_mw[i, j] = stats.mannwhitneyu(arrays[i], arrays[j]).pvalue
+
+    return PairwiseMatrix(
+        metric=metric,
+        conditions=conditions,
+        n=n.astype(int),
+        mean=mean,
+        std=np.sqrt(var),
+        t_statistic=t,
+        df_welch=df,
+        p_value_welch=p_welch,
+        u_statistic=u,
+        p_value_mann_whitney=p_mw,
+        cohens_d=d,
+        ci_lower=diff - t_crit * se,
+        ci_upper=diff + t_crit * se,
+        ci_level=ci_level,
+    )
+
+
+def experiment_matrices(
+    data: ExperimentColumns,
+    metrics: list[str],
+    ci_level: float = 0.95,
+) -> dict[str, Optional[PairwiseMatrix]]:
+    """PairwiseMatrix per metric (None when fewer than 2 usable conditions)."""
+    out: dict[str, Optional[PairwiseMatrix]] = {}
+    for metric in metrics:
+        groups = {c: v for c, v in data.groups(metric).items() if len(v) >= 2}
+        out[metric] = pairwise_matrix(groups, metric, ci_level) if len(groups) > 1 else None
+    return out
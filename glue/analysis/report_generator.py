@@ -3,21 +3,22 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime, timezone
-from itertools import combinations
 from pathlib import Path
 from typing import Optional
 
-import duckdb
 import numpy as np
 
 from glue.analysis.statistical_tests import (
     PairwiseResult,
+    ResamplingResult,
     holm_bonferroni,
-    pairwise_comparison,
+    resampling_tests,
     test_equal_variance,
     test_normality,
 )
 from glue.analysis.diagnostics import run_diagnostics
+from glue.analysis.factorial_anova import design_factors, factorial_anova_groups
+from glue.analysis.pairwise_matrix import load_experiment_columns, pairwise_matrix
 
 logger = logging.getLogger(__name__)
 
@@ -28,22 +29,7 @@ def load_experiment_data(
     db_path: str, experiment_id: str, metric: str = "kill_rate"
 ) -> dict[str, np.ndarray]:
     """Load experiment data grouped by condition from DuckDB."""
-    con = duckdb.connect(db_path, read_only=True)
-    try:
-        rows = con.execute(
-            f"SELECT condition, {metric} FROM experiments "
-            f"WHERE experiment_id = ? AND {metric} IS NOT NULL "
-            f"ORDER BY condition, episode_number",
-            [experiment_id],
-        ).fetchall()
-    finally:
-        con.close()
-
-    data: dict[str, list[float]] = {}
-    for condition, value in rows:
-        data.setdefault(condition, []).append(value)
-
-    return {k: np.array(v) for k, v in data.items()}
+    return load_experiment_columns(db_path, experiment_id, [metric]).groups(metric)
 
 
 def assess_trust_level(
@@ -98,7 +84,9 @@ def generate_report(
     ]
 
     primary_metric = metrics[0]  # kill_rate
-    primary_data = load_experiment_data(db_path, experiment_id, primary_metric)
+    # Every metric in one columnar query
+    columns = load_experiment_columns(db_path, experiment_id, metrics)
+    primary_data = columns.groups(primary_metric)
 
     if not primary_data:
         lines.append("**ERROR**: No data found for this experiment.")
@@ -121,7 +109,7 @@ def generate_report(
     lines.append("")
 
     for metric in metrics:
-        data = load_experiment_data(db_path, experiment_id, metric)
+        data = columns.groups(metric)
         if not data:
             continue
 
@@ -157,19 +145,66 @@ def generate_report(
                 f"{var_result.format_stat_marker()}")
     lines.append("")
 
+    # Multi-factor ANOVA when the condition labels encode a factorial design
+    factors = design_factors(list(primary_data))
+    if factors and len(next(iter(factors.values()))) > 1:
+        anova = factorial_anova_groups(primary_data, primary_metric, factors=factors)
+        curvature = any(t.source == "curvature" for t in anova.terms)
+        lines.append("## Factorial ANOVA (Primary: kill_rate)")
+        lines.append("")
+        lines.append(
+            f"Type III sums of squares, factors: {', '.join(anova.factors)}"
+            + (" (curvature: factorial vs center points)." if curvature else ".")
+        )
+        lines.append("")
+        lines.append(anova.format_table())
+        lines.append("")
+        fd = anova.diagnostics
+        lines.append(f"- Residual normality (Jarque-Bera): "
+                     f"**{'PASS' if fd.normality_pass else 'FAIL'}** (p={fd.normality_p:.3f})")
+        lines.append(f"- Equal variance across cells (Levene): "
+                     f"**{'PASS' if fd.equal_variance_pass else 'FAIL'}** (p={fd.levene_p:.3f})")
+        lines.append(f"- Outliers (|studentized residual| > 3): {fd.n_outliers}")
+        lines.append("")
+
     # Pairwise comparisons
     lines.append("## Pairwise Comparisons (Primary: kill_rate)")
     lines.append("")
 
-    conditions = sorted(primary_data.keys())
-    all_results: list[PairwiseResult] = []
-
-    for cond_a, cond_b in combinations(conditions, 2):
-        result = pairwise_comparison(
-            primary_data[cond_a], primary_data[cond_b],
-            cond_a, cond_b, primary_metric,
+    # Bootstrap CIs and permutation p-values: every pair and metric in one
+    # batched pass over the complete-case episode rows
+    rows = columns.complete_rows(metrics)
+    resampled: dict[tuple[str, str, str], ResamplingResult] = {}
+    if len(rows) > 1:
+        for r in resampling_tests(rows, metrics):
+            resampled[(r.condition_a, r.condition_b, r.metric)] = r
+
+    # All pairs at once from per-condition sufficient statistics
+    comparable = {c: v for c, v in primary_data.items() if len(v) >= 2}
+    excluded = sorted(set(primary_data) - set(comparable))
+    if excluded:
+        logger.warning(
+            f"{experiment_id}: fewer than 2 episodes, excluded from pairwise "
+            f"comparisons: {', '.join(excluded)}"
+        )
+        lines.append(
+            f"**Excluded** (fewer than 2 episodes): {', '.join(excluded)}"
         )
-        all_results.append(result)
+        lines.append("")
+    all_results: list[PairwiseResult] = []
+    if len(comparable) > 1:
+        all_results = pairwise_matrix(comparable, primary_metric).results()
+
+    for result in all_results:
+        a, b = result.condition_a, result.condition_b
+        resampling = resampled.get((a, b, primary_metric))
+        # Only when the complete cases are exactly the primary data
+        if resampling is not None and (
+            len(rows[a]) == result.n_a and len(rows[b]) == result.n_b
+        ):
+            result.p_value_permutation = resampling.p_value
+            result.boot_ci_lower = resampling.ci_lower
+            result.boot_ci_upper = resampling.ci_upper
 
     # Holm-Bonferroni correction
     p_values = [r.p_value_welch for r in all_results]
@@ -199,6 +234,29 @@ def generate_report(
         lines.append(f"- Effect size: {d_interp} (d={result.cohens_d:.2f})")
         lines.append("")
 
+    if resampled:
+        lines.append("## Resampling Tests (all metrics)")
+        lines.append("")
+        n_resamples = next(iter(resampled.values())).n_resamples
+        lines.append(
+            f"Permutation p-values and percentile bootstrap 95% CIs of the mean "
+            f"difference ({n_resamples} resamples, episodes with all metrics "
+            f"recorded), Holm-Bonferroni corrected per metric."
+        )
+        lines.append("")
+        lines.append("| Metric | Comparison | Difference | Bootstrap CI | p (perm) | Holm |")
+        lines.append("|--------|------------|------------|--------------|----------|------|")
+        for metric in metrics:
+            metric_results = [r for r in resampled.values() if r.metric == metric]
+            corrected = holm_bonferroni([r.p_value for r in metric_results])
+            for r, sig in zip(metric_results, corrected):
+                lines.append(
+                    f"| {metric} | {r.condition_a} vs {r.condition_b} | "
+                    f"{r.mean_diff:.3f} | [{r.ci_lower:.3f}, {r.ci_upper:.3f}] | "
+                    f"{r.p_value:.4f} | {'significant' if sig else 'n.s.'} |"
+                )
+        lines.append("")
+
     # Trust level
     trust = assess_trust_level(all_results, diag.overall_pass)
     lines.append("## Verdict")
@@ -0,0 +1,212 @@
+"""Group-sequential stopping rules for DOE conditions.
+
+A fixed-sample DOE runs every condition's full seed list even when a
+comparison is already decisive after a fraction of it. A SequentialPlan
+instead analyses the data at ``looks`` interim points (after
+ceil(n * k / looks) seeds of every run) and stops allocating episodes to a
+condition once all of its comparisons are resolved.
+
+Error control:
+- Lan-DeMets alpha spending: look k may spend
+  alpha(t_k) - alpha(t_{k-1}) of the overall alpha, t_k = k / looks.
+  O'Brien-Fleming-type spending keeps early boundaries strict (the final
+  look is close to the fixed-sample test); Pocock-type spends evenly.
+  Testing each look at its increment is a union bound over looks, so the
+  overall type I error stays <= alpha without the correlated-boundary
+  numerics.
+- Holm-Bonferroni across the open comparisons of a look, at that look's
+  increment. True nulls are never removed before a false rejection, so
+  the family-wise error rate is controlled in the strong sense.
+
+Comparisons use the Welch t-test from statistical_tests. Only efficacy
+stopping is implemented; a condition that never separates runs its full
+seed list, exactly as in a fixed-sample DOE.
+"""
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+from itertools import combinations
+from statistics import NormalDist
+
+import numpy as np
+
+from glue.analysis.statistical_tests import holm_bonferroni, welch_t_test
+
+# Columns of the experiments table a plan may monitor
+METRICS = (
+    "kill_rate", "kills", "survival_time", "damage_dealt", "damage_taken",
+    "ammo_efficiency", "exploration_coverage",
+)
+
+_NORMAL = NormalDist()
+
+
+def obrien_fleming_spending(t: float, alpha: float) -> float:
+    """Lan-DeMets O'Brien-Fleming-type spending: 2 - 2 Phi(z_{1-alpha/2} / sqrt(t))."""
+    if t <= 0:
+        return 0.0
+    z = _NORMAL.inv_cdf(1 - alpha / 2)
+    return min(alpha, 2 - 2 * _NORMAL.cdf(z / math.sqrt(min(t, 1.0))))
+
+
+def pocock_spending(t: float, alpha: float) -> float:
+    """Lan-DeMets Pocock-type spending: alpha * ln(1 + (e - 1) t)."""
+    if t <= 0:
+        return 0.0
+    return alpha * math.log(1 + (math.e - 1) * min(t, 1.0))
+
+
+SPENDING_FUNCTIONS = {
+    "obrien_fleming": obrien_fleming_spending,
+    "pocock": pocock_spending,
+}
+
+
+@dataclass(frozen=True)
+class SequentialPlan:
+    """Stopping rule for a sequential DOE execution.
+
+    reference: compare every condition against this control condition;
+        None compares all pairs of conditions.
+    min_n: comparisons with fewer episodes per side are not tested yet.
+    """
+
+    metric: str = "kill_rate"
+    alpha: float = 0.05
+    looks: int = 5
+    spending: str = "obrien_fleming"
+    reference: str | None = None
+    min_n: int = 3
+
+    def __post_init__(self) -> None:
+        if self.metric not in METRICS:
+            raise ValueError(f"Unknown metric {self.metric!r}; expected one of {METRICS}")
+        if self.spending not in SPENDING_FUNCTIONS:
+            raise ValueError(
+                f"Unknown spending function {self.spending!r}; "
+                f"expected one of {sorted(SPENDING_FUNCTIONS)}"
+            )
+        if not 0 < self.alpha < 1:
+            raise ValueError(f"alpha must be in (0, 1), got {self.alpha}")
+        if self.looks < 1:
+            raise ValueError(f"looks must be >= 1, got {self.looks}")
+        if self.min_n < 2:
+            raise ValueError(f"min_n must be >= 2, got {self.min_n}")
+
+    def info_fraction(self, look: int) -> float:
+        return look / self.looks
+
+    def alpha_spent(self, look: int) -> float:
+        """Cumulative alpha spent through ``look``."""
+        return SPENDING_FUNCTIONS[self.spending](self.info_fraction(look), self.alpha)
+
+    def look_alpha(self, look: int) -> float:
+        """Alpha available to the tests of ``look``."""
+        return self.alpha_spent(look) - self.alpha_spent(look - 1)
+
+    def stage_size(self, n_seeds: int, look: int) -> int:
+        """Seeds of a run scheduled through ``look``."""
+        return math.ceil(n_seeds * look / self.looks)
+
+    def rule(self) -> str:
+        """Human-readable stopping rule (recorded with every decision)."""
+        family = f"vs {self.reference}" if self.reference else "all pairs"
+        return (
+            f"group-sequential {self.spending} spending, alpha={self.alpha}, "
+            f"looks={self.looks}, Welch t on {self.metric}, "
+            f"Holm across {family}, min_n={self.min_n}"
+        )
+
+
+@dataclass
+class Comparison:
+    """One comparison at one look."""
+
+    condition_a: str
+    condition_b: str
+    n_a: int
+    n_b: int
+    mean_a: float
+    mean_b: float
+    p_value: float
+    resolved: bool
+
+
+@dataclass
+class LookResult:
+    """Outcome of one interim analysis."""
+
+    look: int
+    info_fraction: float
+    nominal_alpha: float  # alpha available to this look
+    comparisons: list[Comparison]  # open comparisons tested at this look
+    stopped: list[str]  # conditions resolved at this look
+
+
+@dataclass
+class SequentialMonitor:
+    """Tracks resolved comparisons and active conditions across looks."""
+
+    plan: SequentialPlan
+    conditions: list[str]
+    resolved: set[tuple[str, str]] = field(default_factory=set)
+    stopped: dict[str, int] = field(default_factory=dict)  # condition -> look
+    pairs: list[tuple[str, str]] = field(init=False)
+
+    def __post_init__(self) -> None:
+        ref = self.plan.reference
+        if ref is not None and ref not in self.conditions:
+            raise ValueError(
+                f"Reference condition {ref!r} not in experiment conditions {self.conditions}"
+            )
+        if ref is None:
+            self.pairs = list(combinations(self.conditions, 2))
+        else:
+            self.pairs = [(ref, c) for c in self.conditions if c != ref]
+
+    @property
+    def active(self) -> list[str]:
+        return [c for c in self.conditions if c not in self.stopped]
+
+    def look(self, look: int, values: dict[str, np.ndarray]) -> LookResult:
+        """Test the open comparisons on the data available at ``look``."""
+        nominal = self.plan.look_alpha(look)
+        open_pairs = [p for p in self.pairs if p not in self.resolved]
+        comparisons = []
+        for a, b in open_pairs:
+            xa = np.asarray(values.get(a, ()), dtype=float)
+            xb = np.asarray(values.get(b, ()), dtype=float)
+            p = 1.0
+            if min(len(xa), len(xb)) >= self.plan.min_n:
+                p = welch_t_test(xa, xb)[1]
+                if math.isnan(p):  # both sides constant
+                    p = 0.0 if xa.mean() != xb.mean() else 1.0
+            comparisons.append(Comparison(
+                a, b, len(xa), len(xb),
+                float(xa.mean()) if len(xa) else math.nan,
+                float(xb.mean()) if len(xb) else math.nan,
+                float(p), False,
+            ))
+
+        if comparisons:
+            significant = holm_bonferroni([c.p_value for c in comparisons], nominal)
+            for comparison, sig in zip(comparisons, significant):
+                if sig:
+                    comparison.resolved = True
+                    self.resolved.add((comparison.condition_a, comparison.condition_b))
+
+        newly_stopped = []
+        for condition in self.active:
+            own = [p for p in self.pairs if condition in p]
+            if own and all(p in self.resolved for p in own):
+                self.stopped[condition] = look
+                newly_stopped.append(condition)
+
+        return LookResult(
+            look=look,
+            info_fraction=self.plan.info_fraction(look),
+            nominal_alpha=nominal,
+            comparisons=comparisons,
+            stopped=newly_stopped,
+        )
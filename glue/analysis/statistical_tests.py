@@ -7,12 +7,23 @@ Implements the required battery of tests for comparing experimental conditions:
 - Anderson-Darling normality test
 - Levene's test for equal variance
 - Holm-Bonferroni correction for multiple comparisons
+- Bootstrap CIs and permutation p-values for mean differences, batched
+  over all condition pairs and metrics (resampling_tests)
+
+scipy.stats is imported on first use (it dominates import time), so
+importing this module for the result dataclasses stays cheap.
 """
 from __future__ import annotations
 
+from itertools import combinations
+from typing import Optional
+
 import numpy as np
 from dataclasses import dataclass
-from scipy import stats
+
+# Upper bound on array elements materialized per resampling chunk
+# (~32 MB of float64)
+DEFAULT_MAX_ELEMENTS = 4_000_000
 
 
 @dataclass
@@ -45,6 +56,11 @@ class PairwiseResult:
     ci_upper: float
     ci_level: float  # e.g., 0.95
 
+    # Resampling (filled when pairwise_comparison gets a ResamplingResult)
+    p_value_permutation: Optional[float] = None
+    boot_ci_lower: Optional[float] = None
+    boot_ci_upper: Optional[float] = None
+
     def is_significant(self, alpha: float = 0.05) -> bool:
         return self.p_value_welch < alpha
 
@@ -56,9 +72,36 @@ class PairwiseResult:
         markers.append(f"[STAT:effect_size=Cohen's d={self.cohens_d:.2f}]")
         markers.append(f"[STAT:ci={int(self.ci_level*100)}%: {self.ci_lower:.2f}-{self.ci_upper:.2f}]")
         markers.append(f"[STAT:n={self.n_a}+{self.n_b}]")
+        if self.p_value_permutation is not None:
+            markers.append(f"[STAT:p_perm={self.p_value_permutation:.4f}]")
+            markers.append(
+                f"[STAT:boot_ci={int(self.ci_level*100)}%: "
+                f"{self.boot_ci_lower:.2f}-{self.boot_ci_upper:.2f}]"
+            )
         return " ".join(markers)
 
 
+@dataclass
+class ResamplingResult:
+    """Bootstrap CI and permutation p-value for mean(a) - mean(b)."""
+    condition_a: str
+    condition_b: str
+    metric: str
+    mean_diff: float
+    ci_lower: float  # percentile bootstrap
+    ci_upper: float
+    ci_level: float
+    p_value: float  # two-sided permutation test
+    n_resamples: int
+
+    def format_stat_markers(self) -> str:
+        return (
+            f"[STAT:p_perm={self.p_value:.4f}] "
+            f"[STAT:boot_ci={int(self.ci_level*100)}%: "
+            f"{self.ci_lower:.2f}-{self.ci_upper:.2f}]"
+        )
+
+
 @dataclass
 class NormalityResult:
     """Result of normality testing."""
@@ -88,6 +131,8 @@ class VarianceResult:
 
 def welch_t_test(a: np.ndarray, b: np.ndarray) -> tuple[float, float, float]:
     """Welch's t-test (unequal variance assumed)."""
+    from scipy import stats
+
     result = stats.ttest_ind(a, b, equal_var=False)
     # Welch-Satterthwaite degrees of freedom
     na, nb = len(a), len(b)
@@ -100,6 +145,8 @@ def welch_t_test(a: np.ndarray, b: np.ndarray) -> tuple[float, float, float]:
 
 def mann_whitney_u(a: np.ndarray, b: np.ndarray) -> tuple[float, float]:
     """Mann-Whitney U test (non-parametric alternative)."""
+    from scipy import stats
+
     result = stats.mannwhitneyu(a, b, alternative='two-sided')
     return float(result.statistic), float(result.pvalue)
 
@@ -115,6 +162,8 @@ def cohens_d(a: np.ndarray, b: np.ndarray) -> float:
 
 def confidence_interval_diff(a: np.ndarray, b: np.ndarray, level: float = 0.95) -> tuple[float, float]:
     """Confidence interval for difference in means (Welch)."""
+    from scipy import stats
+
     diff = np.mean(a) - np.mean(b)
     se = np.sqrt(np.var(a, ddof=1)/len(a) + np.var(b, ddof=1)/len(b))
     # Welch df
@@ -129,6 +178,8 @@ def confidence_interval_diff(a: np.ndarray, b: np.ndarray, level: float = 0.95)
 
 def anderson_darling_test(data: np.ndarray) -> tuple[float, float]:
     """Anderson-Darling normality test. Returns (statistic, p_value)."""
+    from scipy import stats
+
     try:
         # scipy >= 1.17: use method='interpolate' for direct p-value
         result = stats.anderson(data, dist='norm', method='interpolate')
@@ -157,6 +208,8 @@ def anderson_darling_test(data: np.ndarray) -> tuple[float, float]:
 
 def levene_test(*groups: np.ndarray) -> tuple[float, float]:
     """Levene's test for equality of variances."""
+    from scipy import stats
+
     result = stats.levene(*groups)
     return float(result.statistic), float(result.pvalue)
 
@@ -178,6 +231,125 @@ def holm_bonferroni(p_values: list[float], alpha: float = 0.05) -> list[bool]:
     return significant
 
 
+def _bootstrap_means(
+    x: np.ndarray, n_resamples: int, rng: np.random.Generator, max_elements: int
+) -> np.ndarray:
+    """(n_resamples, M) bootstrap means of the rows of x (n, M).
+
+    A resample is a multinomial count vector over the n rows, so a chunk of
+    resamples is one (b, n) @ (n, M) product.
+    """
+    n = len(x)
+    means = np.empty((n_resamples, x.shape[1]))
+    step = max(1, max_elements // n)
+    probs = np.full(n, 1.0 / n)
+    for start in range(0, n_resamples, step):
+        b = min(step, n_resamples - start)
+        counts = rng.multinomial(n, probs, size=b)
+        means[start:start + b] = counts @ x / n
+    return means
+
+
+def resampling_tests(
+    groups: dict[str, np.ndarray],
+    metrics: list[str],
+    pairs: Optional[list[tuple[str, str]]] = None,
+    n_resamples: int = 5000,
+    ci_level: float = 0.95,
+    seed: int = 0,
+    max_elements: int = DEFAULT_MAX_ELEMENTS,
+) -> list[ResamplingResult]:
+    """Bootstrap CIs and permutation p-values for many pairs and metrics.
+
+    Args:
+        groups: condition -> (n,) values, or (n, len(metrics)) episode rows
+            (metrics resampled together share every resample).
+        metrics: metric name of each column.
+        pairs: (condition_a, condition_b) pairs; default all pairs of the
+            sorted conditions.
+        n_resamples: bootstrap and permutation resamples per pair.
+        max_elements: memory bound per chunk; results are reproducible for a
+            given seed and max_elements.
+
+    Returns:
+        One ResamplingResult per pair and metric, pair-major.
+    """
+    values = {
+        c: np.asarray(v, dtype=float).reshape(len(v), -1) for c, v in groups.items()
+    }
+    for c, x in values.items():
+        if x.shape[1] != len(metrics):
+            raise ValueError(f"{c}: {x.shape[1]} columns for {len(metrics)} metrics")
+        if len(x) == 0:
+            raise ValueError(f"{c}: no observations")
+    if pairs is None:
+        pairs = list(combinations(sorted(values), 2))
+    if not pairs:
+        return []
+    rng = np.random.default_rng(seed)
+    n_metrics = len(metrics)
+    n_pairs = len(pairs)
+
+    # Bootstrap: each condition's resampled means once, differenced per pair
+    boot = {
+        c: _bootstrap_means(values[c], n_resamples, rng, max_elements)
+        for c in sorted({c for pair in pairs for c in pair})
+    }
+    q = [(1 - ci_level) / 2, (1 + ci_level) / 2]
+    ci = np.empty((2, n_pairs, n_metrics))
+    pair_step = max(1, max_elements // (n_resamples * n_metrics))
+    for start in range(0, n_pairs, pair_step):
+        chunk = pairs[start:start + pair_step]
+        diffs = np.stack([boot[a] - boot[b] for a, b in chunk])
+        ci[:, start:start + len(chunk)] = np.quantile(diffs, q, axis=1)
+
+    # Permutation: pad every pair's pooled sample to a common length and
+    # draw random n_a-subsets (the n_a smallest of uniform keys) in batches
+    n_a = np.array([len(values[a]) for a, _ in pairs])
+    n_b = np.array([len(values[b]) for _, b in pairs])
+    width = int((n_a + n_b).max())
+    pooled = np.zeros((n_pairs, width, n_metrics))
+    valid = np.zeros((n_pairs, width), dtype=bool)
+    for i, (a, b) in enumerate(pairs):
+        pooled[i, :n_a[i] + n_b[i]] = np.vstack([values[a], values[b]])
+        valid[i, :n_a[i] + n_b[i]] = True
+    total = pooled.sum(axis=1)
+    observed = np.stack([values[a].mean(axis=0) - values[b].mean(axis=0) for a, b in pairs])
+    threshold = np.abs(observed) * (1 - 1e-12)
+    exceed = np.zeros((n_pairs, n_metrics))
+
+    per_pair = max(1, max_elements // width)
+    pair_step = max(1, min(n_pairs, per_pair // n_resamples))
+    resample_step = max(1, min(n_resamples, per_pair // pair_step))
+    for p0 in range(0, n_pairs, pair_step):
+        sl = slice(p0, p0 + pair_step)
+        na, nb = n_a[sl, None, None], n_b[sl, None, None]
+        for r0 in range(0, n_resamples, resample_step):
+            r = min(resample_step, n_resamples - r0)
+            keys = np.where(valid[sl, None, :], rng.random((len(na), r, width)), 2.0)
+            cutoff = np.take_along_axis(np.sort(keys, axis=-1), na - 1, axis=-1)
+            sum_a = (keys <= cutoff).astype(float) @ pooled[sl]
+            diff = sum_a / na - (total[sl, None, :] - sum_a) / nb
+            exceed[sl] += (np.abs(diff) >= threshold[sl, None, :]).sum(axis=1)
+    p_values = (1 + exceed) / (1 + n_resamples)
+
+    return [
+        ResamplingResult(
+            condition_a=a,
+            condition_b=b,
+            metric=metric,
+            mean_diff=float(observed[i, j]),
+            ci_lower=float(ci[0, i, j]),
+            ci_upper=float(ci[1, i, j]),
+            ci_level=ci_level,
+            p_value=float(p_values[i, j]),
+            n_resamples=n_resamples,
+        )
+        for i, (a, b) in enumerate(pairs)
+        for j, metric in enumerate(metrics)
+    ]
+
+
 def pairwise_comparison(
     data_a: np.ndarray,
     data_b: np.ndarray,
@@ -185,8 +357,13 @@ def pairwise_comparison(
     condition_b: str,
     metric: str,
     ci_level: float = 0.95,
+    resampling: Optional[ResamplingResult] = None,
 ) -> PairwiseResult:
-    """Run full pairwise comparison battery."""
+    """Run full pairwise comparison battery.
+
+    A ResamplingResult for the same pair and metric (from resampling_tests)
+    adds the permutation p-value and bootstrap CI to the result.
+    """
     t_stat, p_welch, df = welch_t_test(data_a, data_b)
     u_stat, p_mw = mann_whitney_u(data_a, data_b)
     d = cohens_d(data_a, data_b)
@@ -211,6 +388,9 @@ def pairwise_comparison(
         ci_lower=ci_lo,
         ci_upper=ci_hi,
         ci_level=ci_level,
+        p_value_permutation=resampling.p_value if resampling else None,
+        boot_ci_lower=resampling.ci_lower if resampling else None,
+        boot_ci_upper=resampling.ci_upper if resampling else None,
     )
 
 
@@ -0,0 +1,135 @@
+"""Vectorized TOPSIS multi-criteria ranking.
+
+TOPSIS scores each alternative (a genome or DOE condition) by its relative
+closeness to the ideal solution:
+
+    1. vector-normalize every criterion column,
+    2. multiply by the criterion weights,
+    3. take the ideal best / worst per column (max / min for benefit
+       criteria, min / max for cost criteria),
+    4. C_i = d_worst / (d_best + d_worst), in [0, 1], higher is better.
+
+closeness() accepts a single weight vector or an (m, k) stack of them.
+Because weights are non-negative, the weighted ideals are the weighted
+normalized ideals, so the squared distances of every alternative under
+every weight vector are one (m, k) @ (k, n) matrix product: a sweep over
+thousands of weight vectors costs about as much as writing its (m, n)
+result, instead of m Python loops over the alternatives.
+
+Conventions shared by all callers: an all-zero column is left
+unnormalized, and an alternative at zero distance from both ideals (all
+alternatives equal) scores 0.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional, Sequence
+
+import numpy as np
+
+
+def _benefit_mask(benefit: Optional[Sequence[bool]], k: int) -> np.ndarray:
+    if benefit is None:
+        return np.ones(k, dtype=bool)
+    mask = np.asarray(benefit, dtype=bool)
+    if mask.shape != (k,):
+        raise ValueError(f"benefit must have {k} entries, got {mask.shape}")
+    return mask
+
+
+def normalize(matrix: np.ndarray) -> np.ndarray:
+    """Vector-normalize columns."""
+    norms = np.sqrt((matrix ** 2).sum(axis=0))
+    return matrix / np.where(norms > 0, norms, 1.0)
+
+
+def _closeness_normalized(
+    normalized: np.ndarray, weights: np.ndarray, benefit: np.ndarray
+) -> np.ndarray:
+    # With w_j >= 0 the weighted ideals are w_j times the normalized ones, so
+    # d^2 = sum_j w_j^2 (x_ij - ideal_j)^2: one (m, k) @ (k, n) product
+    col_max = normalized.max(axis=0)
+    col_min = normalized.min(axis=0)
+    best = np.where(benefit, col_max, col_min)
+    worst = np.where(benefit, col_min, col_max)
+    w2 = weights ** 2
+    d_best = np.sqrt(np.clip(w2 @ ((normalized - best) ** 2).T, 0.0, None))
+    d_worst = np.sqrt(np.clip(w2 @ ((normalized - worst) ** 2).T, 0.0, None))
+    total = d_best + d_worst
+    return np.divide(d_worst, total, out=np.zeros_like(total), where=total > 0)
+
+
+def closeness(
+    matrix,
+    weights,
+    benefit: Optional[Sequence[bool]] = None,
+) -> np.ndarray:
+    """TOPSIS closeness coefficients.
+
+    Args:
+        matrix: (n, k) decision matrix, alternatives x criteria.
+        weights: (k,) non-negative weight vector, or (m, k) weight vectors
+            for a sweep.
+        benefit: per-criterion True (maximize, default) / False (minimize).
+
+    Returns:
+        (n,) closeness for a single weight vector, else (m, n).
+    """
+    matrix = np.asarray(matrix, dtype=float)
+    if matrix.ndim != 2:
+        raise ValueError(f"matrix must be 2-D, got shape {matrix.shape}")
+    n, k = matrix.shape
+    weights = np.asarray(weights, dtype=float)
+    if weights.shape[-1] != k or weights.ndim > 2:
+        raise ValueError(f"weights must have shape ({k},) or (m, {k}), got {weights.shape}")
+    if (weights < 0).any():
+        raise ValueError("TOPSIS weights must be non-negative")
+    mask = _benefit_mask(benefit, k)
+    if n == 0:
+        return np.zeros(weights.shape[:-1] + (0,))
+    return _closeness_normalized(normalize(matrix), weights, mask)
+
+
+def rank_order(scores: np.ndarray) -> np.ndarray:
+    """Indices best first (ties keep input order) along the last axis."""
+    return np.argsort(-np.asarray(scores), axis=-1, kind="stable")
+
+
+def random_weights(m: int, k: int, seed: int = 0) -> np.ndarray:
+    """m weight vectors drawn uniformly from the k-simplex (Dirichlet(1))."""
+    return np.random.default_rng(seed).dirichlet(np.ones(k), size=m)
+
+
+@dataclass
+class Sensitivity:
+    """Rank stability of alternatives across a weight sweep."""
+
+    weights: np.ndarray  # (m, k)
+    first_share: np.ndarray  # (n,) fraction of weight vectors ranking it #1
+    mean_rank: np.ndarray  # (n,) 1 = best
+    rank_range: np.ndarray  # (n, 2) best and worst rank reached
+
+
+def weight_sensitivity(
+    matrix,
+    weights=None,
+    benefit: Optional[Sequence[bool]] = None,
+    samples: int = 10_000,
+    seed: int = 0,
+) -> Sensitivity:
+    """Rank alternatives under many weight vectors (random simplex by default)."""
+    matrix = np.asarray(matrix, dtype=float)
+    n, k = matrix.shape
+    if weights is None:
+        weights = random_weights(samples, k, seed)
+    weights = np.atleast_2d(np.asarray(weights, dtype=float))
+    scores = closeness(matrix, weights, benefit)
+    order = rank_order(scores)
+    ranks = np.empty_like(order)
+    np.put_along_axis(ranks, order, np.arange(1, n + 1)[None, :], axis=1)
+    return Sensitivity(
+        weights=weights,
+        first_share=np.bincount(order[:, 0], minlength=n) / len(weights),
+        mean_rank=ranks.mean(axis=0),
+        rank_range=np.column_stack([ranks.min(axis=0), ranks.max(axis=0)]),
+    )
@@ -1,7 +1,8 @@
 """Bulk-index strategy seed documents into OpenSearch.
 
 Reads strategy documents from a JSON file and indexes them into the
-'strategies' index using the OpenSearch _bulk API.
+'strategies' index using the OpenSearch _bulk API. All requests share one
+keep-alive connection (glue.http_pool).
 """
 from __future__ import annotations
 
@@ -10,7 +11,11 @@ import os
 import sys
 from pathlib import Path
 
-import requests
+# Allow running as a script (python glue/data/seed_to_opensearch.py)
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from glue.http_pool import get_pool
+from glue.strategy_index import invalidate_query_caches
 
 OPENSEARCH_URL = os.environ.get("OPENSEARCH_URL", "http://localhost:9200")
 INDEX_NAME = "strategies"
@@ -43,15 +48,15 @@ def bulk_index(docs: list[dict], base_url: str, index: str, batch_size: int = BA
             lines.append(body)
 
         payload = "\n".join(lines) + "\n"
-        resp = requests.post(
-            f"{base_url}/_bulk",
-            headers={"Content-Type": "application/x-ndjson"},
-            data=payload,
-            timeout=30,
+        result = json.loads(
+            get_pool(base_url).request(
+                "POST",
+                "/_bulk",
+                body=payload,
+                headers={"Content-Type": "application/x-ndjson"},
+                timeout=30,
+            )
         )
-        resp.raise_for_status()
-
-        result = resp.json()
         if result.get("errors"):
             for item in result["items"]:
                 op = item.get("index", {})
@@ -73,17 +78,20 @@ def bulk_index(docs: list[dict], base_url: str, index: str, batch_size: int = BA
 
 
 def refresh_index(base_url: str, index: str) -> None:
-    """Force refresh the index so documents are searchable."""
-    resp = requests.post(f"{base_url}/{index}/_refresh", timeout=10)
-    resp.raise_for_status()
+    """Force refresh the index so documents are searchable.
+
+    Also drops cached L2 query results for the index held in this process.
+    Other processes pick up the new documents when their cache TTL expires.
+    """
+    get_pool(base_url).request("POST", f"/{index}/_refresh", timeout=10)
     print(f"[seed_to_opensearch] Index '{index}' refreshed.")
+    invalidate_query_caches(index)
 
 
 def get_doc_count(base_url: str, index: str) -> int:
     """Get current document count in index."""
-    resp = requests.get(f"{base_url}/{index}/_count", timeout=10)
-    resp.raise_for_status()
-    return resp.json().get("count", 0)
+    body = get_pool(base_url).request("GET", f"/{index}/_count", timeout=10)
+    return json.loads(body).get("count", 0)
 
 
 def main() -> None:
@@ -102,6 +110,14 @@ def main() -> None:
     count = get_doc_count(OPENSEARCH_URL, INDEX_NAME)
     print(f"[seed_to_opensearch] Complete: {indexed} indexed, {count} total in '{INDEX_NAME}'")
 
+    pool = get_pool(OPENSEARCH_URL)
+    summary = pool.latency_summary()
+    print(
+        f"[seed_to_opensearch] HTTP: {pool.requests} requests over "
+        f"{pool.connections_opened} connection(s), "
+        f"p50={summary['p50_ms']:.1f}ms p99={summary['p99_ms']:.1f}ms"
+    )
+
 
 if __name__ == "__main__":
     main()
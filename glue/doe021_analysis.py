@@ -8,21 +8,30 @@ Performs:
 3. Residual diagnostics (normality, equal variance)
 4. Tukey HSD pairwise comparisons
 5. TOPSIS fitness computation
+6. TOPSIS weight sensitivity (rank stability over random weight vectors)
 
 Run inside Docker container with access to /app/data/clau-doom.duckdb
+
+duckdb, scipy and statsmodels are imported by the steps that use them.
 """
 
+from __future__ import annotations
+
 import sys
-from typing import Dict, List, Tuple
+from typing import TYPE_CHECKING, Dict, List, Tuple
 
-import duckdb
 import numpy as np
-from scipy import stats
-from statsmodels.stats.multicomp import pairwise_tukeyhsd
+
+from glue.analysis.topsis import closeness, weight_sensitivity
+
+if TYPE_CHECKING:
+    import duckdb
 
 
 def load_experiment_data(db_path: str, experiment_id: str) -> duckdb.DuckDBPyConnection:
     """Connect to DuckDB and verify experiment data exists."""
+    import duckdb
+
     conn = duckdb.connect(db_path, read_only=True)
 
     # Check if data exists
@@ -107,6 +116,8 @@ def one_way_anova(
     Returns:
         Dict with F-statistic, p-value, df_between, df_within
     """
+    from scipy import stats
+
     groups = list(data_by_condition.values())
 
     # ANOVA
@@ -161,6 +172,8 @@ def check_normality(residuals: np.ndarray) -> Tuple[float, float]:
     Returns:
         (statistic, p_value)
     """
+    from scipy import stats
+
     stat, p = stats.shapiro(residuals)
     return stat, p
 
@@ -172,6 +185,8 @@ def check_equal_variance(data_by_condition: Dict[str, np.ndarray]) -> Tuple[floa
     Returns:
         (statistic, p_value)
     """
+    from scipy import stats
+
     groups = list(data_by_condition.values())
     stat, p = stats.levene(*groups, center='median')
     return stat, p
@@ -200,6 +215,8 @@ def tukey_hsd_test(df, response_col: str) -> str:
     Returns:
         String summary of pairwise comparisons
     """
+    from statsmodels.stats.multicomp import pairwise_tukeyhsd
+
     result = pairwise_tukeyhsd(
         endog=df[response_col],
         groups=df['condition'],
@@ -237,24 +254,9 @@ def topsis_fitness(
         for cond in conditions
     ])
 
-    # Step 1: Normalize matrix (vector normalization)
-    norm_matrix = matrix / np.sqrt(np.sum(matrix**2, axis=0))
-
-    # Step 2: Weighted normalized matrix
-    weighted_matrix = norm_matrix * weights
-
-    # Step 3: Ideal best and worst
-    ideal_best = np.max(weighted_matrix, axis=0)
-    ideal_worst = np.min(weighted_matrix, axis=0)
-
-    # Step 4: Distances
-    dist_best = np.sqrt(np.sum((weighted_matrix - ideal_best)**2, axis=1))
-    dist_worst = np.sqrt(np.sum((weighted_matrix - ideal_worst)**2, axis=1))
+    C_i = closeness(matrix, weights)
 
-    # Step 5: Closeness coefficient
-    C_i = dist_worst / (dist_best + dist_worst)
-
-    return {cond: c for cond, c in zip(conditions, C_i)}
+    return {cond: float(c) for cond, c in zip(conditions, C_i)}
 
 
 def print_anova_table(result: Dict[str, float], eta_squared: float) -> None:
@@ -333,6 +335,32 @@ def print_topsis_ranking(
         print(f"{rank}. {condition} (C_i = {c_i:.4f})")
 
 
+def print_weight_sensitivity(
+    condition_means: Dict[str, Dict[str, float]],
+    samples: int = 10_000,
+) -> None:
+    """Print how stable the TOPSIS ranking is across random weight vectors."""
+    conditions = sorted(condition_means.keys())
+    matrix = [
+        [condition_means[c]['kills'], condition_means[c]['kill_rate'],
+         condition_means[c]['survival_time']]
+        for c in conditions
+    ]
+    result = weight_sensitivity(matrix, samples=samples)
+
+    print("\n" + "="*70)
+    print(f"TOPSIS WEIGHT SENSITIVITY ({samples} random weight vectors)")
+    print("="*70)
+    print(f"{'Condition':<22} {'P(rank 1)':<11} {'Mean rank':<11} {'Rank range':<10}")
+    print("-" * 70)
+    for i in np.argsort(result.mean_rank, kind="stable"):
+        best, worst = result.rank_range[i]
+        print(
+            f"{conditions[i]:<22} {result.first_share[i]:>9.3f}  "
+            f"{result.mean_rank[i]:>9.2f}   {best:>3d} - {worst:<3d}"
+        )
+
+
 def main():
     """Main analysis workflow."""
     db_path = "/app/data/clau-doom.duckdb"
@@ -387,6 +415,7 @@ def main():
 
     topsis_scores = topsis_fitness(condition_means)
     print_topsis_ranking(topsis_scores, condition_means)
+    print_weight_sensitivity(condition_means)
 
     # Close connection
     conn.close()
@@ -9,6 +9,9 @@ Usage (inside doom-player Docker container):
     python3 -m glue.doe021_evolve --dry-run
     python3 -m glue.doe021_evolve --max-gen 3
     python3 -m glue.doe021_evolve --db-path data/clau-doom.duckdb
+    python3 -m glue.doe021_evolve --racing     # successive-halving evaluation
+    python3 -m glue.doe021_evolve --workers 4  # parallel generation evaluation
+    python3 -m glue.doe021_evolve --surrogate  # surrogate pre-screening of offspring
 """
 
 from __future__ import annotations
@@ -17,13 +20,14 @@ import argparse
 import copy
 import json
 import logging
-import math
 import sys
 import time
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
 
+from glue.racing import RaceResult, RacingSchedule, fetch_race_ranking, race
+
 logger = logging.getLogger(__name__)
 
 DEFAULT_DB_PATH = Path("data/clau-doom.duckdb")
@@ -143,56 +147,30 @@ def compute_topsis(genome_stats: list[dict]) -> list[GenomeFitness]:
     Returns:
         List of GenomeFitness sorted by C_i descending (best first).
     """
-    n = len(genome_stats)
-    if n == 0:
+    if not genome_stats:
         return []
 
+    # Defer heavy imports
+    from glue.analysis.topsis import closeness
+
     # Criteria: mean_kills, mean_kill_rate, mean_survival_time (all maximize)
     criteria_keys = ["mean_kills", "mean_kill_rate", "mean_survival_time"]
     weights = [1.0 / 3, 1.0 / 3, 1.0 / 3]
 
-    # Build decision matrix (n x 3)
-    matrix = []
-    for gs in genome_stats:
-        matrix.append([gs[k] for k in criteria_keys])
-
-    # Step 1: Normalize (vector normalization)
-    norm_matrix = []
-    for j in range(3):
-        col_sum_sq = sum(matrix[i][j] ** 2 for i in range(n))
-        col_norm = math.sqrt(col_sum_sq) if col_sum_sq > 0 else 1.0
-        norm_matrix.append(col_norm)
-
-    normalized = []
-    for i in range(n):
-        row = [matrix[i][j] / norm_matrix[j] for j in range(3)]
-        normalized.append(row)
-
-    # Step 2: Weight
-    weighted = []
-    for i in range(n):
-        row = [normalized[i][j] * weights[j] for j in range(3)]
-        weighted.append(row)
-
-    # Step 3: Ideal best and worst (all maximize)
-    ideal_best = [max(weighted[i][j] for i in range(n)) for j in range(3)]
-    ideal_worst = [min(weighted[i][j] for i in range(n)) for j in range(3)]
-
-    # Step 4: Distances
-    results = []
-    for i in range(n):
-        d_best = math.sqrt(sum((weighted[i][j] - ideal_best[j]) ** 2 for j in range(3)))
-        d_worst = math.sqrt(sum((weighted[i][j] - ideal_worst[j]) ** 2 for j in range(3)))
-        c_i = d_worst / (d_best + d_worst) if (d_best + d_worst) > 0 else 0.0
-
-        results.append(GenomeFitness(
-            name=genome_stats[i]["name"],
-            genome=genome_stats[i]["genome"],
-            mean_kills=genome_stats[i]["mean_kills"],
-            mean_kill_rate=genome_stats[i]["mean_kill_rate"],
-            mean_survival_time=genome_stats[i]["mean_survival_time"],
-            c_i=c_i,
-        ))
+    matrix = [[gs[k] for k in criteria_keys] for gs in genome_stats]
+    scores = closeness(matrix, weights)
+
+    results = [
+        GenomeFitness(
+            name=gs["name"],
+            genome=gs["genome"],
+            mean_kills=gs["mean_kills"],
+            mean_kill_rate=gs["mean_kill_rate"],
+            mean_survival_time=gs["mean_survival_time"],
+            c_i=float(c_i),
+        )
+        for gs, c_i in zip(genome_stats, scores)
+    ]
 
     results.sort(key=lambda r: r.c_i, reverse=True)
     return results
@@ -270,14 +248,15 @@ def generate_random_genome(rng: _random_module.Random) -> dict:
     return enforce_constraints(genome)
 
 
-def create_next_generation(
+def offspring_candidates(
     parents: list[GenomeFitness],
     rng: _random_module.Random,
     gen_number: int,
-) -> dict[str, dict]:
-    """Create 10 genomes for the next generation.
+    per_slot: int = 1,
+) -> dict[str, list[dict]]:
+    """Breed ``per_slot`` candidate genomes for each slot of the next generation.
 
-    Slot 1:  Elite (best genome unchanged)
+    Slot 1:  Elite (best genome unchanged, always a single candidate)
     Slot 2:  Crossover + mutation of parents #1 x #2
     Slot 3:  Crossover + mutation of parents #1 x #2
     Slot 4:  Crossover + mutation of parents #1 x #3
@@ -287,36 +266,111 @@ def create_next_generation(
     Slot 8:  Mutation-only clone of parent #2
     Slot 9:  Mutation-only clone of parent #3
     Slot 10: Random genome (diversity)
+
+    Slots are bred in order, so with per_slot=1 the RNG is consumed exactly
+    as before surrogate screening existed.
     """
     p = [parents[i].genome for i in range(4)]
+    g = f"gen{gen_number}"
+
+    slots = [
+        # Slots 2-3: Crossover parents #1 x #2
+        (f"{g}_G02_x12a", lambda: mutate(crossover_uniform(p[0], p[1], rng), rng)),
+        (f"{g}_G03_x12b", lambda: mutate(crossover_uniform(p[0], p[1], rng), rng)),
+        # Slots 4-5: Crossover parents #1x#3, #2x#4
+        (f"{g}_G04_x13", lambda: mutate(crossover_uniform(p[0], p[2], rng), rng)),
+        (f"{g}_G05_x24", lambda: mutate(crossover_uniform(p[1], p[3], rng), rng)),
+        # Slots 6-7: Crossover parents #1x#4, #3x#4
+        (f"{g}_G06_x14", lambda: mutate(crossover_uniform(p[0], p[3], rng), rng)),
+        (f"{g}_G07_x34", lambda: mutate(crossover_uniform(p[2], p[3], rng), rng)),
+        # Slots 8-9: Mutation-only clones of parents #2, #3
+        (f"{g}_G08_mut2", lambda: mutate(copy.deepcopy(p[1]), rng)),
+        (f"{g}_G09_mut3", lambda: mutate(copy.deepcopy(p[2]), rng)),
+        # Slot 10: Random genome
+        (f"{g}_G10_random", lambda: generate_random_genome(rng)),
+    ]
+
+    candidates: dict[str, list[dict]] = {f"{g}_G01_elite": [copy.deepcopy(p[0])]}
+    for name, breed in slots:
+        candidates[name] = [breed() for _ in range(per_slot)]
+    return candidates
+
 
-    genomes: dict[str, dict] = {}
+def create_next_generation(
+    parents: list[GenomeFitness],
+    rng: _random_module.Random,
+    gen_number: int,
+) -> dict[str, dict]:
+    """Create 10 genomes for the next generation (see offspring_candidates)."""
+    candidates = offspring_candidates(parents, rng, gen_number)
+    return {name: genomes[0] for name, genomes in candidates.items()}
 
-    # Slot 1: Elite
-    genomes[f"gen{gen_number}_G01_elite"] = copy.deepcopy(p[0])
 
-    # Slots 2-3: Crossover parents #1 x #2
-    genomes[f"gen{gen_number}_G02_x12a"] = mutate(crossover_uniform(p[0], p[1], rng), rng)
-    genomes[f"gen{gen_number}_G03_x12b"] = mutate(crossover_uniform(p[0], p[1], rng), rng)
+def screen_next_generation(
+    parents: list[GenomeFitness],
+    rng: _random_module.Random,
+    gen_number: int,
+    db,
+    oversample: int,
+    kappa: float = 1.0,
+) -> tuple[dict[str, dict], dict]:
+    """Breed ``oversample`` candidates per slot and keep the surrogate's pick.
+
+    The surrogate (glue.surrogate) is fitted on every registered 'genome'
+    outcome in the database behind the DuckDBWriter ``db``. Until there is
+    enough history it cannot be fitted, and each slot keeps its first
+    candidate.
+
+    Returns:
+        (genomes, predictions); predictions is empty without a surrogate.
+    """
+    from glue.surrogate import optional_surrogate
 
-    # Slots 4-5: Crossover parents #1x#3, #2x#4
-    genomes[f"gen{gen_number}_G04_x13"] = mutate(crossover_uniform(p[0], p[2], rng), rng)
-    genomes[f"gen{gen_number}_G05_x24"] = mutate(crossover_uniform(p[1], p[3], rng), rng)
+    candidates = offspring_candidates(parents, rng, gen_number, per_slot=oversample)
+    surrogate = optional_surrogate(
+        GENE_SPEC, db.genome_outcomes("genome"), (1 / 3, 1 / 3, 1 / 3), kappa
+    )
+    if surrogate is None:
+        return {name: genomes[0] for name, genomes in candidates.items()}, {}
 
-    # Slots 6-7: Crossover parents #1x#4, #3x#4
-    genomes[f"gen{gen_number}_G06_x14"] = mutate(crossover_uniform(p[0], p[3], rng), rng)
-    genomes[f"gen{gen_number}_G07_x34"] = mutate(crossover_uniform(p[2], p[3], rng), rng)
+    predictions = surrogate.screen(candidates)
+    logger.info(
+        "Surrogate screened %d candidates for %d slots",
+        sum(len(genomes) for genomes in candidates.values()), len(candidates),
+    )
+    for name, prediction in predictions.items():
+        logger.info(
+            "  %s: predicted kills=%.1f±%.1f C=%.3f (acquisition %.3f of %d)",
+            name, prediction.mean["mean_kills"], prediction.std["mean_kills"],
+            prediction.predicted_score, prediction.acquisition, prediction.candidates,
+        )
+    return {name: p.genome for name, p in predictions.items()}, predictions
 
-    # Slot 8: Mutation-only clone of parent #2
-    genomes[f"gen{gen_number}_G08_mut2"] = mutate(copy.deepcopy(p[1]), rng)
 
-    # Slot 9: Mutation-only clone of parent #3
-    genomes[f"gen{gen_number}_G09_mut3"] = mutate(copy.deepcopy(p[2]), rng)
+def record_surrogate_accuracy(
+    db, experiment_id: str, ranked: list[GenomeFitness], dry_run: bool = False
+) -> None:
+    """Store and log realized vs predicted fitness of a screened generation.
 
-    # Slot 10: Random genome
-    genomes[f"gen{gen_number}_G10_random"] = generate_random_genome(rng)
+    With dry_run the comparison is only logged.
+    """
+    from glue.surrogate import log_accuracy
 
-    return genomes
+    predicted = db.surrogate_predictions(experiment_id)
+    if not predicted:
+        return
+    realized = {
+        r.name: {
+            "mean_kills": r.mean_kills,
+            "mean_kill_rate": r.mean_kill_rate,
+            "mean_survival_time": r.mean_survival_time,
+            "score": r.c_i,
+        }
+        for r in ranked
+    }
+    if not dry_run:
+        db.record_surrogate_realized(experiment_id, realized)
+    log_accuracy(experiment_id, predicted, realized)
 
 
 # ---------------------------------------------------------------------------
@@ -360,27 +414,44 @@ def fetch_generation_stats(con, experiment_id: str) -> list[dict]:
     ]
 
 
-def episode_exists(con, experiment_id: str, condition: str, episode_number: int) -> bool:
-    """Check if a specific episode already exists."""
-    result = con.execute(
-        "SELECT 1 FROM experiments WHERE experiment_id=? AND condition=? AND episode_number=?",
-        [experiment_id, condition, episode_number],
-    ).fetchone()
-    return result is not None
-
-
 # ---------------------------------------------------------------------------
 # Execution engine
 # ---------------------------------------------------------------------------
 
 
+def genome_runs(
+    experiment_id: str, genomes: dict[str, dict], seeds: list[int]
+) -> list:
+    """One RunConfig per genome, so EpisodePool workers can build its policy."""
+    from glue.doe_executor import RunConfig
+
+    return [
+        RunConfig(
+            run_id=f"{experiment_id}-{name}",
+            run_label=name,
+            memory_weight=0.0,
+            strength_weight=0.0,
+            seeds=list(seeds),
+            condition=name,
+            run_type="genome",
+            action_type="genome",
+            scenario="defend_the_line.cfg",
+            genome_params=dict(params),
+        )
+        for name, params in genomes.items()
+    ]
+
+
 def execute_generation(
     gen_number: int,
     genomes: dict[str, dict],
     seeds: list[int],
     db_path: Path,
     dry_run: bool = False,
-) -> None:
+    racing: RacingSchedule | None = None,
+    workers: int = 1,
+    vec_envs: int = 1,
+) -> RaceResult | None:
     """Execute all episodes for a single generation.
 
     Args:
@@ -389,19 +460,38 @@ def execute_generation(
         seeds: Seed set for this generation (30 seeds).
         db_path: Path to DuckDB database.
         dry_run: If True, print genomes and exit without executing.
+        racing: Evaluate by successive halving instead of running every
+            genome on every seed; the race is recorded in DuckDB.
+        workers: With workers > 1, episodes run on an EpisodePool (one warm
+            VizDoom bridge per process), dispatched genome by genome in the
+            shuffled execution order; this process is the only DB writer.
+        vec_envs: With vec_envs > 1 (serial only), up to that many genomes
+            are played side by side on a VecVizDoomBridge, one game each;
+            the recorded episodes are the same as in a serial run.
+
+    Returns:
+        The race result when racing, else None.
     """
+    if workers > 1 and vec_envs > 1:
+        raise ValueError("vec_envs > 1 requires workers == 1")
     experiment_id = f"DOE-021_gen{gen_number}"
 
     if dry_run:
         logger.info("=== DRY RUN: Gen %d (%s) ===", gen_number, experiment_id)
         for name, params in genomes.items():
             logger.info("  %s: %s", name, json.dumps(params, default=str))
-        return
+        return None
 
     # Defer heavy imports
     from glue.action_functions import GenomeAction
-    from glue.duckdb_writer import DuckDBWriter
-    from glue.episode_runner import EpisodeRunner
+    from glue.duckdb_writer import (
+        DEFAULT_BUFFER_SIZE,
+        DEFAULT_FLUSH_INTERVAL,
+        DuckDBWriter,
+    )
+    from glue.doe_executor import run_episode_tasks
+    from glue.episode_pool import EpisodeTask
+    from glue.episode_runner import EpisodeResult, EpisodeRunner
     from glue.vizdoom_bridge import VizDoomBridge
 
     logger.info("=" * 70)
@@ -410,93 +500,160 @@ def execute_generation(
                 len(genomes) * len(seeds))
     logger.info("=" * 70)
 
-    db = DuckDBWriter(db_path=db_path)
+    db = DuckDBWriter(
+        db_path=db_path,
+        buffer_size=DEFAULT_BUFFER_SIZE,
+        flush_interval=DEFAULT_FLUSH_INTERVAL,
+    )
 
     # Register seed set
     formula = f"seed_i = {SEED_FORMULAS[gen_number]['base']} + i * {SEED_FORMULAS[gen_number]['step']}, i=0..29"
     db.write_seed_set(experiment_id, seeds, formula)
+    db.write_genomes(experiment_id, "genome", genomes)
+    done = db.completion_index(experiment_id)
+
+    bridge = None
+    runner = None
+    if vec_envs > 1:
+        from glue.vec_vizdoom_bridge import VecVizDoomBridge
 
-    bridge = VizDoomBridge(scenario="defend_the_line.cfg")
-    runner = EpisodeRunner(bridge)
+        bridge = VecVizDoomBridge(vec_envs, scenario="defend_the_line.cfg")
+    elif workers <= 1:
+        bridge = VizDoomBridge(scenario="defend_the_line.cfg")
+        runner = EpisodeRunner(bridge)
 
     # Randomize genome execution order
     genome_names = list(genomes.keys())
     exec_rng = _random_module.Random(gen_number * 1000)
     exec_rng.shuffle(genome_names)
+    logger.info("Execution order: %s", ", ".join(genome_names))
+    runs = genome_runs(experiment_id, genomes, seeds)
+    run_index = {run.condition: i for i, run in enumerate(runs)}
 
     gen_start = time.monotonic()
     completed = 0
     skipped = 0
 
-    try:
-        for g_idx, genome_name in enumerate(genome_names, start=1):
-            genome_params = genomes[genome_name]
-            action_fn = GenomeAction(**genome_params)
+    def record(result: EpisodeResult) -> None:
+        """Write one finished episode."""
+        nonlocal completed
+        db.write_episode(
+            experiment_id=experiment_id,
+            run_id=f"{experiment_id}-{result.condition}",
+            condition=result.condition,
+            seed=result.seed,
+            episode_number=result.episode_number,
+            metrics=result.metrics_dict(),
+            decision_latency_p99=result.decision_latency_p99,
+            rule_match_rate=result.rule_match_rate,
+            decision_level_counts=result.decision_level_counts,
+        )
 
-            logger.info("-" * 50)
-            logger.info("[%d/%d] Genome: %s", g_idx, len(genome_names), genome_name)
-            logger.info("  Params: %s", json.dumps(genome_params, default=str))
+        completed += 1
 
-            for i, seed in enumerate(seeds):
-                episode_number = i + 1
+    def run_genome(genome_name: str, n_episodes: int) -> None:
+        """Run the first n_episodes seeds of a genome (skipping recorded ones)."""
+        nonlocal skipped
+        genome_params = genomes[genome_name]
+        action_fn = GenomeAction(**genome_params)
 
-                # Resumption check
-                if episode_exists(db._con, experiment_id, genome_name, episode_number):
-                    skipped += 1
-                    continue
+        logger.info("-" * 50)
+        logger.info("Genome: %s (%d episodes)", genome_name, n_episodes)
+        logger.info("  Params: %s", json.dumps(genome_params, default=str))
 
-                action_fn.reset(seed=seed)
+        for i, seed in enumerate(seeds[:n_episodes]):
+            episode_number = i + 1
 
-                result = runner.run_episode(
-                    seed=seed,
-                    condition=genome_name,
-                    episode_number=episode_number,
-                    action_fn=action_fn,
-                )
+            # Resumption check
+            if done.contains(genome_name, episode_number):
+                skipped += 1
+                continue
 
-                metrics = {
-                    "survival_time": result.metrics.survival_time,
-                    "kills": result.metrics.kills,
-                    "damage_dealt": result.metrics.damage_dealt,
-                    "damage_taken": result.metrics.damage_taken,
-                    "ammo_efficiency": result.metrics.ammo_efficiency,
-                    "exploration_coverage": result.metrics.exploration_coverage,
-                    "total_ticks": result.metrics.total_ticks,
-                    "shots_fired": result.metrics.shots_fired,
-                    "hits": result.metrics.hits,
-                    "cells_visited": result.metrics.cells_visited,
-                }
-
-                level_counts: dict[str, int] = {}
-                for level in result.decision_levels:
-                    key = str(level)
-                    level_counts[key] = level_counts.get(key, 0) + 1
-
-                db.write_episode(
-                    experiment_id=experiment_id,
-                    run_id=f"{experiment_id}-{genome_name}",
-                    condition=genome_name,
-                    seed=seed,
-                    episode_number=episode_number,
-                    metrics=metrics,
-                    decision_latency_p99=result.decision_latency_p99,
-                    rule_match_rate=result.rule_match_rate,
-                    decision_level_counts=level_counts,
+            action_fn.reset(seed=seed)
+
+            result = runner.run_episode(
+                seed=seed,
+                condition=genome_name,
+                episode_number=episode_number,
+                action_fn=action_fn,
+            )
+            record(result)
+
+            if episode_number == 1 or i == len(seeds) - 1 or (i + 1) % 10 == 0:
+                logger.info(
+                    "  [%s] ep %d/%d  seed=%d  kills=%d  survival=%.1fs",
+                    genome_name, i + 1, len(seeds), seed,
+                    result.metrics.kills, result.metrics.survival_time,
                 )
 
-                completed += 1
+        logger.info("  Genome %s complete", genome_name)
+
+    def run_genomes_vec(names: list[str], n_episodes: int) -> None:
+        """Run the first n_episodes seeds of each genome side by side."""
+        nonlocal skipped
+        episode_of = {seed: i + 1 for i, seed in enumerate(seeds[:n_episodes])}
+        pending = []
+        for name in names:
+            todo = [s for s, ep in episode_of.items() if not done.contains(name, ep)]
+            skipped += n_episodes - len(todo)
+            pending.append(todo)
+        action_fns = [GenomeAction(**genomes[name]) for name in names]
+        logger.info("Genomes %s side by side (%d envs)", ", ".join(names), vec_envs)
+        for name, finished in zip(names, bridge.run_policies(action_fns, pending)):
+            for ep in finished:
+                record(ep.to_result(name, episode_of[ep.seed]))
+
+    def run_genomes(names: list[str], n_episodes: int) -> None:
+        """Run the first n_episodes seeds of each genome, in ``names`` order."""
+        nonlocal completed, skipped
+        if vec_envs > 1:
+            for start in range(0, len(names), vec_envs):
+                run_genomes_vec(names[start:start + vec_envs], n_episodes)
+            return
+        if workers <= 1:
+            for name in names:
+                run_genome(name, n_episodes)
+            return
+        tasks = []
+        for name in names:
+            for i, seed in enumerate(seeds[:n_episodes]):
+                if done.contains(name, i + 1):
+                    skipped += 1
+                else:
+                    tasks.append(EpisodeTask(run_index[name], seed, i + 1))
+        completed += run_episode_tasks(db, experiment_id, runs, tasks, workers)
 
-                if episode_number == 1 or i == len(seeds) - 1 or (i + 1) % 10 == 0:
-                    logger.info(
-                        "  [%s] ep %d/%d  seed=%d  kills=%d  survival=%.1fs",
-                        genome_name, i + 1, len(seeds), seed,
-                        result.metrics.kills, result.metrics.survival_time,
-                    )
+    def evaluate(names: list[str], budget: int) -> dict[str, dict]:
+        run_genomes(names, budget)
+        return db.condition_means(experiment_id, budget)
 
-            logger.info("  Genome %s complete", genome_name)
+    def score(stats: dict[str, dict]) -> dict[str, float]:
+        ranked = compute_topsis([
+            {"name": name, "genome": genomes[name], **s} for name, s in stats.items()
+        ])
+        return {r.name: r.c_i for r in ranked}
 
+    race_result: RaceResult | None = None
+    try:
+        if racing is None:
+            run_genomes(genome_names, len(seeds))
+        else:
+            race_result = race(genome_names, len(seeds), evaluate, score, racing)
+            db.write_race(experiment_id, race_result, racing.rule())
+            for rung in race_result.rungs:
+                logger.info(
+                    "  Rung %d (%d episodes): eliminated %s",
+                    rung.rung, rung.budget, ", ".join(rung.eliminated) or "-",
+                )
+            logger.info(
+                "  Racing used %d of %d episodes",
+                race_result.episodes, len(genome_names) * len(seeds),
+            )
     finally:
-        bridge.close()
+        if bridge is not None:
+            bridge.close()
+        # Persist completed episodes even if the generation was interrupted
+        db.flush()
 
     elapsed = time.monotonic() - gen_start
     logger.info("=" * 70)
@@ -505,6 +662,7 @@ def execute_generation(
     logger.info("=" * 70)
 
     db.close()
+    return race_result
 
 
 # ---------------------------------------------------------------------------
@@ -516,17 +674,37 @@ def run_evolution(
     max_gen: int = 5,
     db_path: Path = DEFAULT_DB_PATH,
     dry_run: bool = False,
+    racing: RacingSchedule | None = None,
+    workers: int = 1,
+    surrogate_oversample: int = 1,
+    vec_envs: int = 1,
 ) -> None:
     """Run the full generational evolution from Gen 2 to max_gen.
 
     Reads Gen 1 results from DuckDB, computes TOPSIS, breeds Gen 2,
-    executes, evaluates, breeds Gen 3, etc.
+    executes, evaluates, breeds Gen 3, etc. A generation evaluated by
+    racing is ranked by its recorded race instead (eliminated genomes
+    have partial data, so a TOPSIS over all of them would mix budgets).
+
+    With surrogate_oversample > 1, each offspring slot is bred that many
+    times and a surrogate fitted on all recorded genomes picks the one to
+    evaluate (screen_next_generation); its predictions are compared with
+    the realized fitness once the generation has run.
 
     Convergence: stops if elite genome is identical for 2 consecutive generations.
     """
     import duckdb
 
+    from glue.duckdb_writer import DuckDBWriter
+
     evo_rng = _random_module.Random(20260209)
+    screening = surrogate_oversample > 1
+
+    if screening and not dry_run:
+        # Gen 1 may predate genome registration
+        db = DuckDBWriter(db_path=db_path)
+        db.write_genomes("DOE-021", "genome", GEN1_GENOMES)
+        db.close()
 
     con = duckdb.connect(str(db_path))
 
@@ -566,8 +744,15 @@ def run_evolution(
 
         # Compute TOPSIS
         ranked = compute_topsis(stats)
-
-        logger.info("TOPSIS Rankings for %s:", current_experiment_id)
+        race_order = fetch_race_ranking(con, current_experiment_id)
+        if race_order:
+            by_name = {r.name: r for r in ranked}
+            ranked = [by_name[name] for name in race_order if name in by_name]
+
+        logger.info(
+            "%s Rankings for %s:",
+            "Racing" if race_order else "TOPSIS", current_experiment_id,
+        )
         for i, r in enumerate(ranked):
             logger.info(
                 "  #%d: %s  C_i=%.4f  (kills=%.1f, kill_rate=%.2f, survival=%.1f)",
@@ -588,8 +773,21 @@ def run_evolution(
             break
         prev_elite_genome = copy.deepcopy(elite_genome)
 
+        # Close before writing (DuckDBWriter opens its own connection)
+        con.close()
+
         # Create next generation
-        next_genomes = create_next_generation(parents, evo_rng, gen)
+        if screening:
+            db = DuckDBWriter(db_path=db_path)
+            record_surrogate_accuracy(db, current_experiment_id, ranked, dry_run)
+            next_genomes, predictions = screen_next_generation(
+                parents, evo_rng, gen, db, surrogate_oversample
+            )
+            if predictions and not dry_run:
+                db.write_surrogate_predictions(f"DOE-021_gen{gen}", predictions)
+            db.close()
+        else:
+            next_genomes = create_next_generation(parents, evo_rng, gen)
 
         logger.info("Gen %d genomes:", gen)
         for name, params in next_genomes.items():
@@ -599,14 +797,15 @@ def run_evolution(
         seeds = make_seed_set(gen)
 
         # Execute
-        con.close()  # Close before execution (DuckDBWriter opens its own connection)
-
         execute_generation(
             gen_number=gen,
             genomes=next_genomes,
             seeds=seeds,
             db_path=db_path,
             dry_run=dry_run,
+            racing=racing,
+            workers=workers,
+            vec_envs=vec_envs,
         )
 
         # Reopen connection for next iteration
@@ -634,6 +833,10 @@ def run_evolution(
         final_stats = [s for s in final_stats if "genome" in s]
         if final_stats:
             final_ranked = compute_topsis(final_stats)
+            race_order = fetch_race_ranking(con, current_experiment_id)
+            if race_order:
+                by_name = {r.name: r for r in final_ranked}
+                final_ranked = [by_name[n] for n in race_order if n in by_name]
             logger.info("Final TOPSIS Rankings (%s):", current_experiment_id)
             for i, r in enumerate(final_ranked):
                 logger.info(
@@ -644,6 +847,11 @@ def run_evolution(
             logger.info("Best genome: %s", json.dumps(final_ranked[0].genome, default=str))
     con.close()
 
+    if screening and final_stats:
+        db = DuckDBWriter(db_path=db_path)
+        record_surrogate_accuracy(db, current_experiment_id, final_ranked, dry_run)
+        db.close()
+
 
 # ---------------------------------------------------------------------------
 # CLI entry point
@@ -666,17 +874,62 @@ def main() -> None:
         "--dry-run", action="store_true",
         help="Print genomes without executing episodes",
     )
+    parser.add_argument(
+        "--racing", action="store_true",
+        help="Evaluate genomes by successive halving instead of the full seed set",
+    )
+    parser.add_argument(
+        "--racing-initial", type=int, default=5,
+        help="Episodes per genome in the first racing rung (default: 5)",
+    )
+    parser.add_argument(
+        "--racing-eta", type=int, default=2,
+        help="Racing budget multiplier; keeps the top 1/eta per rung (default: 2)",
+    )
+    parser.add_argument(
+        "--workers", type=int, default=1,
+        help="Worker processes for episode execution (default: 1 = serial, "
+        "0 = one per CPU core)",
+    )
+    parser.add_argument(
+        "--vec-envs", type=int, default=1,
+        help="Play up to this many genomes side by side in one process "
+        "(default: 1; cannot be combined with --workers)",
+    )
+    parser.add_argument(
+        "--surrogate", action="store_true",
+        help="Pre-screen over-generated offspring with a surrogate model",
+    )
+    parser.add_argument(
+        "--surrogate-oversample", type=int, default=4,
+        help="Offspring candidates bred per slot with --surrogate (default: 4)",
+    )
     args = parser.parse_args()
+    if args.vec_envs > 1 and args.workers != 1:
+        parser.error("--vec-envs cannot be combined with --workers")
 
     logging.basicConfig(
         level=logging.INFO,
         format="%(asctime)s %(levelname)s %(message)s",
     )
 
+    workers = args.workers
+    if workers == 0:
+        from glue.episode_pool import default_worker_count
+
+        workers = default_worker_count()
+
     run_evolution(
         max_gen=args.max_gen,
         db_path=args.db_path or DEFAULT_DB_PATH,
         dry_run=args.dry_run,
+        racing=(
+            RacingSchedule(initial_episodes=args.racing_initial, eta=args.racing_eta)
+            if args.racing else None
+        ),
+        workers=workers,
+        surrogate_oversample=args.surrogate_oversample if args.surrogate else 1,
+        vec_envs=args.vec_envs,
     )
 
 
@@ -0,0 +1,318 @@
+"""Declarative DOE design files compiled into cached design matrices.
+
+A design file (TOML or JSON) states an experiment as data -- factors and
+levels, seed formula, center-point blocking and run order -- instead of a
+hand-written ``build_doeXXX_config`` function. compile_design() expands it
+into the same ExperimentConfig the builders return; load_design() caches
+the expansion as a JSON artifact named by the design's content hash, so
+executors and analyzers load a design without recompiling it and an
+edited design can never be served from a stale artifact.
+
+Design keys::
+
+    experiment_id = "DOE-005"
+    scenario = "defend_the_center.cfg"     # ExperimentConfig.scenario
+    design = "full_factorial"              # | "central_composite" | "explicit"
+    order = ["R4", "CP1", "R2", ...]       # or {shuffle_seed = 4401}; default: standard order
+
+    [seeds]                                # seed_i = base + i * step, i=0..n-1
+    base = 2501
+    step = 23
+    n = 30
+    formula = "..."                        # optional; overrides the generated text
+
+    [factors]                              # full_factorial: level lists
+    memory_weight = [0.7, 0.9]             # central_composite: {center, step}
+
+    [run]                                  # RunConfig fields shared by all runs;
+    condition = "memory={memory_weight}"   # strings are formatted with the levels
+
+    [center_points]
+    count = 3
+    seed_blocks = true                     # split the seeds into `count` blocks (default)
+    levels = {memory_weight = 0.8}         # default: midpoint of each factor
+
+Factors named after RunConfig fields (memory_weight, action_type, ...) set
+those fields directly; other factors only feed the ``[run]`` templates
+(e.g. ``action_type = "ar_{ratio}"``). ``design = "explicit"`` takes a
+``[[runs]]`` array of tables with a ``label`` plus RunConfig fields.
+
+Factorial runs are labelled R1..Rn in standard (Yates) order: the first
+factor varies fastest. Central composite designs add 2k axial runs
+(A1..A2k, run_type "axial") at +/-alpha coded units.
+"""
+
+from __future__ import annotations
+
+import copy
+import dataclasses
+import hashlib
+import itertools
+import json
+import os
+import random
+from pathlib import Path
+from typing import Any, Optional
+
+from glue.doe_executor import DEFAULT_DB_PATH, ExperimentConfig, RunConfig
+
+# Bump when compile_design() output changes for the same design
+COMPILER_VERSION = 2
+
+DEFAULT_DESIGN_CACHE = Path("data/design_cache")
+DESIGN_DIR = Path(__file__).parent / "designs"
+
+_RUN_FIELDS = {f.name for f in dataclasses.fields(RunConfig)}
+_DERIVED_FIELDS = {"run_id", "run_label", "seeds", "run_type", "episode_offset"}
+
+# Level precision; keeps midpoints like (0.7 + 0.9) / 2 at 0.8
+_LEVEL_DIGITS = 10
+
+
+def read_design(path: Path | str) -> dict[str, Any]:
+    """Parse a ``.toml`` or ``.json`` design file."""
+    path = Path(path)
+    if path.suffix == ".toml":
+        import tomllib
+
+        with open(path, "rb") as f:
+            return tomllib.load(f)
+    if path.suffix == ".json":
+        return json.loads(path.read_text())
+    raise ValueError(f"Unsupported design file type: {path}")
+
+
+def design_hash(design: dict[str, Any]) -> str:
+    """Content hash of a design (and the compiler version)."""
+    canonical = json.dumps(
+        {"compiler": COMPILER_VERSION, "design": design},
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+# ---------------------------------------------------------------------------
+# Compilation
+# ---------------------------------------------------------------------------
+
+
+def _seed_set(spec: dict[str, Any]) -> tuple[list[int], str]:
+    if "list" in spec:
+        seeds = [int(s) for s in spec["list"]]
+        return seeds, spec.get("formula", "explicit seed list")
+    base, step, n = int(spec["base"]), int(spec["step"]), int(spec["n"])
+    seeds = [base + i * step for i in range(n)]
+    formula = spec.get("formula", f"seed_i = {base} + i * {step}, i=0..{n - 1}")
+    return seeds, formula
+
+
+def _level(value: Any) -> Any:
+    return round(value, _LEVEL_DIGITS) if isinstance(value, float) else value
+
+
+def _standard_order(factors: dict[str, list]) -> list[dict[str, Any]]:
+    """Full factorial in Yates order (first factor varies fastest)."""
+    names = list(factors)
+    points = itertools.product(*(factors[name] for name in reversed(names)))
+    return [dict(zip(names, reversed(point))) for point in points]
+
+
+def _central_composite(
+    factors: dict[str, dict[str, float]], alpha: Any
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]], dict[str, Any]]:
+    """Corner, axial and center points of a central composite design."""
+    names = list(factors)
+    k = len(names)
+    if alpha == "rotatable":
+        alpha = (2 ** k) ** 0.25
+    elif alpha == "face":
+        alpha = 1.0
+    alpha = float(alpha)
+
+    def actual(name: str, coded: float) -> Any:
+        spec = factors[name]
+        return _level(spec["center"] + coded * spec["step"])
+
+    corners = [
+        {name: actual(name, coded) for name, coded in point.items()}
+        for point in _standard_order({name: [-1.0, 1.0] for name in names})
+    ]
+    axial = []
+    for name in names:
+        for coded in (-alpha, alpha):
+            point = {other: actual(other, 0.0) for other in names}
+            point[name] = actual(name, coded)
+            axial.append(point)
+    center = {name: actual(name, 0.0) for name in names}
+    return corners, axial, center
+
+
+def _make_run(
+    exp_id: str,
+    label: str,
+    run_type: str,
+    seeds: list[int],
+    template: dict[str, Any],
+    levels: dict[str, Any],
+) -> RunConfig:
+    fields: dict[str, Any] = {"memory_weight": 0.5, "strength_weight": 0.5}
+    for key, value in template.items():
+        fields[key] = value.format(**levels) if isinstance(value, str) else copy.deepcopy(value)
+    fields.update((k, v) for k, v in levels.items() if k in _RUN_FIELDS)
+    if "condition" not in fields:
+        fields["condition"] = "_".join(f"{k}={v}" for k, v in levels.items())
+    unknown = set(fields) - _RUN_FIELDS
+    if unknown:
+        raise ValueError(f"{exp_id} {label}: unknown RunConfig fields {sorted(unknown)}")
+    return RunConfig(
+        run_id=f"{exp_id}-{label}",
+        run_label=label,
+        seeds=list(seeds),
+        run_type=run_type,
+        **fields,
+    )
+
+
+def _seed_blocks(seeds: list[int], count: int) -> list[list[int]]:
+    size, rem = divmod(len(seeds), count)
+    if rem:
+        raise ValueError(f"{len(seeds)} seeds cannot be split into {count} equal blocks")
+    return [seeds[i * size:(i + 1) * size] for i in range(count)]
+
+
+def compile_design(design: dict[str, Any], db_path: Optional[Path] = None) -> ExperimentConfig:
+    """Expand a design into an ExperimentConfig (runs in execution order)."""
+    exp_id = design["experiment_id"]
+    kind = design.get("design", "full_factorial")
+    seeds, formula = _seed_set(design["seeds"])
+    template = dict(design.get("run", {}))
+    derived = _DERIVED_FIELDS & set(template)
+    if derived:
+        raise ValueError(f"{exp_id}: [run] cannot set {sorted(derived)}")
+
+    runs: list[RunConfig] = []
+    center: Optional[dict[str, Any]] = None
+    if kind == "full_factorial":
+        factors = {name: [_level(v) for v in levels] for name, levels in design["factors"].items()}
+        for i, levels in enumerate(_standard_order(factors), start=1):
+            runs.append(_make_run(exp_id, f"R{i}", "factorial", seeds, template, levels))
+        center = {
+            name: _level(sum(levels) / len(levels))
+            for name, levels in factors.items()
+            if all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in levels)
+        }
+    elif kind == "central_composite":
+        corners, axial, center = _central_composite(
+            design["factors"], design.get("alpha", "rotatable")
+        )
+        for i, levels in enumerate(corners, start=1):
+            runs.append(_make_run(exp_id, f"R{i}", "factorial", seeds, template, levels))
+        for i, levels in enumerate(axial, start=1):
+            runs.append(_make_run(exp_id, f"A{i}", "axial", seeds, template, levels))
+    elif kind == "explicit":
+        for spec in design["runs"]:
+            spec = dict(spec)
+            label = spec.pop("label")
+            run_type = spec.pop("run_type", "factorial")
+            runs.append(_make_run(exp_id, label, run_type, seeds, {**template, **spec}, {}))
+    else:
+        raise ValueError(f"{exp_id}: unknown design type {kind!r}")
+
+    cp = design.get("center_points")
+    if cp:
+        count = int(cp.get("count", 1))
+        levels = {**(center or {}), **cp.get("levels", {})}
+        if not cp.get("seed_blocks", True) and count > 1:
+            raise ValueError(
+                f"{exp_id}: {count} center points without seed_blocks would replay "
+                f"the same seeds; use seed_blocks = true"
+            )
+        blocks = _seed_blocks(seeds, count)
+        for i, block in enumerate(blocks, start=1):
+            runs.append(_make_run(exp_id, f"CP{i}", "center", block, template, levels))
+
+    return ExperimentConfig(
+        experiment_id=exp_id,
+        runs=_ordered(exp_id, runs, design.get("order")),
+        seed_set=seeds,
+        seed_formula=formula,
+        scenario=design.get("scenario", "defend_the_center.cfg"),
+        db_path=db_path or DEFAULT_DB_PATH,
+    )
+
+
+def _ordered(exp_id: str, runs: list[RunConfig], order: Any) -> list[RunConfig]:
+    """Apply the design's randomized run order."""
+    if order is None:
+        return runs
+    if isinstance(order, dict):
+        shuffled = list(runs)
+        random.Random(order["shuffle_seed"]).shuffle(shuffled)
+        return shuffled
+    by_label = {run.run_label: run for run in runs}
+    if sorted(order) != sorted(by_label):
+        raise ValueError(
+            f"{exp_id}: order {order} does not list each run exactly once "
+            f"({sorted(by_label)})"
+        )
+    return [by_label[label] for label in order]
+
+
+# ---------------------------------------------------------------------------
+# Cached artifacts
+# ---------------------------------------------------------------------------
+
+
+def config_to_artifact(config: ExperimentConfig, digest: str) -> dict[str, Any]:
+    return {
+        "compiler": COMPILER_VERSION,
+        "design_hash": digest,
+        "experiment_id": config.experiment_id,
+        "scenario": config.scenario,
+        "seed_set": config.seed_set,
+        "seed_formula": config.seed_formula,
+        "runs": [dataclasses.asdict(run) for run in config.runs],
+    }
+
+
+def config_from_artifact(
+    artifact: dict[str, Any], db_path: Optional[Path] = None
+) -> ExperimentConfig:
+    return ExperimentConfig(
+        experiment_id=artifact["experiment_id"],
+        runs=[RunConfig(**run) for run in artifact["runs"]],
+        seed_set=artifact["seed_set"],
+        seed_formula=artifact["seed_formula"],
+        scenario=artifact["scenario"],
+        db_path=db_path or DEFAULT_DB_PATH,
+    )
+
+
+def load_design(
+    path: Path | str,
+    cache_dir: Optional[Path] = DEFAULT_DESIGN_CACHE,
+    db_path: Optional[Path] = None,
+) -> ExperimentConfig:
+    """ExperimentConfig for a design file, via its hashed artifact.
+
+    The artifact ``<cache_dir>/<experiment_id>-<hash>.json`` is written on
+    first use and reused while the design is unchanged. ``cache_dir=None``
+    compiles without caching.
+    """
+    design = read_design(path)
+    if cache_dir is None:
+        return compile_design(design, db_path)
+    digest = design_hash(design)
+    artifact_path = Path(cache_dir) / f"{design['experiment_id']}-{digest[:16]}.json"
+    if artifact_path.exists():
+        artifact = json.loads(artifact_path.read_text())
+        if artifact.get("design_hash") == digest:
+            return config_from_artifact(artifact, db_path)
+
+    config = compile_design(design, db_path)
+    artifact_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = artifact_path.with_suffix(f".{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(config_to_artifact(config, digest), indent=1))
+    os.replace(tmp, artifact_path)
+    return config
@@ -12,6 +12,8 @@ Design:
     2. build_doe005_config() constructs the DOE-005 specific design
     3. execute_experiment() orchestrates VizDoom episodes in randomized run order
     4. Supports resumption: skips already-completed episodes via DuckDBWriter
+    5. --sequential runs in stages and stops conditions whose comparisons
+       are resolved (glue.analysis.sequential), recording the decisions
 """
 
 from __future__ import annotations
@@ -20,8 +22,16 @@ import argparse
 import logging
 import sys
 import time
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
+from functools import partial
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+from glue.action_registry import close_policy, policy_for_run
+
+if TYPE_CHECKING:
+    from glue.analysis.sequential import SequentialPlan
+    from glue.racing import RacingSchedule
 
 logger = logging.getLogger(__name__)
 
@@ -49,6 +59,41 @@ class RunConfig:
     num_actions: int = 3  # Number of available actions (3 or 5)
     genome_params: dict | None = None  # For genome-based action functions (DOE-021+)
     doom_skill: int = 3  # Difficulty level (1=Easy, 2=Normal, 3=Hard, 4=Very Hard, 5=Nightmare)
+    episode_offset: int | None = None  # Episodes before this block of the condition (set by ExperimentConfig)
+
+
+def _block_index(run: RunConfig) -> int:
+    digits = run.run_label.lstrip("ABCDEFGHIJKLMNOPQRSTUVWXYZ")
+    return int(digits) if digits.isdigit() else 0
+
+
+def assign_episode_offsets(runs: list[RunConfig]) -> list[RunConfig]:
+    """Set episode_offset on runs sharing a condition (center-point blocks).
+
+    Blocks of a condition are numbered consecutively in label order (CP1,
+    CP2, ...): each starts after the running total of the earlier blocks'
+    seeds. Runs that already carry an offset (e.g. the truncated stages of
+    a sequential experiment) keep it. Raises ValueError when two runs would
+    still write the same (condition, episode_number).
+    """
+    by_condition: dict[str, list[int]] = {}
+    for idx, run in enumerate(runs):
+        by_condition.setdefault(run.condition, []).append(idx)
+
+    out = list(runs)
+    for condition, indices in by_condition.items():
+        total = 0
+        for idx in sorted(indices, key=lambda i: (_block_index(runs[i]), i)):
+            run = runs[idx]
+            if run.episode_offset is None:
+                out[idx] = replace(run, episode_offset=total)
+            total = max(total, out[idx].episode_offset + len(run.seeds))
+        numbers = [
+            _episode_number(out[idx], i) for idx in indices for i in range(len(out[idx].seeds))
+        ]
+        if len(numbers) != len(set(numbers)):
+            raise ValueError(f"runs of condition {condition!r} share episode numbers")
+    return out
 
 
 @dataclass
@@ -62,6 +107,9 @@ class ExperimentConfig:
     scenario: str = "defend_the_center.cfg"
     db_path: Path = field(default_factory=lambda: DEFAULT_DB_PATH)
 
+    def __post_init__(self) -> None:
+        self.runs = assign_episode_offsets(self.runs)
+
 
 # ---------------------------------------------------------------------------
 # DOE-005 configuration builder
@@ -1071,59 +1119,57 @@ def build_doe022_config(db_path=None):
 # ---------------------------------------------------------------------------
 
 
-def execute_experiment(config: ExperimentConfig) -> None:
+def _episode_number(run: RunConfig, i: int) -> int:
+    """Episode number for the i-th seed of a run (1-indexed).
+
+    Center-point blocks share a condition; each continues after the earlier
+    blocks (episode_offset, see assign_episode_offsets).
+    """
+    return (run.episode_offset or 0) + i + 1
+
+
+def execute_experiment(
+    config: ExperimentConfig,
+    workers: int = 1,
+    trace: bool = False,
+    trace_dir: Path | None = None,
+    strategy_docs: Path | None = None,
+    sequential: SequentialPlan | None = None,
+) -> None:
     """Execute a full DOE experiment with real VizDoom episodes.
 
     Args:
         config: Complete experiment configuration with runs in execution order.
+        workers: Number of worker processes. With workers > 1, episodes are
+            executed by an EpisodePool (one VizDoom instance per process) and
+            written to DuckDB by this process only.
+        trace: Record per-decision encounter traces into the encounters table.
+        trace_dir: Write traces as Parquet partitions under this directory
+            instead (implies trace).
+        strategy_docs: Directory of ``<index_name>.json`` strategy documents
+            served in-process to L2 policies instead of OpenSearch.
+        sequential: Run in stages with interim analyses and stop allocating
+            episodes to conditions whose comparisons are resolved.
 
     Raises:
         RuntimeError: If VizDoom fails to initialize.
     """
+    trace = trace or trace_dir is not None
+    if sequential is not None:
+        _execute_experiment_sequential(
+            config, sequential, workers, trace, trace_dir, strategy_docs
+        )
+        return
+    if workers > 1:
+        _execute_experiment_parallel(config, workers, trace, trace_dir, strategy_docs)
+        return
+
     # Defer heavy imports so --help works without dependencies
-    from glue.action_functions import (
-        Adaptive5Action,
-        AdaptiveAggression7Action,
-        AdaptiveKillAction,
-        AggressiveAdaptiveAction,
-        AttackOnlyAction,
-        AttackRatioAction,
-        AttackRatioActionRaw,
-        Burst1Action,
-        Burst3Action,
-        Burst3ThresholdAction,
-        Burst5Action,
-        Burst7Action,
-        BurstAdvance7Action,
-        BurstCycleAction,
-        CompoundAttackTurnAction,
-        CompoundBurst3Action,
-        DodgeBurst3Action,
-        ForwardAttackAction,
-        ForwardBiased7Action,
-        FullAgentAction,
-        Genome5Action,
-        GenomeAction,
-        L0MemoryAction,
-        L0StrengthAction,
-        L2MetaStrategyAction,
-        L2MetaStrategy5Action,
-        L2RagAction,
-        PureAttackAction,
-        Random5Action,
-        Random7Action,
-        Random9Action,
-        RandomRotation5Action,
-        RandomSelectAction,
-        Smart5Action,
-        StrafeBurst3Action,
-        StrafeDodge7Action,
-        SurvivalBurstAction,
-        SweepLRAction,
-        random_action,
-        rule_only_action,
+    from glue.duckdb_writer import (
+        DEFAULT_BUFFER_SIZE,
+        DEFAULT_FLUSH_INTERVAL,
+        DuckDBWriter,
     )
-    from glue.duckdb_writer import DuckDBWriter
     from glue.episode_runner import EpisodeRunner
     from glue.vizdoom_bridge import VizDoomBridge
 
@@ -1152,7 +1198,11 @@ def execute_experiment(config: ExperimentConfig) -> None:
         raise RuntimeError(f"VizDoom init failed: {exc}") from exc
 
     runner = EpisodeRunner(bridge)
-    db = DuckDBWriter(db_path=config.db_path)
+    db = DuckDBWriter(
+        db_path=config.db_path,
+        buffer_size=DEFAULT_BUFFER_SIZE,
+        flush_interval=DEFAULT_FLUSH_INTERVAL,
+    )
 
     # Register seed set
     db.write_seed_set(
@@ -1160,16 +1210,30 @@ def execute_experiment(config: ExperimentConfig) -> None:
         seed_set=config.seed_set,
         formula=config.seed_formula,
     )
+    _register_genomes(db, config)
     logger.info(
         "Seed set registered: n=%d, formula=%s",
         len(config.seed_set),
         config.seed_formula,
     )
 
+    # Completed episodes, loaded once (resumption)
+    done = db.completion_index(config.experiment_id)
+    if len(done):
+        logger.info("Resuming: %d episodes already recorded", len(done))
+
+    recorder = None
+    if trace:
+        # numpy-backed; only needed when tracing
+        from glue.trace_recorder import TraceRecorder
+
+        recorder = TraceRecorder(config.experiment_id)
+
     experiment_start = time.monotonic()
     completed_episodes = 0
     skipped_episodes = 0
 
+    action_fn = None
     try:
         for run_idx, run in enumerate(config.runs, start=1):
             logger.info("-" * 50)
@@ -1186,9 +1250,7 @@ def execute_experiment(config: ExperimentConfig) -> None:
             )
 
             # Check for resumption
-            existing = db.get_episode_count(
-                config.experiment_id, run.condition
-            )
+            existing = done.count(run.condition)
 
             # For center points sharing the same condition, we need to
             # count episodes relative to this specific run's seed subset.
@@ -1201,8 +1263,8 @@ def execute_experiment(config: ExperimentConfig) -> None:
 
             if run.run_type == "center":
                 # For center points: check if all seeds for this run are done
-                # by querying specific seed values
-                run_done = _count_run_episodes(db, config.experiment_id, run)
+                # by matching specific seed values
+                run_done = done.count_seeds(run.condition, run.seeds)
                 if run_done >= len(run.seeds):
                     skipped_episodes += len(run.seeds)
                     logger.info(
@@ -1242,134 +1304,16 @@ def execute_experiment(config: ExperimentConfig) -> None:
                 current_num_actions = run_num_actions
                 current_doom_skill = run_doom_skill
 
-            # Create action function based on run's action_type
-            if run.action_type == "random":
-                action_fn = random_action
-            elif run.action_type == "rule_only":
-                action_fn = rule_only_action
-            elif run.action_type == "l0_memory":
-                action_fn = L0MemoryAction()
-            elif run.action_type == "l0_strength":
-                action_fn = L0StrengthAction()
-            elif run.action_type == "sweep_lr":
-                action_fn = SweepLRAction()
-            elif run.action_type == "burst_3":
-                action_fn = Burst3Action()
-            elif run.action_type == "burst_5":
-                action_fn = Burst5Action()
-            elif run.action_type == "random_5":
-                action_fn = Random5Action()
-            elif run.action_type == "strafe_burst_3":
-                action_fn = StrafeBurst3Action()
-            elif run.action_type == "smart_5":
-                action_fn = Smart5Action()
-            elif run.action_type == "adaptive_5":
-                action_fn = Adaptive5Action()
-            elif run.action_type == "dodge_burst_3":
-                action_fn = DodgeBurst3Action()
-            elif run.action_type == "survival_burst":
-                action_fn = SurvivalBurstAction()
-            elif run.action_type == "compound_attack_turn":
-                action_fn = CompoundAttackTurnAction()
-            elif run.action_type == "compound_burst_3":
-                action_fn = CompoundBurst3Action()
-            elif run.action_type == "burst_1":
-                action_fn = Burst1Action()
-            elif run.action_type == "burst_7":
-                action_fn = Burst7Action()
-            elif run.action_type == "attack_only":
-                action_fn = AttackOnlyAction()
-            elif run.action_type.startswith("burst3_threshold_"):
-                threshold = int(run.action_type.split("_")[-1])
-                action_fn = Burst3ThresholdAction(health_threshold=threshold)
-            elif run.action_type == "random_7":
-                action_fn = Random7Action()
-            elif run.action_type == "random_9":
-                action_fn = Random9Action()
-            elif run.action_type == "forward_attack":
-                action_fn = ForwardAttackAction()
-            elif run.action_type == "adaptive_kill":
-                action_fn = AdaptiveKillAction()
-            elif run.action_type == "aggressive_adaptive":
-                action_fn = AggressiveAdaptiveAction()
-            elif run.action_type == "genome":
-                action_fn = GenomeAction(**run.genome_params)
-            elif run.action_type == "l2_rag_good":
-                action_fn = L2RagAction(
-                    opensearch_url="http://opensearch:9200",
-                    index_name="strategies_high",
-                    k=5,
-                )
-            elif run.action_type == "l2_rag_random":
-                action_fn = L2RagAction(
-                    opensearch_url="http://opensearch:9200",
-                    index_name="strategies_low",
-                    k=5,
-                )
-            elif run.action_type == "l2_meta_select":
-                action_fn = L2MetaStrategyAction(
-                    opensearch_url="http://opensearch:9200",
-                    index_name="strategies_meta",
-                    k=5,
-                )
-            elif run.action_type == "random_select":
-                action_fn = RandomSelectAction()
-            elif run.action_type == "l2_meta_5action":
-                action_fn = L2MetaStrategy5Action(
-                    opensearch_url="http://opensearch:9200",
-                    index_name="strategies_meta_5action",
-                    k=5,
-                )
-            elif run.action_type == "random_rotation_5":
-                action_fn = RandomRotation5Action()
-            elif run.action_type.startswith("ar_"):
-                ratio = int(run.action_type.split("_")[1]) / 100.0
-                action_fn = AttackRatioAction(attack_ratio=ratio)
-            elif run.action_type.startswith("cycle_"):
-                burst_len = int(run.action_type.split("_")[1])
-                action_fn = BurstCycleAction(burst_length=burst_len)
-            elif run.action_type == "rand50_raw":
-                action_fn = AttackRatioActionRaw(attack_ratio=0.5)
-            elif run.action_type == "attack_ovr":
-                action_fn = PureAttackAction(health_override=True)
-            elif run.action_type == "attack_raw":
-                action_fn = PureAttackAction(health_override=False)
-            elif run.action_type == "forward_biased_7":
-                action_fn = ForwardBiased7Action()
-            elif run.action_type == "strafe_dodge_7":
-                action_fn = StrafeDodge7Action()
-            elif run.action_type == "burst_advance_7":
-                action_fn = BurstAdvance7Action()
-            elif run.action_type == "adaptive_aggression_7":
-                action_fn = AdaptiveAggression7Action()
-            elif run.action_type == "genome5":
-                action_fn = Genome5Action(**run.genome_params)
-            else:  # "full_agent" (default)
-                action_fn = FullAgentAction(
-                    memory_weight=run.memory_weight,
-                    strength_weight=run.strength_weight,
-                )
+            close_policy(action_fn)
+            action_fn = policy_for_run(run, strategy_docs)
 
             run_start = time.monotonic()
 
             for i, seed in enumerate(run.seeds):
-                episode_number = i + 1
-
-                # For center points, offset episode_number to avoid PK clash.
-                # CP1 uses episodes 1-10, CP2 uses 11-20, CP3 uses 21-30.
-                if run.run_type == "center":
-                    if run.run_label == "CP2":
-                        episode_number = i + 11
-                    elif run.run_label == "CP3":
-                        episode_number = i + 21
+                episode_number = _episode_number(run, i)
 
                 # Skip already-completed episodes (resumption)
-                if _episode_exists(
-                    db,
-                    config.experiment_id,
-                    run.condition,
-                    episode_number,
-                ):
+                if done.contains(run.condition, episode_number):
                     skipped_episodes += 1
                     continue
 
@@ -1384,27 +1328,11 @@ def execute_experiment(config: ExperimentConfig) -> None:
                     condition=run.condition,
                     episode_number=episode_number,
                     action_fn=action_fn,
+                    trace=recorder,
                 )
 
-                # Convert EpisodeResult to DuckDB format
-                metrics = {
-                    "survival_time": result.metrics.survival_time,
-                    "kills": result.metrics.kills,
-                    "damage_dealt": result.metrics.damage_dealt,
-                    "damage_taken": result.metrics.damage_taken,
-                    "ammo_efficiency": result.metrics.ammo_efficiency,
-                    "exploration_coverage": result.metrics.exploration_coverage,
-                    "total_ticks": result.metrics.total_ticks,
-                    "shots_fired": result.metrics.shots_fired,
-                    "hits": result.metrics.hits,
-                    "cells_visited": result.metrics.cells_visited,
-                }
-
-                # Count decision level occurrences
-                level_counts: dict[str, int] = {}
-                for level in result.decision_levels:
-                    key = str(level)
-                    level_counts[key] = level_counts.get(key, 0) + 1
+                if result.trace is not None:
+                    _write_trace(db, result.trace, trace_dir)
 
                 db.write_episode(
                     experiment_id=config.experiment_id,
@@ -1412,10 +1340,10 @@ def execute_experiment(config: ExperimentConfig) -> None:
                     condition=run.condition,
                     seed=seed,
                     episode_number=episode_number,
-                    metrics=metrics,
+                    metrics=result.metrics_dict(),
                     decision_latency_p99=result.decision_latency_p99,
                     rule_match_rate=result.rule_match_rate,
-                    decision_level_counts=level_counts,
+                    decision_level_counts=result.decision_level_counts,
                 )
 
                 completed_episodes += 1
@@ -1441,20 +1369,12 @@ def execute_experiment(config: ExperimentConfig) -> None:
                 run_elapsed,
             )
     finally:
+        close_policy(action_fn)
         bridge.close()
+        # Persist completed episodes even if the run was interrupted
+        db.flush()
 
-    # Verify data integrity
-    logger.info("-" * 50)
-    logger.info("Verifying data integrity...")
-    integrity = db.verify_integrity(config.experiment_id)
-    if integrity["valid"]:
-        logger.info("Data integrity OK")
-    else:
-        logger.warning("Data integrity issues: %s", integrity["issues"])
-
-    for cond, count in sorted(integrity["counts"].items()):
-        logger.info("  %s: %d episodes", cond, count)
-
+    _log_integrity(db, config.experiment_id)
     db.close()
 
     total_elapsed = time.monotonic() - experiment_start
@@ -1470,43 +1390,310 @@ def execute_experiment(config: ExperimentConfig) -> None:
     logger.info("=" * 70)
 
 
-# ---------------------------------------------------------------------------
-# Helper queries for resumption
-# ---------------------------------------------------------------------------
+def _execute_experiment_parallel(
+    config: ExperimentConfig,
+    workers: int,
+    trace: bool = False,
+    trace_dir: Path | None = None,
+    strategy_docs: Path | None = None,
+) -> None:
+    """Execute a DOE experiment on a multi-process EpisodePool.
 
+    Work items are planned up front in randomized run order, skipping
+    episodes that already exist (resumption). Workers own their own
+    VizDoomBridge; this process is the single DuckDB writer.
+    """
+    from glue.duckdb_writer import (
+        DEFAULT_BUFFER_SIZE,
+        DEFAULT_FLUSH_INTERVAL,
+        DuckDBWriter,
+    )
+    from glue.episode_pool import EpisodeTask
 
-def _episode_exists(
-    db: "DuckDBWriter",
-    experiment_id: str,
-    condition: str,
-    episode_number: int,
-) -> bool:
-    """Check if a specific episode already exists in the database."""
-    result = db._con.execute(
-        "SELECT COUNT(*) FROM experiments "
-        "WHERE experiment_id = ? AND condition = ? AND episode_number = ?",
-        [experiment_id, condition, episode_number],
-    ).fetchone()
-    return bool(result and result[0] > 0)
-
-
-def _count_run_episodes(
+    total_episodes = sum(len(r.seeds) for r in config.runs)
+    logger.info("=" * 70)
+    logger.info(
+        "DOE Experiment: %s (%d runs, %d total episodes, %d workers)",
+        config.experiment_id,
+        len(config.runs),
+        total_episodes,
+        workers,
+    )
+    logger.info("=" * 70)
+
+    db = DuckDBWriter(
+        db_path=config.db_path,
+        buffer_size=DEFAULT_BUFFER_SIZE,
+        flush_interval=DEFAULT_FLUSH_INTERVAL,
+    )
+    db.write_seed_set(
+        experiment_id=config.experiment_id,
+        seed_set=config.seed_set,
+        formula=config.seed_formula,
+    )
+    _register_genomes(db, config)
+    logger.info(
+        "Seed set registered: n=%d, formula=%s",
+        len(config.seed_set),
+        config.seed_formula,
+    )
+
+    experiment_start = time.monotonic()
+
+    # Plan remaining work in randomized run order
+    done = db.completion_index(config.experiment_id)
+    tasks: list[EpisodeTask] = []
+    for run_idx, run in enumerate(config.runs):
+        for i, seed in enumerate(run.seeds):
+            episode_number = _episode_number(run, i)
+            if done.contains(run.condition, episode_number):
+                continue
+            tasks.append(EpisodeTask(run_idx, seed, episode_number))
+    skipped_episodes = total_episodes - len(tasks)
+    logger.info(
+        "Planned %d episodes (%d already complete)", len(tasks), skipped_episodes
+    )
+
+    completed_episodes = 0
+    try:
+        completed_episodes = run_episode_tasks(
+            db,
+            config.experiment_id,
+            config.runs,
+            tasks,
+            workers,
+            trace=trace,
+            trace_dir=trace_dir,
+            strategy_docs=strategy_docs,
+        )
+    finally:
+        _log_integrity(db, config.experiment_id)
+        db.close()
+
+    total_elapsed = time.monotonic() - experiment_start
+    logger.info("=" * 70)
+    logger.info(
+        "%s COMPLETE: %d new + %d skipped episodes in %.1fs (%d workers)",
+        config.experiment_id,
+        completed_episodes,
+        skipped_episodes,
+        total_elapsed,
+        workers,
+    )
+    logger.info("  DB: %s", config.db_path)
+    logger.info("=" * 70)
+
+
+def _execute_experiment_sequential(
+    config: ExperimentConfig,
+    plan: SequentialPlan,
+    workers: int = 1,
+    trace: bool = False,
+    trace_dir: Path | None = None,
+    strategy_docs: Path | None = None,
+) -> None:
+    """Execute a DOE experiment with group-sequential early stopping.
+
+    Look k runs the first ceil(n * k / looks) seeds of every run whose
+    condition is still active (earlier seeds are skipped by resumption),
+    then tests the open comparisons on exactly those episodes. Conditions
+    with all comparisons resolved get no further episodes. Every look and
+    stopping decision is written to sequential_looks / sequential_stops.
+    """
+    from glue.analysis.sequential import SequentialMonitor
+    from glue.duckdb_writer import DuckDBWriter
+
+    conditions = list(dict.fromkeys(run.condition for run in config.runs))
+    monitor = SequentialMonitor(plan, conditions)
+    rule = plan.rule()
+    planned = dict.fromkeys(conditions, 0)
+    for run in config.runs:
+        planned[run.condition] += len(run.seeds)
+    scheduled: dict[str, set[int]] = {c: set() for c in conditions}
+    logger.info("Sequential %s: %s", config.experiment_id, rule)
+
+    for look in range(1, plan.looks + 1):
+        active = monitor.active
+        stage_runs = []
+        for run in config.runs:
+            if run.condition not in active:
+                continue
+            n = plan.stage_size(len(run.seeds), look)
+            stage_runs.append(replace(run, seeds=run.seeds[:n]))
+            scheduled[run.condition].update(_episode_number(run, i) for i in range(n))
+        logger.info(
+            "Sequential look %d/%d: %d active conditions, %d runs",
+            look,
+            plan.looks,
+            len(active),
+            len(stage_runs),
+        )
+        execute_experiment(
+            replace(config, runs=stage_runs),
+            workers=workers,
+            trace=trace,
+            trace_dir=trace_dir,
+            strategy_docs=strategy_docs,
+        )
+
+        db = DuckDBWriter(db_path=config.db_path)
+        try:
+            values: dict[str, list[float]] = {c: [] for c in active}
+            for condition, episode_number, value in db.metric_values(
+                config.experiment_id, plan.metric
+            ):
+                if condition in values and episode_number in scheduled[condition]:
+                    values[condition].append(value)
+            result = monitor.look(look, values)
+            db.write_sequential_look(config.experiment_id, plan.metric, result)
+
+            decided = [(c, "stopped", look) for c in result.stopped]
+            if look == plan.looks:
+                decided += [(c, "completed", None) for c in monitor.active]
+            for condition, status, stop_look in decided:
+                db.write_sequential_stop(
+                    config.experiment_id,
+                    condition,
+                    status,
+                    stop_look,
+                    episodes_run=len(values[condition]),
+                    episodes_planned=planned[condition],
+                    stopping_rule=rule,
+                )
+        finally:
+            db.close()
+
+        for comparison in result.comparisons:
+            logger.info(
+                "  look %d: %s vs %s  n=%d+%d  p=%.4g  (alpha %.4g)%s",
+                look,
+                comparison.condition_a,
+                comparison.condition_b,
+                comparison.n_a,
+                comparison.n_b,
+                comparison.p_value,
+                result.nominal_alpha,
+                "  RESOLVED" if comparison.resolved else "",
+            )
+        for condition in result.stopped:
+            logger.info(
+                "  Stopped %s after %d/%d episodes",
+                condition,
+                len(values[condition]),
+                planned[condition],
+            )
+        if not monitor.active:
+            break
+
+    saved = sum(planned.values()) - sum(len(s) for s in scheduled.values())
+    logger.info(
+        "Sequential %s: %d of %d conditions stopped early, %d episodes saved",
+        config.experiment_id,
+        len(monitor.stopped),
+        len(conditions),
+        saved,
+    )
+
+
+def run_episode_tasks(
     db: "DuckDBWriter",
     experiment_id: str,
-    run: RunConfig,
+    runs: list[RunConfig],
+    tasks: list["EpisodeTask"],
+    workers: int,
+    trace: bool = False,
+    trace_dir: Path | None = None,
+    strategy_docs: Path | None = None,
 ) -> int:
-    """Count how many episodes from a specific run exist.
+    """Execute episode tasks on an EpisodePool, writing results through ``db``.
+
+    Tasks are dispatched in list order (the caller's randomized order);
+    each worker keeps its bridge warm and builds a run's policy once via
+    policy_for_run. This process is the only DuckDB writer.
 
-    For center points that share a condition, checks by seed values.
+    Returns:
+        Number of episodes completed.
     """
-    placeholders = ", ".join(["?"] * len(run.seeds))
-    result = db._con.execute(
-        f"SELECT COUNT(*) FROM experiments "
-        f"WHERE experiment_id = ? AND condition = ? "
-        f"AND seed IN ({placeholders})",
-        [experiment_id, run.condition, *run.seeds],
-    ).fetchone()
-    return result[0] if result else 0
+    from glue.episode_pool import EpisodeOutcome, EpisodePool
+
+    completed = 0
+
+    def _write(outcome: EpisodeOutcome) -> None:
+        nonlocal completed
+        run = runs[outcome.task.run_index]
+        if outcome.trace is not None:
+            _write_trace(db, outcome.trace, trace_dir)
+        db.write_episode(
+            experiment_id=experiment_id,
+            run_id=run.run_id,
+            condition=run.condition,
+            seed=outcome.task.seed,
+            episode_number=outcome.task.episode_number,
+            metrics=outcome.metrics,
+            decision_latency_p99=outcome.decision_latency_p99,
+            rule_match_rate=outcome.rule_match_rate,
+            decision_level_counts=outcome.decision_level_counts,
+        )
+        completed += 1
+        if completed % 10 == 0 or completed == len(tasks):
+            logger.info(
+                "  [%d/%d] %s ep %d  seed=%d  kills=%d  survival=%.1fs  (pid %d)",
+                completed,
+                len(tasks),
+                run.run_label,
+                outcome.task.episode_number,
+                outcome.task.seed,
+                outcome.metrics["kills"],
+                outcome.metrics["survival_time"],
+                outcome.worker_pid,
+            )
+
+    pool = EpisodePool(
+        runs,
+        partial(policy_for_run, strategy_docs=strategy_docs),
+        workers=workers,
+        trace_experiment_id=experiment_id if trace else None,
+    )
+    pool.run(tasks, _write)
+    return completed
+
+
+def _write_trace(
+    db: "DuckDBWriter",
+    trace: "EpisodeTrace",
+    trace_dir: Path | None,
+) -> None:
+    """Persist an episode trace to Parquet (if trace_dir) or DuckDB."""
+    if trace_dir is not None:
+        from glue.trace_recorder import write_trace_parquet
+
+        write_trace_parquet(trace, trace_dir)
+    else:
+        db.write_trace(trace)
+
+
+def _register_genomes(db: "DuckDBWriter", config: ExperimentConfig) -> None:
+    """Record genome parameters of genome-action runs (surrogate training data)."""
+    by_action: dict[str, dict[str, dict]] = {}
+    for run in config.runs:
+        if run.genome_params is not None:
+            by_action.setdefault(run.action_type, {})[run.condition] = run.genome_params
+    for action_type, genomes in by_action.items():
+        db.write_genomes(config.experiment_id, action_type, genomes)
+
+
+def _log_integrity(db: "DuckDBWriter", experiment_id: str) -> None:
+    """Verify and log per-condition data integrity for an experiment."""
+    logger.info("-" * 50)
+    logger.info("Verifying data integrity...")
+    integrity = db.verify_integrity(experiment_id)
+    if integrity["valid"]:
+        logger.info("Data integrity OK")
+    else:
+        logger.warning("Data integrity issues: %s", integrity["issues"])
+
+    for cond, count in sorted(integrity["counts"].items()):
+        logger.info("  %s: %d episodes", cond, count)
 
 
 def build_doe023_config(db_path=None):
@@ -2666,6 +2853,7 @@ def execute_doe032(config: ExperimentConfig) -> None:
         seed_set=config.seed_set,
         formula=config.seed_formula,
     )
+    done = db.completion_index(config.experiment_id)
 
     experiment_start = time.monotonic()
     completed = 0
@@ -2699,9 +2887,7 @@ def execute_doe032(config: ExperimentConfig) -> None:
                     episode_number = seq_id * 10 + ep_in_seq + 1
 
                     # Skip already-completed episodes
-                    if _episode_exists(
-                        db, config.experiment_id, run.condition, episode_number
-                    ):
+                    if done.contains(run.condition, episode_number):
                         skipped += 1
                         continue
 
@@ -2716,34 +2902,16 @@ def execute_doe032(config: ExperimentConfig) -> None:
                         action_fn=action_fn,
                     )
 
-                    metrics = {
-                        "survival_time": result.metrics.survival_time,
-                        "kills": result.metrics.kills,
-                        "damage_dealt": result.metrics.damage_dealt,
-                        "damage_taken": result.metrics.damage_taken,
-                        "ammo_efficiency": result.metrics.ammo_efficiency,
-                        "exploration_coverage": result.metrics.exploration_coverage,
-                        "total_ticks": result.metrics.total_ticks,
-                        "shots_fired": result.metrics.shots_fired,
-                        "hits": result.metrics.hits,
-                        "cells_visited": result.metrics.cells_visited,
-                    }
-
-                    level_counts: dict[str, int] = {}
-                    for level in result.decision_levels:
-                        key = str(level)
-                        level_counts[key] = level_counts.get(key, 0) + 1
-
                     db.write_episode(
                         experiment_id=config.experiment_id,
                         run_id=run.run_id,
                         condition=run.condition,
                         seed=seed,
                         episode_number=episode_number,
-                        metrics=metrics,
+                        metrics=result.metrics_dict(),
                         decision_latency_p99=result.decision_latency_p99,
                         rule_match_rate=result.rule_match_rate,
-                        decision_level_counts=level_counts,
+                        decision_level_counts=result.decision_level_counts,
                     )
 
                     completed += 1
@@ -3578,57 +3746,30 @@ def _topsis(results: list[dict], weights: list[float]) -> list[float]:
     Returns:
         Closeness coefficients (0-1), higher is better.
     """
-    import math
+    from glue.analysis.topsis import closeness
 
-    n = len(results)
     criteria = ["kills", "survival_time", "kill_rate"]
-
-    # Build decision matrix
     matrix = [[r[c] for c in criteria] for r in results]
+    return closeness(matrix, weights).tolist() if results else []
 
-    # Normalize columns
-    col_norms = [
-        math.sqrt(sum(row[j] ** 2 for row in matrix)) for j in range(3)
-    ]
-    normalized = [
-        [row[j] / (col_norms[j] if col_norms[j] > 0 else 1) for j in range(3)]
-        for row in matrix
-    ]
-
-    # Apply weights
-    weighted = [
-        [normalized[i][j] * weights[j] for j in range(3)] for i in range(n)
-    ]
-
-    # Ideal best and worst (all maximize)
-    ideal_best = [max(weighted[i][j] for i in range(n)) for j in range(3)]
-    ideal_worst = [min(weighted[i][j] for i in range(n)) for j in range(3)]
-
-    # Distances to ideal best/worst
-    d_plus = [
-        math.sqrt(sum((weighted[i][j] - ideal_best[j]) ** 2 for j in range(3)))
-        for i in range(n)
-    ]
-    d_minus = [
-        math.sqrt(sum((weighted[i][j] - ideal_worst[j]) ** 2 for j in range(3)))
-        for i in range(n)
-    ]
-
-    # Closeness coefficient
-    closeness = [
-        d_minus[i] / (d_plus[i] + d_minus[i])
-        if (d_plus[i] + d_minus[i]) > 0
-        else 0
-        for i in range(n)
-    ]
-    return closeness
 
-
-def execute_doe044(config: ExperimentConfig) -> None:
+def execute_doe044(
+    config: ExperimentConfig,
+    racing: RacingSchedule | None = None,
+    workers: int = 1,
+    surrogate_oversample: int = 1,
+) -> None:
     """Evolutionary executor for DOE-044: 5 generations with TOPSIS selection.
 
     Runs 10 genomes per generation, evaluates via TOPSIS, then evolves
-    the population through selection, crossover, and mutation.
+    the population through selection, crossover, and mutation. With
+    ``racing``, each generation is evaluated by successive halving
+    (glue.racing) and ranked by the recorded race. With workers > 1 a
+    generation's episodes run on an EpisodePool (run_episode_tasks),
+    dispatched genome by genome in G01..G10 order. With
+    surrogate_oversample > 1, every offspring slot is bred that many times
+    and a surrogate (glue.surrogate) fitted on all recorded genome5
+    outcomes picks the candidate to evaluate.
 
     Convergence: stops if best genome unchanged for 2 consecutive generations.
     """
@@ -3637,7 +3778,10 @@ def execute_doe044(config: ExperimentConfig) -> None:
 
     from glue.action_functions import Genome5Action
     from glue.duckdb_writer import DuckDBWriter
+    from glue.episode_pool import EpisodeTask
     from glue.episode_runner import EpisodeRunner
+    from glue.racing import race
+    from glue.surrogate import log_accuracy, optional_surrogate, spec_from_bounds
     from glue.vizdoom_bridge import VizDoomBridge
 
     MAX_GENERATIONS = 5
@@ -3675,6 +3819,9 @@ def execute_doe044(config: ExperimentConfig) -> None:
         "burst_cooldown": (0, 5),
         "movement_commitment": (1, 5),
     }
+    GENOME_SPEC = spec_from_bounds(FLOAT_CLAMP, INT_CLAMP)
+    # Surrogate criteria order: kills, kill_rate, survival_time
+    SURROGATE_WEIGHTS = (TOPSIS_WEIGHTS[0], TOPSIS_WEIGHTS[2], TOPSIS_WEIGHTS[1])
 
     # Extract Gen 1 genomes from config
     current_genomes = []
@@ -3693,10 +3840,13 @@ def execute_doe044(config: ExperimentConfig) -> None:
     )
     logger.info("=" * 70)
 
-    bridge = VizDoomBridge(
-        scenario="defend_the_line_5action.cfg", num_actions=5, doom_skill=3
-    )
-    runner = EpisodeRunner(bridge)
+    bridge = None
+    runner = None
+    if workers <= 1:
+        bridge = VizDoomBridge(
+            scenario="defend_the_line_5action.cfg", num_actions=5, doom_skill=3
+        )
+        runner = EpisodeRunner(bridge)
     db = DuckDBWriter(db_path=config.db_path)
 
     db.write_seed_set(
@@ -3734,27 +3884,37 @@ def execute_doe044(config: ExperimentConfig) -> None:
                     formula=f"gen{gen} seeds",
                 )
 
-            genome_results: list[dict] = []
+            labels = [f"G{g_idx + 1:02d}" for g_idx in range(len(current_genomes))]
+            genome_by_label = dict(zip(labels, current_genomes))
+
+            def _condition(g_label: str) -> str:
+                return f"gen{gen}_{g_label}" if gen > 1 else g_label
+
+            db.write_genomes(
+                gen_exp_id,
+                "genome5",
+                {_condition(g_label): genome_by_label[g_label] for g_label in labels},
+            )
 
-            for g_idx, genome in enumerate(current_genomes):
-                g_label = f"G{g_idx + 1:02d}"
-                condition = f"gen{gen}_{g_label}" if gen > 1 else g_label
+            def _run_genome(g_label: str, n_episodes: int) -> None:
+                nonlocal completed, skipped
+                genome = genome_by_label[g_label]
+                condition = _condition(g_label)
 
                 logger.info(
-                    "  [Gen %d] Genome %s: %s", gen, g_label, genome
+                    "  [Gen %d] Genome %s (%d episodes): %s",
+                    gen, g_label, n_episodes, genome,
                 )
 
                 action_fn = Genome5Action(**genome)
 
-                ep_kills = []
-                ep_survival = []
-                ep_kill_rate = []
-
-                for ep_i, seed in enumerate(seeds):
+                for ep_i, seed in enumerate(seeds[:n_episodes]):
                     episode_number = ep_i + 1
 
                     # Check resumption
-                    if _episode_exists(db, gen_exp_id, condition, episode_number):
+                    if db.completion_index(gen_exp_id).contains(
+                        condition, episode_number
+                    ):
                         skipped += 1
                         continue
 
@@ -3767,70 +3927,103 @@ def execute_doe044(config: ExperimentConfig) -> None:
                         action_fn=action_fn,
                     )
 
-                    metrics = {
-                        "survival_time": result.metrics.survival_time,
-                        "kills": result.metrics.kills,
-                        "damage_dealt": result.metrics.damage_dealt,
-                        "damage_taken": result.metrics.damage_taken,
-                        "ammo_efficiency": result.metrics.ammo_efficiency,
-                        "exploration_coverage": result.metrics.exploration_coverage,
-                        "total_ticks": result.metrics.total_ticks,
-                        "shots_fired": result.metrics.shots_fired,
-                        "hits": result.metrics.hits,
-                        "cells_visited": result.metrics.cells_visited,
-                    }
-
-                    level_counts: dict[str, int] = {}
-                    for level in result.decision_levels:
-                        key = str(level)
-                        level_counts[key] = level_counts.get(key, 0) + 1
-
                     db.write_episode(
                         experiment_id=gen_exp_id,
                         run_id=f"{gen_exp_id}-{g_label}",
                         condition=condition,
                         seed=seed,
                         episode_number=episode_number,
-                        metrics=metrics,
+                        metrics=result.metrics_dict(),
                         decision_latency_p99=result.decision_latency_p99,
                         rule_match_rate=result.rule_match_rate,
-                        decision_level_counts=level_counts,
+                        decision_level_counts=result.decision_level_counts,
                     )
-
-                    ep_kills.append(result.metrics.kills)
-                    ep_survival.append(result.metrics.survival_time)
-                    ep_kill_rate.append(result.metrics.kill_rate)
                     completed += 1
 
-                # Compute means for this genome
-                mean_kills = sum(ep_kills) / len(ep_kills) if ep_kills else 0.0
-                mean_survival = (
-                    sum(ep_survival) / len(ep_survival) if ep_survival else 0.0
+            genome_runs = [
+                RunConfig(
+                    run_id=f"{gen_exp_id}-{g_label}",
+                    run_label=g_label,
+                    memory_weight=0.0,
+                    strength_weight=0.0,
+                    seeds=list(seeds),
+                    condition=_condition(g_label),
+                    run_type="one_way",
+                    action_type="genome5",
+                    scenario="defend_the_line_5action.cfg",
+                    num_actions=5,
+                    doom_skill=3,
+                    genome_params=dict(genome_by_label[g_label]),
                 )
-                mean_kr = (
-                    sum(ep_kill_rate) / len(ep_kill_rate) if ep_kill_rate else 0.0
+                for g_label in labels
+            ]
+
+            def _run_genomes(names: list[str], n_episodes: int) -> None:
+                nonlocal completed, skipped
+                if workers <= 1:
+                    for g_label in names:
+                        _run_genome(g_label, n_episodes)
+                    return
+                done = db.completion_index(gen_exp_id)
+                tasks = []
+                for g_label in names:
+                    for ep_i, seed in enumerate(seeds[:n_episodes]):
+                        if done.contains(_condition(g_label), ep_i + 1):
+                            skipped += 1
+                        else:
+                            tasks.append(
+                                EpisodeTask(labels.index(g_label), seed, ep_i + 1)
+                            )
+                completed += run_episode_tasks(
+                    db, gen_exp_id, genome_runs, tasks, workers
                 )
 
-                genome_results.append({
-                    "genome": genome,
+            def _genome_result(g_label: str, stats: dict) -> dict:
+                # Means over the genome's episodes in DuckDB, so resumed
+                # genomes are scored on their recorded episodes too
+                return {
+                    "genome": genome_by_label[g_label],
                     "label": g_label,
-                    "kills": mean_kills,
-                    "survival_time": mean_survival,
-                    "kill_rate": mean_kr,
-                })
+                    "kills": stats.get("mean_kills") or 0.0,
+                    "survival_time": stats.get("mean_survival_time") or 0.0,
+                    "kill_rate": stats.get("mean_kill_rate") or 0.0,
+                }
 
+            def _evaluate(names: list[str], budget: int) -> dict[str, dict]:
+                _run_genomes(names, budget)
+                means = db.condition_means(gen_exp_id, budget)
+                return {g_label: means.get(_condition(g_label), {}) for g_label in names}
+
+            def _score(stats: dict[str, dict]) -> dict[str, float]:
+                results = [_genome_result(g_label, s) for g_label, s in stats.items()]
+                return dict(zip(stats, _topsis(results, TOPSIS_WEIGHTS)))
+
+            if racing is None:
+                stats = _evaluate(labels, len(seeds))
+                scores = _score(stats)
+                ranked = sorted(
+                    ((scores[g_label], _genome_result(g_label, stats[g_label]))
+                     for g_label in labels),
+                    key=lambda x: x[0],
+                    reverse=True,
+                )
+            else:
+                race_result = race(labels, len(seeds), _evaluate, _score, racing)
+                db.write_race(gen_exp_id, race_result, racing.rule())
+                ranked = []
+                for g_label in race_result.ranking:
+                    stats, score = race_result.final(g_label)
+                    ranked.append((score, _genome_result(g_label, stats)))
                 logger.info(
-                    "    %s: kills=%.1f  survival=%.1fs  kill_rate=%.2f/min",
-                    g_label, mean_kills, mean_survival, mean_kr,
+                    "Gen %d racing used %d of %d episodes",
+                    gen, race_result.episodes, len(labels) * len(seeds),
                 )
 
-            # Compute TOPSIS fitness
-            fitness = _topsis(genome_results, TOPSIS_WEIGHTS)
-            ranked = sorted(
-                zip(fitness, genome_results),
-                key=lambda x: x[0],
-                reverse=True,
-            )
+            for score, gr in ranked:
+                logger.info(
+                    "    %s: kills=%.1f  survival=%.1fs  kill_rate=%.2f/min",
+                    gr["label"], gr["kills"], gr["survival_time"], gr["kill_rate"],
+                )
 
             logger.info("-" * 40)
             logger.info("Gen %d TOPSIS Rankings:", gen)
@@ -3845,6 +4038,20 @@ def execute_doe044(config: ExperimentConfig) -> None:
                     gr["kill_rate"],
                 )
 
+            predicted = db.surrogate_predictions(gen_exp_id) if gen > 1 else {}
+            if predicted:
+                realized = {
+                    _condition(gr["label"]): {
+                        "mean_kills": gr["kills"],
+                        "mean_kill_rate": gr["kill_rate"],
+                        "mean_survival_time": gr["survival_time"],
+                        "score": score,
+                    }
+                    for score, gr in ranked
+                }
+                db.record_surrogate_realized(gen_exp_id, realized)
+                log_accuracy(gen_exp_id, predicted, realized)
+
             # Check convergence
             best_genome = ranked[0][1]["genome"]
 
@@ -3922,24 +4129,52 @@ def execute_doe044(config: ExperimentConfig) -> None:
                         g["burst_cooldown"] = 0
                     return g
 
-                next_gen = [
-                    dict(r1),                           # 1: Elite (best, unchanged)
-                    _mutate(_crossover(r1, r2)),         # 2: Child of Rank1 x Rank2
-                    _mutate(_crossover(r1, r2)),         # 3: Child of Rank1 x Rank2
-                    _mutate(_crossover(r1, r3)),         # 4: Child of Rank1 x Rank3
-                    _mutate(_crossover(r2, r4)),         # 5: Child of Rank2 x Rank4
-                    _mutate(_crossover(r3, r4)),         # 6: Child of Rank3 x Rank4
-                    _mutate(_crossover(r1, r4)),         # 7: Child of Rank1 x Rank4
-                    _mutate(dict(r2)),                   # 8: Mutation-only clone of Rank2
-                    _mutate(dict(r3)),                   # 9: Mutation-only clone of Rank3
-                    _random_genome(),                    # 10: Random new genome
+                # Slots 2-10 are bred in order (surrogate_oversample
+                # candidates each), so without the surrogate the RNG
+                # stream is unchanged
+                breeders = [
+                    lambda: _mutate(_crossover(r1, r2)),  # 2: Child of Rank1 x Rank2
+                    lambda: _mutate(_crossover(r1, r2)),  # 3: Child of Rank1 x Rank2
+                    lambda: _mutate(_crossover(r1, r3)),  # 4: Child of Rank1 x Rank3
+                    lambda: _mutate(_crossover(r2, r4)),  # 5: Child of Rank2 x Rank4
+                    lambda: _mutate(_crossover(r3, r4)),  # 6: Child of Rank3 x Rank4
+                    lambda: _mutate(_crossover(r1, r4)),  # 7: Child of Rank1 x Rank4
+                    lambda: _mutate(dict(r2)),            # 8: Mutation-only clone of Rank2
+                    lambda: _mutate(dict(r3)),            # 9: Mutation-only clone of Rank3
+                    _random_genome,                       # 10: Random new genome
                 ]
+                candidates = {f"gen{gen + 1}_G01": [dict(r1)]}  # 1: Elite (unchanged)
+                for slot, breed in enumerate(breeders, start=2):
+                    candidates[f"gen{gen + 1}_G{slot:02d}"] = [
+                        breed() for _ in range(surrogate_oversample)
+                    ]
+                next_gen = [genomes[0] for genomes in candidates.values()]
+
+                surrogate = None
+                if surrogate_oversample > 1:
+                    surrogate = optional_surrogate(
+                        GENOME_SPEC,
+                        db.genome_outcomes("genome5"),
+                        SURROGATE_WEIGHTS,
+                        kappa=1.0,
+                    )
+                if surrogate is not None:
+                    predictions = surrogate.screen(candidates)
+                    next_gen = [predictions[name].genome for name in candidates]
+                    db.write_surrogate_predictions(
+                        f"{config.experiment_id}_gen{gen + 1}", predictions
+                    )
+                    logger.info(
+                        "Surrogate picked 1 of %d candidates per slot",
+                        surrogate_oversample,
+                    )
 
                 current_genomes = next_gen
                 logger.info("Next generation created (%d genomes)", len(next_gen))
 
     finally:
-        bridge.close()
+        if bridge is not None:
+            bridge.close()
 
     # Verify data integrity
     logger.info("-" * 50)
@@ -4018,6 +4253,25 @@ EXPERIMENT_BUILDERS: dict[str, object] = {
 # ---------------------------------------------------------------------------
 
 
+def _print_run_table(config: ExperimentConfig) -> None:
+    """Print the design of ``config`` in execution order."""
+    total = sum(len(run.seeds) for run in config.runs)
+    print(f"{config.experiment_id}: {len(config.runs)} runs, {total} episodes, "
+          f"db={config.db_path}")
+    for run in config.runs:
+        print(f"  {run.run_label:<6} {run.action_type:<22} {run.scenario:<28} "
+              f"{len(run.seeds):>3} eps  {run.condition}")
+
+
+def _worker_count(workers: int) -> int:
+    """--workers value; 0 means one per CPU core."""
+    if workers == 0:
+        from glue.episode_pool import default_worker_count
+
+        return default_worker_count()
+    return workers
+
+
 def main() -> None:
     """CLI entry point for DOE experiment execution."""
     parser = argparse.ArgumentParser(
@@ -4025,33 +4279,220 @@ def main() -> None:
     )
     parser.add_argument(
         "--experiment",
-        required=True,
         choices=list(EXPERIMENT_BUILDERS.keys()),
         help="Experiment ID to execute (e.g., DOE-005)",
     )
+    parser.add_argument(
+        "--design",
+        type=Path,
+        default=None,
+        help="Declarative design file (.toml/.json, see glue.doe_design) to "
+        "execute instead of a built-in --experiment",
+    )
+    parser.add_argument(
+        "--design-cache",
+        type=Path,
+        default=None,
+        help="Directory for compiled design artifacts "
+        "(default: data/design_cache)",
+    )
+    parser.add_argument(
+        "--list",
+        action="store_true",
+        help="List available experiment IDs and exit",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Print the run table of --experiment without starting VizDoom "
+        "or opening the database",
+    )
     parser.add_argument(
         "--db-path",
         type=Path,
         default=None,
         help=f"DuckDB database path (default: {DEFAULT_DB_PATH})",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes for episode execution (default: 1 = serial, "
+        "0 = one per CPU core)",
+    )
+    parser.add_argument(
+        "--trace",
+        action="store_true",
+        help="Record per-decision encounter traces into the encounters table",
+    )
+    parser.add_argument(
+        "--trace-dir",
+        type=Path,
+        default=None,
+        help="Write encounter traces as Parquet partitions under this "
+        "directory instead of DuckDB",
+    )
+    parser.add_argument(
+        "--strategy-docs",
+        type=Path,
+        default=None,
+        help="Directory of <index_name>.json strategy documents; L2 policies "
+        "retrieve from an in-process index instead of OpenSearch",
+    )
+    parser.add_argument(
+        "--sequential",
+        action="store_true",
+        help="Group-sequential execution: interim analyses after each stage, "
+        "stop conditions whose comparisons are resolved",
+    )
+    parser.add_argument(
+        "--seq-looks",
+        type=int,
+        default=5,
+        help="Interim analyses for --sequential (default: 5)",
+    )
+    parser.add_argument(
+        "--seq-alpha",
+        type=float,
+        default=0.05,
+        help="Overall family-wise alpha for --sequential (default: 0.05)",
+    )
+    parser.add_argument(
+        "--seq-metric",
+        default="kill_rate",
+        help="experiments column compared by --sequential (default: kill_rate)",
+    )
+    parser.add_argument(
+        "--seq-spending",
+        choices=["obrien_fleming", "pocock"],
+        default="obrien_fleming",
+        help="Alpha-spending function for --sequential (default: obrien_fleming)",
+    )
+    parser.add_argument(
+        "--seq-reference",
+        default=None,
+        help="Compare every condition against this control condition "
+        "(default: all pairs)",
+    )
+    parser.add_argument(
+        "--racing",
+        action="store_true",
+        help="DOE-044: evaluate each generation by successive halving "
+        "instead of the full seed set",
+    )
+    parser.add_argument(
+        "--racing-initial",
+        type=int,
+        default=5,
+        help="Episodes per genome in the first racing rung (default: 5)",
+    )
+    parser.add_argument(
+        "--racing-eta",
+        type=int,
+        default=2,
+        help="Racing budget multiplier; keeps the top 1/eta per rung (default: 2)",
+    )
+    parser.add_argument(
+        "--surrogate",
+        action="store_true",
+        help="DOE-044: pre-screen over-generated offspring with a surrogate model",
+    )
+    parser.add_argument(
+        "--surrogate-oversample",
+        type=int,
+        default=4,
+        help="Offspring candidates bred per slot with --surrogate (default: 4)",
+    )
     args = parser.parse_args()
 
+    if args.list:
+        print("\n".join(EXPERIMENT_BUILDERS))
+        return
+    if (args.experiment is None) == (args.design is None):
+        parser.error("exactly one of --experiment or --design is required")
+
     logging.basicConfig(
         level=logging.INFO,
         format="%(asctime)s %(levelname)s %(message)s",
     )
 
-    builder = EXPERIMENT_BUILDERS[args.experiment]
-    config = builder(db_path=args.db_path)
+    if args.design is not None:
+        from glue.doe_design import DEFAULT_DESIGN_CACHE, load_design
+
+        config = load_design(
+            args.design,
+            cache_dir=args.design_cache or DEFAULT_DESIGN_CACHE,
+            db_path=args.db_path,
+        )
+    else:
+        builder = EXPERIMENT_BUILDERS[args.experiment]
+        config = builder(db_path=args.db_path)
+
+    # Special executors (DOE-044, DOE-032) take only their own options
+    experiment_id = config.experiment_id
+    unsupported = {
+        "--workers": args.workers != 1 and experiment_id == "DOE-032",
+        "--trace": args.trace,
+        "--trace-dir": args.trace_dir is not None,
+        "--strategy-docs": args.strategy_docs is not None,
+        "--sequential": args.sequential,
+    }
+    if experiment_id in ("DOE-044", "DOE-032"):
+        for flag, given in unsupported.items():
+            if given:
+                parser.error(f"{flag} is not supported for {experiment_id}")
+    if args.racing and experiment_id != "DOE-044":
+        parser.error("--racing is only supported for DOE-044")
+    if args.surrogate and experiment_id != "DOE-044":
+        parser.error("--surrogate is only supported for DOE-044")
+    if args.surrogate and args.surrogate_oversample < 2:
+        parser.error("--surrogate-oversample must be >= 2")
+
+    if args.dry_run:
+        _print_run_table(config)
+        return
+
+    sequential = None
+    if args.sequential:
+        from glue.analysis.sequential import SequentialPlan
+
+        try:
+            sequential = SequentialPlan(
+                metric=args.seq_metric,
+                alpha=args.seq_alpha,
+                looks=args.seq_looks,
+                spending=args.seq_spending,
+                reference=args.seq_reference,
+            )
+        except ValueError as exc:
+            parser.error(str(exc))
 
     # Special executors for specific experiments
-    if args.experiment == "DOE-044":
-        execute_doe044(config)
-    elif args.experiment == "DOE-032":
+    if config.experiment_id == "DOE-044":
+        racing = None
+        if args.racing:
+            from glue.racing import RacingSchedule
+
+            racing = RacingSchedule(
+                initial_episodes=args.racing_initial, eta=args.racing_eta
+            )
+        execute_doe044(
+            config,
+            racing=racing,
+            workers=_worker_count(args.workers),
+            surrogate_oversample=args.surrogate_oversample if args.surrogate else 1,
+        )
+    elif config.experiment_id == "DOE-032":
         execute_doe032(config)
     else:
-        execute_experiment(config)
+        execute_experiment(
+            config,
+            workers=_worker_count(args.workers),
+            trace=args.trace,
+            trace_dir=args.trace_dir,
+            strategy_docs=args.strategy_docs,
+            sequential=sequential,
+        )
 
 
 if __name__ == "__main__":
@@ -4,26 +4,119 @@ from __future__ import annotations
 
 import json
 import logging
+import time
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import duckdb
 
+if TYPE_CHECKING:
+    from glue.analysis.sequential import LookResult
+    from glue.racing import RaceResult
+    from glue.surrogate import Prediction
+    from glue.trace_recorder import EpisodeTrace
+
 logger = logging.getLogger(__name__)
 
 SCHEMA_SQL_PATH = Path(__file__).parent / "schema" / "init_duckdb.sql"
 DEFAULT_DB_PATH = Path("volumes/data/clau-doom.duckdb")
 
+# Buffered-mode defaults used by the experiment executors: at most this many
+# episodes (or this many seconds of work) are lost on a crash
+DEFAULT_BUFFER_SIZE = 50
+DEFAULT_FLUSH_INTERVAL = 30.0
+
+# Column order and Arrow types of buffered episode rows (experiments table)
+_EPISODE_COLUMN_TYPES = (
+    ("experiment_id", "string"), ("run_id", "string"),
+    ("condition", "string"), ("baseline_type", "string"),
+    ("seed", "int64"), ("episode_number", "int64"),
+    ("kill_rate", "float64"), ("kills", "int64"), ("survival_time", "float64"),
+    ("damage_dealt", "float64"), ("damage_taken", "float64"),
+    ("ammo_efficiency", "float64"), ("exploration_coverage", "float64"),
+    ("decision_latency_p99", "float64"), ("rule_match_rate", "float64"),
+    ("decision_level_counts", "string"),
+    ("total_ticks", "int64"), ("shots_fired", "int64"),
+    ("hits", "int64"), ("cells_visited", "int64"),
+)
+EPISODE_COLUMNS = tuple(name for name, _ in _EPISODE_COLUMN_TYPES)
+
+
+class CompletionIndex:
+    """Completed episodes of one experiment, for resumption checks.
+
+    Loaded from DuckDB with a single query and kept current as
+    DuckDBWriter commits episodes, so executors can plan remaining work up
+    front instead of issuing one SELECT per run or seed.
+    """
+
+    def __init__(self, experiment_id: str):
+        self.experiment_id = experiment_id
+        # condition -> {episode_number: seed}
+        self._episodes: dict[str, dict[int, int]] = {}
+
+    def add(self, condition: str, episode_number: int, seed: int) -> None:
+        self._episodes.setdefault(condition, {})[episode_number] = seed
+
+    def contains(self, condition: str, episode_number: int) -> bool:
+        """True if (condition, episode_number) is complete."""
+        return episode_number in self._episodes.get(condition, ())
+
+    def count(self, condition: str) -> int:
+        """Number of completed episodes for a condition."""
+        return len(self._episodes.get(condition, ()))
+
+    def count_seeds(self, condition: str, seeds: list[int]) -> int:
+        """Number of completed episodes of a condition played with ``seeds``."""
+        wanted = set(seeds)
+        return sum(
+            1 for seed in self._episodes.get(condition, {}).values() if seed in wanted
+        )
+
+    def __len__(self) -> int:
+        return sum(len(eps) for eps in self._episodes.values())
+
 
 class DuckDBWriter:
-    """Writes experiment data to DuckDB."""
+    """Writes experiment data to DuckDB.
+
+    By default every write_episode() is an immediate INSERT. With
+    ``buffer_size > 1`` episode rows are buffered in memory and appended in
+    bulk (Arrow registration when pyarrow is available, executemany
+    otherwise) once ``buffer_size`` rows are pending, ``flush_interval``
+    seconds have passed since the last flush, or on flush()/close().
 
-    def __init__(self, db_path: Optional[Path] = None):
+    Crash safety: each flush is a single transaction (a failing batch is
+    retried episode by episode, see flush()), so an episode is persisted iff
+    the transaction containing it committed. After flush() returns, every
+    episode passed to write_episode() before it is durable or listed in
+    ``rejected``; a crash loses at most the pending buffer and never leaves
+    a partial batch, so resumption (which only sees committed rows) re-runs
+    exactly the lost episodes. Reads through this writer flush first.
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[Path] = None,
+        buffer_size: int = 1,
+        flush_interval: Optional[float] = None,
+    ):
         self._db_path = db_path or DEFAULT_DB_PATH
         self._db_path.parent.mkdir(parents=True, exist_ok=True)
         self._con = duckdb.connect(str(self._db_path))
         self._ensure_schema()
 
+        self._buffer_size = max(1, buffer_size)
+        self._flush_interval = flush_interval
+        self._buffer: list[tuple] = []
+        self._pending_keys: set[tuple[str, str, int]] = set()
+        self._traces: list[EpisodeTrace] = []
+        self._last_flush = time.monotonic()
+        self._indexes: dict[str, CompletionIndex] = {}
+        self.episodes_persisted = 0
+        # ((experiment_id, condition, episode_number), error) of dropped rows
+        self.rejected: list[tuple[tuple[str, str, int], str]] = []
+
     def _ensure_schema(self) -> None:
         if SCHEMA_SQL_PATH.exists():
             # DuckDB Python API uses execute(), not executescript()
@@ -41,58 +134,251 @@ class DuckDBWriter:
         rule_match_rate: float = 0.0,
         decision_level_counts: Optional[dict] = None,
     ) -> None:
-        """Insert a single episode result into the experiments table."""
+        """Insert (or buffer) a single episode result into the experiments table."""
         survival_time = metrics.get("survival_time", 0.0)
         kills = metrics.get("kills", 0)
         kill_rate = (
             (kills / (survival_time / 60.0)) if survival_time > 0 else 0.0
         )
 
-        self._con.execute(
-            """
-            INSERT INTO experiments (
-                experiment_id, run_id, condition, baseline_type,
-                seed, episode_number,
-                kill_rate, kills, survival_time,
-                damage_dealt, damage_taken,
-                ammo_efficiency, exploration_coverage,
-                decision_latency_p99, rule_match_rate,
-                decision_level_counts,
-                total_ticks, shots_fired, hits, cells_visited
-            ) VALUES (
-                ?, ?, ?, ?,
-                ?, ?,
-                ?, ?, ?,
-                ?, ?,
-                ?, ?,
-                ?, ?,
-                ?,
-                ?, ?, ?, ?
+        row = (
+            experiment_id,
+            run_id,
+            condition,
+            condition,
+            seed,
+            episode_number,
+            kill_rate,
+            kills,
+            survival_time,
+            metrics.get("damage_dealt", 0.0),
+            metrics.get("damage_taken", 0.0),
+            metrics.get("ammo_efficiency", 0.0),
+            metrics.get("exploration_coverage", 0.0),
+            decision_latency_p99,
+            rule_match_rate,
+            json.dumps(decision_level_counts or {}),
+            metrics.get("total_ticks", 0),
+            metrics.get("shots_fired", 0),
+            metrics.get("hits", 0),
+            metrics.get("cells_visited", 0),
+        )
+
+        if self._buffer_size == 1:
+            self._con.execute(_INSERT_EPISODE_SQL, list(row))
+            self._mark_persisted([row])
+            return
+
+        self._buffer.append(row)
+        self._pending_keys.add((experiment_id, condition, episode_number))
+        if len(self._buffer) >= self._buffer_size or (
+            self._flush_interval is not None
+            and time.monotonic() - self._last_flush >= self._flush_interval
+        ):
+            self.flush()
+
+    @property
+    def pending_count(self) -> int:
+        """Number of buffered episodes not yet persisted."""
+        return len(self._buffer)
+
+    def is_pending(self, experiment_id: str, condition: str, episode_number: int) -> bool:
+        """True if the episode is buffered but not yet persisted."""
+        return (experiment_id, condition, episode_number) in self._pending_keys
+
+    def completion_index(self, experiment_id: str) -> CompletionIndex:
+        """Committed episodes of an experiment.
+
+        Loaded once per experiment with a single query (after flushing the
+        buffer), then updated whenever an episode written through this
+        writer is committed.
+        """
+        index = self._indexes.get(experiment_id)
+        if index is not None:
+            return index
+
+        self.flush()
+        index = CompletionIndex(experiment_id)
+        rows = self._con.execute(
+            "SELECT condition, episode_number, seed FROM experiments "
+            "WHERE experiment_id = ?",
+            [experiment_id],
+        ).fetchall()
+        for condition, episode_number, seed in rows:
+            index.add(condition, episode_number, seed)
+
+        self._indexes[experiment_id] = index
+        logger.debug(
+            "Completion index for %s: %d episodes", experiment_id, len(index)
+        )
+        return index
+
+    def flush(self) -> int:
+        """Persist all buffered episodes (and their traces) in one transaction.
+
+        If the batch fails (e.g. a primary-key conflict) it is rolled back and
+        retried one episode per transaction, together with that episode's
+        trace. Episodes that still fail are dropped from the buffer, logged
+        and recorded in ``rejected`` instead of being replayed by every
+        later flush.
+
+        Returns:
+            Number of episodes written.
+        """
+        self._last_flush = time.monotonic()
+        if not self._buffer and not self._traces:
+            return 0
+
+        rows, traces = self._buffer, self._traces
+        self._buffer = []
+        self._traces = []
+        self._pending_keys.clear()
+        try:
+            self._commit(rows, traces)
+        except Exception as exc:
+            logger.warning(
+                "Batch of %d episodes failed (%s); retrying one by one",
+                len(rows), exc,
             )
-        """,
+            rows = self._commit_each(rows, traces)
+        self._mark_persisted(rows)
+        logger.debug("Flushed %d episodes to %s", len(rows), self._db_path)
+        return len(rows)
+
+    def _commit(self, rows: list[tuple], traces: list["EpisodeTrace"]) -> None:
+        """Insert episode rows and traces in a single transaction."""
+        self._con.execute("BEGIN TRANSACTION")
+        try:
+            if rows:
+                self._insert_episodes(rows)
+            if traces:
+                self._insert_traces(traces)
+            self._con.execute("COMMIT")
+        except Exception:
+            self._con.execute("ROLLBACK")
+            raise
+
+    def _commit_each(
+        self, rows: list[tuple], traces: list["EpisodeTrace"]
+    ) -> list[tuple]:
+        """Commit each episode with its trace separately; return the rows written."""
+        by_episode: dict[tuple, list[EpisodeTrace]] = {}
+        for trace in traces:
+            key = (trace.experiment_id, trace.condition, trace.episode_number)
+            by_episode.setdefault(key, []).append(trace)
+
+        written = []
+        for row in rows:
+            key = (row[0], row[2], row[5])
+            try:
+                self._commit([row], by_episode.pop(key, []))
+            except Exception as exc:
+                logger.error("Dropping episode %s: %s", key, exc)
+                self.rejected.append((key, str(exc)))
+            else:
+                written.append(row)
+
+        # Traces whose episode row was written earlier (or not through here)
+        orphans = [t for ts in by_episode.values() for t in ts]
+        if orphans:
+            try:
+                self._commit([], orphans)
+            except Exception as exc:
+                logger.error("Dropping %d traces: %s", len(orphans), exc)
+        return written
+
+    def _mark_persisted(self, rows: list[tuple]) -> None:
+        """Record committed episode rows in the loaded completion indexes."""
+        for row in rows:
+            index = self._indexes.get(row[0])
+            if index is not None:
+                index.add(row[2], row[5], row[4])
+        self.episodes_persisted += len(rows)
+
+    def _insert_episodes(self, rows: list[tuple]) -> None:
+        """Bulk-insert episode rows (caller owns the transaction)."""
+        try:
+            import pyarrow as pa
+        except ImportError:
+            self._con.executemany(_INSERT_EPISODE_SQL, [list(r) for r in rows])
+            return
+
+        schema = pa.schema(
+            [(name, pa.type_for_alias(t)) for name, t in _EPISODE_COLUMN_TYPES]
+        )
+        batch = pa.Table.from_arrays(
             [
-                experiment_id,
-                run_id,
-                condition,
-                condition,
-                seed,
-                episode_number,
-                kill_rate,
-                kills,
-                survival_time,
-                metrics.get("damage_dealt", 0.0),
-                metrics.get("damage_taken", 0.0),
-                metrics.get("ammo_efficiency", 0.0),
-                metrics.get("exploration_coverage", 0.0),
-                decision_latency_p99,
-                rule_match_rate,
-                json.dumps(decision_level_counts or {}),
-                metrics.get("total_ticks", 0),
-                metrics.get("shots_fired", 0),
-                metrics.get("hits", 0),
-                metrics.get("cells_visited", 0),
+                pa.array([r[i] for r in rows], type=field.type)
+                for i, field in enumerate(schema)
             ],
+            schema=schema,
+        )
+        self._con.register("_episode_batch", batch)
+        try:
+            self._con.execute(
+                f"INSERT INTO experiments ({', '.join(EPISODE_COLUMNS)}) "
+                f"SELECT {', '.join(EPISODE_COLUMNS)} FROM _episode_batch"
+            )
+        finally:
+            self._con.unregister("_episode_batch")
+
+    def write_trace(self, trace: "EpisodeTrace") -> int:
+        """Write one episode's encounter trace.
+
+        In buffered mode the trace is committed with the next flush, in the
+        same transaction as the episode rows, so a trace is persisted iff its
+        episode is. Otherwise it is written immediately as one batch. Either
+        way the batch replaces rows already stored for the same episode, so
+        re-running an episode is idempotent.
+
+        Returns:
+            Number of encounter rows written (or buffered).
+        """
+        if len(trace) == 0:
+            return 0
+
+        if self._buffer_size > 1:
+            self._traces.append(trace)
+            return len(trace)
+
+        self._con.execute("BEGIN TRANSACTION")
+        try:
+            self._insert_traces([trace])
+            self._con.execute("COMMIT")
+        except Exception:
+            self._con.execute("ROLLBACK")
+            raise
+        return len(trace)
+
+    def _insert_traces(self, traces: list["EpisodeTrace"]) -> None:
+        """Replace encounter rows of the traced episodes (caller owns the transaction)."""
+        from glue.trace_recorder import ENCOUNTER_COLUMNS
+
+        columns = ", ".join(ENCOUNTER_COLUMNS)
+        self._con.executemany(
+            "DELETE FROM encounters "
+            "WHERE experiment_id = ? AND condition = ? AND episode_number = ?",
+            [[t.experiment_id, t.condition, t.episode_number] for t in traces],
         )
+        try:
+            import pyarrow as pa
+        except ImportError:
+            self._con.executemany(
+                f"INSERT INTO encounters ({columns}) "
+                f"VALUES ({', '.join(['?'] * len(ENCOUNTER_COLUMNS))})",
+                [row for t in traces for row in t.rows()],
+            )
+            return
+
+        batch = pa.concat_tables([t.to_arrow() for t in traces])
+        self._con.register("_trace_batch", batch)
+        try:
+            self._con.execute(
+                f"INSERT INTO encounters ({columns}) "
+                f"SELECT {columns} FROM _trace_batch"
+            )
+        finally:
+            self._con.unregister("_trace_batch")
 
     def write_seed_set(
         self,
@@ -114,8 +400,260 @@ class DuckDBWriter:
             [experiment_id, json.dumps(seed_set), len(seed_set), formula],
         )
 
+    def metric_values(
+        self, experiment_id: str, metric: str
+    ) -> list[tuple[str, int, float]]:
+        """(condition, episode_number, value) of a metric column, flushed first."""
+        if metric not in EPISODE_COLUMNS:
+            raise ValueError(f"Unknown experiments column: {metric}")
+        self.flush()
+        return self._con.execute(
+            f"SELECT condition, episode_number, {metric} FROM experiments "
+            f"WHERE experiment_id = ? AND {metric} IS NOT NULL",
+            [experiment_id],
+        ).fetchall()
+
+    def write_sequential_look(
+        self, experiment_id: str, metric: str, result: "LookResult"
+    ) -> None:
+        """Record the comparisons of one sequential interim analysis."""
+        self._con.execute(
+            "DELETE FROM sequential_looks WHERE experiment_id = ? AND look = ?",
+            [experiment_id, result.look],
+        )
+        if not result.comparisons:
+            return
+        self._con.executemany(
+            """
+            INSERT INTO sequential_looks (
+                experiment_id, look, condition_a, condition_b, metric,
+                info_fraction, nominal_alpha, n_a, n_b, mean_a, mean_b,
+                p_value, resolved
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+            [
+                [
+                    experiment_id, result.look, c.condition_a, c.condition_b,
+                    metric, result.info_fraction, result.nominal_alpha,
+                    c.n_a, c.n_b, c.mean_a, c.mean_b, c.p_value, c.resolved,
+                ]
+                for c in result.comparisons
+            ],
+        )
+
+    def write_sequential_stop(
+        self,
+        experiment_id: str,
+        condition: str,
+        status: str,
+        look: Optional[int],
+        episodes_run: int,
+        episodes_planned: int,
+        stopping_rule: str,
+    ) -> None:
+        """Record (or replace) the stopping decision for a condition."""
+        self._con.execute(
+            "DELETE FROM sequential_stops WHERE experiment_id = ? AND condition = ?",
+            [experiment_id, condition],
+        )
+        self._con.execute(
+            """
+            INSERT INTO sequential_stops (
+                experiment_id, condition, status, look,
+                episodes_run, episodes_planned, stopping_rule
+            ) VALUES (?, ?, ?, ?, ?, ?, ?)
+        """,
+            [
+                experiment_id, condition, status, look,
+                episodes_run, episodes_planned, stopping_rule,
+            ],
+        )
+
+    def condition_means(
+        self, experiment_id: str, max_episode_number: Optional[int] = None
+    ) -> dict[str, dict]:
+        """Per-condition means over episodes 1..max_episode_number (all if None)."""
+        self.flush()
+        rows = self._con.execute(
+            """
+            SELECT condition, COUNT(*), AVG(kills), AVG(kill_rate), AVG(survival_time)
+            FROM experiments
+            WHERE experiment_id = ? AND (? IS NULL OR episode_number <= ?)
+            GROUP BY condition
+        """,
+            [experiment_id, max_episode_number, max_episode_number],
+        ).fetchall()
+        return {
+            row[0]: {
+                "n": row[1],
+                "mean_kills": row[2],
+                "mean_kill_rate": row[3],
+                "mean_survival_time": row[4],
+            }
+            for row in rows
+        }
+
+    def write_race(
+        self, experiment_id: str, result: "RaceResult", schedule: str
+    ) -> None:
+        """Record every rung and the final ranking of a genome race."""
+        self._con.execute(
+            "DELETE FROM racing_rungs WHERE experiment_id = ?", [experiment_id]
+        )
+        self._con.execute(
+            "DELETE FROM racing_ranking WHERE experiment_id = ?", [experiment_id]
+        )
+        self._con.executemany(
+            """
+            INSERT INTO racing_rungs (
+                experiment_id, rung, condition, budget, n, mean_kills,
+                mean_kill_rate, mean_survival_time, score, survived
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+            [
+                [
+                    experiment_id, rung.rung, name, rung.budget,
+                    stats.get("n"), stats.get("mean_kills"),
+                    stats.get("mean_kill_rate"), stats.get("mean_survival_time"),
+                    rung.scores[name], name in rung.survivors,
+                ]
+                for rung in result.rungs
+                for name, stats in rung.stats.items()
+            ],
+        )
+        self._con.executemany(
+            """
+            INSERT INTO racing_ranking (
+                experiment_id, condition, final_rank, episodes, schedule
+            ) VALUES (?, ?, ?, ?, ?)
+        """,
+            [
+                [experiment_id, name, rank, result.budgets.get(name), schedule]
+                for rank, name in enumerate(result.ranking, start=1)
+            ],
+        )
+
+    def write_genomes(
+        self, experiment_id: str, action_type: str, genomes: dict[str, dict]
+    ) -> None:
+        """Register the genome parameters of an experiment's conditions."""
+        if not genomes:
+            return
+        self._con.executemany(
+            "DELETE FROM genomes WHERE experiment_id = ? AND condition = ?",
+            [[experiment_id, condition] for condition in genomes],
+        )
+        self._con.executemany(
+            """
+            INSERT INTO genomes (experiment_id, condition, action_type, genome)
+            VALUES (?, ?, ?, ?)
+        """,
+            [
+                [experiment_id, condition, action_type, json.dumps(params, sort_keys=True)]
+                for condition, params in genomes.items()
+            ],
+        )
+
+    def genome_outcomes(self, action_type: str) -> list[dict]:
+        """Per-genome means of every registered genome of an action type."""
+        self.flush()
+        rows = self._con.execute(
+            """
+            SELECT g.genome, COUNT(*), AVG(e.kills), AVG(e.kill_rate),
+                   AVG(e.survival_time)
+            FROM genomes g
+            JOIN experiments e USING (experiment_id, condition)
+            WHERE g.action_type = ?
+            GROUP BY g.experiment_id, g.condition, g.genome
+            ORDER BY g.experiment_id, g.condition
+        """,
+            [action_type],
+        ).fetchall()
+        return [
+            {
+                "genome": json.loads(row[0]),
+                "n": row[1],
+                "mean_kills": row[2],
+                "mean_kill_rate": row[3],
+                "mean_survival_time": row[4],
+            }
+            for row in rows
+        ]
+
+    def write_surrogate_predictions(
+        self, experiment_id: str, predictions: dict[str, "Prediction"]
+    ) -> None:
+        """Record (or replace) the surrogate predictions of a generation."""
+        self._con.execute(
+            "DELETE FROM surrogate_predictions WHERE experiment_id = ?",
+            [experiment_id],
+        )
+        self._con.executemany(
+            """
+            INSERT INTO surrogate_predictions (
+                experiment_id, condition, candidates, pred_kills,
+                pred_kill_rate, pred_survival_time, sd_kills, sd_kill_rate,
+                sd_survival_time, predicted_score, acquisition
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+            [
+                [
+                    experiment_id, condition, p.candidates,
+                    p.mean["mean_kills"], p.mean["mean_kill_rate"],
+                    p.mean["mean_survival_time"], p.std["mean_kills"],
+                    p.std["mean_kill_rate"], p.std["mean_survival_time"],
+                    p.predicted_score, p.acquisition,
+                ]
+                for condition, p in predictions.items()
+            ],
+        )
+
+    def surrogate_predictions(self, experiment_id: str) -> dict[str, dict]:
+        """Stored predictions: condition -> {mean_kills, ..., score}."""
+        rows = self._con.execute(
+            """
+            SELECT condition, pred_kills, pred_kill_rate, pred_survival_time,
+                   predicted_score
+            FROM surrogate_predictions WHERE experiment_id = ?
+        """,
+            [experiment_id],
+        ).fetchall()
+        return {
+            row[0]: {
+                "mean_kills": row[1],
+                "mean_kill_rate": row[2],
+                "mean_survival_time": row[3],
+                "score": row[4],
+            }
+            for row in rows
+        }
+
+    def record_surrogate_realized(
+        self, experiment_id: str, realized: dict[str, dict]
+    ) -> None:
+        """Fill in realized fitness ({mean_kills, ..., score}) per condition."""
+        self._con.executemany(
+            """
+            UPDATE surrogate_predictions
+            SET realized_kills = ?, realized_kill_rate = ?,
+                realized_survival_time = ?, realized_score = ?
+            WHERE experiment_id = ? AND condition = ?
+        """,
+            [
+                [
+                    r["mean_kills"], r["mean_kill_rate"],
+                    r["mean_survival_time"], r["score"], experiment_id, condition,
+                ]
+                for condition, r in realized.items()
+            ],
+        )
+
     def get_episode_count(self, experiment_id: str, condition: str) -> int:
         """Count completed episodes for a condition."""
+        self.flush()
+        index = self._indexes.get(experiment_id)
+        if index is not None:
+            return index.count(condition)
         result = self._con.execute(
             "SELECT COUNT(*) FROM experiments "
             "WHERE experiment_id = ? AND condition = ?",
@@ -125,6 +663,7 @@ class DuckDBWriter:
 
     def verify_integrity(self, experiment_id: str) -> dict:
         """Verify data integrity for an experiment."""
+        self.flush()
         issues: list[str] = []
 
         # Check episode counts per condition
@@ -167,4 +706,13 @@ class DuckDBWriter:
         }
 
     def close(self) -> None:
-        self._con.close()
+        try:
+            self.flush()
+        finally:
+            self._con.close()
+
+
+_INSERT_EPISODE_SQL = f"""
+    INSERT INTO experiments ({", ".join(EPISODE_COLUMNS)})
+    VALUES ({", ".join(["?"] * len(EPISODE_COLUMNS))})
+"""
@@ -0,0 +1,303 @@
+"""Multi-process episode pool: parallel VizDoom execution with a single writer.
+
+Each worker process owns its own VizDoomBridge/EpisodeRunner and pulls
+(run, seed, episode_number) work items from a shared FIFO queue.  Results
+come back over a result queue to the parent process, which is the only
+process that touches DuckDB.
+
+Design:
+    1. Work items are enqueued in the caller's order, so the randomized run
+       order of a DOE is preserved at dispatch time.
+    2. Workers keep their bridge warm across episodes and only rebuild it
+       when a run needs a different scenario / action space / skill.
+    3. Action functions are built once per run inside the worker via a
+       picklable ``action_factory(run)`` and reset with the episode seed,
+       exactly as in the serial executor.
+    4. The "fork" start method is used by default so workers share the
+       parent's str hash salt. GenomeAction seeds its RNG with ``hash()`` of
+       a tuple holding its ``turn_direction`` string, and str hashes differ
+       per interpreter unless PYTHONHASHSEED is set; a spawned or forkserver
+       worker would play different genome episodes than a serial run.
+       (Tuples of ints and floats hash the same in every process.)
+    5. Forking copies only the calling thread, so locks held by other
+       threads (gRPC channel pollers, L2 prefetch pools) would stay locked
+       in the workers. Policies are therefore built inside the workers only,
+       and run() warns when the parent forks while other threads are alive.
+"""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing as mp
+import os
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+# Seconds between worker liveness checks while waiting for results
+_POLL_INTERVAL = 1.0
+
+
+def _warn_if_threaded() -> None:
+    """Warn before forking workers from a process running other threads."""
+    current = threading.current_thread()
+    others = [t.name for t in threading.enumerate() if t is not current]
+    if others:
+        logger.warning(
+            "Forking episode workers while %d other thread(s) run (%s); "
+            "locks they hold stay locked in the workers",
+            len(others), ", ".join(others),
+        )
+
+
+@dataclass(frozen=True)
+class EpisodeTask:
+    """A single unit of work: one episode of one run."""
+
+    run_index: int  # index into the pool's run list
+    seed: int
+    episode_number: int
+
+
+@dataclass
+class EpisodeOutcome:
+    """Compact episode result returned from a worker to the writer."""
+
+    task: EpisodeTask
+    metrics: dict
+    kill_rate: float
+    decision_latency_p99: float
+    rule_match_rate: float
+    decision_level_counts: dict[str, int] = field(default_factory=dict)
+    worker_pid: int = 0
+    trace: Any = None  # EpisodeTrace when the pool records traces
+
+
+@dataclass
+class _EpisodeFailure:
+    """Error report from a worker (exceptions may not be picklable)."""
+
+    task: EpisodeTask
+    error: str
+    worker_pid: int
+
+
+def default_worker_count() -> int:
+    """Number of workers to use when the caller asks for all cores."""
+    return max(1, os.cpu_count() or 1)
+
+
+def _bridge_key(run: Any) -> tuple[str, int, int]:
+    """Bridge configuration a run needs: (scenario, num_actions, doom_skill)."""
+    return (
+        getattr(run, "scenario", "defend_the_center.cfg"),
+        getattr(run, "num_actions", 3),
+        getattr(run, "doom_skill", 3),
+    )
+
+
+def _worker_main(
+    runs: list,
+    action_factory: Callable[[Any], Any],
+    task_queue: "mp.Queue",
+    result_queue: "mp.Queue",
+    trace_experiment_id: Optional[str] = None,
+) -> None:
+    """Worker loop: run episodes until the None sentinel arrives."""
+    from glue.action_registry import close_policy
+    from glue.episode_runner import EpisodeRunner
+    from glue.vizdoom_bridge import VizDoomBridge
+
+    pid = os.getpid()
+    recorder = None
+    if trace_experiment_id is not None:
+        from glue.trace_recorder import TraceRecorder
+
+        recorder = TraceRecorder(trace_experiment_id)
+    bridge: Optional[VizDoomBridge] = None
+    runner: Optional[EpisodeRunner] = None
+    current_key: Optional[tuple[str, int, int]] = None
+    action_fns: dict[int, Any] = {}
+
+    try:
+        while True:
+            task = task_queue.get()
+            if task is None:
+                break
+
+            run = runs[task.run_index]
+            try:
+                key = _bridge_key(run)
+                if key != current_key:
+                    if bridge is not None:
+                        bridge.close()
+                    scenario, num_actions, doom_skill = key
+                    bridge = VizDoomBridge(
+                        scenario=scenario,
+                        num_actions=num_actions,
+                        doom_skill=doom_skill,
+                    )
+                    runner = EpisodeRunner(bridge)
+                    current_key = key
+
+                action_fn = action_fns.get(task.run_index)
+                if action_fn is None:
+                    action_fn = action_factory(run)
+                    action_fns[task.run_index] = action_fn
+
+                if hasattr(action_fn, "reset"):
+                    action_fn.reset(seed=task.seed)
+
+                result = runner.run_episode(
+                    seed=task.seed,
+                    condition=run.condition,
+                    episode_number=task.episode_number,
+                    action_fn=action_fn,
+                    trace=recorder,
+                )
+            except Exception as exc:  # reported to the parent, which aborts
+                result_queue.put(_EpisodeFailure(task, repr(exc), pid))
+                continue
+
+            result_queue.put(
+                EpisodeOutcome(
+                    task=task,
+                    metrics=result.metrics_dict(),
+                    kill_rate=result.metrics.kill_rate,
+                    decision_latency_p99=result.decision_latency_p99,
+                    rule_match_rate=result.rule_match_rate,
+                    decision_level_counts=result.decision_level_counts,
+                    worker_pid=pid,
+                    trace=result.trace,
+                )
+            )
+    finally:
+        for action_fn in action_fns.values():
+            close_policy(action_fn)
+        if bridge is not None:
+            bridge.close()
+
+
+class EpisodePool:
+    """Fixed set of worker processes executing EpisodeTasks.
+
+    Args:
+        runs: Run descriptions indexed by ``EpisodeTask.run_index``. Each run
+            must be picklable and expose ``condition`` plus (optionally)
+            ``scenario``, ``num_actions`` and ``doom_skill``.
+        action_factory: Module-level (picklable) callable building the
+            action function for a run.
+        workers: Number of worker processes.
+        start_method: multiprocessing start method (default "fork", see
+            the module docstring).
+        trace_experiment_id: If set, workers record per-decision traces
+            under this experiment ID and return them in EpisodeOutcome.trace.
+    """
+
+    def __init__(
+        self,
+        runs: list,
+        action_factory: Callable[[Any], Any],
+        workers: int,
+        start_method: str = "fork",
+        trace_experiment_id: Optional[str] = None,
+    ) -> None:
+        if workers < 1:
+            raise ValueError(f"workers must be >= 1, got {workers}")
+        self._runs = list(runs)
+        self._action_factory = action_factory
+        self._workers = workers
+        self._ctx = mp.get_context(start_method)
+        self._trace_experiment_id = trace_experiment_id
+
+    def run(
+        self,
+        tasks: Iterable[EpisodeTask],
+        on_result: Callable[[EpisodeOutcome], None],
+    ) -> int:
+        """Execute all tasks, invoking ``on_result`` in this process.
+
+        Tasks are dispatched in iteration order. ``on_result`` is the single
+        writer: it is called once per episode, in completion order.
+
+        Returns:
+            Number of completed episodes.
+
+        Raises:
+            RuntimeError: If an episode fails or a worker dies. Results that
+                arrived before the failure have already been passed to
+                ``on_result``, so the run can be resumed.
+        """
+        tasks = list(tasks)
+        if not tasks:
+            return 0
+
+        n_workers = min(self._workers, len(tasks))
+        task_queue = self._ctx.Queue()
+        result_queue = self._ctx.Queue()
+
+        for task in tasks:
+            task_queue.put(task)
+        for _ in range(n_workers):
+            task_queue.put(None)
+
+        procs = [
+            self._ctx.Process(
+                target=_worker_main,
+                args=(
+                    self._runs,
+                    self._action_factory,
+                    task_queue,
+                    result_queue,
+                    self._trace_experiment_id,
+                ),
+                name=f"episode-worker-{i}",
+                daemon=True,
+            )
+            for i in range(n_workers)
+        ]
+        if self._ctx.get_start_method() == "fork":
+            _warn_if_threaded()
+        for p in procs:
+            p.start()
+        logger.info(
+            "Episode pool started: %d workers, %d episodes", n_workers, len(tasks)
+        )
+
+        completed = 0
+        try:
+            while completed < len(tasks):
+                try:
+                    item = result_queue.get(timeout=_POLL_INTERVAL)
+                except queue.Empty:
+                    dead = [p for p in procs if not p.is_alive() and p.exitcode != 0]
+                    if dead:
+                        raise RuntimeError(
+                            f"Episode worker {dead[0].name} exited with code "
+                            f"{dead[0].exitcode} ({completed}/{len(tasks)} done)"
+                        )
+                    continue
+
+                if isinstance(item, _EpisodeFailure):
+                    raise RuntimeError(
+                        f"Episode failed in worker {item.worker_pid} "
+                        f"(run_index={item.task.run_index}, seed={item.task.seed}): "
+                        f"{item.error}"
+                    )
+
+                on_result(item)
+                completed += 1
+        finally:
+            if completed < len(tasks):
+                for p in procs:
+                    if p.is_alive():
+                        p.terminate()
+            deadline = time.monotonic() + 30.0
+            for p in procs:
+                p.join(timeout=max(0.0, deadline - time.monotonic()))
+
+        return completed
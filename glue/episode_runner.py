@@ -5,8 +5,9 @@ from __future__ import annotations
 import logging
 import time
 from dataclasses import dataclass
-from typing import Callable, Optional
+from typing import TYPE_CHECKING, Callable, Optional, Union
 
+from glue.policy_compiler import CompiledPolicy
 from glue.vizdoom_bridge import (
     EpisodeMetrics,
     GameState,
@@ -14,11 +15,16 @@ from glue.vizdoom_bridge import (
     VizDoomBridge,
 )
 
+if TYPE_CHECKING:
+    from glue.trace_recorder import EpisodeTrace, TraceRecorder
+
 logger = logging.getLogger(__name__)
 
 # Type for action selection function
-# Takes GameState, returns action index [0, NUM_ACTIONS)
-ActionFn = Callable[[GameState], int]
+# Takes GameState, returns action index [0, NUM_ACTIONS), or an
+# (action, repeat_count) plan to hold the action for several tics
+ActionPlan = tuple[int, int]
+ActionFn = Callable[[GameState], Union[int, ActionPlan]]
 
 
 @dataclass
@@ -29,8 +35,9 @@ class EpisodeResult:
     condition: str
     episode_number: int
     metrics: EpisodeMetrics
-    decision_latencies: list[float]  # per-tick latency in ms
-    decision_levels: list[int]  # per-tick decision level
+    decision_latencies: list[float]  # per-decision latency in ms
+    decision_levels: list[int]  # per-decision decision level
+    trace: Optional["EpisodeTrace"] = None  # per-decision records, if traced
 
     @property
     def decision_latency_p99(self) -> float:
@@ -48,6 +55,30 @@ class EpisodeResult:
             self.decision_levels
         )
 
+    @property
+    def decision_level_counts(self) -> dict[str, int]:
+        """Occurrences of each decision level, keyed by str(level)."""
+        counts: dict[str, int] = {}
+        for level in self.decision_levels:
+            key = str(level)
+            counts[key] = counts.get(key, 0) + 1
+        return counts
+
+    def metrics_dict(self) -> dict:
+        """Episode metrics in the format expected by DuckDBWriter."""
+        return {
+            "survival_time": self.metrics.survival_time,
+            "kills": self.metrics.kills,
+            "damage_dealt": self.metrics.damage_dealt,
+            "damage_taken": self.metrics.damage_taken,
+            "ammo_efficiency": self.metrics.ammo_efficiency,
+            "exploration_coverage": self.metrics.exploration_coverage,
+            "total_ticks": self.metrics.total_ticks,
+            "shots_fired": self.metrics.shots_fired,
+            "hits": self.metrics.hits,
+            "cells_visited": self.metrics.cells_visited,
+        }
+
 
 class EpisodeRunner:
     """Runs episodes with pluggable action selection."""
@@ -62,12 +93,27 @@ class EpisodeRunner:
         episode_number: int,
         action_fn: ActionFn,
         decision_level: int = -1,  # -1 for random, 0 for rule-only
+        frame_skip: int = 1,
+        trace: Optional["TraceRecorder"] = None,
     ) -> EpisodeResult:
-        """Run a single episode."""
+        """Run a single episode.
+
+        With ``frame_skip > 1`` each decision is held for that many tics.
+        An action function may also return an ``(action, repeat_count)``
+        plan, which overrides ``frame_skip`` for that decision. Latencies
+        and decision levels are recorded once per decision, and so are the
+        rows of the optional ``trace`` recorder (returned as result.trace).
+        A CompiledPolicy's kernel is called directly.
+        """
         self._bridge.start_episode(seed)
+        if trace is not None:
+            trace.begin(condition, episode_number, self._bridge.get_button_names())
 
         decision_latencies: list[float] = []
         decision_levels: list[int] = []
+        decide = action_fn.kernel if isinstance(action_fn, CompiledPolicy) else action_fn
+        # Use dynamic decision level from gRPC if available
+        has_dynamic_level = hasattr(action_fn, 'last_decision_level')
 
         while not self._bridge.is_episode_finished():
             state = self._bridge.get_game_state()
@@ -75,18 +121,26 @@ class EpisodeRunner:
                 break
 
             t0 = time.perf_counter_ns()
-            action = action_fn(state)
+            action = decide(state)
             t1 = time.perf_counter_ns()
 
+            if isinstance(action, tuple):
+                action, repeat = action
+            else:
+                repeat = frame_skip
+
             latency_ms = (t1 - t0) / 1e6
             decision_latencies.append(latency_ms)
-            # Use dynamic decision level from gRPC if available
-            if hasattr(action_fn, 'last_decision_level'):
-                decision_levels.append(action_fn.last_decision_level)
+            if has_dynamic_level:
+                level = action_fn.last_decision_level
             else:
-                decision_levels.append(decision_level)
+                level = decision_level
+            decision_levels.append(level)
+
+            if trace is not None:
+                trace.record(state, action, level, latency_ms)
 
-            self._bridge.make_action(action)
+            self._bridge.make_action(action, tics=repeat)
 
         metrics = self._bridge.get_episode_metrics()
 
@@ -97,6 +151,7 @@ class EpisodeRunner:
             metrics=metrics,
             decision_latencies=decision_latencies,
             decision_levels=decision_levels,
+            trace=trace.end() if trace is not None else None,
         )
 
     def run_condition(
@@ -107,6 +162,7 @@ class EpisodeRunner:
         action_fn: ActionFn,
         decision_level: int = -1,
         on_episode_complete: Optional[Callable[[EpisodeResult], None]] = None,
+        frame_skip: int = 1,
     ) -> list[EpisodeResult]:
         """Run all episodes for a condition."""
         results: list[EpisodeResult] = []
@@ -119,7 +175,8 @@ class EpisodeRunner:
             )
 
             result = self.run_episode(
-                seed, condition, episode_number, action_fn, decision_level
+                seed, condition, episode_number, action_fn, decision_level,
+                frame_skip=frame_skip,
             )
             results.append(result)
 
@@ -0,0 +1,187 @@
+"""Asyncio gRPC client: many concurrent episodes over one agent-core channel.
+
+A single AsyncAgentChannel owns one ``grpc.aio`` channel and an event loop
+running in a background thread. Each concurrently running episode gets a
+lightweight AsyncGrpcActionClient handle that implements the blocking
+ActionFn protocol, so EpisodeRunner is unchanged: ``__call__`` submits a
+Tick coroutine to the shared loop and waits for its result.
+
+Flow control and fallback:
+    - At most ``max_in_flight`` Tick RPCs are outstanding on the channel;
+      further ticks wait for a slot.
+    - Every tick has a deadline covering both the wait for a slot and the
+      RPC. If it expires, the handle answers with a local L0 rule instead
+      (decision_level 0, rule_matched "deadline_fallback") so a slow
+      agent-core never stalls the game loop. Other RPC errors propagate.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from typing import Callable, Optional
+
+import grpc
+
+from glue.action_functions import rule_only_action
+from glue.grpc_client import _ACTION_TYPE_TO_INDEX, to_proto_state
+from glue.proto import agent_pb2
+from glue.proto.agent_pb2_grpc import AgentServiceStub
+from glue.vizdoom_bridge import GameState
+
+FALLBACK_RULE = "deadline_fallback"
+
+
+class AsyncAgentChannel:
+    """Shared grpc.aio channel multiplexing Tick RPCs from many episodes.
+
+    Args:
+        host, port: agent-core address.
+        max_in_flight: Maximum concurrent Tick RPCs on the channel.
+        deadline_ms: Per-tick budget (slot wait + RPC) before falling back.
+        fallback: Local rule used when the deadline expires.
+    """
+
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 50051,
+        max_in_flight: int = 32,
+        deadline_ms: float = 50.0,
+        fallback: Callable[[GameState], int] = rule_only_action,
+    ):
+        if max_in_flight < 1:
+            raise ValueError(f"max_in_flight must be >= 1, got {max_in_flight}")
+        self._target = f"{host}:{port}"
+        self._max_in_flight = max_in_flight
+        self.deadline_s = deadline_ms / 1000.0
+        self.fallback = fallback
+
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="grpc-aio-loop", daemon=True
+        )
+        self._thread.start()
+        self._channel: Optional[grpc.aio.Channel] = None
+        self._stub: Optional[AgentServiceStub] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._submit(self._open()).result()
+
+        self._stats_lock = threading.Lock()
+        self.ticks = 0
+        self.fallbacks = 0
+
+    # ------------------------------------------------------------------
+    # Event-loop side
+    # ------------------------------------------------------------------
+
+    def _submit(self, coro):
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+
+    async def _open(self) -> None:
+        # aio objects must be created on the loop that uses them
+        self._channel = grpc.aio.insecure_channel(self._target)
+        self._stub = AgentServiceStub(self._channel)
+        self._slots = asyncio.Semaphore(self._max_in_flight)
+
+    async def _tick(self, request: agent_pb2.GameState) -> Optional[agent_pb2.Action]:
+        """One Tick within the deadline; None if the deadline expired."""
+        loop = asyncio.get_running_loop()
+        expires = loop.time() + self.deadline_s
+        try:
+            await asyncio.wait_for(self._slots.acquire(), self.deadline_s)
+        except asyncio.TimeoutError:
+            return None
+        try:
+            return await self._stub.Tick(
+                request, timeout=max(expires - loop.time(), 0.0)
+            )
+        except grpc.aio.AioRpcError as exc:
+            if exc.code() == grpc.StatusCode.DEADLINE_EXCEEDED:
+                return None
+            raise
+        finally:
+            self._slots.release()
+
+    async def _close(self) -> None:
+        await self._channel.close()
+
+    # ------------------------------------------------------------------
+    # Caller side (any thread)
+    # ------------------------------------------------------------------
+
+    def tick(self, request: agent_pb2.GameState) -> Optional[agent_pb2.Action]:
+        """Blocking Tick from any thread; None means use the fallback."""
+        response = self._submit(self._tick(request)).result()
+        with self._stats_lock:
+            self.ticks += 1
+            if response is None:
+                self.fallbacks += 1
+        return response
+
+    def episode(self, cascade_mode: str = "full_agent") -> "AsyncGrpcActionClient":
+        """New ActionFn handle for one concurrently running episode."""
+        return AsyncGrpcActionClient(self, cascade_mode)
+
+    @property
+    def fallback_rate(self) -> float:
+        with self._stats_lock:
+            return self.fallbacks / self.ticks if self.ticks else 0.0
+
+    def close(self) -> None:
+        """Close the channel and stop the event loop thread."""
+        if not self._loop.is_running():
+            return
+        self._submit(self._close()).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    def __enter__(self) -> "AsyncAgentChannel":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class AsyncGrpcActionClient:
+    """Per-episode ActionFn handle on a shared AsyncAgentChannel.
+
+    Same metadata as GrpcActionClient (last_decision_level,
+    last_latency_ms, last_confidence, last_rule_matched, last_rtt_ms).
+    Handles are cheap; create one per concurrently running episode.
+    """
+
+    def __init__(self, channel: AsyncAgentChannel, cascade_mode: str = "full_agent"):
+        self._channel = channel
+        self._cascade_mode = cascade_mode
+
+        self.last_decision_level: int = -1
+        self.last_latency_ms: float = 0.0
+        self.last_rtt_ms: float = 0.0
+        self.last_confidence: float = 0.0
+        self.last_rule_matched: str = ""
+        self.fallback_count = 0
+
+    def reset(self, seed: int = 0) -> None:
+        self.fallback_count = 0
+
+    def __call__(self, state: GameState) -> int:
+        t0 = time.perf_counter_ns()
+        response = self._channel.tick(to_proto_state(state, self._cascade_mode))
+        self.last_rtt_ms = (time.perf_counter_ns() - t0) / 1e6
+
+        if response is None:
+            self.fallback_count += 1
+            self.last_decision_level = 0
+            self.last_latency_ms = self.last_rtt_ms
+            self.last_confidence = 1.0
+            self.last_rule_matched = FALLBACK_RULE
+            return self._channel.fallback(state)
+
+        self.last_decision_level = response.decision_level
+        self.last_latency_ms = response.latency_ms
+        self.last_confidence = response.confidence
+        self.last_rule_matched = response.rule_matched
+        return _ACTION_TYPE_TO_INDEX.get(response.action_type, 2)
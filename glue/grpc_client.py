@@ -3,6 +3,9 @@
 from __future__ import annotations
 
 import logging
+import queue
+import time
+from typing import Iterator, Optional
 
 import grpc
 
@@ -20,10 +23,42 @@ _ACTION_TYPE_TO_INDEX = {
 }
 
 
+def to_proto_state(state: GameState, cascade_mode: str) -> agent_pb2.GameState:
+    """Convert a bridge GameState into the proto request message."""
+    return agent_pb2.GameState(
+        health=state.health,
+        ammo=state.ammo,
+        kills=state.kills,
+        enemies_visible=state.enemies_visible,
+        position_x=state.position_x,
+        position_y=state.position_y,
+        position_z=state.position_z,
+        angle=state.angle,
+        episode_time=state.episode_time,
+        is_dead=state.is_dead,
+        tick=state.tick,
+        cascade_mode=cascade_mode,
+    )
+
+
+def _percentile(values: list[float], q: float) -> float:
+    """Nearest-rank percentile (same convention as EpisodeResult)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(int(len(ordered) * q), len(ordered) - 1)]
+
+
 class GrpcActionClient:
     """gRPC-based action selection via Rust agent-core.
 
     Implements ActionFn protocol (callable: GameState -> int).
+
+    Args:
+        streaming: Use one long-lived bidirectional StreamTick stream per
+            episode instead of a unary Tick RPC per tick. The stream is
+            opened lazily on the first tick and closed by reset()/close().
+            Decisions and last_* metadata are identical in both modes.
     """
 
     def __init__(
@@ -31,46 +66,128 @@ class GrpcActionClient:
         host: str = "localhost",
         port: int = 50051,
         cascade_mode: str = "full_agent",
+        streaming: bool = False,
     ):
         self._channel = grpc.insecure_channel(f"{host}:{port}")
         self._stub = AgentServiceStub(self._channel)
         self._cascade_mode = cascade_mode
+        self._streaming = streaming
+
+        # Open StreamTick call: request queue feeding the stream + responses
+        self._requests: Optional[queue.SimpleQueue] = None
+        self._responses: Optional[Iterator[agent_pb2.Action]] = None
 
         # Last response metadata (for episode_runner to read)
         self.last_decision_level: int = -1
-        self.last_latency_ms: float = 0.0
+        self.last_latency_ms: float = 0.0  # server-reported decision latency
+        self.last_rtt_ms: float = 0.0  # client-measured round trip
         self.last_confidence: float = 0.0
         self.last_rule_matched: str = ""
 
+        # Per-episode latency samples (cleared by reset())
+        self._rtts_ms: list[float] = []
+        self._server_latencies_ms: list[float] = []
+
+    def reset(self, seed: int = 0) -> None:
+        """Start a new episode: close the stream, log and clear latency samples."""
+        self._close_stream()
+        self._log_latency_summary()
+        self._rtts_ms = []
+        self._server_latencies_ms = []
+
     def __call__(self, state: GameState) -> int:
         """ActionFn protocol: convert state to gRPC call, return action index."""
-        proto_state = agent_pb2.GameState(
-            health=state.health,
-            ammo=state.ammo,
-            kills=state.kills,
-            enemies_visible=state.enemies_visible,
-            position_x=state.position_x,
-            position_y=state.position_y,
-            position_z=state.position_z,
-            angle=state.angle,
-            episode_time=state.episode_time,
-            is_dead=state.is_dead,
-            tick=state.tick,
-            cascade_mode=self._cascade_mode,
-        )
+        proto_state = to_proto_state(state, self._cascade_mode)
 
-        response = self._stub.Tick(proto_state)
+        t0 = time.perf_counter_ns()
+        if self._streaming:
+            response = self._stream_tick(proto_state)
+        else:
+            response = self._stub.Tick(proto_state)
+        rtt_ms = (time.perf_counter_ns() - t0) / 1e6
 
         # Store metadata for episode_runner
         self.last_decision_level = response.decision_level
         self.last_latency_ms = response.latency_ms
+        self.last_rtt_ms = rtt_ms
         self.last_confidence = response.confidence
         self.last_rule_matched = response.rule_matched
 
+        self._rtts_ms.append(rtt_ms)
+        self._server_latencies_ms.append(response.latency_ms)
+
         return _ACTION_TYPE_TO_INDEX.get(response.action_type, 2)
 
+    def _stream_tick(self, proto_state: agent_pb2.GameState) -> agent_pb2.Action:
+        """Send one frame over the episode's StreamTick stream."""
+        if self._responses is None:
+            self._requests = queue.SimpleQueue()
+            # Request iterator ends when the None sentinel is queued
+            self._responses = self._stub.StreamTick(iter(self._requests.get, None))
+
+        self._requests.put(proto_state)
+        try:
+            return next(self._responses)
+        except (grpc.RpcError, StopIteration) as exc:
+            # Stream is unusable; the next tick opens a fresh one. The sentinel
+            # releases gRPC's request-consumer thread blocked on the queue.
+            self._requests.put(None)
+            self._requests = None
+            self._responses = None
+            if isinstance(exc, StopIteration):
+                raise RuntimeError("StreamTick closed by server") from None
+            raise
+
+    def _close_stream(self) -> None:
+        """Half-close the StreamTick stream and wait for the server to end it."""
+        if self._responses is None:
+            return
+        self._requests.put(None)
+        try:
+            for _ in self._responses:
+                pass
+        except grpc.RpcError as exc:
+            logger.debug("StreamTick closed with %s", exc.code())
+        self._requests = None
+        self._responses = None
+
+    def latency_summary(self) -> dict[str, float]:
+        """Client round-trip vs server-reported latency for the current episode.
+
+        The difference between the two is transport overhead (serialization,
+        HTTP/2 framing, per-call setup in unary mode).
+        """
+        rtts = self._rtts_ms
+        server = self._server_latencies_ms
+        return {
+            "n": float(len(rtts)),
+            "rtt_p50_ms": _percentile(rtts, 0.50),
+            "rtt_p95_ms": _percentile(rtts, 0.95),
+            "rtt_p99_ms": _percentile(rtts, 0.99),
+            "server_p50_ms": _percentile(server, 0.50),
+            "server_p95_ms": _percentile(server, 0.95),
+            "server_p99_ms": _percentile(server, 0.99),
+        }
+
+    def _log_latency_summary(self) -> None:
+        """Log the finished episode's latency summary (no-op without samples)."""
+        if not self._rtts_ms:
+            return
+        s = self.latency_summary()
+        logger.info(
+            "gRPC %s: %d ticks, rtt p50/p95/p99=%.2f/%.2f/%.2fms, "
+            "server p50/p95/p99=%.2f/%.2f/%.2fms",
+            "StreamTick" if self._streaming else "Tick", s["n"],
+            s["rtt_p50_ms"], s["rtt_p95_ms"], s["rtt_p99_ms"],
+            s["server_p50_ms"], s["server_p95_ms"], s["server_p99_ms"],
+        )
+
     def close(self) -> None:
-        """Close the gRPC channel."""
+        """Close the stream (if any) and the gRPC channel."""
+        self._close_stream()
+        self._log_latency_summary()
+        self._rtts_ms = []
+        self._server_latencies_ms = []
         self._channel.close()
 
 
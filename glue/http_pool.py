@@ -0,0 +1,247 @@
+"""Keep-alive HTTP connection pools shared across glue (stdlib only).
+
+OpenSearch traffic (L2 policy queries, seeding) goes through one
+HTTPConnectionPool per host instead of a new TCP connection per request.
+get_pool() returns the process-wide pool for a base URL; pools are
+re-created after fork so worker processes never share sockets with
+their parent.
+
+Each pool records per-request latency (connection wait + round trip) and
+exposes latency_summary() with p50/p95/p99.
+"""
+
+from __future__ import annotations
+
+import http.client
+import os
+import queue
+import threading
+import time
+from typing import Optional
+from urllib.parse import urlsplit
+
+DEFAULT_POOL_SIZE = 4
+DEFAULT_TIMEOUT = 10.0  # seconds
+_MAX_LATENCY_SAMPLES = 10_000
+
+# Errors meaning a reused keep-alive connection was closed by the server
+_STALE_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.CannotSendRequest,
+    BrokenPipeError,
+    ConnectionResetError,
+)
+
+
+class HTTPError(Exception):
+    """Non-2xx response from a pooled request."""
+
+    def __init__(self, status: int, reason: str, body: bytes):
+        super().__init__(f"HTTP {status} {reason}: {body[:200]!r}")
+        self.status = status
+        self.reason = reason
+        self.body = body
+
+
+def _percentile(values: list[float], q: float) -> float:
+    """Nearest-rank percentile (same convention as EpisodeResult)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(int(len(ordered) * q), len(ordered) - 1)]
+
+
+class HTTPConnectionPool:
+    """Bounded pool of persistent HTTP/1.1 connections to one host.
+
+    Args:
+        base_url: ``http://host:port`` (https is supported; a path prefix
+            is prepended to every request path).
+        maxsize: Maximum open connections; callers block for a free one.
+        timeout: Default socket timeout in seconds.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        maxsize: int = DEFAULT_POOL_SIZE,
+        timeout: float = DEFAULT_TIMEOUT,
+    ):
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be >= 1, got {maxsize}")
+        parts = urlsplit(base_url)
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            raise ValueError(f"Unsupported base URL: {base_url!r}")
+        self.base_url = base_url
+        self.maxsize = maxsize
+        self.timeout = timeout
+        self._conn_cls = (
+            http.client.HTTPSConnection if parts.scheme == "https"
+            else http.client.HTTPConnection
+        )
+        self._host = parts.hostname
+        self._port = parts.port
+        self._prefix = parts.path.rstrip("/")
+
+        # LIFO so the warmest connection is reused first; None = free slot
+        self._idle: queue.LifoQueue = queue.LifoQueue(maxsize)
+        for _ in range(maxsize):
+            self._idle.put(None)
+        self._lock = threading.Lock()
+        self._latencies_ms: list[float] = []
+        self.requests = 0
+        self.connections_opened = 0
+        self.errors = 0
+
+    def _new_connection(self, timeout: float) -> http.client.HTTPConnection:
+        with self._lock:
+            self.connections_opened += 1
+        return self._conn_cls(self._host, self._port, timeout=timeout)
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        body: Optional[bytes | str] = None,
+        headers: Optional[dict[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> bytes:
+        """Send one request over a pooled connection; returns the body.
+
+        A reused connection the server has closed is transparently replaced
+        once. Raises HTTPError for non-2xx responses and OSError /
+        http.client.HTTPException for transport failures.
+        """
+        timeout = self.timeout if timeout is None else timeout
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        start = time.perf_counter()
+        try:
+            conn = self._idle.get(timeout=timeout)
+        except queue.Empty:
+            with self._lock:
+                self.errors += 1
+            raise TimeoutError(f"No free connection to {self.base_url} within {timeout}s")
+
+        keep = False
+        try:
+            reused = conn is not None
+            if conn is None:
+                conn = self._new_connection(timeout)
+            try:
+                status, reason, data, will_close = self._send(
+                    conn, method, path, body, headers, timeout
+                )
+            except _STALE_ERRORS:
+                if not reused:
+                    raise
+                conn.close()
+                conn = self._new_connection(timeout)
+                status, reason, data, will_close = self._send(
+                    conn, method, path, body, headers, timeout
+                )
+            keep = not will_close
+        except Exception:
+            with self._lock:
+                self.errors += 1
+            raise
+        finally:
+            if not keep and conn is not None:
+                conn.close()
+            self._idle.put(conn if keep else None)
+
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        with self._lock:
+            self.requests += 1
+            if len(self._latencies_ms) < _MAX_LATENCY_SAMPLES:
+                self._latencies_ms.append(elapsed_ms)
+        if not 200 <= status < 300:
+            raise HTTPError(status, reason, data)
+        return data
+
+    def _send(self, conn, method, path, body, headers, timeout):
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout)
+        else:
+            conn.timeout = timeout
+        conn.request(method, self._prefix + path, body=body, headers=headers or {})
+        resp = conn.getresponse()
+        data = resp.read()
+        return resp.status, resp.reason, data, resp.will_close
+
+    def latency_summary(self) -> dict[str, float]:
+        """Request count and latency percentiles (ms) since the last reset."""
+        with self._lock:
+            samples = list(self._latencies_ms)
+        return {
+            "n": len(samples),
+            "p50_ms": _percentile(samples, 0.50),
+            "p95_ms": _percentile(samples, 0.95),
+            "p99_ms": _percentile(samples, 0.99),
+        }
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._latencies_ms = []
+            self.requests = 0
+            self.connections_opened = 0
+            self.errors = 0
+
+    def close(self) -> None:
+        """Close idle connections; in-use ones are returned as usual."""
+        drained = 0
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            drained += 1
+            if conn is not None:
+                conn.close()
+        for _ in range(drained):
+            self._idle.put(None)
+
+
+# ---------------------------------------------------------------------------
+# Process-wide registry
+# ---------------------------------------------------------------------------
+
+_pools: dict[str, HTTPConnectionPool] = {}
+_pool_sizes: dict[str, int] = {}
+_pools_pid = os.getpid()
+_registry_lock = threading.Lock()
+
+
+def _pool_key(base_url: str) -> str:
+    return base_url.rstrip("/")
+
+
+def configure_pool(base_url: str, maxsize: int) -> None:
+    """Set the pool size for ``base_url`` (applies to pools created afterwards)."""
+    with _registry_lock:
+        _pool_sizes[_pool_key(base_url)] = maxsize
+
+
+def get_pool(base_url: str, timeout: float = DEFAULT_TIMEOUT) -> HTTPConnectionPool:
+    """Shared pool for ``base_url``, created on first use."""
+    global _pools_pid
+    key = _pool_key(base_url)
+    with _registry_lock:
+        if _pools_pid != os.getpid():
+            # Forked child: drop (without closing) the parent's sockets
+            _pools.clear()
+            _pools_pid = os.getpid()
+        pool = _pools.get(key)
+        if pool is None:
+            size = _pool_sizes.get(key, DEFAULT_POOL_SIZE)
+            pool = _pools[key] = HTTPConnectionPool(key, maxsize=size, timeout=timeout)
+        return pool
+
+
+def close_all_pools() -> None:
+    """Close and forget every shared pool in this process."""
+    with _registry_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
@@ -0,0 +1,238 @@
+"""Compile stateless/periodic action functions into lookup-table kernels.
+
+Many policies in glue.action_functions are pure functions of (tick,
+health, ammo, RNG draw): an optional health / ammo emergency rule, then
+either a fixed cycle of actions (some positions drawing uniformly from a
+few moves) or a Bernoulli attack draw. compile_policy() describes such a
+policy as a PolicyTable and returns a CompiledPolicy whose per-episode
+kernel is a closure over precomputed tables: no attribute lookups, list
+allocations or random.Random method dispatch per tick.
+
+Decisions are bit-identical to the interpreted classes: the kernel seeds
+the same random.Random and consumes it the same way, but calls the C-level
+getrandbits()/random() directly instead of going through Random.choice()
+(Random._randbelow: r = getrandbits(n.bit_length()), redrawn while r >= n).
+That copy of a CPython implementation detail is pinned by
+test_policy_compiler.test_kernel_draws_match_random_choice.
+
+EpisodeRunner.run_episode calls CompiledPolicy.kernel directly.
+"""
+
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass
+from typing import Any, Callable, Optional, Union
+
+from glue.action_functions import (
+    AttackOnlyAction,
+    AttackRatioAction,
+    AttackRatioActionRaw,
+    Burst1Action,
+    Burst3Action,
+    Burst3ThresholdAction,
+    Burst5Action,
+    Burst7Action,
+    BurstCycleAction,
+    ForwardAttackAction,
+    PureAttackAction,
+)
+from glue.vizdoom_bridge import ACTION_ATTACK, ACTION_MOVE_LEFT, ACTION_MOVE_RIGHT, GameState
+
+# A table slot is a fixed action (int) or a uniform draw over a tuple of actions
+Slot = Union[int, tuple[int, ...]]
+
+
+@dataclass(frozen=True)
+class PolicyTable:
+    """Declarative form of a compilable policy.
+
+    Per tick, in order:
+        1. ``health < health_threshold`` -> ``health_slot``
+        2. ``ammo == 0`` -> ``ammo_slot`` (if set)
+        3. ``attack_ratio`` set: ``random() < attack_ratio`` -> ``ratio_attack``,
+           else a draw from ``ratio_moves``
+        4. otherwise ``cycle[tick % len(cycle)]``, advancing tick.
+    """
+
+    cycle: tuple[Slot, ...] = ()
+    health_threshold: Optional[int] = None
+    health_slot: Optional[Slot] = None
+    ammo_slot: Optional[Slot] = None
+    attack_ratio: Optional[float] = None
+    ratio_attack: int = 4
+    ratio_moves: tuple[int, ...] = (0, 1, 2, 3)
+    seed_fn: Callable[[int], int] = int  # seed passed to random.Random on reset
+    default_seed: int = 42  # random.Random seed before the first reset
+
+
+def _make_kernel(table: PolicyTable, seed: int) -> Callable[[GameState], int]:
+    """Build one episode's decision closure."""
+    health_threshold = table.health_threshold
+    health_slot = table.health_slot
+    has_ammo_rule = table.ammo_slot is not None
+    ammo_slot = table.ammo_slot
+    ratio = table.attack_ratio
+    ratio_attack = table.ratio_attack
+    ratio_moves = table.ratio_moves
+    ratio_n = len(ratio_moves)
+    ratio_bits = ratio_n.bit_length()
+    cycle_len = len(table.cycle)
+    # Per cycle position: (fixed action, choices, bits)
+    cycle = [
+        (slot, None, 0) if isinstance(slot, int) else (None, slot, len(slot).bit_length())
+        for slot in table.cycle
+    ]
+
+    if (
+        cycle_len == 1 and cycle[0][1] is None
+        and health_threshold is None and not has_ammo_rule and ratio is None
+    ):
+        action = cycle[0][0]
+        return lambda state: action
+
+    rng = random.Random(seed)
+    getrandbits = rng.getrandbits
+    uniform = rng.random
+
+    def choice(seq: tuple[int, ...]) -> int:
+        # Random.choice -> Random._randbelow_with_getrandbits
+        n = len(seq)
+        k = n.bit_length()
+        r = getrandbits(k)
+        while r >= n:
+            r = getrandbits(k)
+        return seq[r]
+
+    tick = 0
+
+    def kernel(state: GameState) -> int:
+        nonlocal tick
+        if health_threshold is not None and state.health < health_threshold:
+            return health_slot if isinstance(health_slot, int) else choice(health_slot)
+        if has_ammo_rule and state.ammo == 0:
+            return ammo_slot if isinstance(ammo_slot, int) else choice(ammo_slot)
+        if ratio is not None:
+            if uniform() < ratio:
+                return ratio_attack
+            r = getrandbits(ratio_bits)
+            while r >= ratio_n:
+                r = getrandbits(ratio_bits)
+            return ratio_moves[r]
+        fixed, seq, k = cycle[tick % cycle_len]
+        tick += 1
+        if seq is None:
+            return fixed
+        n = len(seq)
+        r = getrandbits(k)
+        while r >= n:
+            r = getrandbits(k)
+        return seq[r]
+
+    return kernel
+
+
+class CompiledPolicy:
+    """ActionFn backed by a PolicyTable kernel (rebuilt on every reset)."""
+
+    def __init__(self, table: PolicyTable, source: Any = None):
+        self.table = table
+        self.source = source
+        self.kernel = _make_kernel(table, table.default_seed)
+
+    def reset(self, seed: int = 0) -> None:
+        self.kernel = _make_kernel(self.table, self.table.seed_fn(seed))
+
+    def __call__(self, state: GameState) -> int:
+        return self.kernel(state)
+
+
+# ---------------------------------------------------------------------------
+# Compilers for supported action classes
+# ---------------------------------------------------------------------------
+
+_MOVE_LR = (ACTION_MOVE_LEFT, ACTION_MOVE_RIGHT)
+_STRAFE = (2, 3)  # MOVE_LEFT / MOVE_RIGHT in the 5-action space
+
+
+def _burst(attacks: int, seed_fn: Callable[[int], int], default_seed: int) -> PolicyTable:
+    return PolicyTable(
+        cycle=(ACTION_ATTACK,) * attacks + (_MOVE_LR,),
+        health_threshold=20,
+        health_slot=ACTION_MOVE_LEFT,
+        ammo_slot=ACTION_MOVE_LEFT,
+        seed_fn=seed_fn,
+        default_seed=default_seed,
+    )
+
+
+def _compile_burst3(fn: Burst3Action) -> Optional[PolicyTable]:
+    return None if fn.plan else _burst(3, hash, 0)
+
+
+def _compile_burst3_threshold(fn: Burst3ThresholdAction) -> PolicyTable:
+    return PolicyTable(
+        cycle=(ACTION_ATTACK,) * 3 + (_MOVE_LR,),
+        health_threshold=fn._health_threshold,
+        health_slot=_MOVE_LR,
+        ammo_slot=ACTION_MOVE_LEFT,
+    )
+
+
+def _compile_attack_ratio(fn: AttackRatioAction) -> PolicyTable:
+    return PolicyTable(
+        health_threshold=20,
+        health_slot=_STRAFE,
+        ammo_slot=_STRAFE,
+        attack_ratio=fn.attack_ratio,
+    )
+
+
+def _compile_burst_cycle(fn: BurstCycleAction) -> Optional[PolicyTable]:
+    if fn.plan:
+        return None
+    return PolicyTable(
+        cycle=(4,) * fn.burst_length + ((0, 1, 2, 3),) * fn.burst_length,
+        health_threshold=20,
+        health_slot=_STRAFE,
+        ammo_slot=_STRAFE,
+    )
+
+
+def _compile_pure_attack(fn: PureAttackAction) -> PolicyTable:
+    if not fn.health_override:
+        return PolicyTable(cycle=(4,))
+    return PolicyTable(cycle=(4,), health_threshold=20, health_slot=_STRAFE, ammo_slot=_STRAFE)
+
+
+_COMPILERS: dict[type, Callable[[Any], Optional[PolicyTable]]] = {
+    Burst1Action: lambda fn: _burst(1, int, 42),
+    Burst3Action: _compile_burst3,
+    Burst5Action: lambda fn: _burst(5, hash, 0),
+    Burst7Action: lambda fn: _burst(7, int, 42),
+    Burst3ThresholdAction: _compile_burst3_threshold,
+    AttackOnlyAction: lambda fn: PolicyTable(cycle=(ACTION_ATTACK,)),
+    ForwardAttackAction: lambda fn: PolicyTable(cycle=(2, 2, 2, 3)),
+    AttackRatioAction: _compile_attack_ratio,
+    AttackRatioActionRaw: lambda fn: PolicyTable(attack_ratio=fn.attack_ratio),
+    BurstCycleAction: _compile_burst_cycle,
+    PureAttackAction: _compile_pure_attack,
+}
+
+
+def compile_table(action_fn: Any) -> Optional[PolicyTable]:
+    """PolicyTable for ``action_fn``, or None if it is not compilable."""
+    compiler = _COMPILERS.get(type(action_fn))
+    return compiler(action_fn) if compiler is not None else None
+
+
+def compile_policy(action_fn: Any) -> Any:
+    """CompiledPolicy equivalent of ``action_fn``, or ``action_fn`` unchanged.
+
+    Only exact instances of the supported classes are compiled (subclasses
+    may override behaviour); action plans (plan=True) are left interpreted.
+    """
+    table = compile_table(action_fn)
+    if table is None:
+        return action_fn
+    return CompiledPolicy(table, source=action_fn)
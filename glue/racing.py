@@ -0,0 +1,149 @@
+"""Successive-halving racing for evolutionary genome evaluation.
+
+Evaluating every genome on the full seed set spends as many episodes on a
+clearly bad genome as on the elite. race() instead scores all genomes on
+the first ``initial_episodes`` seeds, keeps the best 1/eta of them, and
+multiplies the budget by eta for the survivors until the full seed set is
+reached. All genomes share the same seed prefix at every rung (common
+random numbers), so eliminations compare like with like, and the rung
+budgets are prefixes of the seed list, so a survivor's earlier episodes
+are reused rather than rerun.
+
+At least ``min_survivors`` genomes always reach the full budget (the
+evolution loops breed from the top 4), so parents are still chosen on
+full-seed-set fitness; racing removes the episodes spent finishing
+genomes that had already fallen out of contention.
+
+Every rung (per-genome stats, score, survived) and the final ranking are
+persisted in the racing_rungs / racing_ranking tables via DuckDBWriter,
+so selection can be reproduced and resumed from the database.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+from typing import Callable
+
+# evaluate(names, budget) -> {name: stats over that name's first `budget` episodes}
+Evaluate = Callable[[list[str], int], dict[str, dict]]
+# score({name: stats}) -> {name: fitness}, higher is better
+Score = Callable[[dict[str, dict]], dict[str, float]]
+
+
+@dataclass(frozen=True)
+class RacingSchedule:
+    """Successive-halving budget ladder."""
+
+    initial_episodes: int = 5
+    eta: int = 2  # budget multiplier per rung; keep the top 1/eta
+    min_survivors: int = 4
+
+    def __post_init__(self) -> None:
+        if self.initial_episodes < 1:
+            raise ValueError(f"initial_episodes must be >= 1, got {self.initial_episodes}")
+        if self.eta < 2:
+            raise ValueError(f"eta must be >= 2, got {self.eta}")
+        if self.min_survivors < 1:
+            raise ValueError(f"min_survivors must be >= 1, got {self.min_survivors}")
+
+    def budgets(self, n_seeds: int) -> list[int]:
+        """Episodes per surviving genome at each rung; the last is n_seeds."""
+        budgets = []
+        budget = min(self.initial_episodes, n_seeds)
+        while budget < n_seeds:
+            budgets.append(budget)
+            budget *= self.eta
+        budgets.append(n_seeds)
+        return budgets
+
+    def survivors(self, n_alive: int) -> int:
+        return min(n_alive, max(self.min_survivors, math.ceil(n_alive / self.eta)))
+
+    def rule(self) -> str:
+        return (
+            f"successive halving: initial={self.initial_episodes}, "
+            f"eta={self.eta}, min_survivors={self.min_survivors}"
+        )
+
+
+@dataclass
+class Rung:
+    """Scores and elimination decision of one rung."""
+
+    rung: int
+    budget: int
+    stats: dict[str, dict]
+    scores: dict[str, float]
+    survivors: list[str]  # best first
+    eliminated: list[str]  # best first
+
+
+@dataclass
+class RaceResult:
+    """Outcome of a race: the full ranking and how it was reached."""
+
+    ranking: list[str]  # best first: finalists, then later-eliminated first
+    rungs: list[Rung]
+    budgets: dict[str, int] = field(default_factory=dict)  # episodes per genome
+
+    @property
+    def episodes(self) -> int:
+        return sum(self.budgets.values())
+
+    def final(self, name: str) -> tuple[dict, float]:
+        """Stats and score of ``name`` at the last rung it was evaluated."""
+        for rung in reversed(self.rungs):
+            if name in rung.scores:
+                return rung.stats[name], rung.scores[name]
+        raise KeyError(name)
+
+
+def race(
+    candidates: list[str],
+    n_seeds: int,
+    evaluate: Evaluate,
+    score: Score,
+    schedule: RacingSchedule,
+) -> RaceResult:
+    """Race ``candidates`` over a seed list of length ``n_seeds``.
+
+    ``evaluate`` runs whatever episodes are missing for the named genomes
+    up to ``budget`` and returns their stats over exactly those episodes;
+    ``score`` turns the stats of one rung into fitness values. Ties keep
+    the candidates' order.
+    """
+    alive = list(candidates)
+    order = {name: i for i, name in enumerate(candidates)}
+    budgets = schedule.budgets(n_seeds)
+    rungs: list[Rung] = []
+    spent: dict[str, int] = {}
+
+    for r, budget in enumerate(budgets):
+        evaluated = evaluate(alive, budget)
+        stats = {name: evaluated[name] for name in alive}
+        scores = score(stats)
+        ranked = sorted(alive, key=lambda name: (-scores[name], order[name]))
+        keep = len(ranked) if r == len(budgets) - 1 else schedule.survivors(len(ranked))
+        rungs.append(Rung(r, budget, stats, scores, ranked[:keep], ranked[keep:]))
+        spent.update((name, budget) for name in alive)
+        alive = ranked[:keep]
+
+    ranking = list(rungs[-1].survivors)
+    for rung in reversed(rungs):
+        ranking.extend(rung.eliminated)
+    return RaceResult(ranking=ranking, rungs=rungs, budgets=spent)
+
+
+def fetch_race_ranking(con, experiment_id: str) -> list[str]:
+    """Persisted racing ranking of an experiment (best first), or []."""
+    exists = con.execute(
+        "SELECT COUNT(*) FROM information_schema.tables WHERE table_name = 'racing_ranking'"
+    ).fetchone()[0]
+    if not exists:
+        return []
+    rows = con.execute(
+        "SELECT condition FROM racing_ranking WHERE experiment_id = ? ORDER BY final_rank",
+        [experiment_id],
+    ).fetchall()
+    return [row[0] for row in rows]
@@ -30,6 +30,12 @@ def init_database(db_path: Path) -> None:
             "agent_configs",
             "generations",
             "seed_sets",
+            "sequential_looks",
+            "sequential_stops",
+            "racing_rungs",
+            "racing_ranking",
+            "genomes",
+            "surrogate_predictions",
         ]
         for t in expected:
             assert t in table_names, f"Missing table: {t}"
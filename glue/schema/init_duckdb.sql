@@ -120,6 +120,102 @@ CREATE TABLE IF NOT EXISTS seed_sets (
     created_at TIMESTAMP DEFAULT current_timestamp
 );
 
+-- 8. sequential_looks: Interim analyses of sequential (early-stopping) runs
+CREATE TABLE IF NOT EXISTS sequential_looks (
+    experiment_id TEXT NOT NULL,
+    look INTEGER NOT NULL,             -- 1-indexed interim analysis
+    condition_a TEXT NOT NULL,
+    condition_b TEXT NOT NULL,
+    metric TEXT NOT NULL,              -- e.g., 'kill_rate'
+    info_fraction DOUBLE,              -- look / planned looks
+    nominal_alpha DOUBLE,              -- alpha spent at this look
+    n_a INTEGER,
+    n_b INTEGER,
+    mean_a DOUBLE,
+    mean_b DOUBLE,
+    p_value DOUBLE,                    -- Welch t-test
+    resolved BOOLEAN,                  -- rejected (Holm) at this look
+    created_at TIMESTAMP DEFAULT current_timestamp,
+
+    PRIMARY KEY (experiment_id, look, condition_a, condition_b)
+);
+
+-- 9. sequential_stops: Stopping decision per condition
+CREATE TABLE IF NOT EXISTS sequential_stops (
+    experiment_id TEXT NOT NULL,
+    condition TEXT NOT NULL,
+    status TEXT NOT NULL,              -- 'stopped' (early) or 'completed'
+    look INTEGER,                      -- look at which the condition stopped
+    episodes_run INTEGER,
+    episodes_planned INTEGER,
+    stopping_rule TEXT,                -- e.g., 'group-sequential obrien_fleming ...'
+    created_at TIMESTAMP DEFAULT current_timestamp,
+
+    PRIMARY KEY (experiment_id, condition)
+);
+
+-- 10. racing_rungs: Successive-halving rungs of genome evaluation
+CREATE TABLE IF NOT EXISTS racing_rungs (
+    experiment_id TEXT NOT NULL,
+    rung INTEGER NOT NULL,             -- 0-indexed
+    condition TEXT NOT NULL,           -- genome name
+    budget INTEGER,                    -- episodes evaluated at this rung
+    n INTEGER,                         -- episodes with data
+    mean_kills DOUBLE,
+    mean_kill_rate DOUBLE,
+    mean_survival_time DOUBLE,
+    score DOUBLE,                      -- fitness within the rung (TOPSIS C_i)
+    survived BOOLEAN,                  -- promoted to the next rung / finalist
+    created_at TIMESTAMP DEFAULT current_timestamp,
+
+    PRIMARY KEY (experiment_id, rung, condition)
+);
+
+-- 11. racing_ranking: Final racing selection order
+CREATE TABLE IF NOT EXISTS racing_ranking (
+    experiment_id TEXT NOT NULL,
+    condition TEXT NOT NULL,
+    final_rank INTEGER NOT NULL,       -- 1 = best
+    episodes INTEGER,                  -- episodes spent on this genome
+    schedule TEXT,                     -- e.g., 'successive halving: initial=5, ...'
+    created_at TIMESTAMP DEFAULT current_timestamp,
+
+    PRIMARY KEY (experiment_id, condition)
+);
+
+-- 12. genomes: Genome parameters behind genome-action conditions
+CREATE TABLE IF NOT EXISTS genomes (
+    experiment_id TEXT NOT NULL,
+    condition TEXT NOT NULL,
+    action_type TEXT NOT NULL,         -- 'genome' (DOE-021) or 'genome5' (DOE-044)
+    genome JSON NOT NULL,              -- parameter dict, sorted keys
+    created_at TIMESTAMP DEFAULT current_timestamp,
+
+    PRIMARY KEY (experiment_id, condition)
+);
+
+-- 13. surrogate_predictions: Surrogate pre-screening vs realized fitness
+CREATE TABLE IF NOT EXISTS surrogate_predictions (
+    experiment_id TEXT NOT NULL,
+    condition TEXT NOT NULL,
+    candidates INTEGER,                -- offspring screened for this slot
+    pred_kills DOUBLE,
+    pred_kill_rate DOUBLE,
+    pred_survival_time DOUBLE,
+    sd_kills DOUBLE,
+    sd_kill_rate DOUBLE,
+    sd_survival_time DOUBLE,
+    predicted_score DOUBLE,            -- TOPSIS C_i of predicted means
+    acquisition DOUBLE,                -- TOPSIS C_i of mean + kappa * sd
+    realized_kills DOUBLE,             -- filled in after evaluation
+    realized_kill_rate DOUBLE,
+    realized_survival_time DOUBLE,
+    realized_score DOUBLE,
+    created_at TIMESTAMP DEFAULT current_timestamp,
+
+    PRIMARY KEY (experiment_id, condition)
+);
+
 -- Useful views for analysis
 CREATE VIEW IF NOT EXISTS v_experiment_summary AS
 SELECT
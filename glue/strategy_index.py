@@ -0,0 +1,296 @@
+"""Strategy document retrieval for the L2 action functions.
+
+The L2 policies (L2RagAction, L2MetaStrategyAction, L2MetaStrategy5Action)
+ask a retriever for the top-k strategy documents matching the current
+situation tags. Two retrievers share one interface, ``search(tags, k)``,
+returning OpenSearch-shaped hits (``{"_score": float, "_source": doc}``):
+
+    - OpenSearchRetriever: an HTTP ``_search`` POST per query over a
+      keep-alive connection pool.
+    - LocalStrategyIndex: documents loaded once into an in-process inverted
+      index over ``situation_tags``; queries take microseconds and do not
+      depend on network jitter.
+
+LocalStrategyIndex reproduces the query the L2 policies send::
+
+    bool:
+      should: [term situation_tags=<tag>, ...]   minimum_should_match: 1
+      filter: [term metadata.retired=false, range quality.trust_score>=0.3]
+
+scored with Lucene's BM25 as OpenSearch applies it to a ``keyword`` field
+(single shard): each matching tag contributes
+``idf * 1 / (1 + k1 * (1 - b + b / avgdl))`` with
+``idf = ln(1 + (N - df + 0.5) / (df + 0.5))``. Collection statistics (N,
+df, avgdl) cover all indexed documents, filtered or not, like Lucene's.
+Ties are broken by index order.
+
+Situation tags take only a few dozen distinct values, so the policies
+memoize results in a QueryCache keyed by (index name, sorted tags, k) with
+LRU and TTL eviction. invalidate_query_caches() drops cached results in
+every live cache, e.g. after an index is re-seeded.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import time
+import weakref
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Hashable, Iterable, Optional, Protocol, Sequence
+
+# Lucene BM25Similarity defaults
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Filter clauses of the L2 query
+MIN_TRUST_SCORE = 0.3
+
+# QueryCache defaults
+DEFAULT_CACHE_SIZE = 256
+DEFAULT_CACHE_TTL = 60.0  # seconds
+
+
+class StrategyRetriever(Protocol):
+    """Top-k strategy documents for a set of situation tags."""
+
+    def search(self, tags: Sequence[str], k: int) -> list[dict[str, Any]]:
+        """OpenSearch-shaped hits, best first. May raise on transport errors."""
+        ...
+
+
+def build_query(tags: Sequence[str], k: int) -> dict[str, Any]:
+    """The OpenSearch query body sent by the L2 policies."""
+    return {
+        "size": k,
+        "query": {
+            "bool": {
+                "should": [{"term": {"situation_tags": tag}} for tag in tags],
+                "minimum_should_match": 1,
+                "filter": [
+                    {"term": {"metadata.retired": False}},
+                    {"range": {"quality.trust_score": {"gte": MIN_TRUST_SCORE}}},
+                ],
+            }
+        },
+    }
+
+
+class OpenSearchRetriever:
+    """Remote retrieval via the OpenSearch ``_search`` endpoint.
+
+    Requests go over the process-wide keep-alive pool for the URL
+    (glue.http_pool.get_pool), so policies share warm connections.
+
+    Args:
+        opensearch_url: Base URL, e.g. ``http://opensearch:9200``.
+        index_name: Index to search.
+        timeout: Per-request timeout in seconds.
+    """
+
+    def __init__(self, opensearch_url: str, index_name: str, timeout: float = 0.08):
+        self.opensearch_url = opensearch_url
+        self.index_name = index_name
+        self.timeout = timeout
+
+    def search(self, tags: Sequence[str], k: int) -> list[dict[str, Any]]:
+        from glue.http_pool import get_pool
+
+        body = get_pool(self.opensearch_url).request(
+            "POST",
+            f"/{self.index_name}/_search",
+            body=json.dumps(build_query(tags, k)),
+            headers={"Content-Type": "application/json"},
+            timeout=self.timeout,
+        )
+        result = json.loads(body)
+        return result.get("hits", {}).get("hits", [])
+
+
+class LocalStrategyIndex:
+    """In-process inverted index over strategy documents' situation_tags.
+
+    Args:
+        docs: Documents in OpenSearch ``_source`` form (doc_id,
+            situation_tags, decision, quality, metadata). A bulk-file
+            ``_id`` key, if present, is dropped.
+    """
+
+    def __init__(self, docs: Iterable[dict[str, Any]]):
+        self._docs: list[dict[str, Any]] = []
+        self._postings: dict[str, list[int]] = {}
+        self._eligible: list[bool] = []
+        total_tags = 0
+        with_tags = 0
+        for doc in docs:
+            doc = {key: value for key, value in doc.items() if key != "_id"}
+            idx = len(self._docs)
+            self._docs.append(doc)
+            tags = list(dict.fromkeys(doc.get("situation_tags") or ()))
+            if tags:
+                with_tags += 1
+                total_tags += len(tags)
+            for tag in tags:
+                self._postings.setdefault(tag, []).append(idx)
+            retired = doc.get("metadata", {}).get("retired", False)
+            trust = doc.get("quality", {}).get("trust_score")
+            self._eligible.append(
+                retired is False and trust is not None and trust >= MIN_TRUST_SCORE
+            )
+
+        # Per-term BM25 contribution (keyword field: tf = 1, no norms)
+        self._term_scores: dict[str, float] = {}
+        if with_tags:
+            avgdl = total_tags / with_tags
+            tf_norm = 1.0 / (1.0 + BM25_K1 * (1.0 - BM25_B + BM25_B / avgdl))
+            for tag, postings in self._postings.items():
+                df = len(postings)
+                idf = math.log(1.0 + (with_tags - df + 0.5) / (df + 0.5))
+                self._term_scores[tag] = idf * tf_norm
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def search(self, tags: Sequence[str], k: int) -> list[dict[str, Any]]:
+        scores: dict[int, float] = {}
+        for tag in dict.fromkeys(tags):
+            postings = self._postings.get(tag)
+            if postings is None:
+                continue
+            term_score = self._term_scores[tag]
+            for idx in postings:
+                if self._eligible[idx]:
+                    scores[idx] = scores.get(idx, 0.0) + term_score
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))[:k]
+        return [{"_score": score, "_source": self._docs[idx]} for idx, score in ranked]
+
+    @classmethod
+    def from_json(cls, path: Path | str) -> "LocalStrategyIndex":
+        """Load a JSON array of documents or an OpenSearch bulk NDJSON file.
+
+        Accepts the output of strategy_seed_generator.save_strategy_docs_json
+        and the ``*.json`` / ``*.ndjson`` files of doe022/doe024_gen_docs.
+        """
+        path = Path(path)
+        text = path.read_text()
+        if path.suffix == ".ndjson":
+            lines = [json.loads(line) for line in text.splitlines() if line.strip()]
+            docs = [line for line in lines if "index" not in line]
+        else:
+            docs = json.loads(text)
+        return cls(docs)
+
+    @classmethod
+    def from_duckdb(cls, conn: Any) -> "LocalStrategyIndex":
+        """Load the ``strategy_docs`` cache table.
+
+        The table stores no trust score or retirement flag; trust is
+        recomputed as the Wilson lower bound of success_rate over
+        sample_size (as the seed generator does) and rows are treated as
+        active.
+        """
+        from glue.data.strategy_seed_generator import wilson_lower_bound
+
+        rows = conn.execute(
+            "SELECT doc_id, agent_id, generation, situation_tags, tactic, weapon, "
+            "success_rate, sample_size, confidence_tier "
+            "FROM strategy_docs ORDER BY doc_id"
+        ).fetchall()
+        docs = []
+        for (doc_id, agent_id, generation, tags, tactic, weapon,
+             success_rate, sample_size, confidence_tier) in rows:
+            success_rate = success_rate or 0.0
+            sample_size = sample_size or 0
+            trust = wilson_lower_bound(round(success_rate * sample_size), sample_size)
+            docs.append({
+                "doc_id": doc_id,
+                "agent_id": agent_id,
+                "generation": generation,
+                "situation_tags": json.loads(tags) if tags else [],
+                "decision": {"tactic": tactic, "weapon": weapon},
+                "quality": {
+                    "success_rate": success_rate,
+                    "sample_size": sample_size,
+                    "confidence_tier": confidence_tier,
+                    "trust_score": round(trust, 4),
+                },
+                "metadata": {"retired": False},
+            })
+        return cls(docs)
+
+
+# ---------------------------------------------------------------------------
+# Query result cache
+# ---------------------------------------------------------------------------
+
+_LIVE_CACHES: "weakref.WeakSet[QueryCache]" = weakref.WeakSet()
+
+
+def query_key(index_name: str, tags: Sequence[str], k: int) -> tuple:
+    """Cache key; tag order does not affect the (additive) scores."""
+    return (index_name, tuple(sorted(set(tags))), k)
+
+
+class QueryCache:
+    """LRU + TTL memo of retrieval results.
+
+    Args:
+        maxsize: Maximum cached queries (0 disables caching).
+        ttl: Seconds a result stays valid (None = until evicted).
+        clock: Time source, injectable for tests.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_CACHE_SIZE,
+        ttl: Optional[float] = DEFAULT_CACHE_TTL,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, tuple[float, list]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        _LIVE_CACHES.add(self)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[list[dict[str, Any]]]:
+        """Cached hits for ``key``, or None on a miss or expired entry."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            stored_at, hits = entry
+            if self.ttl is None or self._clock() - stored_at < self.ttl:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return hits
+            del self._entries[key]
+        self.misses += 1
+        return None
+
+    def put(self, key: Hashable, hits: list[dict[str, Any]]) -> None:
+        if self.maxsize <= 0:
+            return
+        self._entries[key] = (self._clock(), hits)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, index_name: Optional[str] = None) -> int:
+        """Drop entries for ``index_name`` (all if None); returns the count."""
+        if index_name is None:
+            dropped = len(self._entries)
+            self._entries.clear()
+            return dropped
+        stale = [key for key in self._entries if key[0] == index_name]
+        for key in stale:
+            del self._entries[key]
+        return len(stale)
+
+
+def invalidate_query_caches(index_name: Optional[str] = None) -> int:
+    """Invalidate ``index_name`` (all if None) in every live QueryCache."""
+    return sum(cache.invalidate(index_name) for cache in list(_LIVE_CACHES))
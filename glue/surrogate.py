@@ -0,0 +1,261 @@
+"""Surrogate-model pre-screening of offspring genomes.
+
+Every offspring produced by crossover and mutation costs a full batch of
+VizDoom episodes. GenomeSurrogate fits one Gaussian process per fitness
+criterion (mean kills, kill rate, survival time) on every historical
+genome -> outcome row (the genomes table joined with experiments), so the
+evolution drivers can over-generate offspring and only send the most
+promising candidate of each breeding slot to real evaluation.
+
+Design:
+    1. Genomes are encoded from their gene spec (GENE_SPEC format): numeric
+       genes scaled to [0, 1], bools as 0/1, enums one-hot.
+    2. Each GP is exact regression with an RBF kernel on standardized
+       targets; length scale and noise are picked from a small grid by
+       log marginal likelihood. numpy only (Cholesky), CPU, milliseconds
+       for the few hundred rows an evolution produces.
+    3. Candidates are ranked by TOPSIS closeness of the optimistic
+       criteria mu + kappa * sigma over the whole candidate pool (upper
+       confidence bound: predicted score plus uncertainty).
+    4. Predictions are stored in surrogate_predictions (DuckDBWriter) and
+       completed with the realized fitness once the generation has run, so
+       the model's accuracy is logged and queryable.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+import numpy as np
+
+from glue.analysis.topsis import closeness
+
+logger = logging.getLogger(__name__)
+
+# Fitness criteria modelled (all maximized), as in fetch_generation_stats
+CRITERIA = ("mean_kills", "mean_kill_rate", "mean_survival_time")
+
+_LENGTH_SCALES = (0.1, 0.2, 0.35, 0.5, 0.75, 1.0, 1.5, 2.5)
+_NOISE_LEVELS = (0.01, 0.05, 0.1, 0.2, 0.4, 0.8)
+_JITTER = 1e-8
+
+
+def encode_genome(genome: dict, spec: dict[str, dict]) -> list[float]:
+    """Feature vector of a genome under a GENE_SPEC-style spec."""
+    features: list[float] = []
+    for name, gene in spec.items():
+        value = genome[name]
+        kind = gene["type"]
+        if kind in ("int", "float"):
+            span = gene["max"] - gene["min"]
+            features.append((float(value) - gene["min"]) / span if span else 0.0)
+        elif kind == "bool":
+            features.append(1.0 if value else 0.0)
+        elif kind == "enum":
+            features.extend(1.0 if value == option else 0.0 for option in gene["values"])
+        else:
+            raise ValueError(f"Unknown gene type {kind!r} for {name}")
+    return features
+
+
+class GaussianProcess:
+    """Exact GP regression, RBF kernel, grid-searched hyperparameters."""
+
+    def fit(self, X: np.ndarray, y: np.ndarray) -> "GaussianProcess":
+        self._X = X
+        self._y_mean = float(y.mean())
+        self._y_std = float(y.std()) or 1.0
+        z = (y - self._y_mean) / self._y_std
+        sq_dists = _sq_dists(X, X)
+
+        best = None
+        for length in _LENGTH_SCALES:
+            K = np.exp(-0.5 * sq_dists / length ** 2)
+            for noise in _NOISE_LEVELS:
+                try:
+                    L = np.linalg.cholesky(K + (noise + _JITTER) * np.eye(len(X)))
+                except np.linalg.LinAlgError:
+                    continue
+                alpha = np.linalg.solve(L.T, np.linalg.solve(L, z))
+                lml = -0.5 * z @ alpha - np.log(np.diag(L)).sum()
+                if best is None or lml > best[0]:
+                    best = (lml, length, noise, L, alpha)
+        _, self.length_scale, self.noise, self._L, self._alpha = best
+        return self
+
+    def predict(self, Xs: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Posterior mean and standard deviation of the latent function."""
+        Ks = np.exp(-0.5 * _sq_dists(Xs, self._X) / self.length_scale ** 2)
+        mean = Ks @ self._alpha
+        v = np.linalg.solve(self._L, Ks.T)
+        var = np.clip(1.0 - (v ** 2).sum(axis=0), 0.0, None)
+        return mean * self._y_std + self._y_mean, np.sqrt(var) * self._y_std
+
+
+def _sq_dists(A: np.ndarray, B: np.ndarray) -> np.ndarray:
+    return ((A[:, None, :] - B[None, :, :]) ** 2).sum(axis=2)
+
+
+@dataclass
+class Prediction:
+    """Surrogate prediction for the candidate chosen for one slot."""
+
+    condition: str
+    genome: dict
+    mean: dict[str, float]
+    std: dict[str, float]
+    acquisition: float  # UCB TOPSIS closeness within the candidate pool
+    candidates: int  # candidates screened for this slot
+    predicted_score: float = math.nan  # TOPSIS of mean among chosen genomes
+
+
+@dataclass
+class GenomeSurrogate:
+    """Per-criterion GP surrogate of genome fitness.
+
+    weights: TOPSIS weight per criterion (same order as CRITERIA).
+    Training rows come from DuckDBWriter.genome_outcomes().
+    kappa: standard deviations added to each criterion for ranking.
+    min_rows: fewer training genomes than this disables screening.
+    """
+
+    spec: dict[str, dict]
+    weights: tuple[float, ...] = (1 / 3, 1 / 3, 1 / 3)
+    kappa: float = 1.0
+    min_rows: int = 8
+    _models: list[GaussianProcess] = field(default_factory=list, init=False, repr=False)
+
+    @property
+    def ready(self) -> bool:
+        return bool(self._models)
+
+    def fit(self, rows: list[dict]) -> bool:
+        """Fit on outcome rows ({"genome", *CRITERIA}); False if too few rows."""
+        rows = [r for r in rows if all(r.get(c) is not None for c in CRITERIA)]
+        if len(rows) < self.min_rows:
+            self._models = []
+            return False
+        X = np.array([encode_genome(r["genome"], self.spec) for r in rows])
+        self._models = [
+            GaussianProcess().fit(X, np.array([float(r[c]) for r in rows]))
+            for c in CRITERIA
+        ]
+        return True
+
+    def predict(self, genomes: list[dict]) -> tuple[np.ndarray, np.ndarray]:
+        """(n, len(CRITERIA)) posterior means and standard deviations."""
+        X = np.array([encode_genome(g, self.spec) for g in genomes])
+        outputs = [model.predict(X) for model in self._models]
+        return (
+            np.column_stack([m for m, _ in outputs]),
+            np.column_stack([s for _, s in outputs]),
+        )
+
+    def screen(self, candidates: dict[str, list[dict]]) -> dict[str, Prediction]:
+        """Pick the best-acquisition candidate of every slot."""
+        pool = [(name, g) for name, genomes in candidates.items() for g in genomes]
+        mean, std = self.predict([g for _, g in pool])
+        # Predicted fitness cannot be negative; keeps TOPSIS norms meaningful
+        optimistic = np.clip(mean + self.kappa * std, 0.0, None)
+        acquisition = closeness(optimistic, np.asarray(self.weights))
+
+        chosen: dict[str, Prediction] = {}
+        for i, (name, genome) in enumerate(pool):
+            if name in chosen and chosen[name].acquisition >= acquisition[i]:
+                continue
+            chosen[name] = Prediction(
+                condition=name,
+                genome=genome,
+                mean=dict(zip(CRITERIA, mean[i].tolist())),
+                std=dict(zip(CRITERIA, std[i].tolist())),
+                acquisition=float(acquisition[i]),
+                candidates=len(candidates[name]),
+            )
+        predicted = closeness(
+            np.clip(np.array([[p.mean[c] for c in CRITERIA] for p in chosen.values()]), 0.0, None),
+            np.asarray(self.weights),
+        )
+        for prediction, score in zip(chosen.values(), predicted):
+            prediction.predicted_score = float(score)
+        return chosen
+
+
+def accuracy_report(
+    predicted: dict[str, dict], realized: dict[str, dict]
+) -> dict[str, float]:
+    """Mean absolute error per criterion and Spearman rank correlation of scores.
+
+    Both arguments map condition -> {*CRITERIA, "score"}.
+    """
+    common = [c for c in predicted if c in realized]
+    report: dict[str, float] = {"n": float(len(common))}
+    if not common:
+        return report
+    for criterion in CRITERIA:
+        report[f"mae_{criterion}"] = float(np.mean([
+            abs(predicted[c][criterion] - realized[c][criterion]) for c in common
+        ]))
+    if len(common) > 2:
+        ranks_p = _ranks([predicted[c]["score"] for c in common])
+        ranks_r = _ranks([realized[c]["score"] for c in common])
+        report["spearman_score"] = float(np.corrcoef(ranks_p, ranks_r)[0, 1])
+    return report
+
+
+def _ranks(values: list[float]) -> np.ndarray:
+    order = np.argsort(values, kind="stable")
+    ranks = np.empty(len(values))
+    ranks[order] = np.arange(len(values))
+    return ranks
+
+
+def log_accuracy(experiment_id: str, predicted: dict[str, dict], realized: dict[str, dict]) -> None:
+    """Log prediction vs realized fitness for a generation."""
+    for condition in predicted:
+        if condition not in realized:
+            continue
+        p, r = predicted[condition], realized[condition]
+        logger.info(
+            "  %s: predicted kills=%.1f kill_rate=%.2f survival=%.1f C=%.3f | "
+            "realized kills=%.1f kill_rate=%.2f survival=%.1f C=%.3f",
+            condition, p["mean_kills"], p["mean_kill_rate"], p["mean_survival_time"],
+            p["score"], r["mean_kills"], r["mean_kill_rate"], r["mean_survival_time"],
+            r["score"],
+        )
+    report = accuracy_report(predicted, realized)
+    logger.info(
+        "Surrogate accuracy for %s: %s",
+        experiment_id,
+        ", ".join(f"{k}={v:.3f}" for k, v in report.items()),
+    )
+
+
+def spec_from_bounds(
+    float_bounds: dict[str, tuple[float, float]],
+    int_bounds: dict[str, tuple[int, int]],
+) -> dict[str, dict[str, Any]]:
+    """GENE_SPEC-style spec from clamp tables (as used by DOE-044)."""
+    spec: dict[str, dict[str, Any]] = {}
+    for name, (lo, hi) in float_bounds.items():
+        spec[name] = {"type": "float", "min": lo, "max": hi}
+    for name, (lo, hi) in int_bounds.items():
+        spec[name] = {"type": "int", "min": lo, "max": hi}
+    return spec
+
+
+def optional_surrogate(
+    spec: dict[str, dict], rows: list[dict], weights: tuple[float, ...], kappa: float
+) -> Optional[GenomeSurrogate]:
+    """Fitted surrogate, or None (logged) when there is too little history."""
+    surrogate = GenomeSurrogate(spec, weights=weights, kappa=kappa)
+    if not surrogate.fit(rows):
+        logger.info(
+            "Surrogate: %d historical genomes (< %d), screening skipped",
+            len(rows), surrogate.min_rows,
+        )
+        return None
+    logger.info("Surrogate fitted on %d historical genomes", len(rows))
+    return surrogate
@@ -1,7 +1,96 @@
-"""Pytest configuration for glue tests."""
+"""Pytest configuration and shared VizDoom fakes for glue tests."""
+
+from __future__ import annotations
+
+import random
+from pathlib import Path
+
+import pytest
+
+from glue.episode_runner import EpisodeResult
+from glue.vizdoom_bridge import ACTION_ATTACK, EpisodeMetrics, GameState
 
 # Tell pytest not to collect test functions from source modules
 collect_ignore = [
     "../analysis/statistical_tests.py",
     "../analysis/diagnostics.py",
 ]
+
+# Fixed states the policy under test plays in the default kills model
+STATES = [
+    GameState(health=random.Random(t).choice([20, 60, 100]), ammo=50, tick=t)
+    for t in range(120)
+]
+
+
+def policy_kills(seed, condition, action_fn) -> tuple[int, float]:
+    """Kills = attacks chosen by the (seeded) policy on STATES."""
+    kills = sum(action_fn(state) == ACTION_ATTACK for state in STATES)
+    return kills, 60.0 + seed % 7
+
+
+class FakeBridge:
+    def __init__(self, **kwargs):
+        pass
+
+    def close(self):
+        pass
+
+
+class FakeRunner:
+    """EpisodeRunner stand-in whose metrics come from ``model``.
+
+    ``model(seed, condition, action_fn)`` returns (kills, survival_time).
+    Every played episode is appended to ``log_path``: a file rather than a
+    list, so episodes played in forked EpisodePool workers are seen too.
+    """
+
+    model = staticmethod(policy_kills)
+    log_path: Path | None = None
+
+    def __init__(self, bridge):
+        pass
+
+    def run_episode(self, seed, condition, episode_number, action_fn, trace=None):
+        with open(self.log_path, "a") as f:
+            f.write(f"{condition} {seed} {episode_number}\n")
+        kills, survival_time = self.model(seed, condition, action_fn)
+        return EpisodeResult(
+            seed, condition, episode_number,
+            EpisodeMetrics(kills=kills, survival_time=survival_time), [], [],
+        )
+
+
+class FakeVizDoom:
+    """Handle returned by the ``fake_vizdoom`` fixture."""
+
+    def __init__(self, monkeypatch: pytest.MonkeyPatch, log_path: Path):
+        self._monkeypatch = monkeypatch
+        self._log_path = log_path
+
+    def use(self, model) -> None:
+        """Replace the kills model for this test."""
+        self._monkeypatch.setattr(FakeRunner, "model", staticmethod(model))
+
+    def played(self) -> list[tuple[str, int, int]]:
+        """(condition, seed, episode_number) of every episode played so far."""
+        if not self._log_path.exists():
+            return []
+        lines = self._log_path.read_text().splitlines()
+        return [
+            (condition, int(seed), int(episode_number))
+            for condition, seed, episode_number in (line.rsplit(" ", 2) for line in lines)
+        ]
+
+    def clear(self) -> None:
+        self._log_path.unlink(missing_ok=True)
+
+
+@pytest.fixture
+def fake_vizdoom(monkeypatch, tmp_path) -> FakeVizDoom:
+    """Run executors against FakeBridge/FakeRunner instead of VizDoom."""
+    log_path = tmp_path / "played.log"
+    monkeypatch.setattr("glue.vizdoom_bridge.VizDoomBridge", FakeBridge)
+    monkeypatch.setattr("glue.episode_runner.EpisodeRunner", FakeRunner)
+    monkeypatch.setattr(FakeRunner, "log_path", log_path)
+    return FakeVizDoom(monkeypatch, log_path)
@@ -8,7 +8,14 @@ from glue.vizdoom_bridge import (
     ACTION_MOVE_RIGHT,
     GameState,
 )
-from glue.action_functions import FullAgentAction, random_action, rule_only_action
+from glue.action_functions import (
+    Burst3Action,
+    BurstCycleAction,
+    FullAgentAction,
+    GenomeAction,
+    random_action,
+    rule_only_action,
+)
 
 
 def make_state(
@@ -114,3 +121,44 @@ class TestFullAgentAction:
         agent = FullAgentAction()
         state = make_state(health=100, ammo=0)
         assert agent(state) == ACTION_MOVE_LEFT
+
+
+def expand(action_fn, n_ticks: int) -> list[int]:
+    """Flatten (action, repeat) plans into a per-tick action sequence."""
+    actions: list[int] = []
+    while len(actions) < n_ticks:
+        a = action_fn(make_state(tick=len(actions)))
+        if isinstance(a, tuple):
+            actions.extend([a[0]] * a[1])
+        else:
+            actions.append(a)
+    return actions[:n_ticks]
+
+
+class TestActionPlans:
+    @pytest.mark.parametrize("factory", [
+        lambda **kw: Burst3Action(**kw),
+        lambda **kw: BurstCycleAction(burst_length=4, **kw),
+        lambda **kw: GenomeAction(burst_length=5, turn_count=2, **kw),
+    ])
+    def test_plan_matches_per_tick_sequence(self, factory):
+        per_tick = factory()
+        planned = factory(plan=True)
+        per_tick.reset(seed=7)
+        planned.reset(seed=7)
+        assert expand(planned, 200) == expand(per_tick, 200)
+
+    def test_plan_returns_remaining_burst(self):
+        agent = Burst3Action(plan=True)
+        agent.reset(seed=1)
+        assert agent(make_state()) == (ACTION_ATTACK, 3)
+        assert agent(make_state()) in (ACTION_MOVE_LEFT, ACTION_MOVE_RIGHT)
+
+    def test_plan_keeps_emergency_rules(self):
+        agent = GenomeAction(plan=True)
+        assert agent(make_state(health=10)) == ACTION_MOVE_LEFT
+
+    def test_adaptive_genome_never_plans(self):
+        agent = GenomeAction(adaptive_enabled=True, plan=True)
+        agent.reset(seed=3)
+        assert not any(isinstance(agent(make_state()), tuple) for _ in range(50))
@@ -0,0 +1,133 @@
+"""Tests for the declarative action-function registry."""
+
+import json
+import pickle
+import subprocess
+import sys
+
+import pytest
+
+from glue.action_functions import (
+    AttackRatioAction,
+    Burst3ThresholdAction,
+    BurstCycleAction,
+    FullAgentAction,
+    GenomeAction,
+    L2MetaStrategyAction,
+    PureAttackAction,
+    rule_only_action,
+)
+from glue.action_registry import (
+    ACTION_REGISTRY,
+    ActionSpec,
+    build_action,
+    get_policy,
+    policy_for_run,
+    spec_for_action_type,
+)
+from glue.doe_executor import RunConfig
+from glue.policy_compiler import CompiledPolicy
+from glue.strategy_index import LocalStrategyIndex
+
+
+def make_run(action_type, **kwargs):
+    return RunConfig(
+        run_id="T-R1", run_label="R1", memory_weight=0.7, strength_weight=0.3,
+        seeds=[1], condition="c", run_type="factorial", action_type=action_type,
+        **kwargs,
+    )
+
+
+class TestSpecResolution:
+    def test_parametric_action_types(self):
+        assert spec_for_action_type("ar_35") == ActionSpec.of("ar", attack_ratio=0.35)
+        assert spec_for_action_type("cycle_4") == ActionSpec.of("cycle", burst_length=4)
+        assert spec_for_action_type("burst3_threshold_15") == ActionSpec.of(
+            "burst3_threshold", health_threshold=15
+        )
+
+    def test_full_agent_default_and_fallback(self):
+        expected = ActionSpec.of("full_agent", memory_weight=0.9, strength_weight=0.1)
+        assert spec_for_action_type("full_agent", 0.9, 0.1) == expected
+        assert spec_for_action_type("no_such_action", 0.9, 0.1) == expected
+
+    def test_unknown_kind_rejected(self):
+        with pytest.raises(KeyError):
+            ActionSpec.of("no_such_kind")
+
+    def test_encode_round_trip(self):
+        genome = {"burst_length": 5, "turn_direction": "random", "adaptive_enabled": False}
+        spec = spec_for_action_type("genome", genome_params=genome)
+        text = spec.encode()
+        assert json.loads(text) == ["genome", genome]
+        assert ActionSpec.decode(text) == spec
+        assert pickle.loads(pickle.dumps(spec)) == spec
+
+
+class TestBuild:
+    def test_builds_configured_instances(self):
+        ratio = build_action(spec_for_action_type("ar_70"))
+        assert type(ratio) is AttackRatioAction and ratio.attack_ratio == 0.7
+        assert build_action(spec_for_action_type("cycle_5")).burst_length == 5
+        threshold = build_action(spec_for_action_type("burst3_threshold_40"))
+        assert type(threshold) is Burst3ThresholdAction
+        assert threshold._health_threshold == 40
+        assert build_action(spec_for_action_type("attack_raw")).health_override is False
+        assert type(build_action(ActionSpec.of("attack_ovr"))) is PureAttackAction
+        assert build_action(ActionSpec.of("rule_only")) is rule_only_action
+
+    def test_run_parameters(self):
+        agent = build_action(spec_for_action_type("full_agent", 0.7, 0.3))
+        assert type(agent) is FullAgentAction
+        assert (agent.memory_weight, agent.strength_weight) == (0.7, 0.3)
+        genome = build_action(
+            spec_for_action_type("genome", genome_params={"burst_length": 6})
+        )
+        assert type(genome) is GenomeAction and genome.burst_length == 6
+
+    def test_build_from_encoded_spec(self):
+        action = build_action('["cycle",{"burst_length":2}]')
+        assert type(action) is BurstCycleAction and action.burst_length == 2
+
+    def test_l2_entries_use_local_index(self, tmp_path):
+        doc = {
+            "doc_id": "m", "situation_tags": ["full_health"],
+            "decision": {"strategy": "adaptive_kill"},
+            "quality": {"trust_score": 0.9}, "metadata": {"retired": False},
+        }
+        (tmp_path / "strategies_meta.json").write_text(json.dumps([doc]))
+        action = build_action(ActionSpec.of("l2_meta_select"), strategy_docs=tmp_path)
+        assert type(action) is L2MetaStrategyAction
+        assert action.index_name == "strategies_meta"
+        assert isinstance(action.retriever, LocalStrategyIndex)
+        with pytest.raises(FileNotFoundError):
+            build_action(ActionSpec.of("l2_rag_good"), strategy_docs=tmp_path)
+
+    def test_every_entry_resolves(self):
+        for kind, entry in ACTION_REGISTRY.items():
+            if entry.l2_index is None and kind not in ("ar", "cycle", "burst3_threshold"):
+                assert build_action(ActionSpec.of(kind)) is not None
+
+
+class TestPolicyCache:
+    def test_runs_with_equal_parameters_share_a_policy(self):
+        first = policy_for_run(make_run("ar_50"))
+        assert isinstance(first, CompiledPolicy)
+        assert policy_for_run(make_run("ar_50")) is first
+        assert get_policy('["ar",{"attack_ratio":0.5}]') is first
+        assert policy_for_run(make_run("ar_60")) is not first
+
+    def test_uncompilable_policies_are_cached_too(self):
+        run = make_run("full_agent")
+        policy = policy_for_run(run)
+        assert type(policy) is FullAgentAction
+        assert policy_for_run(run) is policy
+
+    def test_resolving_specs_does_not_import_policies(self):
+        code = (
+            "import sys\n"
+            "from glue.action_registry import spec_for_action_type\n"
+            "spec_for_action_type('ar_50').encode()\n"
+            "assert 'glue.action_functions' not in sys.modules\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
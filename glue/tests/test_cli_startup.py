@@ -0,0 +1,87 @@
+"""Startup-path tests: CLIs validate flags and defer heavy imports."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+
+def run_python(code):
+    return subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=PROJECT_ROOT, capture_output=True, text=True, check=True,
+    ).stdout
+
+
+def loaded_after(code, modules):
+    """Which of ``modules`` are in sys.modules after running ``code``."""
+    probe = f"{code}\nimport sys\nprint(sorted(m for m in {modules!r} if m in sys.modules))"
+    return run_python(probe).strip().splitlines()[-1]
+
+
+@pytest.mark.parametrize(
+    "module",
+    [
+        "glue.analysis.statistical_tests",
+        "glue.analysis.report_generator",
+        "glue.doe021_analysis",
+    ],
+)
+def test_analysis_modules_defer_scipy_and_duckdb(module):
+    heavy = ("scipy", "statsmodels", "duckdb")
+    assert loaded_after(f"import {module}", heavy) == "[]"
+
+
+def test_statistical_tests_still_compute():
+    out = run_python(
+        "import numpy as np\n"
+        "from glue.analysis.statistical_tests import welch_t_test\n"
+        "print(round(welch_t_test(np.array([1., 2, 3, 4]), np.array([2., 3, 4, 5]))[1], 4))"
+    )
+    assert out.strip() == "0.3153"
+
+
+def test_dry_run_skips_vizdoom_duckdb_and_numpy():
+    code = (
+        "import sys\n"
+        "sys.argv = ['doe_executor', '--experiment', 'DOE-028', '--dry-run']\n"
+        "from glue.doe_executor import main\n"
+        "main()"
+    )
+    out = loaded_after(code, ("vizdoom", "duckdb", "numpy", "glue.action_functions"))
+    assert out == "[]"
+    table = run_python(code)
+    assert table.startswith("DOE-028: ")
+    assert "cycle_" in table
+
+
+def test_list_experiments():
+    out = subprocess.run(
+        [sys.executable, "-m", "glue.doe_executor", "--list"],
+        cwd=PROJECT_ROOT, capture_output=True, text=True, check=True,
+    ).stdout.split()
+    assert "DOE-005" in out and "DOE-045" in out
+
+
+@pytest.mark.parametrize(
+    "experiment, flags",
+    [
+        ("DOE-044", ["--trace"]),
+        ("DOE-044", ["--strategy-docs", "docs"]),
+        ("DOE-044", ["--trace-dir", "traces"]),
+        ("DOE-032", ["--workers", "4"]),
+        ("DOE-032", ["--trace"]),
+        ("DOE-028", ["--racing"]),
+    ],
+)
+def test_rejects_unsupported_flags(experiment, flags):
+    result = subprocess.run(
+        [sys.executable, "-m", "glue.doe_executor", "--experiment", experiment,
+         "--dry-run", *flags],
+        cwd=PROJECT_ROOT, capture_output=True, text=True,
+    )
+    assert result.returncode == 2
+    assert f"{flags[0]} is" in result.stderr and "supported" in result.stderr
@@ -0,0 +1,159 @@
+"""Tests for declarative DOE design files."""
+
+import json
+import math
+
+import pytest
+
+from glue import doe_design
+from glue import doe_executor
+from glue.doe_design import DESIGN_DIR, compile_design, design_hash, load_design
+
+DOE005_DESIGN = {
+    "experiment_id": "DOE-005",
+    "scenario": "defend_the_center.cfg",
+    "order": ["R4", "CP1", "R2", "R1", "CP3", "R3", "CP2"],
+    "seeds": {"base": 2501, "step": 23, "n": 30},
+    "factors": {"memory_weight": [0.7, 0.9], "strength_weight": [0.7, 0.9]},
+    "run": {"condition": "memory={memory_weight}_strength={strength_weight}"},
+    "center_points": {"count": 3, "seed_blocks": True},
+}
+
+
+@pytest.mark.parametrize("name", ["005", "007", "027"])
+def test_shipped_designs_match_builders(name):
+    builder = getattr(doe_executor, f"build_doe{name}_config")
+    config = load_design(DESIGN_DIR / f"doe{name}.toml", cache_dir=None)
+    assert config == builder()
+
+
+def test_json_design_equals_builder(tmp_path):
+    path = tmp_path / "doe005.json"
+    path.write_text(json.dumps(DOE005_DESIGN))
+    assert load_design(path, cache_dir=None) == doe_executor.build_doe005_config()
+
+
+class TestArtifactCache:
+    def test_artifact_reused_until_design_changes(self, tmp_path, monkeypatch):
+        design_path = tmp_path / "d.json"
+        design_path.write_text(json.dumps(DOE005_DESIGN))
+        cache = tmp_path / "cache"
+        first = load_design(design_path, cache_dir=cache)
+        (artifact,) = cache.iterdir()
+        assert artifact.name == f"DOE-005-{design_hash(DOE005_DESIGN)[:16]}.json"
+
+        def fail(*args, **kwargs):
+            raise AssertionError("recompiled a cached design")
+
+        monkeypatch.setattr(doe_design, "compile_design", fail)
+        assert load_design(design_path, cache_dir=cache) == first
+        monkeypatch.undo()
+
+        changed = dict(DOE005_DESIGN, seeds={"base": 1, "step": 2, "n": 30})
+        design_path.write_text(json.dumps(changed))
+        assert load_design(design_path, cache_dir=cache).seed_set[:2] == [1, 3]
+        assert len(list(cache.iterdir())) == 2
+
+    def test_db_path_applied_at_load(self, tmp_path):
+        design_path = tmp_path / "d.json"
+        design_path.write_text(json.dumps(DOE005_DESIGN))
+        load_design(design_path, cache_dir=tmp_path)
+        config = load_design(design_path, cache_dir=tmp_path, db_path=tmp_path / "x.duckdb")
+        assert config.db_path == tmp_path / "x.duckdb"
+
+
+class TestGeneratedDesigns:
+    def test_full_factorial_standard_order(self):
+        config = compile_design({
+            "experiment_id": "X",
+            "seeds": {"base": 1, "step": 1, "n": 4},
+            "factors": {"memory_weight": [0.1, 0.2], "doom_skill": [1, 3, 5]},
+        })
+        levels = [(r.memory_weight, r.doom_skill) for r in config.runs]
+        assert levels == [(0.1, 1), (0.2, 1), (0.1, 3), (0.2, 3), (0.1, 5), (0.2, 5)]
+        assert [r.run_label for r in config.runs] == [f"R{i}" for i in range(1, 7)]
+        assert config.runs[0].condition == "memory_weight=0.1_doom_skill=1"
+
+    def test_central_composite(self):
+        config = compile_design({
+            "experiment_id": "RSM",
+            "design": "central_composite",
+            "seeds": {"base": 1, "step": 1, "n": 30},
+            "factors": {
+                "memory_weight": {"center": 0.5, "step": 0.2},
+                "strength_weight": {"center": 0.5, "step": 0.1},
+            },
+            "center_points": {"count": 3, "seed_blocks": True},
+        })
+        types = [r.run_type for r in config.runs]
+        assert types == ["factorial"] * 4 + ["axial"] * 4 + ["center"] * 3
+        axial = [w for r in config.runs[4:8] for w in (r.memory_weight, r.strength_weight)]
+        a = math.sqrt(2)
+        assert axial == pytest.approx(
+            [0.5 - 0.2 * a, 0.5, 0.5 + 0.2 * a, 0.5, 0.5, 0.5 - 0.1 * a, 0.5, 0.5 + 0.1 * a]
+        )
+        assert [len(r.seeds) for r in config.runs[8:]] == [10, 10, 10]
+
+    def test_shuffle_order_is_seeded(self):
+        design = {
+            "experiment_id": "X",
+            "seeds": {"base": 1, "step": 1, "n": 2},
+            "factors": {"doom_skill": [1, 2, 3, 4, 5]},
+            "order": {"shuffle_seed": 4401},
+        }
+        labels = [r.run_label for r in compile_design(design).runs]
+        assert labels == [r.run_label for r in compile_design(design).runs]
+        assert sorted(labels) == ["R1", "R2", "R3", "R4", "R5"]
+
+    @pytest.mark.parametrize(
+        "override",
+        [
+            {"order": ["R1"]},
+            {"run": {"seeds": [1]}},
+            {"run": {"not_a_field": 1}},
+            {"center_points": {"count": 4, "seed_blocks": True}},
+        ],
+    )
+    def test_invalid_designs_rejected(self, override):
+        with pytest.raises(ValueError):
+            compile_design({**DOE005_DESIGN, **override})
+
+
+class TestCenterPointEpisodes:
+    def test_blocks_get_unique_episode_numbers(self):
+        design = {**DOE005_DESIGN, "center_points": {"count": 5}}
+        design.pop("order")
+        config = compile_design(design)
+        center = [r for r in config.runs if r.run_type == "center"]
+        assert [len(r.seeds) for r in center] == [6] * 5
+        numbers = [
+            (r.condition, doe_executor._episode_number(r, i))
+            for r in config.runs
+            for i in range(len(r.seeds))
+        ]
+        assert len(numbers) == len(set(numbers))
+        cp_numbers = sorted(n for c, n in numbers if c == center[0].condition)
+        assert cp_numbers == list(range(1, 31))
+
+    def test_unblocked_center_points_rejected(self):
+        with pytest.raises(ValueError):
+            compile_design({**DOE005_DESIGN, "center_points": {"count": 3, "seed_blocks": False}})
+
+    def test_truncated_stage_keeps_block_offsets(self):
+        config = doe_executor.build_doe005_config()
+        staged = doe_executor.ExperimentConfig(
+            experiment_id=config.experiment_id,
+            runs=[doe_executor.replace(r, seeds=r.seeds[:4]) for r in config.runs],
+            seed_set=config.seed_set,
+            seed_formula=config.seed_formula,
+        )
+        offsets = {r.run_label: r.episode_offset for r in staged.runs if r.run_type == "center"}
+        assert offsets == {"CP1": 0, "CP2": 10, "CP3": 20}
+
+    def test_colliding_runs_rejected(self):
+        config = doe_executor.build_doe005_config()
+        cp1 = next(r for r in config.runs if r.run_label == "CP1")
+        with pytest.raises(ValueError):
+            doe_executor.assign_episode_offsets(
+                config.runs + [doe_executor.replace(cp1, run_label="CP9", episode_offset=5)]
+            )
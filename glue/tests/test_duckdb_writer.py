@@ -0,0 +1,112 @@
+"""Tests for DuckDBWriter buffered mode and flush failure handling."""
+
+from __future__ import annotations
+
+import duckdb
+import pytest
+
+from glue.duckdb_writer import DuckDBWriter
+
+
+def mock_episodes(condition: str, n: int, start: int = 0) -> list[dict]:
+    """Deterministic episode rows for one condition of DOE-001."""
+    return [
+        {
+            "experiment_id": "DOE-001",
+            "run_id": f"DOE-001-{condition}",
+            "condition": condition,
+            "seed": 42 + i * 31,
+            "episode_number": i,
+            "kills": i % 7,
+            "survival_time": 30.0 + 2.5 * i,
+            "decision_latency_p99": 0.5 + i / 10,
+        }
+        for i in range(start, start + n)
+    ]
+
+
+def write_mock(writer: DuckDBWriter, episodes: list[dict]) -> None:
+    for ep in episodes:
+        writer.write_episode(
+            experiment_id=ep["experiment_id"],
+            run_id=ep["run_id"],
+            condition=ep["condition"],
+            seed=ep["seed"],
+            episode_number=ep["episode_number"],
+            metrics={"kills": ep["kills"], "survival_time": ep["survival_time"]},
+            decision_latency_p99=ep["decision_latency_p99"],
+        )
+
+
+def count_rows(writer: DuckDBWriter, table: str = "experiments") -> int:
+    return writer._con.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+
+@pytest.fixture
+def writer(tmp_path):
+    w = DuckDBWriter(tmp_path / "w.duckdb", buffer_size=100)
+    yield w
+    w.close()
+
+
+def test_buffered_writer_matches_immediate(tmp_path):
+    """Buffered writes persist the same rows as immediate INSERTs."""
+    episodes = mock_episodes("rule_only", 25)
+    immediate = DuckDBWriter(tmp_path / "immediate.duckdb")
+    write_mock(immediate, episodes)
+    immediate.close()
+
+    buffered = DuckDBWriter(tmp_path / "buffered.duckdb", buffer_size=10)
+    write_mock(buffered, episodes)
+    assert buffered.pending_count == 5
+    assert buffered.episodes_persisted == 20
+    assert buffered.is_pending("DOE-001", "rule_only", 24)
+    buffered.close()
+
+    query = "SELECT * EXCLUDE (started_at) FROM experiments ORDER BY episode_number"
+    results = []
+    for name in ("immediate", "buffered"):
+        con = duckdb.connect(str(tmp_path / f"{name}.duckdb"))
+        results.append(con.execute(query).fetchall())
+        con.close()
+    assert results[0] == results[1]
+    assert len(results[0]) == 25
+
+
+def test_failed_batch_keeps_good_rows_and_drops_bad(writer):
+    """A conflicting row is rejected; the rest of the batch is committed once."""
+    write_mock(writer, mock_episodes("random", 3))
+    writer.flush()
+
+    # Second batch: two new episodes around a primary-key duplicate of episode 2
+    write_mock(writer, mock_episodes("random", 1, start=3))
+    write_mock(writer, mock_episodes("random", 1, start=2))
+    write_mock(writer, mock_episodes("random", 1, start=4))
+    assert writer.flush() == 2
+    assert writer.pending_count == 0
+    assert count_rows(writer) == 5
+    assert [key for key, _ in writer.rejected] == [("DOE-001", "random", 2)]
+
+    # The bad row is not replayed by later flushes
+    write_mock(writer, mock_episodes("random", 1, start=5))
+    assert writer.flush() == 1
+    assert count_rows(writer) == 6
+    assert len(writer.rejected) == 1
+    assert writer.episodes_persisted == 6
+
+
+def test_index_updated_only_after_commit(writer):
+    """Buffered and rejected episodes never appear in the completion index."""
+    write_mock(writer, mock_episodes("random", 2))
+    index = writer.completion_index("DOE-001")  # flushes first
+    assert index.count("random") == 2
+
+    write_mock(writer, mock_episodes("random", 2, start=2))
+    assert writer.is_pending("DOE-001", "random", 3)
+    assert not index.contains("random", 3)
+
+    write_mock(writer, mock_episodes("random", 1, start=1))  # duplicate
+    writer.flush()
+    assert index.count("random") == 4
+    assert index.contains("random", 3)
+    assert writer.get_episode_count("DOE-001", "random") == count_rows(writer) == 4
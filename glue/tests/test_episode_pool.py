@@ -0,0 +1,175 @@
+"""Tests for EpisodePool with a stub bridge, runner and policy."""
+
+from __future__ import annotations
+
+import multiprocessing as mp
+import random
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+
+import pytest
+
+from glue.episode_pool import EpisodePool, EpisodeTask
+from glue.episode_runner import EpisodeResult
+from glue.vizdoom_bridge import EpisodeMetrics, GameState
+
+STATES = [GameState(health=100 - t % 90, ammo=50, tick=t) for t in range(60)]
+
+
+@dataclass(frozen=True)
+class Run:
+    condition: str
+    attack_rate: float
+    scenario: str = "defend_the_center.cfg"
+    fail_seed: int = -1
+
+
+class StubPolicy:
+    """Seeded policy: attacks (action 2) with the run's probability."""
+
+    def __init__(self, run: Run):
+        self._rate = run.attack_rate
+        self._rng = random.Random()
+
+    def reset(self, seed: int) -> None:
+        self._rng.seed(seed)
+
+    def __call__(self, state: GameState) -> int:
+        return 2 if self._rng.random() < self._rate else self._rng.randrange(2)
+
+    def close(self) -> None:
+        log("policy close")
+
+
+def make_policy(run: Run) -> StubPolicy:
+    return StubPolicy(run)
+
+
+def log(line: str) -> None:
+    """Append a lifecycle event to StubBridge.log_path (shared with forked workers)."""
+    if StubBridge.log_path is not None:
+        with open(StubBridge.log_path, "a") as f:
+            f.write(line + "\n")
+
+
+class StubBridge:
+    log_path: Path | None = None
+
+    def __init__(self, scenario, num_actions, doom_skill):
+        log(f"open {scenario}")
+
+    def close(self):
+        log("close")
+
+
+class StubRunner:
+    def __init__(self, bridge):
+        pass
+
+    def run_episode(self, seed, condition, episode_number, action_fn, trace=None):
+        if seed == RUNS_BY_CONDITION[condition].fail_seed:
+            raise ValueError(f"bridge crashed on seed {seed}")
+        actions = [action_fn(state) for state in STATES]
+        return EpisodeResult(
+            seed, condition, episode_number,
+            EpisodeMetrics(kills=actions.count(2), survival_time=float(len(actions))),
+            [0.1] * len(actions),
+            [0 if a == 2 else 1 for a in actions],
+        )
+
+
+RUNS = [
+    Run("passive", 0.1),
+    Run("aggressive", 0.8, scenario="defend_the_line.cfg"),
+    Run("broken", 0.5, fail_seed=103),
+]
+RUNS_BY_CONDITION = {run.condition: run for run in RUNS}
+
+
+@pytest.fixture
+def stub_vizdoom(monkeypatch, tmp_path):
+    monkeypatch.setattr("glue.vizdoom_bridge.VizDoomBridge", StubBridge)
+    monkeypatch.setattr("glue.episode_runner.EpisodeRunner", StubRunner)
+    monkeypatch.setattr(StubBridge, "log_path", tmp_path / "bridges.log")
+    return StubBridge.log_path
+
+
+def tasks_for(run_indices, n_seeds=6):
+    return [
+        EpisodeTask(r, 100 + s, s + 1) for s in range(n_seeds) for r in run_indices
+    ]
+
+
+def serial_rows(tasks):
+    """What the serial executor records for ``tasks``."""
+    runner = StubRunner(None)
+    policies = {}
+    rows = []
+    for task in tasks:
+        run = RUNS[task.run_index]
+        policy = policies.setdefault(task.run_index, make_policy(run))
+        policy.reset(seed=task.seed)
+        result = runner.run_episode(task.seed, run.condition, task.episode_number, policy)
+        rows.append((
+            run.condition, task.episode_number, task.seed, result.metrics_dict(),
+            result.decision_level_counts, result.rule_match_rate,
+        ))
+    return sorted(rows, key=lambda r: (r[0], r[1]))
+
+
+def pool_rows(tasks, workers):
+    rows = []
+    pool = EpisodePool(RUNS, make_policy, workers=workers)
+    completed = pool.run(tasks, lambda o: rows.append((
+        RUNS[o.task.run_index].condition, o.task.episode_number, o.task.seed,
+        o.metrics, o.decision_level_counts, o.rule_match_rate,
+    )))
+    assert completed == len(tasks)
+    return sorted(rows, key=lambda r: (r[0], r[1]))
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_parallel_rows_match_serial(stub_vizdoom, workers):
+    tasks = tasks_for([0, 1])
+    assert pool_rows(tasks, workers) == serial_rows(tasks)
+
+
+def test_clean_shutdown_closes_bridges_and_policies(stub_vizdoom):
+    pool_rows(tasks_for([0, 1]), workers=2)
+    log = stub_vizdoom.read_text().split("\n")[:-1]
+    opened = [line for line in log if line.startswith("open")]
+    assert len(opened) >= 2  # both scenarios were needed
+    assert log.count("close") == len(opened)
+    # each worker closes every policy it built (2 runs x 2 workers at most)
+    assert 2 <= log.count("policy close") <= 4
+    assert mp.active_children() == []
+
+
+def test_worker_failure_propagates(stub_vizdoom):
+    tasks = tasks_for([0, 2])
+    delivered = []
+    pool = EpisodePool(RUNS, make_policy, workers=2)
+    with pytest.raises(RuntimeError, match="seed=103.*bridge crashed on seed 103"):
+        pool.run(tasks, delivered.append)
+    assert all(o.task.seed != 103 or o.task.run_index != 2 for o in delivered)
+    assert len(delivered) < len(tasks)
+    assert mp.active_children() == []
+
+
+def test_fork_with_live_threads_warns(stub_vizdoom, caplog):
+    stop = threading.Event()
+    poller = threading.Thread(target=stop.wait, name="grpc-poller")
+    poller.start()
+    try:
+        pool_rows(tasks_for([0]), workers=1)
+    finally:
+        stop.set()
+        poller.join()
+    assert "grpc-poller" in caplog.text
+
+
+def test_rejects_zero_workers():
+    with pytest.raises(ValueError):
+        EpisodePool(RUNS, make_policy, workers=0)
+    assert EpisodePool(RUNS, make_policy, workers=2).run([], print) == 0
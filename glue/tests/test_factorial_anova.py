@@ -0,0 +1,156 @@
+"""Tests for the aggregate-based factorial / RSM ANOVA engine."""
+
+import duckdb
+import numpy as np
+import pytest
+from scipy import stats
+
+from glue.analysis.factorial_anova import (
+    design_factors,
+    factorial_anova,
+    factorial_anova_groups,
+    parse_condition,
+)
+
+
+def two_level_design(seed=0, n=20):
+    """2^2 factorial with a center cell, memory effect and curvature."""
+    rng = np.random.default_rng(seed)
+    groups = {}
+    for m in (0.7, 0.9):
+        for s in (0.7, 0.9):
+            groups[f"memory={m}_strength={s}"] = rng.normal(
+                10 + 20 * (m - 0.8) + 5 * (m - 0.8) * (s - 0.8) * 100, 2, n)
+    groups["memory=0.8_strength=0.8"] = rng.normal(13, 2, n + 5)
+    groups["memory=0.9_strength=0.9"][0] = 40.0  # one outlier
+    return groups
+
+
+def to_frame(groups):
+    pd = pytest.importorskip("pandas")
+    rows = []
+    for condition, values in groups.items():
+        levels = parse_condition(condition)
+        rows += [{**levels, "y": v} for v in values]
+    return pd.DataFrame(rows)
+
+
+def test_parse_condition():
+    assert parse_condition("memory=0.7_strength=0.9") == {"memory": 0.7, "strength": 0.9}
+    assert parse_condition("action_strategy=L0_memory") == {"action_strategy": "L0_memory"}
+    assert parse_condition("memory_weight=0.7_strength_weight=0.9",
+                           names=["memory_weight", "strength_weight"]) == {
+        "memory_weight": 0.7, "strength_weight": 0.9}
+    with pytest.raises(ValueError):
+        parse_condition("burst_3")
+    assert design_factors(["burst_3", "random"]) is None
+    assert design_factors(["a=1_b=2", "a=1"]) is None
+
+
+def test_factorial_matches_row_level_ols():
+    smf = pytest.importorskip("statsmodels.formula.api")
+    from statsmodels.stats.anova import anova_lm
+
+    groups = two_level_design()
+    result = factorial_anova_groups(groups, "y")
+    assert [t.source for t in result.terms] == [
+        "memory", "strength", "memory:strength", "curvature"]
+
+    df = to_frame(groups)
+    df["a"] = np.round((df["memory"] - 0.8) / 0.1)
+    df["b"] = np.round((df["strength"] - 0.8) / 0.1)
+    df["c"] = ((df["a"] == 0) & (df["b"] == 0)).astype(float)
+    model = smf.ols("y ~ a * b + c", df).fit()
+    table = anova_lm(model, typ=3)
+    for source, key in [("memory", "a"), ("strength", "b"),
+                        ("memory:strength", "a:b"), ("curvature", "c")]:
+        assert result.term(source).ss == pytest.approx(table.loc[key, "sum_sq"])
+        assert result.term(source).p == pytest.approx(table.loc[key, "PR(>F)"])
+    assert result.residual.ss == pytest.approx(model.ssr)
+    assert result.residual.df == model.df_resid
+    assert result.lack_of_fit is None  # saturated on the cells
+    assert result.term("curvature").p < 0.05
+
+    diag = result.diagnostics
+    jb = stats.jarque_bera(model.resid)
+    assert diag.jarque_bera == pytest.approx(jb.statistic)
+    assert diag.levene_p == pytest.approx(stats.levene(*groups.values()).pvalue)
+    studentized = model.get_influence().resid_studentized_internal
+    assert diag.max_abs_studentized == pytest.approx(np.abs(studentized).max())
+    assert diag.n_outliers == int((np.abs(studentized) > 3).sum()) >= 1
+
+
+def test_unbalanced_multilevel_types():
+    smf = pytest.importorskip("statsmodels.formula.api")
+    from statsmodels.stats.anova import anova_lm
+
+    rng = np.random.default_rng(1)
+    groups = {
+        f"arm={arm}_dose={dose}": rng.normal(i + dose * (arm == "hi"), 1, 8 + 3 * i + dose)
+        for i, arm in enumerate(["lo", "mid", "hi"]) for dose in (1, 2)
+    }
+    df = to_frame(groups)
+    model = smf.ols("y ~ C(arm, Sum) * C(dose, Sum)", df).fit()
+    for typ in (1, 3):
+        result = factorial_anova_groups(groups, "y", typ=typ)
+        table = anova_lm(model, typ=typ)
+        assert [t.df for t in result.terms] == [2, 1, 2]
+        np.testing.assert_allclose(
+            [t.ss for t in result.terms], table["sum_sq"].iloc[-4:-1] if typ == 3
+            else table["sum_sq"].iloc[:3])
+    sequential = factorial_anova_groups(groups, "y", typ=1)
+    model_ss = sum(t.ss for t in sequential.terms)
+    assert model_ss + sequential.residual.ss == pytest.approx(sequential.total_ss)
+
+
+def test_rsm_lack_of_fit_and_aliasing():
+    rng = np.random.default_rng(2)
+    levels = (0.1, 0.5, 0.9)
+    groups = {
+        f"m={x}_s={z}": rng.normal(5 + 3 * x - 4 * x ** 2 + np.sin(7 * z), 1, 10)
+        for x in levels for z in levels
+    }
+    result = factorial_anova_groups(groups, "y", model="rsm")
+    assert [t.source for t in result.terms] == ["m", "s", "m:s", "m^2", "s^2"]
+    assert result.lack_of_fit.df == 9 - 6
+    assert result.lack_of_fit.ss + result.pure_error.ss == pytest.approx(result.residual.ss)
+    assert result.term("m^2").p < 0.05
+
+    # 2^2 + center: only one pure quadratic is estimable
+    rsm = factorial_anova_groups(two_level_design(), "y", model="rsm")
+    assert rsm.aliased == ["strength^2"]
+
+
+def test_duckdb_aggregates_match_in_memory(tmp_path):
+    groups = two_level_design(seed=3)
+    db_path = str(tmp_path / "f.duckdb")
+    con = duckdb.connect(db_path)
+    con.execute("CREATE TABLE experiments (experiment_id TEXT, condition TEXT, "
+                "episode_number INTEGER, kill_rate DOUBLE)")
+    rows = []
+    for condition, values in groups.items():
+        # Center points run in two blocks with their own labels
+        center = condition == "memory=0.8_strength=0.8"
+        for i, v in enumerate(values):
+            label = f"{condition}_block={i % 2}" if center else condition
+            rows.append(["DOE-X", label, i, float(v)])
+    rows.append(["DOE-X", "memory=0.7_strength=0.7", 999, None])
+    rows.append(["DOE-Y", "memory=0.7_strength=0.7", 0, 1e6])
+    con.executemany("INSERT INTO experiments VALUES (?, ?, ?, ?)", rows)
+    con.close()
+
+    factors = {
+        row[1]: {k: v for k, v in parse_condition(row[1]).items() if k != "block"}
+        for row in rows if row[0] == "DOE-X"
+    }
+    from_db = factorial_anova(db_path, "DOE-X", "kill_rate", factors=factors)
+    in_memory = factorial_anova_groups(groups, "kill_rate")
+    assert from_db.cells.n.tolist() == in_memory.cells.n.tolist()
+    assert len(from_db.cells.conditions[2]) == 2  # blocks pooled into one cell
+    for a, b in zip(from_db.terms, in_memory.terms):
+        assert a.ss == pytest.approx(b.ss) and a.df == b.df
+    assert from_db.diagnostics.levene_p == pytest.approx(in_memory.diagnostics.levene_p)
+    assert from_db.diagnostics.n_outliers == in_memory.diagnostics.n_outliers >= 1
+
+    with pytest.raises(ValueError):
+        factorial_anova(db_path, "DOE-X", "kill_rate")  # block labels differ
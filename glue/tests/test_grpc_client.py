@@ -0,0 +1,227 @@
+"""Tests for the gRPC action clients against an in-process AgentService."""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from concurrent import futures
+
+import grpc
+import pytest
+
+from glue.action_functions import rule_only_action
+from glue.grpc_async_client import FALLBACK_RULE, AsyncAgentChannel
+from glue.grpc_client import GrpcActionClient
+from glue.proto import agent_pb2
+from glue.proto.agent_pb2_grpc import (
+    AgentServiceServicer,
+    add_AgentServiceServicer_to_server,
+)
+from glue.vizdoom_bridge import ACTION_ATTACK, ACTION_MOVE_LEFT, GameState
+
+
+class FakeAgentService(AgentServiceServicer):
+    """Deterministic rule: dodge below 30 health, otherwise attack."""
+
+    def __init__(self) -> None:
+        self.streams_opened = 0
+        self.delay_s = 0.0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def _decide(self, state: agent_pb2.GameState) -> agent_pb2.Action:
+        if state.health < 30:
+            return agent_pb2.Action(
+                action_type=agent_pb2.MOVE_LEFT,
+                decision_level=0,
+                latency_ms=0.25,
+                rule_matched="low_health",
+            )
+        return agent_pb2.Action(
+            action_type=agent_pb2.ATTACK, decision_level=2, latency_ms=0.5
+        )
+
+    def Tick(self, request, context):
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if self.delay_s:
+                time.sleep(self.delay_s)
+            return self._decide(request)
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+    def StreamTick(self, request_iterator, context):
+        self.streams_opened += 1
+        for state in request_iterator:
+            if state.health < 0:
+                context.abort(grpc.StatusCode.INVALID_ARGUMENT, "negative health")
+            yield self._decide(state)
+
+
+def _start_server() -> tuple[grpc.Server, FakeAgentService, int]:
+    servicer = FakeAgentService()
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=8))
+    add_AgentServiceServicer_to_server(servicer, server)
+    port = server.add_insecure_port("localhost:0")
+    server.start()
+    return server, servicer, port
+
+
+@pytest.fixture
+def agent_server():
+    server, servicer, port = _start_server()
+    yield servicer, port
+    server.stop(grace=None)
+
+
+def _request_consumers() -> int:
+    """Live gRPC threads feeding a stream from a client-side request iterator."""
+    count = 0
+    for frame in sys._current_frames().values():
+        while frame is not None:
+            if frame.f_code.co_name == "consume_request_iterator":
+                count += 1
+                break
+            frame = frame.f_back
+    return count
+
+
+def _episode(health_values: list[int]) -> list[GameState]:
+    return [GameState(health=h, tick=i) for i, h in enumerate(health_values)]
+
+
+class TestStreamingClient:
+    def test_streaming_matches_unary(self, agent_server):
+        servicer, port = agent_server
+        states = _episode([100, 80, 25, 10, 90])
+        unary = GrpcActionClient("localhost", port, streaming=False)
+        stream = GrpcActionClient("localhost", port, streaming=True)
+        try:
+            for state in states:
+                assert stream(state) == unary(state)
+                assert stream.last_decision_level == unary.last_decision_level
+                assert stream.last_latency_ms == unary.last_latency_ms
+                assert stream.last_rule_matched == unary.last_rule_matched
+        finally:
+            unary.close()
+            stream.close()
+        assert servicer.streams_opened == 1
+
+    def test_one_stream_per_episode(self, agent_server):
+        servicer, port = agent_server
+        client = GrpcActionClient("localhost", port, streaming=True)
+        try:
+            for seed in range(3):
+                client.reset(seed=seed)
+                actions = [client(s) for s in _episode([100, 20])]
+                assert actions == [ACTION_ATTACK, ACTION_MOVE_LEFT]
+        finally:
+            client.close()
+        assert servicer.streams_opened == 3
+
+    def test_latency_summary(self, agent_server, caplog):
+        _, port = agent_server
+        client = GrpcActionClient("localhost", port, streaming=True)
+        try:
+            for state in _episode([100] * 20):
+                client(state)
+            summary = client.latency_summary()
+            assert summary["n"] == 20
+            assert summary["server_p50_ms"] == pytest.approx(0.5)
+            assert summary["rtt_p99_ms"] >= summary["rtt_p50_ms"] > 0
+            assert client.last_rtt_ms > 0
+
+            with caplog.at_level("INFO", logger="glue.grpc_client"):
+                client.reset()
+            assert "StreamTick: 20 ticks, rtt p50/p95/p99=" in caplog.text
+            assert "server p50/p95/p99=0.50/0.50/0.50ms" in caplog.text
+            assert client.latency_summary()["n"] == 0
+        finally:
+            client.close()
+
+    def test_stream_error_reopens_on_next_tick(self, agent_server):
+        servicer, port = agent_server
+        client = GrpcActionClient("localhost", port, streaming=True)
+        try:
+            with pytest.raises(grpc.RpcError):
+                client(GameState(health=-1))
+            assert client(GameState(health=100)) == ACTION_ATTACK
+        finally:
+            client.close()
+        assert servicer.streams_opened == 2
+
+    def test_server_death_releases_request_thread(self):
+        server, _, port = _start_server()
+        client = GrpcActionClient("localhost", port, streaming=True)
+        try:
+            assert client(GameState(health=100)) == ACTION_ATTACK
+            assert _request_consumers() == 1
+            server.stop(grace=None).wait()
+            with pytest.raises(grpc.RpcError):
+                for state in _episode([100] * 5):
+                    client(state)
+            deadline = time.monotonic() + 5
+            while _request_consumers() and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert _request_consumers() == 0
+        finally:
+            client.close()
+
+
+class TestAsyncClient:
+    def test_matches_sync_client(self, agent_server):
+        _, port = agent_server
+        states = _episode([100, 80, 25, 10, 90])
+        sync = GrpcActionClient("localhost", port)
+        with AsyncAgentChannel("localhost", port, deadline_ms=1000) as channel:
+            client = channel.episode()
+            for state in states:
+                assert client(state) == sync(state)
+                assert client.last_decision_level == sync.last_decision_level
+                assert client.last_latency_ms == sync.last_latency_ms
+                assert client.last_rule_matched == sync.last_rule_matched
+            assert channel.fallbacks == 0
+        sync.close()
+
+    def test_concurrent_episodes_share_channel(self, agent_server):
+        servicer, port = agent_server
+        servicer.delay_s = 0.02
+        results: dict[int, list[int]] = {}
+
+        def run(channel: AsyncAgentChannel, idx: int) -> None:
+            client = channel.episode()
+            results[idx] = [client(s) for s in _episode([100, 20, 100])]
+
+        with AsyncAgentChannel(
+            "localhost", port, max_in_flight=2, deadline_ms=5000
+        ) as channel:
+            threads = [
+                threading.Thread(target=run, args=(channel, i)) for i in range(6)
+            ]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            assert channel.ticks == 18
+
+        expected = [ACTION_ATTACK, ACTION_MOVE_LEFT, ACTION_ATTACK]
+        assert all(results[i] == expected for i in range(6))
+        assert 1 < servicer.max_in_flight <= 2
+
+    def test_deadline_falls_back_to_l0_rule(self, agent_server):
+        servicer, port = agent_server
+        servicer.delay_s = 0.2
+        state = GameState(health=100, ammo=50, enemies_visible=1)
+        with AsyncAgentChannel("localhost", port, deadline_ms=20) as channel:
+            client = channel.episode()
+            assert client(state) == rule_only_action(state)
+            assert client.last_decision_level == 0
+            assert client.last_rule_matched == FALLBACK_RULE
+            assert client.fallback_count == 1
+            assert channel.fallback_rate == 1.0
+            assert client.last_rtt_ms < 200
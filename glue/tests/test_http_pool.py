@@ -0,0 +1,153 @@
+"""Tests for the keep-alive HTTP pool against a local OpenSearch stand-in."""
+
+from __future__ import annotations
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from glue.action_functions import L2RagAction
+from glue.data import seed_to_opensearch
+from glue.http_pool import HTTPConnectionPool, HTTPError, close_all_pools, get_pool
+from glue.strategy_index import OpenSearchRetriever
+from glue.vizdoom_bridge import ACTION_MOVE_LEFT, GameState
+
+
+class FakeOpenSearch(BaseHTTPRequestHandler):
+    """Minimal _search/_bulk/_refresh/_count endpoints."""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    docs: list[dict] = []
+    connections: set = set()
+    drop_after_response = False
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self, status: int, payload: dict) -> None:
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        if self.drop_after_response:
+            # close without announcing it, like an idle-timeout on the server
+            self.close_connection = True
+
+    def do_POST(self):
+        self.connections.add(self.client_address)
+        data = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if self.path.endswith("/_search"):
+            hits = [{"_score": 1.0, "_source": d} for d in self.docs]
+            self._reply(200, {"hits": {"hits": hits}})
+        elif self.path == "/_bulk":
+            lines = [json.loads(line) for line in data.decode().splitlines()]
+            self.docs.extend(lines[1::2])
+            self._reply(200, {"errors": False, "items": []})
+        elif self.path.endswith("/_refresh"):
+            self._reply(200, {})
+        else:
+            self._reply(404, {"error": "no handler"})
+
+    def do_GET(self):
+        self.connections.add(self.client_address)
+        if self.path.endswith("/_count"):
+            self._reply(200, {"count": len(self.docs)})
+        else:
+            self._reply(404, {"error": "no handler"})
+
+
+@pytest.fixture
+def opensearch():
+    FakeOpenSearch.docs = []
+    FakeOpenSearch.connections = set()
+    FakeOpenSearch.drop_after_response = False
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeOpenSearch)
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    close_all_pools()
+    server.shutdown()
+    server.server_close()
+
+
+class TestHTTPConnectionPool:
+    def test_reuses_one_connection(self, opensearch):
+        pool = HTTPConnectionPool(opensearch, maxsize=2)
+        for _ in range(20):
+            assert json.loads(pool.request("GET", "/idx/_count")) == {"count": 0}
+        assert pool.connections_opened == 1
+        assert len(FakeOpenSearch.connections) == 1
+        summary = pool.latency_summary()
+        assert summary["n"] == 20
+        assert summary["p99_ms"] >= summary["p50_ms"] > 0
+        pool.close()
+
+    def test_reconnects_after_server_close(self, opensearch):
+        FakeOpenSearch.drop_after_response = True
+        pool = HTTPConnectionPool(opensearch)
+        for _ in range(3):
+            pool.request("GET", "/idx/_count")
+        assert pool.requests == 3
+        assert pool.connections_opened >= 2
+        pool.close()
+
+    def test_http_error_keeps_connection(self, opensearch):
+        pool = HTTPConnectionPool(opensearch)
+        with pytest.raises(HTTPError) as exc:
+            pool.request("GET", "/missing")
+        assert exc.value.status == 404
+        pool.request("GET", "/idx/_count")
+        assert pool.connections_opened == 1
+        pool.close()
+
+    def test_concurrent_requests_bounded_by_pool_size(self, opensearch):
+        pool = HTTPConnectionPool(opensearch, maxsize=2)
+        threads = [
+            threading.Thread(
+                target=lambda: [pool.request("GET", "/idx/_count") for _ in range(10)]
+            )
+            for _ in range(4)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert pool.requests == 40
+        assert pool.connections_opened <= 2
+        pool.close()
+
+    def test_get_pool_is_shared(self, opensearch):
+        assert get_pool(opensearch) is get_pool(opensearch + "/")
+
+
+class TestOpenSearchClients:
+    def test_l2_policy_queries_over_shared_pool(self, opensearch):
+        FakeOpenSearch.docs = [
+            {"doc_id": "r", "decision": {"tactic": "retreat"}, "quality": {"trust_score": 0.9}}
+        ]
+        action = L2RagAction(
+            retriever=OpenSearchRetriever(opensearch, "strategies_high", timeout=2.0)
+        )
+        action.reset(seed=0)
+        assert action(GameState(health=100, ammo=30)) == ACTION_MOVE_LEFT
+        # a second policy instance reuses the same warm connection
+        other = L2RagAction(
+            retriever=OpenSearchRetriever(opensearch, "strategies_high", timeout=2.0)
+        )
+        other.reset(seed=0)
+        assert other(GameState(health=100, ammo=30)) == ACTION_MOVE_LEFT
+        assert get_pool(opensearch).connections_opened == 1
+
+    def test_seed_script_uses_pool(self, opensearch):
+        docs = [{"_id": f"s{i}", "doc_id": f"s{i}"} for i in range(7)]
+        assert seed_to_opensearch.bulk_index(docs, opensearch, "strategies", batch_size=3) == 7
+        seed_to_opensearch.refresh_index(opensearch, "strategies")
+        assert seed_to_opensearch.get_doc_count(opensearch, "strategies") == 7
+        pool = get_pool(opensearch)
+        assert pool.requests == 5
+        assert pool.connections_opened == 1
@@ -535,6 +535,35 @@ def test_report_generation(tmp_db):
         assert report_file.exists()
 
 
+@pytest.mark.filterwarnings("ignore::RuntimeWarning")  # SD of a single episode
+def test_report_lists_conditions_excluded_from_comparisons(tmp_db, tmp_path, caplog):
+    """One-episode conditions are named in the report, not silently dropped."""
+    writer, db_path = tmp_db
+    for cond, n in [("random", 10), ("rule_only", 10), ("full_agent", 1)]:
+        for ep in generate_mock_episodes(cond, n):
+            writer.write_episode(
+                experiment_id="DOE-001",
+                run_id=f"DOE-001-{cond}",
+                condition=cond,
+                seed=ep["seed"],
+                episode_number=ep["episode_number"],
+                metrics={"kills": ep["kills"], "survival_time": ep["survival_time"]},
+            )
+    writer.close()
+
+    with caplog.at_level("WARNING", logger="glue.analysis.report_generator"):
+        report = generate_report(
+            str(db_path), "DOE-001", metrics=["kills", "survival_time"],
+            output_dir=tmp_path,
+        )
+
+    assert "**Excluded** (fewer than 2 episodes): full_agent" in report
+    assert "### random vs rule_only" in report or "### rule_only vs random" in report
+    headings = [line for line in report.splitlines() if line.startswith("### ")]
+    assert not any("full_agent" in h for h in headings)
+    assert "full_agent" in caplog.text
+
+
 def test_go_cli_doe_list():
     """Test Go CLI DOE list command works."""
     import subprocess
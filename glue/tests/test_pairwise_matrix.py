@@ -0,0 +1,102 @@
+"""Tests for the all-pairs comparison matrix engine."""
+
+import duckdb
+import numpy as np
+import pytest
+
+from glue.analysis.pairwise_matrix import (
+    ExperimentColumns,
+    load_experiment_columns,
+    pairwise_matrix,
+)
+from glue.analysis.statistical_tests import holm_bonferroni, pairwise_comparison
+
+FIELDS = [
+    "mean_a", "mean_b", "std_a", "std_b", "n_a", "n_b", "t_statistic",
+    "p_value_welch", "df_welch", "u_statistic", "p_value_mann_whitney",
+    "cohens_d", "ci_lower", "ci_upper",
+]
+
+
+def make_groups():
+    rng = np.random.default_rng(7)
+    groups = {
+        # Integer-valued metrics (kills) have many ties
+        f"int_{i}": rng.poisson(10 + i, 20 + 3 * i).astype(float) for i in range(4)
+    }
+    groups.update({f"cont_{i}": rng.normal(50 + 2 * i, 8, 30) for i in range(3)})
+    groups["small"] = np.array([41.5, 47.25, 52.0, 58.75, 60.5])  # exact MWU
+    groups["flat"] = np.array([12.0, 12.0, 12.0])  # zero variance
+    return groups
+
+
+@pytest.mark.filterwarnings("ignore::RuntimeWarning")
+def test_matches_pairwise_comparison():
+    groups = make_groups()
+    matrix = pairwise_matrix(groups, "kills")
+    results = matrix.results()
+    assert len(results) == 9 * 8 // 2
+    for result in results:
+        a, b = result.condition_a, result.condition_b
+        expected = pairwise_comparison(groups[a], groups[b], a, b, "kills")
+        for field in FIELDS:
+            assert getattr(result, field) == pytest.approx(
+                getattr(expected, field), rel=1e-9, abs=1e-12, nan_ok=True
+            ), (a, b, field)
+
+
+def test_matrix_orientation_and_holm():
+    groups = make_groups()
+    matrix = pairwise_matrix(groups, "kills")
+    np.testing.assert_allclose(matrix.t_statistic, -matrix.t_statistic.T)
+    np.testing.assert_allclose(matrix.p_value_welch, matrix.p_value_welch.T)
+    n = matrix.n
+    np.testing.assert_allclose(matrix.u_statistic + matrix.u_statistic.T, np.outer(n, n))
+
+    sig = matrix.holm_significant()
+    flags = holm_bonferroni([r.p_value_welch for r in matrix.results()])
+    assert [sig[i, j] for i, j in matrix.pairs()] == flags
+    assert (sig == sig.T).all()
+
+
+def test_requires_two_observations():
+    with pytest.raises(ValueError):
+        pairwise_matrix({"a": np.array([1.0]), "b": np.array([1.0, 2.0])}, "kills")
+
+
+def test_experiment_columns_groups_and_complete_rows():
+    columns = ExperimentColumns(
+        conditions=np.array(["b", "a", "b", "a", "a"]),
+        columns={
+            "kills": np.array([1.0, 2.0, 3.0, np.nan, 5.0]),
+            "survival_time": np.array([10.0, 20.0, np.nan, 40.0, 50.0]),
+        },
+    )
+    groups = columns.groups("kills")
+    assert list(groups) == ["a", "b"]
+    assert groups["a"].tolist() == [2.0, 5.0] and groups["b"].tolist() == [1.0, 3.0]
+    rows = columns.complete_rows(["kills", "survival_time"])
+    assert rows["a"].tolist() == [[2.0, 20.0], [5.0, 50.0]]
+    assert rows["b"].tolist() == [[1.0, 10.0]]
+
+
+def test_load_experiment_columns_single_query(tmp_path):
+    db_path = str(tmp_path / "x.duckdb")
+    con = duckdb.connect(db_path)
+    con.execute(
+        "CREATE TABLE experiments (experiment_id TEXT, condition TEXT, "
+        "episode_number INTEGER, kills INTEGER, kill_rate DOUBLE)"
+    )
+    con.executemany(
+        "INSERT INTO experiments VALUES (?, ?, ?, ?, ?)",
+        [
+            ["E", "b", 2, 4, 1.5], ["E", "b", 1, 3, None], ["E", "a", 1, 7, 2.5],
+            ["F", "a", 1, 99, 9.9],
+        ],
+    )
+    con.close()
+
+    columns = load_experiment_columns(db_path, "E", ["kills", "kill_rate"])
+    assert columns.conditions.tolist() == ["a", "b", "b"]
+    assert columns.groups("kills")["b"].tolist() == [3.0, 4.0]
+    assert columns.groups("kill_rate")["b"].tolist() == [1.5]
@@ -0,0 +1,46 @@
+"""Parallel generation evaluation matches the serial evolutionary drivers."""
+
+import duckdb
+
+from glue import doe021_evolve
+from glue.doe_executor import build_doe044_config, execute_doe044
+from glue.racing import RacingSchedule
+
+
+def episodes(db_path, experiment_like):
+    con = duckdb.connect(str(db_path))
+    rows = con.execute(
+        "SELECT experiment_id, condition, episode_number, seed, kills, run_id "
+        "FROM experiments WHERE experiment_id LIKE ? ORDER BY ALL",
+        [experiment_like],
+    ).fetchall()
+    con.close()
+    return rows
+
+
+def test_generation_workers_match_serial(tmp_path, fake_vizdoom):
+    genomes = dict(list(doe021_evolve.GEN1_GENOMES.items())[:5])
+    seeds = doe021_evolve.make_seed_set(2)[:6]
+    for workers in (1, 2):
+        doe021_evolve.execute_generation(
+            2, genomes, seeds, tmp_path / f"w{workers}.duckdb", workers=workers
+        )
+    serial = episodes(tmp_path / "w1.duckdb", "DOE-021%")
+    assert len(serial) == 30
+    assert episodes(tmp_path / "w2.duckdb", "DOE-021%") == serial
+
+
+def test_doe044_workers_match_serial_with_racing(tmp_path, fake_vizdoom):
+    rankings = []
+    for workers in (1, 2):
+        config = build_doe044_config(db_path=tmp_path / f"w{workers}.duckdb")
+        execute_doe044(config, racing=RacingSchedule(), workers=workers)
+        con = duckdb.connect(str(config.db_path))
+        rankings.append(con.execute(
+            "SELECT experiment_id, condition, final_rank FROM racing_ranking ORDER BY ALL"
+        ).fetchall())
+        con.close()
+    assert rankings[0] and rankings[0] == rankings[1]
+    assert episodes(tmp_path / "w2.duckdb", "DOE-044%") == episodes(
+        tmp_path / "w1.duckdb", "DOE-044%"
+    )
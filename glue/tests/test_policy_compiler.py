@@ -0,0 +1,152 @@
+"""Tests for compiled lookup-table policies."""
+
+import random
+
+import pytest
+
+from glue.action_functions import (
+    AttackOnlyAction,
+    AttackRatioAction,
+    AttackRatioActionRaw,
+    Burst1Action,
+    Burst3Action,
+    Burst3ThresholdAction,
+    Burst5Action,
+    Burst7Action,
+    BurstCycleAction,
+    ForwardAttackAction,
+    FullAgentAction,
+    PureAttackAction,
+)
+from glue.episode_runner import EpisodeRunner
+from glue.policy_compiler import (
+    CompiledPolicy,
+    PolicyTable,
+    _make_kernel,
+    compile_policy,
+    compile_table,
+)
+from glue.vizdoom_bridge import EpisodeMetrics, GameState
+
+COMPILABLE = [
+    Burst1Action,
+    Burst3Action,
+    Burst5Action,
+    Burst7Action,
+    lambda: Burst3ThresholdAction(health_threshold=35),
+    AttackOnlyAction,
+    ForwardAttackAction,
+    lambda: AttackRatioAction(attack_ratio=0.7),
+    lambda: AttackRatioActionRaw(attack_ratio=0.3),
+    lambda: BurstCycleAction(burst_length=5),
+    PureAttackAction,
+    lambda: PureAttackAction(health_override=False),
+]
+
+
+def mixed_states(n=600, seed=7):
+    """States crossing the health / ammo emergency rules."""
+    rng = random.Random(seed)
+    return [
+        GameState(
+            health=rng.choice([5, 19, 20, 30, 40, 100]),
+            ammo=rng.choice([0, 0, 5, 50]),
+            tick=tick,
+        )
+        for tick in range(n)
+    ]
+
+
+@pytest.mark.parametrize("factory", COMPILABLE)
+def test_compiled_decisions_match_interpreted(factory):
+    states = mixed_states()
+    reference, compiled = factory(), compile_policy(factory())
+    assert isinstance(compiled, CompiledPolicy)
+
+    # before any reset both fall back to their default RNG seed
+    assert [compiled(s) for s in states[:50]] == [reference(s) for s in states[:50]]
+    for seed in (0, 1, 42, 123456):
+        reference.reset(seed=seed)
+        compiled.reset(seed=seed)
+        assert [compiled(s) for s in states] == [reference(s) for s in states]
+
+
+@pytest.mark.parametrize("n", [2, 3, 4, 5, 7, 8, 9])
+@pytest.mark.parametrize("seed", [0, 42, 2**40 + 3])
+def test_kernel_draws_match_random_choice(n, seed):
+    """The kernel's inlined getrandbits loop consumes the RNG like Random.choice.
+
+    Guards the copy of Random._randbelow against CPython changing it.
+    """
+    moves = tuple(range(10, 10 + n))
+    state = GameState(health=100, ammo=50)
+
+    cycle = _make_kernel(PolicyTable(cycle=(3, moves)), seed)
+    ref = random.Random(seed)
+    assert [cycle(state) for _ in range(400)] == [
+        3 if i % 2 == 0 else ref.choice(moves) for i in range(400)
+    ]
+
+    ratio = _make_kernel(PolicyTable(attack_ratio=0.4, ratio_moves=moves), seed)
+    ref = random.Random(seed)
+    assert [ratio(state) for _ in range(400)] == [
+        4 if ref.random() < 0.4 else ref.choice(moves) for _ in range(400)
+    ]
+
+
+def test_unsupported_policies_stay_interpreted():
+    planned = Burst3Action(plan=True)
+    assert compile_policy(planned) is planned
+    assert compile_table(BurstCycleAction(plan=True)) is None
+    agent = FullAgentAction()
+    assert compile_policy(agent) is agent
+
+    class CustomBurst(Burst3Action):
+        pass
+
+    custom = CustomBurst()
+    assert compile_policy(custom) is custom
+
+
+class FakeBridge:
+    def __init__(self, states):
+        self._states = states
+        self.actions = []
+
+    def start_episode(self, seed):
+        self._i = 0
+
+    def is_episode_finished(self):
+        return self._i >= len(self._states)
+
+    def get_game_state(self):
+        return self._states[self._i]
+
+    def make_action(self, action, tics=1):
+        self.actions.append(action)
+        self._i += 1
+
+    def get_episode_metrics(self):
+        return EpisodeMetrics(total_ticks=self._i)
+
+
+def test_runner_calls_kernel_directly():
+    states = mixed_states(200)
+    policy = compile_policy(BurstCycleAction(burst_length=3))
+    policy.reset(seed=3)
+    calls = []
+    kernel = policy.kernel
+
+    def traced(state):
+        calls.append(state.tick)
+        return kernel(state)
+
+    policy.kernel = traced
+    bridge = FakeBridge(states)
+    result = EpisodeRunner(bridge).run_episode(3, "c", 1, policy, decision_level=0)
+
+    reference = BurstCycleAction(burst_length=3)
+    reference.reset(seed=3)
+    assert bridge.actions == [reference(s) for s in states]
+    assert len(calls) == 200
+    assert result.decision_levels == [0] * 200
@@ -0,0 +1,106 @@
+"""Tests for successive-halving genome racing."""
+
+import random
+
+import duckdb
+import pytest
+
+from glue import doe021_evolve
+from glue.racing import RacingSchedule, fetch_race_ranking, race
+
+
+class TestSchedule:
+    def test_budget_ladder_ends_at_full_seed_set(self):
+        assert RacingSchedule().budgets(30) == [5, 10, 20, 30]
+        assert RacingSchedule().budgets(20) == [5, 10, 20]
+        assert RacingSchedule(initial_episodes=40).budgets(30) == [30]
+        assert RacingSchedule(eta=3).budgets(30) == [5, 15, 30]
+
+    def test_survivors_never_below_minimum(self):
+        schedule = RacingSchedule()
+        assert [schedule.survivors(n) for n in (10, 5, 4, 2)] == [5, 4, 4, 2]
+
+    def test_invalid_schedule_rejected(self):
+        with pytest.raises(ValueError):
+            RacingSchedule(eta=1)
+
+
+def synthetic(true_means, noise):
+    """evaluate/score pair over per-genome episode values (seeded noise)."""
+    calls = []
+
+    def value(name, episode):
+        return true_means[name] + random.Random(f"{name}-{episode}").gauss(0, noise)
+
+    def evaluate(names, budget):
+        calls.append((tuple(names), budget))
+        return {
+            name: {"mean": sum(value(name, e) for e in range(budget)) / budget}
+            for name in names
+        }
+
+    def score(stats):
+        return {name: s["mean"] for name, s in stats.items()}
+
+    return evaluate, score, calls
+
+
+def test_race_keeps_best_genomes_for_fewer_episodes():
+    true_means = {f"G{i:02d}": float(i) for i in range(1, 11)}
+    evaluate, score, calls = synthetic(true_means, noise=1.0)
+    result = race(list(true_means), 30, evaluate, score, RacingSchedule())
+
+    assert [len(names) for names, _ in calls] == [10, 5, 4, 4]
+    assert result.ranking[:4] == ["G10", "G09", "G08", "G07"]
+    assert sorted(result.ranking) == sorted(true_means)
+    assert result.episodes == 5 * 5 + 10 + 4 * 30
+    assert all(result.budgets[name] == 30 for name in result.ranking[:4])
+    stats, fitness = result.final("G01")
+    assert fitness == stats["mean"] and result.budgets["G01"] == 5
+
+
+def test_race_matches_full_evaluation_top_four():
+    true_means = {f"G{i:02d}": random.Random(i).uniform(0, 10) for i in range(10)}
+    evaluate, score, _ = synthetic(true_means, noise=0.5)
+    full = score(evaluate(list(true_means), 30))
+    expected = sorted(full, key=full.get, reverse=True)[:4]
+    result = race(list(true_means), 30, evaluate, score, RacingSchedule())
+    assert result.ranking[:4] == expected
+
+
+KILLS = {"good": 30, "ok": 20, "meh": 12, "fine": 15, "bad": 2, "worse": 1}
+
+
+def kills_model(seed, condition, action_fn):
+    kills = KILLS[condition] + random.Random(seed).randint(0, 2)
+    return kills, 60.0 + kills
+
+
+def test_execute_generation_records_race(tmp_path, fake_vizdoom):
+    fake_vizdoom.use(kills_model)
+    genome = doe021_evolve.GEN1_GENOMES["G01_burst_3_base"]
+    genomes = {name: dict(genome) for name in KILLS}
+    seeds = doe021_evolve.make_seed_set(2)
+    db_path = tmp_path / "evo.duckdb"
+
+    result = doe021_evolve.execute_generation(
+        2, genomes, seeds, db_path, racing=RacingSchedule()
+    )
+
+    assert len(fake_vizdoom.played()) == result.episodes < len(KILLS) * len(seeds)
+    assert result.ranking[:4] == ["good", "ok", "fine", "meh"]
+    con = duckdb.connect(str(db_path))
+    assert fetch_race_ranking(con, "DOE-021_gen2") == result.ranking
+    eliminated = con.execute(
+        "SELECT condition FROM racing_rungs WHERE rung = 0 AND NOT survived ORDER BY score"
+    ).fetchall()
+    assert eliminated == [("worse",), ("bad",)]
+    con.close()
+
+    # Resuming reuses the recorded episodes and reaches the same decision
+    fake_vizdoom.clear()
+    again = doe021_evolve.execute_generation(
+        2, genomes, seeds, db_path, racing=RacingSchedule()
+    )
+    assert fake_vizdoom.played() == []
+    assert again.ranking == result.ranking
@@ -0,0 +1,91 @@
+"""Tests for batched bootstrap / permutation tests."""
+
+from itertools import combinations
+
+import numpy as np
+import pytest
+
+from glue.analysis.statistical_tests import (
+    holm_bonferroni,
+    pairwise_comparison,
+    resampling_tests,
+)
+
+METRICS = ["kills", "survival_time"]
+
+
+def make_groups(seed=0):
+    rng = np.random.default_rng(seed)
+    shifts = {"a": 0.0, "b": 0.0, "c": 1.5, "d": 3.0}
+    return {
+        c: np.column_stack([rng.normal(10 + s, 2, 30 + i), rng.normal(60, 5, 30 + i)])
+        for i, (c, s) in enumerate(shifts.items())
+    }
+
+
+def naive_permutation_p(x, y, n_resamples, rng):
+    pooled = np.concatenate([x, y])
+    observed = abs(x.mean() - y.mean())
+    hits = 0
+    for _ in range(n_resamples):
+        perm = rng.permutation(pooled)
+        hits += abs(perm[:len(x)].mean() - perm[len(x):].mean()) >= observed * (1 - 1e-12)
+    return (1 + hits) / (1 + n_resamples)
+
+
+def test_all_pairs_and_metrics():
+    groups = make_groups()
+    results = resampling_tests(groups, METRICS, n_resamples=2000)
+    pairs = list(combinations(sorted(groups), 2))
+    assert [(r.condition_a, r.condition_b, r.metric) for r in results] == [
+        (a, b, m) for a, b in pairs for m in METRICS
+    ]
+    by_key = {(r.condition_a, r.condition_b, r.metric): r for r in results}
+
+    for a, b in pairs:
+        r = by_key[(a, b, "kills")]
+        diff = groups[a][:, 0].mean() - groups[b][:, 0].mean()
+        assert r.mean_diff == pytest.approx(diff)
+        assert r.ci_lower < diff < r.ci_upper
+        assert 1 / 2001 <= r.p_value <= 1.0
+    # Large shift: smallest attainable p; no shift in survival_time
+    assert by_key[("a", "d", "kills")].p_value == pytest.approx(1 / 2001)
+    assert by_key[("a", "d", "kills")].ci_upper < 0
+    assert by_key[("a", "b", "survival_time")].p_value > 0.05
+
+
+def test_permutation_p_matches_naive_loop():
+    groups = make_groups(seed=3)
+    x, y = groups["a"][:, 0], groups["c"][:, 0]
+    batched = resampling_tests({"a": x, "c": y}, ["kills"], n_resamples=4000, seed=1)[0]
+    naive = naive_permutation_p(x, y, 4000, np.random.default_rng(2))
+    assert batched.p_value == pytest.approx(naive, abs=0.02)
+
+
+def test_chunking_bounds_memory_without_changing_estimates():
+    groups = make_groups(seed=5)
+    full = resampling_tests(groups, METRICS, n_resamples=3000)
+    chunked = resampling_tests(groups, METRICS, n_resamples=3000, max_elements=5000)
+    for f, c in zip(full, chunked):
+        assert c.mean_diff == f.mean_diff
+        assert c.p_value == pytest.approx(f.p_value, abs=0.03)
+        assert c.ci_lower == pytest.approx(f.ci_lower, abs=0.3)
+
+
+def test_results_feed_pairwise_and_holm():
+    groups = make_groups()
+    results = resampling_tests(groups, METRICS, pairs=[("a", "d"), ("a", "b")])
+    kills = [r for r in results if r.metric == "kills"]
+    assert holm_bonferroni([r.p_value for r in kills]) == [True, False]
+
+    pr = pairwise_comparison(
+        groups["a"][:, 0], groups["d"][:, 0], "a", "d", "kills", resampling=kills[0]
+    )
+    assert pr.p_value_permutation == kills[0].p_value
+    assert pr.boot_ci_lower < pr.boot_ci_upper < 0
+    assert "[STAT:p_perm=" in pr.format_stat_markers()
+
+
+def test_rejects_mismatched_columns():
+    with pytest.raises(ValueError):
+        resampling_tests(make_groups(), ["kills"])
@@ -0,0 +1,86 @@
+"""Resumption: CompletionIndex bookkeeping and executors skipping recorded episodes."""
+
+from __future__ import annotations
+
+import duckdb
+import pytest
+
+from glue import doe021_evolve
+from glue.duckdb_writer import CompletionIndex, DuckDBWriter
+
+
+def write_episodes(writer: DuckDBWriter, condition: str, numbers, seed_base=42):
+    for n in numbers:
+        writer.write_episode(
+            experiment_id="DOE-001",
+            run_id=f"DOE-001-{condition}",
+            condition=condition,
+            seed=seed_base + n,
+            episode_number=n,
+            metrics={"kills": n, "survival_time": 10.0 + n},
+        )
+
+
+def test_completion_index_counts():
+    index = CompletionIndex("DOE-001")
+    index.add("random", 1, 42)
+    index.add("random", 2, 43)
+    index.add("random", 2, 43)  # re-add is idempotent
+    index.add("rule_only", 1, 42)
+    assert len(index) == 3
+    assert index.count("random") == 2 and index.count("missing") == 0
+    assert index.contains("random", 2) and not index.contains("rule_only", 2)
+    assert index.count_seeds("random", [43, 999]) == 1
+
+
+def test_completion_index_tracks_writes(tmp_path):
+    """The index loads persisted episodes and follows new writes."""
+    writer = DuckDBWriter(tmp_path / "idx.duckdb")
+    write_episodes(writer, "random", range(4))
+
+    index = writer.completion_index("DOE-001")
+    assert index.count("random") == 4
+    assert index.contains("random", 3)
+    assert not index.contains("random", 4)
+
+    write_episodes(writer, "random", [4, 5])
+    assert index.contains("random", 5)
+    assert writer.get_episode_count("DOE-001", "random") == 6
+    assert index.count_seeds("random", [42, 999999]) == 1
+    assert writer.completion_index("DOE-001") is index
+    writer.close()
+
+    # Buffered writes are flushed before a later index is loaded
+    buffered = DuckDBWriter(tmp_path / "idx.duckdb", buffer_size=10)
+    write_episodes(buffered, "rule_only", [0, 1])
+    assert buffered.completion_index("DOE-001").count("rule_only") == 2
+    assert buffered.pending_count == 0
+    buffered.close()
+
+
+def kills_model(seed, condition, action_fn):
+    return seed % 11, 30.0 + seed % 7
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_generation_resumes_missing_episodes(tmp_path, fake_vizdoom, workers):
+    fake_vizdoom.use(kills_model)
+    genomes = dict(list(doe021_evolve.GEN1_GENOMES.items())[:3])
+    seeds = doe021_evolve.make_seed_set(2)[:4]
+    db_path = tmp_path / "gen.duckdb"
+    query = "SELECT * EXCLUDE (started_at) FROM experiments ORDER BY ALL"
+
+    doe021_evolve.execute_generation(2, genomes, seeds, db_path, workers=workers)
+    con = duckdb.connect(str(db_path))
+    full = con.execute(query).fetchall()
+    con.execute("DELETE FROM experiments WHERE episode_number > 2")
+    con.close()
+    assert len(full) == 12
+
+    fake_vizdoom.clear()
+    doe021_evolve.execute_generation(2, genomes, seeds, db_path, workers=workers)
+    played = sorted((condition, n) for condition, _, n in fake_vizdoom.played())
+    assert played == sorted((name, n) for name in genomes for n in (3, 4))
+    con = duckdb.connect(str(db_path))
+    assert con.execute(query).fetchall() == full
+    con.close()
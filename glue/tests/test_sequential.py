@@ -0,0 +1,119 @@
+"""Tests for group-sequential early stopping."""
+
+import random
+
+import duckdb
+import numpy as np
+import pytest
+
+from glue.analysis.sequential import (
+    SequentialMonitor,
+    SequentialPlan,
+    obrien_fleming_spending,
+    pocock_spending,
+)
+from glue.doe_executor import ExperimentConfig, RunConfig, execute_experiment
+
+
+class TestSpending:
+    @pytest.mark.parametrize("spend", [obrien_fleming_spending, pocock_spending])
+    def test_spends_exactly_alpha_monotonically(self, spend):
+        values = [spend(t / 10, 0.05) for t in range(11)]
+        assert values[0] == 0.0
+        assert values[-1] == pytest.approx(0.05)
+        assert all(a <= b for a, b in zip(values, values[1:]))
+
+    def test_obrien_fleming_is_strict_early(self):
+        plan = SequentialPlan(looks=5)
+        assert plan.look_alpha(1) < 1e-4
+        assert sum(plan.look_alpha(k) for k in range(1, 6)) == pytest.approx(0.05)
+        assert SequentialPlan(looks=5, spending="pocock").look_alpha(1) > plan.look_alpha(1)
+
+    def test_invalid_plans_rejected(self):
+        with pytest.raises(ValueError):
+            SequentialPlan(metric="decision_level_counts")
+        with pytest.raises(ValueError):
+            SequentialPlan(spending="haybittle")
+        with pytest.raises(ValueError):
+            SequentialMonitor(SequentialPlan(reference="x"), ["a", "b"])
+
+
+class TestMonitor:
+    def test_decisive_condition_stops_null_pair_continues(self):
+        rng = np.random.default_rng(0)
+        data = {"a": rng.normal(10, 2, 30), "b": rng.normal(10, 2, 30), "c": rng.normal(20, 2, 30)}
+        plan = SequentialPlan(looks=3)
+        monitor = SequentialMonitor(plan, ["a", "b", "c"])
+        first = monitor.look(1, {k: v[:10] for k, v in data.items()})
+        assert first.stopped == ["c"]
+        assert monitor.active == ["a", "b"]
+        second = monitor.look(2, {k: v[:20] for k, v in data.items()})
+        assert [(c.condition_a, c.condition_b) for c in second.comparisons] == [("a", "b")]
+        assert second.stopped == []
+
+    def test_reference_stops_when_all_comparisons_resolved(self):
+        plan = SequentialPlan(looks=2, reference="ctl")
+        monitor = SequentialMonitor(plan, ["ctl", "x", "y"])
+        values = {"ctl": [1.0, 1.1, 0.9, 1.0] * 3, "x": [5.0, 5.1, 4.9, 5.0] * 3,
+                  "y": [9.0, 9.1, 8.9, 9.0] * 3}
+        result = monitor.look(1, values)
+        assert sorted(result.stopped) == ["ctl", "x", "y"]
+
+    def test_too_few_episodes_are_not_tested(self):
+        monitor = SequentialMonitor(SequentialPlan(min_n=5), ["a", "b"])
+        result = monitor.look(1, {"a": [0.0, 0.1, 0.2], "b": [9.0, 9.1, 9.2]})
+        assert result.comparisons[0].p_value == 1.0
+        assert monitor.active == ["a", "b"]
+
+    def test_type_one_error_under_null(self):
+        rng = np.random.default_rng(1)
+        rejections = 0
+        for _ in range(200):
+            monitor = SequentialMonitor(SequentialPlan(looks=5, spending="pocock"), ["a", "b"])
+            data = rng.normal(0, 1, (2, 25))
+            for look in range(1, 6):
+                monitor.look(look, {"a": data[0, :5 * look], "b": data[1, :5 * look]})
+            rejections += bool(monitor.stopped)
+        assert rejections / 200 <= 0.05 + 0.03
+
+
+MEANS = {"low": 10.0, "same": 10.0, "high": 30.0}
+
+
+def kills_model(seed, condition, action_fn):
+    """Kill counts drawn around a per-condition mean (survival 60 s)."""
+    return max(0, round(random.Random(seed).gauss(MEANS[condition], 2))), 60.0
+
+
+def test_executor_stops_resolved_conditions(tmp_path, fake_vizdoom):
+    fake_vizdoom.use(kills_model)
+    seeds = list(range(100, 124))
+    runs = [
+        RunConfig(f"S-R{i}", f"R{i}", 0.5, 0.5, seeds, cond, "factorial", action_type="ar_50")
+        for i, cond in enumerate(MEANS, start=1)
+    ]
+    config = ExperimentConfig("SEQ", runs, seeds, "test", db_path=tmp_path / "s.duckdb")
+
+    execute_experiment(config, sequential=SequentialPlan(looks=4))
+
+    ran = {c: sum(1 for cond, _, _ in fake_vizdoom.played() if cond == c) for c in MEANS}
+    assert ran["high"] < 24
+    assert ran["low"] == ran["same"] == 24
+
+    con = duckdb.connect(str(tmp_path / "s.duckdb"))
+    stops = dict(con.execute(
+        "SELECT condition, status FROM sequential_stops WHERE experiment_id = 'SEQ'"
+    ).fetchall())
+    assert stops == {"high": "stopped", "low": "completed", "same": "completed"}
+    (episodes_run, rule), = con.execute(
+        "SELECT episodes_run, stopping_rule FROM sequential_stops WHERE condition = 'high'"
+    ).fetchall()
+    assert episodes_run == ran["high"]
+    assert rule.startswith("group-sequential obrien_fleming")
+    assert con.execute("SELECT MAX(look) FROM sequential_looks").fetchone()[0] == 4
+    con.close()
+
+    # Resuming replays the same decisions without running new episodes
+    fake_vizdoom.clear()
+    execute_experiment(config, sequential=SequentialPlan(looks=4))
+    assert fake_vizdoom.played() == []
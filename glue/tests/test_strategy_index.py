@@ -0,0 +1,345 @@
+"""Tests for the in-process strategy document index."""
+
+import json
+import math
+import threading
+
+import duckdb
+import pytest
+
+from glue.action_functions import (
+    L2MetaStrategy5Action,
+    L2MetaStrategyAction,
+    L2RagAction,
+)
+from glue.strategy_index import (
+    BM25_B,
+    BM25_K1,
+    LocalStrategyIndex,
+    QueryCache,
+    invalidate_query_caches,
+    query_key,
+)
+from glue.vizdoom_bridge import ACTION_ATTACK, ACTION_MOVE_LEFT, GameState
+
+
+def make_doc(doc_id, tags, trust=0.8, retired=False, tactic="attack", strategy=None):
+    decision = {"tactic": tactic}
+    if strategy is not None:
+        decision["strategy"] = strategy
+    return {
+        "doc_id": doc_id,
+        "situation_tags": tags,
+        "decision": decision,
+        "quality": {"trust_score": trust},
+        "metadata": {"retired": retired},
+    }
+
+
+DOCS = [
+    make_doc("a", ["low_health", "multi_enemy"]),
+    make_doc("b", ["low_health"]),
+    make_doc("c", ["full_health", "single_enemy"]),
+    make_doc("d", ["low_health", "multi_enemy"], retired=True),
+    make_doc("e", ["low_health", "multi_enemy"], trust=0.2),
+    make_doc("f", ["multi_enemy"]),
+]
+
+
+def doc_ids(hits):
+    return [hit["_source"]["doc_id"] for hit in hits]
+
+
+class TestLocalStrategyIndex:
+    def test_should_and_filter_semantics(self):
+        index = LocalStrategyIndex(DOCS)
+        hits = index.search(["low_health", "multi_enemy"], k=5)
+        # retired and low-trust docs filtered; best match first, ties by order
+        assert doc_ids(hits) == ["a", "b", "f"]
+        assert hits[0]["_score"] > hits[1]["_score"] > 0
+        assert index.search(["trapped"], k=5) == []
+
+    def test_bm25_keyword_scoring(self):
+        index = LocalStrategyIndex(DOCS)
+        n_docs, avgdl = 6, 10 / 6  # stats include filtered docs
+        tf_norm = 1 / (1 + BM25_K1 * (1 - BM25_B + BM25_B / avgdl))
+
+        def idf(df):
+            return math.log(1 + (n_docs - df + 0.5) / (df + 0.5))
+
+        hits = index.search(["low_health", "multi_enemy"], k=1)
+        assert hits[0]["_score"] == pytest.approx((idf(4) + idf(4)) * tf_norm)
+        # the rarer tag scores higher
+        (hit,) = index.search(["single_enemy"], k=1)
+        assert hit["_score"] == pytest.approx(idf(1) * tf_norm)
+
+    def test_k_limits_hits(self):
+        index = LocalStrategyIndex(DOCS)
+        assert doc_ids(index.search(["low_health", "multi_enemy"], k=2)) == ["a", "b"]
+
+    def test_from_json_and_ndjson(self, tmp_path):
+        array_path = tmp_path / "strategies.json"
+        array_path.write_text(json.dumps([{"_id": d["doc_id"], **d} for d in DOCS]))
+        ndjson_path = tmp_path / "strategies.ndjson"
+        lines = []
+        for d in DOCS:
+            lines.append(json.dumps({"index": {"_index": "s", "_id": d["doc_id"]}}))
+            lines.append(json.dumps(d))
+        ndjson_path.write_text("\n".join(lines) + "\n")
+
+        expected = LocalStrategyIndex(DOCS).search(["low_health"], k=5)
+        assert LocalStrategyIndex.from_json(array_path).search(["low_health"], k=5) == expected
+        assert LocalStrategyIndex.from_json(ndjson_path).search(["low_health"], k=5) == expected
+
+    def test_from_duckdb(self):
+        conn = duckdb.connect(":memory:")
+        conn.execute(
+            "CREATE TABLE strategy_docs (doc_id TEXT, agent_id TEXT, generation INTEGER, "
+            "situation_tags TEXT, tactic TEXT, weapon TEXT, success_rate DOUBLE, "
+            "sample_size INTEGER, confidence_tier TEXT)"
+        )
+        conn.execute(
+            "INSERT INTO strategy_docs VALUES "
+            "('s1', 'A', 0, '[\"low_health\"]', 'retreat', 'pistol', 0.9, 100, 'high'), "
+            "('s2', 'A', 0, '[\"low_health\"]', 'attack', 'pistol', 0.3, 10, 'low')"
+        )
+        index = LocalStrategyIndex.from_duckdb(conn)
+        hits = index.search(["low_health"], k=5)
+        # s2's Wilson lower bound falls below the trust filter
+        assert doc_ids(hits) == ["s1"]
+        assert hits[0]["_source"]["decision"] == {"tactic": "retreat", "weapon": "pistol"}
+
+
+class TestLocalRetrieverInPolicies:
+    def test_l2_rag_uses_local_index(self):
+        index = LocalStrategyIndex([make_doc("r", ["full_health"], tactic="retreat")])
+        action = L2RagAction(retriever=index)
+        state = GameState(health=100, ammo=30)
+        assert action(state) == ACTION_MOVE_LEFT
+        assert action.l2_decisions == 1
+        assert len(action.l2_latencies) == 1
+
+        action(GameState(health=50, ammo=30, enemies_visible=2))  # no tags
+        assert action.l2_decisions == 1
+
+    def test_meta_strategy_switches_from_local_index(self):
+        index = LocalStrategyIndex(
+            [make_doc("m", ["full_health"], strategy="adaptive_kill")]
+        )
+        action = L2MetaStrategyAction(retriever=index)
+        action.reset(seed=0)
+        for tick in range(L2MetaStrategyAction.QUERY_INTERVAL):
+            action(GameState(health=100, ammo=30, kills=7, tick=tick))
+        assert action.current_strategy == "adaptive_kill"
+        assert action.l2_query_count == 1
+
+    def test_empty_index_falls_back(self):
+        action = L2RagAction(retriever=LocalStrategyIndex([]))
+        action.reset(seed=0)
+        assert action(GameState(health=100, ammo=30)) == ACTION_ATTACK
+        assert action.l2_decisions == 0
+
+
+class CountingRetriever:
+    def __init__(self, index):
+        self.index = index
+        self.calls = 0
+
+    def search(self, tags, k):
+        self.calls += 1
+        return self.index.search(tags, k)
+
+
+class TestQueryCache:
+    def test_lru_and_ttl_eviction(self):
+        now = [0.0]
+        cache = QueryCache(maxsize=2, ttl=10.0, clock=lambda: now[0])
+        cache.put("a", [1])
+        cache.put("b", [2])
+        assert cache.get("a") == [1]
+        cache.put("c", [3])  # evicts least recently used "b"
+        assert cache.get("b") is None
+        now[0] = 10.0
+        assert cache.get("a") is None  # expired
+        assert (cache.hits, cache.misses) == (1, 2)
+
+    def test_key_ignores_tag_order(self):
+        assert query_key("i", ["b", "a"], 5) == query_key("i", ["a", "b", "a"], 5)
+        assert query_key("i", ["a"], 5) != query_key("j", ["a"], 5)
+
+    def test_policy_queries_once_per_situation(self):
+        retriever = CountingRetriever(LocalStrategyIndex(DOCS))
+        action = L2RagAction(retriever=retriever)
+        action.reset(seed=0)
+        for tick in range(100):
+            action(GameState(health=100 if tick % 2 else 25, ammo=30, tick=tick))
+        assert retriever.calls == 2
+        assert action.l2_cache_misses == 2
+        assert action.l2_cache_hits == 98
+        assert len(action.l2_latencies) == 100
+
+        # cache survives reset; counters are per episode
+        action.reset(seed=1)
+        action(GameState(health=100, ammo=30))
+        assert retriever.calls == 2
+        assert (action.l2_cache_hits, action.l2_cache_misses) == (1, 0)
+
+    @pytest.mark.parametrize(
+        "cls", [L2RagAction, L2MetaStrategyAction, L2MetaStrategy5Action]
+    )
+    def test_l2_policies_share_cached_retrieval(self, cls):
+        retriever = CountingRetriever(LocalStrategyIndex(DOCS))
+        cache = QueryCache()
+        first = cls(retriever=retriever, query_cache=cache)
+        second = cls(retriever=retriever, query_cache=cache)
+        docs = first.query_opensearch(["full_health", "single_enemy"])
+        assert [d["doc_id"] for d in docs] == ["c"]
+        assert second.query_opensearch(["single_enemy", "full_health"]) == docs
+        assert retriever.calls == 1
+        assert (first.l2_cache_misses, second.l2_cache_hits) == (1, 1)
+        first.reset(seed=1)
+        assert (first.l2_cache_misses, first.l2_latencies) == (0, [])
+
+    def test_invalidation_hook(self):
+        retriever = CountingRetriever(LocalStrategyIndex(DOCS))
+        action = L2RagAction(retriever=retriever, index_name="strategies_test")
+        state = GameState(health=100, ammo=30)
+        action(state)
+        assert invalidate_query_caches("other_index") == 0
+        action(state)
+        assert retriever.calls == 1
+        assert invalidate_query_caches("strategies_test") == 1
+        action(state)
+        assert retriever.calls == 2
+
+    def test_failed_queries_not_cached(self):
+        class Failing:
+            calls = 0
+
+            def search(self, tags, k):
+                self.calls += 1
+                raise TimeoutError
+
+        retriever = Failing()
+        action = L2RagAction(retriever=retriever)
+        action.reset(seed=0)
+        state = GameState(health=100, ammo=30)
+        action(state)
+        action(state)
+        assert retriever.calls == 2
+        assert action.l2_decisions == 0
+
+
+class GatedRetriever(CountingRetriever):
+    """Blocks each search until the test releases it."""
+
+    def __init__(self, index):
+        super().__init__(index)
+        self.release = threading.Event()
+        self.started = threading.Event()
+
+    def search(self, tags, k):
+        self.started.set()
+        self.release.wait(timeout=5)
+        return super().search(tags, k)
+
+
+def prefetch_threads():
+    return [t for t in threading.enumerate() if t.name.startswith("l2-prefetch")]
+
+
+class TestPrefetch:
+    def make_action(self, retriever):
+        index_docs = [
+            make_doc("m", ["full_health"], strategy="adaptive_kill"),
+            make_doc("n", ["low_health"], strategy="burst_3"),
+        ]
+        retriever.index = LocalStrategyIndex(index_docs)
+        action = L2MetaStrategyAction(retriever=retriever, prefetch=True)
+        action.reset(seed=0)
+        return action
+
+    def test_acts_on_current_strategy_until_result_arrives(self):
+        retriever = GatedRetriever(None)
+        action = self.make_action(retriever)
+        state = GameState(health=100, ammo=30, kills=7)
+        action(state)  # tick 1: tags observed, query issued
+        assert retriever.started.wait(timeout=5)
+        for _ in range(4):
+            action(state)  # ticks 2-5: still on the default strategy
+        assert action.current_strategy == "burst_3"
+        assert action.l2_query_count == 0
+
+        retriever.release.set()
+        action._pending.result(timeout=5)
+        action(state)  # tick 6: result applied
+        assert action.current_strategy == "adaptive_kill"
+        assert action.l2_query_count == 1
+        assert action.l2_result_delays == [5]
+        assert action.l2_decision_staleness == [1, 2, 3, 4, 5, 5]
+        action.close()
+
+    def test_requeries_only_on_tag_change(self):
+        retriever = CountingRetriever(None)
+        action = self.make_action(retriever)
+        states = [GameState(health=100, ammo=30, kills=7)] * 40
+        states += [GameState(health=20, ammo=30, kills=7)] * 40
+        for state in states:
+            action(state)
+            if action._pending is not None:
+                action._pending.result(timeout=5)
+        assert retriever.calls == 2
+        assert action.l2_query_count == 2
+        assert action.current_strategy == "burst_3"
+        assert action.l2_strategy_switches == 2
+        assert len(action.l2_decision_staleness) == 80
+        action.close()
+
+    def test_reset_waits_for_in_flight_query(self):
+        retriever = GatedRetriever(None)
+        action = self.make_action(retriever)
+        action(GameState(health=100, ammo=30, kills=7))
+        retriever.release.set()
+        action.reset(seed=1)
+        assert action._pending is None
+        assert action.l2_decision_staleness == []
+        action.close()
+
+    def test_close_stops_thread_and_restarts_on_demand(self):
+        action = self.make_action(CountingRetriever(None))
+        action(GameState(health=100, ammo=30, kills=7))
+        assert prefetch_threads()
+        action.close()
+        assert prefetch_threads() == []
+        action(GameState(health=20, ammo=30, kills=7))  # still usable
+        action._pending.result(timeout=5)
+        action.close()
+        assert prefetch_threads() == []
+
+    def test_executor_closes_policy_after_runs(self, tmp_path, monkeypatch, fake_vizdoom):
+        from glue.doe_executor import ExperimentConfig, RunConfig, execute_experiment
+
+        retriever = CountingRetriever(None)
+        action = self.make_action(retriever)
+        monkeypatch.setattr("glue.doe_executor.policy_for_run", lambda run, docs: action)
+        seeds = [1, 2, 3]
+        runs = [
+            RunConfig(f"P-R{i}", f"R{i}", 0.5, 0.5, seeds, f"c{i}", "factorial")
+            for i in (1, 2)
+        ]
+        config = ExperimentConfig("PRE", runs, seeds, "test", db_path=tmp_path / "p.duckdb")
+        execute_experiment(config)
+        assert retriever.calls > 0
+        assert action._executor is None
+        assert prefetch_threads() == []
+
+    def test_five_action_selector_supports_prefetch(self):
+        index = LocalStrategyIndex([make_doc("s", ["full_health"], strategy="random_5")])
+        action = L2MetaStrategy5Action(retriever=index, prefetch=True)
+        action.reset(seed=0)
+        state = GameState(health=100, ammo=30)
+        action(state)
+        action._pending.result(timeout=5)
+        action(state)
+        assert action.current_strategy == "random_5"
+        action.close()
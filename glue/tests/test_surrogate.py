@@ -0,0 +1,169 @@
+"""Tests for surrogate pre-screening of offspring genomes."""
+
+import random
+
+import duckdb
+import numpy as np
+
+from glue import doe021_evolve
+from glue.doe_executor import build_doe044_config, execute_doe044
+from glue.duckdb_writer import DuckDBWriter
+from glue.surrogate import (
+    GaussianProcess,
+    GenomeSurrogate,
+    accuracy_report,
+    encode_genome,
+)
+
+SPEC = doe021_evolve.GENE_SPEC
+
+
+def test_encode_genome_scales_and_one_hot():
+    genome = doe021_evolve.GEN1_GENOMES["G04_adaptive_tuned"]
+    features = encode_genome(genome, SPEC)
+    # 6 numeric genes, 4 enum values, 1 bool
+    assert len(features) == 11
+    assert all(0.0 <= f <= 1.0 for f in features)
+    assert features[0] == (3 - 1) / 6  # burst_length
+    assert features[1:5] == [0.0, 1.0, 0.0, 0.0]  # turn_direction="alternate"
+
+
+def test_gaussian_process_interpolates_and_reports_uncertainty():
+    rng = np.random.default_rng(0)
+    X = rng.uniform(0, 1, size=(40, 2))
+    y = np.sin(3 * X[:, 0]) + X[:, 1] ** 2
+    gp = GaussianProcess().fit(X, y)
+
+    Xs = rng.uniform(0.1, 0.9, size=(20, 2))
+    mean, std = gp.predict(Xs)
+    assert np.abs(mean - (np.sin(3 * Xs[:, 0]) + Xs[:, 1] ** 2)).max() < 0.15
+    _, far_std = gp.predict(np.array([[4.0, 4.0]]))
+    assert far_std[0] > 5 * std.max()
+
+
+def synthetic_outcome(genome):
+    """Kills grow with burst length and attack probability."""
+    kills = 2.0 * genome["burst_length"] + 20.0 * genome["attack_probability"]
+    return {
+        "genome": genome,
+        "mean_kills": kills,
+        "mean_kill_rate": kills / 1.5,
+        "mean_survival_time": 60.0,
+    }
+
+
+def test_screen_picks_best_candidate_per_slot():
+    rng = random.Random(3)
+    history = [synthetic_outcome(doe021_evolve.generate_random_genome(rng)) for _ in range(40)]
+    surrogate = GenomeSurrogate(SPEC, kappa=0.0)
+    assert surrogate.fit(history)
+
+    candidates = {
+        f"slot{i}": [doe021_evolve.generate_random_genome(rng) for _ in range(5)]
+        for i in range(4)
+    }
+    predictions = surrogate.screen(candidates)
+
+    assert list(predictions) == list(candidates)
+    for name, prediction in predictions.items():
+        true_kills = [synthetic_outcome(g)["mean_kills"] for g in candidates[name]]
+        assert synthetic_outcome(prediction.genome)["mean_kills"] == max(true_kills)
+        assert prediction.candidates == 5
+    scores = {name: p.predicted_score for name, p in predictions.items()}
+    assert max(scores.values()) == 1.0 and min(scores.values()) == 0.0
+
+
+def test_fit_needs_minimum_history():
+    history = [synthetic_outcome(g) for g in doe021_evolve.GEN1_GENOMES.values()]
+    assert not GenomeSurrogate(SPEC, min_rows=11).fit(history)
+    assert GenomeSurrogate(SPEC).fit(history)
+
+
+def test_accuracy_report():
+    predicted = {
+        c: {"mean_kills": k, "mean_kill_rate": k, "mean_survival_time": 60.0, "score": k}
+        for c, k in (("a", 1.0), ("b", 2.0), ("c", 3.0))
+    }
+    realized = {
+        c: {**p, "mean_kills": p["mean_kills"] + 1.0} for c, p in predicted.items()
+    }
+    report = accuracy_report(predicted, realized)
+    assert report["mae_mean_kills"] == 1.0
+    assert report["mae_mean_survival_time"] == 0.0
+    assert report["spearman_score"] == 1.0
+
+
+def test_offspring_candidates_first_candidate_is_unscreened_generation():
+    parents = [
+        doe021_evolve.GenomeFitness(name, genome, 0.0, 0.0, 0.0, 0.0)
+        for name, genome in list(doe021_evolve.GEN1_GENOMES.items())[:4]
+    ]
+    candidates = doe021_evolve.offspring_candidates(parents, random.Random(5), 2, per_slot=3)
+    assert len(candidates) == 10
+    assert len(candidates["gen2_G01_elite"]) == 1
+    assert all(len(c) == 3 for name, c in candidates.items() if name != "gen2_G01_elite")
+
+    single = doe021_evolve.offspring_candidates(parents, random.Random(5), 2)
+    assert doe021_evolve.create_next_generation(parents, random.Random(5), 2) == {
+        name: genomes[0] for name, genomes in single.items()
+    }
+
+
+def test_doe044_surrogate_records_predictions_and_realized(tmp_path, fake_vizdoom):
+    config = build_doe044_config(db_path=tmp_path / "evo.duckdb")
+
+    execute_doe044(config, surrogate_oversample=3)
+
+    con = duckdb.connect(str(config.db_path))
+    genomes = con.execute(
+        "SELECT experiment_id, COUNT(*) FROM genomes WHERE action_type = 'genome5' "
+        "GROUP BY ALL ORDER BY ALL"
+    ).fetchall()
+    assert genomes[0] == ("DOE-044", 10)
+    predictions = con.execute(
+        "SELECT experiment_id, COUNT(*), COUNT(realized_score), MAX(candidates) "
+        "FROM surrogate_predictions GROUP BY ALL ORDER BY ALL"
+    ).fetchall()
+    con.close()
+    assert predictions
+    assert [row[0] for row in predictions] == [row[0] for row in genomes[1:]]
+    assert all(row[1:] == (10, 10, 3) for row in predictions)
+
+
+def dump_tables(db_path) -> dict[str, list]:
+    con = duckdb.connect(str(db_path), read_only=True)
+    tables = [row[0] for row in con.execute("SHOW TABLES").fetchall()]
+    dump = {
+        t: con.execute(f"SELECT * FROM {t} ORDER BY ALL").fetchall() for t in tables
+    }
+    con.close()
+    return dump
+
+
+def test_evolution_dry_run_leaves_database_unchanged(tmp_path, fake_vizdoom):
+    db_path = tmp_path / "evo.duckdb"
+    db = DuckDBWriter(db_path)
+    for i, name in enumerate(doe021_evolve.GEN1_GENOMES):
+        for ep in range(1, 4):
+            db.write_episode(
+                experiment_id="DOE-021", run_id=f"DOE-021-{name}", condition=name,
+                seed=ep, episode_number=ep,
+                metrics={"kills": i + ep, "survival_time": 30.0 + 2 * i},
+            )
+    db.close()
+
+    doe021_evolve.run_evolution(max_gen=2, db_path=db_path, surrogate_oversample=3)
+    # As if that run stopped before gen 2's realized fitness was recorded
+    con = duckdb.connect(str(db_path))
+    con.execute(
+        "UPDATE surrogate_predictions SET realized_kills = NULL, "
+        "realized_kill_rate = NULL, realized_survival_time = NULL, realized_score = NULL"
+    )
+    con.close()
+    before = dump_tables(db_path)
+    assert before["surrogate_predictions"]
+
+    doe021_evolve.run_evolution(
+        max_gen=3, db_path=db_path, dry_run=True, surrogate_oversample=3
+    )
+    assert dump_tables(db_path) == before
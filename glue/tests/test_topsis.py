@@ -0,0 +1,73 @@
+"""Tests for the vectorized TOPSIS engine."""
+
+import math
+
+import numpy as np
+import pytest
+
+from glue.analysis.topsis import (
+    closeness,
+    random_weights,
+    weight_sensitivity,
+)
+
+
+def reference_topsis(matrix, weights, benefit):
+    """Textbook TOPSIS, one alternative at a time."""
+    n, k = len(matrix), len(weights)
+    norms = [math.sqrt(sum(row[j] ** 2 for row in matrix)) or 1.0 for j in range(k)]
+    v = [[row[j] / norms[j] * weights[j] for j in range(k)] for row in matrix]
+    cols = [[v[i][j] for i in range(n)] for j in range(k)]
+    best = [max(c) if benefit[j] else min(c) for j, c in enumerate(cols)]
+    worst = [min(c) if benefit[j] else max(c) for j, c in enumerate(cols)]
+    out = []
+    for row in v:
+        d_best = math.sqrt(sum((x - b) ** 2 for x, b in zip(row, best)))
+        d_worst = math.sqrt(sum((x - w) ** 2 for x, w in zip(row, worst)))
+        out.append(d_worst / (d_best + d_worst) if d_best + d_worst > 0 else 0.0)
+    return out
+
+
+MATRIX = np.random.default_rng(4).uniform(1, 50, size=(25, 4))
+
+
+@pytest.mark.parametrize("benefit", [None, [True, False, True, False]])
+def test_matches_reference(benefit):
+    weights = [0.4, 0.3, 0.2, 0.1]
+    flags = benefit or [True] * 4
+    expected = reference_topsis(MATRIX.tolist(), weights, flags)
+    np.testing.assert_allclose(closeness(MATRIX, weights, benefit), expected, atol=1e-12)
+
+
+def test_cost_criterion_prefers_lower_values():
+    matrix = [[10.0, 5.0], [10.0, 1.0], [10.0, 3.0]]
+    scores = closeness(matrix, [0.5, 0.5], benefit=[True, False])
+    assert scores.tolist() == [0.0, 1.0, 0.5]
+
+
+def test_degenerate_inputs():
+    assert closeness([[1.0, 0.0], [1.0, 0.0]], [0.5, 0.5]).tolist() == [0.0, 0.0]
+    assert closeness(np.empty((0, 3)), [1, 1, 1]).shape == (0,)
+    with pytest.raises(ValueError):
+        closeness(MATRIX, [0.5, -0.1, 0.3, 0.3])
+    with pytest.raises(ValueError):
+        closeness(MATRIX, [0.5, 0.5])
+
+
+def test_weight_sweep_matches_single_vectors():
+    weights = random_weights(50, 4, seed=1)
+    np.testing.assert_allclose(weights.sum(axis=1), 1.0)
+    sweep = closeness(MATRIX, weights)
+    assert sweep.shape == (50, 25)
+    for w, row in zip(weights[:5], sweep[:5]):
+        np.testing.assert_allclose(row, closeness(MATRIX, w), atol=1e-12)
+
+
+def test_weight_sensitivity_dominant_alternative():
+    matrix = np.vstack([MATRIX[:, :3], [[100.0, 100.0, 100.0]]])
+    result = weight_sensitivity(matrix, samples=2000)
+    assert result.first_share[-1] == 1.0
+    assert result.first_share.sum() == pytest.approx(1.0)
+    assert result.mean_rank[-1] == 1.0
+    assert result.rank_range[-1].tolist() == [1, 1]
+    assert result.mean_rank.mean() == pytest.approx((len(matrix) + 1) / 2)
@@ -0,0 +1,93 @@
+"""Tests for encounter traces: recording and persistence to DuckDB."""
+
+from __future__ import annotations
+
+import pytest
+
+from glue.duckdb_writer import DuckDBWriter
+from glue.trace_recorder import ENCOUNTER_COLUMNS, TraceRecorder
+from glue.vizdoom_bridge import GameState
+
+
+def mock_trace(episode_number: int, n_ticks: int, condition: str = "random"):
+    recorder = TraceRecorder("DOE-TRACE", capacity=8)  # forces growth
+    recorder.begin(condition, episode_number, ["TURN_LEFT", "TURN_RIGHT", "ATTACK"])
+    for tick in range(n_ticks):
+        state = GameState(health=100 - tick, ammo=50, tick=tick)
+        action = [1, 0, 1] if tick % 5 == 4 else tick % 3
+        recorder.record(state, action, decision_level=0, latency_ms=0.01)
+    return recorder.end()
+
+
+def write_episode(writer: DuckDBWriter, episode_number: int, condition: str = "random"):
+    writer.write_episode(
+        experiment_id="DOE-TRACE",
+        run_id="DOE-TRACE-R1",
+        condition=condition,
+        seed=42 + episode_number,
+        episode_number=episode_number,
+        metrics={"kills": 1, "survival_time": 1.0},
+    )
+
+
+def count_encounters(writer: DuckDBWriter) -> int:
+    return writer._con.execute("SELECT COUNT(*) FROM encounters").fetchone()[0]
+
+
+def test_rows_match_arrow():
+    pytest.importorskip("pyarrow")
+    trace = mock_trace(episode_number=3, n_ticks=20)
+    assert len(trace) == 20
+    table = trace.to_arrow().select(list(ENCOUNTER_COLUMNS))
+    arrow_rows = [
+        tuple(row[c] for c in ENCOUNTER_COLUMNS) for row in table.to_pylist()
+    ]
+    assert arrow_rows == trace.rows()
+    assert trace.rows()[4][10] == "TURN_LEFT+ATTACK"
+
+
+def test_trace_written_to_encounters(tmp_path):
+    """Episode traces land in encounters; rewriting an episode replaces it."""
+    writer = DuckDBWriter(tmp_path / "trace.duckdb")
+    trace = mock_trace(episode_number=1, n_ticks=20)
+    assert writer.write_trace(trace) == 20
+    assert writer.write_trace(trace) == 20  # idempotent re-run
+
+    rows = writer._con.execute(
+        "SELECT tick, health, action_taken FROM encounters "
+        "WHERE experiment_id = 'DOE-TRACE' ORDER BY tick"
+    ).fetchall()
+    assert len(rows) == 20
+    assert rows[0] == (0, 100, "TURN_LEFT")
+    assert rows[2] == (2, 98, "ATTACK")
+    assert rows[4] == (4, 96, "TURN_LEFT+ATTACK")
+    writer.close()
+
+
+def test_buffered_trace_commits_with_episode(tmp_path):
+    """In buffered mode traces are persisted together with their episode."""
+    writer = DuckDBWriter(tmp_path / "trace.duckdb", buffer_size=10)
+    writer.write_trace(mock_trace(episode_number=1, n_ticks=30))
+    write_episode(writer, 1)
+    assert count_encounters(writer) == 0
+    writer.flush()
+    assert count_encounters(writer) == 30
+    writer.close()
+
+
+def test_rejected_episode_drops_its_trace(tmp_path):
+    """When a batch fails, each trace still commits iff its episode does."""
+    writer = DuckDBWriter(tmp_path / "trace.duckdb", buffer_size=10)
+    write_episode(writer, 1)
+    writer.flush()
+
+    writer.write_trace(mock_trace(episode_number=1, n_ticks=5))  # duplicate episode
+    write_episode(writer, 1)
+    writer.write_trace(mock_trace(episode_number=2, n_ticks=7))
+    write_episode(writer, 2)
+    assert writer.flush() == 1
+    assert [key for key, _ in writer.rejected] == [("DOE-TRACE", "random", 1)]
+    assert writer._con.execute(
+        "SELECT episode_number, COUNT(*) FROM encounters GROUP BY ALL"
+    ).fetchall() == [(2, 7)]
+    writer.close()
@@ -0,0 +1,148 @@
+"""VecVizDoomBridge matches serial EpisodeRunner execution on a simulated game."""
+
+from __future__ import annotations
+
+import random
+
+import duckdb
+import pytest
+
+from glue import doe021_evolve
+from glue.action_functions import GenomeAction
+from glue.episode_runner import EpisodeRunner
+from glue.vec_vizdoom_bridge import VecVizDoomBridge
+from glue.vizdoom_bridge import ACTION_ATTACK, EpisodeMetrics, GameState
+
+
+class SimBridge:
+    """Deterministic stand-in for VizDoomBridge: the game depends on the seed
+    and on the actions taken, and ends on timeout or death."""
+
+    def __init__(self, scenario="defend_the_center.cfg", episode_timeout=2100,
+                 num_actions=3, doom_skill=3, screen_buffer=False):
+        self.closed = False
+
+    def start_episode(self, seed):
+        self._rng = random.Random(seed)
+        self._timeout = 40 + seed % 50
+        self._state = GameState(health=100, ammo=30)
+        self._shots = 0
+
+    def get_game_state(self):
+        return GameState(**vars(self._state))
+
+    def get_button_names(self):
+        return ["MOVE_LEFT", "MOVE_RIGHT", "ATTACK"]
+
+    def make_action(self, action_index, tics=1):
+        state = self._state
+        for _ in range(tics):
+            state.tick += 1
+            if action_index == ACTION_ATTACK and state.ammo > 0:
+                state.ammo -= 1
+                self._shots += 1
+                state.kills += self._rng.random() < 0.3
+            state.health -= self._rng.randrange(4)
+            state.is_dead = state.health <= 0
+        return float(state.kills)
+
+    def is_episode_finished(self):
+        return self._state.tick >= self._timeout
+
+    def get_episode_metrics(self):
+        state = self._state
+        return EpisodeMetrics(
+            kills=state.kills, survival_time=state.tick / 35.0,
+            total_ticks=state.tick, shots_fired=self._shots,
+        )
+
+    def close(self):
+        self.closed = True
+
+
+class LevelPolicy:
+    """Seeded policy exposing a per-decision level, like the gRPC clients."""
+
+    def __init__(self):
+        self._rng = random.Random(0)
+        self.last_decision_level = -1
+
+    def reset(self, seed):
+        self._rng.seed(seed)
+
+    def __call__(self, state):
+        self.last_decision_level = int(state.health < 50)
+        return self._rng.randrange(3)
+
+
+@pytest.fixture
+def sim_vizdoom(monkeypatch):
+    monkeypatch.setattr("glue.vec_vizdoom_bridge.VizDoomBridge", SimBridge)
+    monkeypatch.setattr("glue.vizdoom_bridge.VizDoomBridge", SimBridge)
+
+
+def serial(action_fn, seeds, condition):
+    runner = EpisodeRunner(SimBridge())
+    results = []
+    for i, seed in enumerate(seeds):
+        action_fn.reset(seed=seed)
+        results.append(runner.run_episode(seed, condition, i + 1, action_fn))
+    return results
+
+
+def summary(result):
+    return (
+        result.seed, result.episode_number, result.metrics,
+        result.decision_levels, len(result.decision_latencies),
+    )
+
+
+def test_run_policies_matches_serial(sim_vizdoom):
+    params = list(doe021_evolve.GEN1_GENOMES.values())
+    make = [lambda: GenomeAction(**params[0]), lambda: GenomeAction(**params[1]),
+            LevelPolicy]
+    seeds = [[11, 12, 13], [21, 22], [31, 32, 33, 34]]
+
+    vec = VecVizDoomBridge(4)  # one env stays idle
+    finished = vec.run_policies([f() for f in make], seeds)
+    vec.close()
+
+    for i, (factory, env_seeds) in enumerate(zip(make, seeds)):
+        expected = serial(factory(), env_seeds, f"p{i}")
+        got = [
+            ep.to_result(f"p{i}", env_seeds.index(ep.seed) + 1) for ep in finished[i]
+        ]
+        assert [summary(r) for r in got] == [summary(r) for r in expected]
+    assert {level for ep in finished[2] for level in ep.decision_levels} == {0, 1}
+
+
+def test_run_policies_validates_arguments(sim_vizdoom):
+    vec = VecVizDoomBridge(2)
+    with pytest.raises(ValueError):
+        vec.run_policies([LevelPolicy()] * 3, [[1], [2], [3]])
+    with pytest.raises(ValueError):
+        vec.run_policies([LevelPolicy()], [[1], [2]])
+    vec.close()
+
+
+def test_generation_vec_envs_match_serial(tmp_path, sim_vizdoom):
+    genomes = dict(list(doe021_evolve.GEN1_GENOMES.items())[:5])
+    seeds = doe021_evolve.make_seed_set(2)[:4]
+    query = (
+        "SELECT * EXCLUDE (started_at, decision_latency_p99) "
+        "FROM experiments ORDER BY ALL"
+    )
+    rows = []
+    for vec_envs in (1, 3):
+        db_path = tmp_path / f"v{vec_envs}.duckdb"
+        doe021_evolve.execute_generation(2, genomes, seeds, db_path, vec_envs=vec_envs)
+        con = duckdb.connect(str(db_path))
+        rows.append(con.execute(query).fetchall())
+        con.close()
+    assert len(rows[0]) == 20
+    assert rows[1] == rows[0]
+
+    with pytest.raises(ValueError):
+        doe021_evolve.execute_generation(
+            2, genomes, seeds, tmp_path / "x.duckdb", workers=2, vec_envs=2
+        )
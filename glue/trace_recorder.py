@@ -0,0 +1,222 @@
+"""Per-tick encounter traces: columnar buffering for the encounters table.
+
+A TraceRecorder is passed to EpisodeRunner.run_episode(trace=...). It
+records one row per decision (state, action, decision level, latency) into
+preallocated NumPy columns, so the per-tick cost is a handful of array
+stores. At episode end the columns are trimmed into an EpisodeTrace, which
+is written as one Arrow batch: into DuckDB via DuckDBWriter.write_trace()
+or into a Parquet partition via write_trace_parquet().
+
+With frame skip / action plans a row covers the tics the action was held
+for; the tick column shows the gaps.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Sequence
+from urllib.parse import quote
+
+import numpy as np
+
+from glue.vizdoom_bridge import GameState
+
+# encounters columns filled from the trace (besides the episode key)
+_NUMERIC_COLUMNS: tuple[tuple[str, Any], ...] = (
+    ("tick", np.int32),
+    ("enemies_visible", np.int32),
+    ("health", np.int32),
+    ("ammo", np.int32),
+    ("position_x", np.float64),
+    ("position_y", np.float64),
+    ("angle", np.float64),
+    ("action_code", np.int32),
+    ("decision_level", np.int32),
+    ("latency_ms", np.float64),
+)
+
+ENCOUNTER_COLUMNS = (
+    "experiment_id", "condition", "episode_number", "tick",
+    "enemies_visible", "health", "ammo",
+    "position_x", "position_y", "angle",
+    "action_taken", "decision_level", "latency_ms",
+)
+
+
+@dataclass
+class EpisodeTrace:
+    """Per-decision records of one episode (trimmed NumPy columns)."""
+
+    experiment_id: str
+    condition: str
+    episode_number: int
+    columns: dict[str, np.ndarray]
+    action_labels: list[str]  # action_code -> action_taken
+
+    def __len__(self) -> int:
+        return len(self.columns["tick"])
+
+    def to_arrow(self):
+        """Arrow table with the encounters table's columns."""
+        import pyarrow as pa
+
+        n = len(self)
+        cols = self.columns
+        return pa.table({
+            "experiment_id": pa.array([self.experiment_id] * n, pa.string()),
+            "condition": pa.array([self.condition] * n, pa.string()),
+            "episode_number": pa.array(np.full(n, self.episode_number, np.int32)),
+            "tick": pa.array(cols["tick"]),
+            "enemies_visible": pa.array(cols["enemies_visible"]),
+            "health": pa.array(cols["health"]),
+            "ammo": pa.array(cols["ammo"]),
+            "position_x": pa.array(cols["position_x"]),
+            "position_y": pa.array(cols["position_y"]),
+            "angle": pa.array(cols["angle"]),
+            "action_taken": pa.DictionaryArray.from_arrays(
+                pa.array(cols["action_code"]),
+                pa.array(self.action_labels, pa.string()),
+            ),
+            "decision_level": pa.array(cols["decision_level"]),
+            "latency_ms": pa.array(cols["latency_ms"]),
+        })
+
+    def rows(self) -> list[tuple]:
+        """Plain row tuples in ENCOUNTER_COLUMNS order (no-pyarrow fallback)."""
+        cols = self.columns
+        labels = self.action_labels
+        return [
+            (
+                self.experiment_id, self.condition, self.episode_number,
+                int(cols["tick"][i]), int(cols["enemies_visible"][i]),
+                int(cols["health"][i]), int(cols["ammo"][i]),
+                float(cols["position_x"][i]), float(cols["position_y"][i]),
+                float(cols["angle"][i]),
+                labels[cols["action_code"][i]],
+                int(cols["decision_level"][i]), float(cols["latency_ms"][i]),
+            )
+            for i in range(len(self))
+        ]
+
+
+class TraceRecorder:
+    """Buffers per-decision records of the current episode.
+
+    Args:
+        experiment_id: Written to every row.
+        capacity: Initial rows per column; grows by doubling (default covers
+            a 2100-tick timeout without reallocating).
+    """
+
+    def __init__(self, experiment_id: str, capacity: int = 2112):
+        self.experiment_id = experiment_id
+        self._capacity = capacity
+        self._cols = {name: np.empty(capacity, dtype) for name, dtype in _NUMERIC_COLUMNS}
+        self._n = 0
+        self._condition = ""
+        self._episode_number = 0
+        self._button_names: Sequence[str] = ()
+        self._labels: list[str] = []
+        self._codes: dict[Any, int] = {}
+
+    def begin(
+        self,
+        condition: str,
+        episode_number: int,
+        button_names: Sequence[str] = (),
+    ) -> None:
+        """Start a new episode; ``button_names`` label the action indices."""
+        self._condition = condition
+        self._episode_number = episode_number
+        self._button_names = tuple(button_names)
+        self._labels = []
+        self._codes = {}
+        self._n = 0
+
+    def _action_code(self, action: Any) -> int:
+        key = tuple(action) if isinstance(action, list) else action
+        code = self._codes.get(key)
+        if code is None:
+            names = self._button_names
+            if isinstance(key, tuple):
+                label = "+".join(
+                    names[i] if i < len(names) else str(i)
+                    for i, pressed in enumerate(key) if pressed
+                ) or "NOOP"
+            elif 0 <= key < len(names):
+                label = names[key]
+            else:
+                label = str(key)
+            code = len(self._labels)
+            self._labels.append(label)
+            self._codes[key] = code
+        return code
+
+    def record(
+        self,
+        state: GameState,
+        action: Any,
+        decision_level: int,
+        latency_ms: float,
+    ) -> None:
+        """Append one decision."""
+        n = self._n
+        if n == self._capacity:
+            self._grow()
+        cols = self._cols
+        cols["tick"][n] = state.tick
+        cols["enemies_visible"][n] = state.enemies_visible
+        cols["health"][n] = state.health
+        cols["ammo"][n] = state.ammo
+        cols["position_x"][n] = state.position_x
+        cols["position_y"][n] = state.position_y
+        cols["angle"][n] = state.angle
+        cols["action_code"][n] = self._action_code(action)
+        cols["decision_level"][n] = decision_level
+        cols["latency_ms"][n] = latency_ms
+        self._n = n + 1
+
+    def _grow(self) -> None:
+        self._capacity *= 2
+        for name, col in self._cols.items():
+            grown = np.empty(self._capacity, col.dtype)
+            grown[: self._n] = col[: self._n]
+            self._cols[name] = grown
+
+    def end(self) -> EpisodeTrace:
+        """Finish the episode and return its trace (copied columns)."""
+        n = self._n
+        return EpisodeTrace(
+            experiment_id=self.experiment_id,
+            condition=self._condition,
+            episode_number=self._episode_number,
+            columns={name: col[:n].copy() for name, col in self._cols.items()},
+            action_labels=list(self._labels),
+        )
+
+
+def write_trace_parquet(trace: EpisodeTrace, root: Path) -> Path:
+    """Write one episode as a Parquet file in a hive-style partition.
+
+    Layout: ``root/experiment_id=<id>/condition=<cond>/episode_<n>.parquet``,
+    readable with DuckDB's ``read_parquet(..., hive_partitioning=true)``.
+    Partition values are percent-encoded (conditions such as
+    ``memory=0.8_strength=0.8`` contain ``=``); readers decode them.
+    Rewriting an episode replaces its file.
+    """
+    import pyarrow.parquet as pq
+
+    part = (
+        Path(root)
+        / f"experiment_id={quote(trace.experiment_id, safe='')}"
+        / f"condition={quote(trace.condition, safe='')}"
+    )
+    part.mkdir(parents=True, exist_ok=True)
+    path = part / f"episode_{trace.episode_number:05d}.parquet"
+    table = trace.to_arrow().drop_columns(["experiment_id", "condition"])
+    tmp = path.with_suffix(".parquet.tmp")
+    pq.write_table(table, tmp)
+    tmp.replace(path)
+    return path
+
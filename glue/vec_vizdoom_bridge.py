@@ -0,0 +1,325 @@
+"""Vectorized VizDoom bridge: N DoomGame instances behind one step() call.
+
+Each environment is a regular VizDoomBridge, so per-episode delta tracking
+(kills, damage, ammo) and EpisodeMetrics are identical to the single-game
+path. The batch API returns NumPy arrays so population policies (e.g. a
+generation of GenomeAction genomes) can be evaluated side by side with one
+Python call per tick instead of one per game.
+
+Episode boundaries:
+    - An environment is done when its episode finishes or the player dies
+      (same stopping rule as EpisodeRunner.run_episode).
+    - Finished episodes are auto-reset with the next seed from the queue;
+      the observation returned for that env is the new episode's first
+      frame and ``done[i]`` marks the boundary.
+    - When the queue is empty the env becomes inactive (``active[i]`` False)
+      and its actions are ignored.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Optional, Sequence
+
+import numpy as np
+
+from glue.episode_runner import EpisodeResult
+from glue.policy_compiler import CompiledPolicy
+from glue.vizdoom_bridge import EpisodeMetrics, GameState, VizDoomBridge
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class VecObservation:
+    """Batched observation for all environments."""
+
+    health: np.ndarray  # int32, shape (N,)
+    ammo: np.ndarray  # int32, shape (N,)
+    kills: np.ndarray  # int32, shape (N,)
+    done: np.ndarray  # bool, episode ended on this step (before auto-reset)
+    active: np.ndarray  # bool, env is running an episode
+    reward: np.ndarray  # float64, step reward
+
+
+@dataclass
+class FinishedEpisode:
+    """A completed episode from one environment."""
+
+    env_index: int
+    seed: int
+    metrics: EpisodeMetrics
+    # Per-decision records (filled by run_policies, as in EpisodeRunner)
+    decision_latencies: list[float] = field(default_factory=list)
+    decision_levels: list[int] = field(default_factory=list)
+
+    def to_result(self, condition: str, episode_number: int) -> EpisodeResult:
+        """The EpisodeResult a serial EpisodeRunner would have returned."""
+        return EpisodeResult(
+            seed=self.seed,
+            condition=condition,
+            episode_number=episode_number,
+            metrics=self.metrics,
+            decision_latencies=self.decision_latencies,
+            decision_levels=self.decision_levels,
+        )
+
+
+class VecVizDoomBridge:
+    """Drives ``num_envs`` VizDoomBridge instances in lockstep.
+
+    Args:
+        num_envs: Number of DoomGame instances.
+        scenario, episode_timeout, num_actions, doom_skill, screen_buffer:
+            Passed through to each VizDoomBridge.
+    """
+
+    def __init__(
+        self,
+        num_envs: int,
+        scenario: str = "defend_the_center.cfg",
+        episode_timeout: int = 2100,
+        num_actions: int = 3,
+        doom_skill: int = 3,
+        screen_buffer: bool = False,
+    ) -> None:
+        if num_envs < 1:
+            raise ValueError(f"num_envs must be >= 1, got {num_envs}")
+
+        self._bridges: list[VizDoomBridge] = []
+        try:
+            for _ in range(num_envs):
+                self._bridges.append(
+                    VizDoomBridge(
+                        scenario=scenario,
+                        episode_timeout=episode_timeout,
+                        num_actions=num_actions,
+                        doom_skill=doom_skill,
+                        screen_buffer=screen_buffer,
+                    )
+                )
+        except Exception:
+            self.close()
+            raise
+
+        self.num_envs = num_envs
+        self._shared_queue: deque[int] = deque()
+        self._env_queues: Optional[list[deque[int]]] = None
+
+        self._seeds = np.full(num_envs, -1, dtype=np.int64)
+        self._active = np.zeros(num_envs, dtype=bool)
+        self._health = np.zeros(num_envs, dtype=np.int32)
+        self._ammo = np.zeros(num_envs, dtype=np.int32)
+        self._kills = np.zeros(num_envs, dtype=np.int32)
+
+        self._finished: list[FinishedEpisode] = []
+
+    # ------------------------------------------------------------------
+    # Episode management
+    # ------------------------------------------------------------------
+
+    def reset(self, seeds: Sequence[int] | Sequence[Sequence[int]]) -> VecObservation:
+        """Queue seeds and start the first episode on every environment.
+
+        Args:
+            seeds: Either a flat list of seeds (one shared queue, any env
+                picks up the next seed) or a list of ``num_envs`` seed lists
+                (env i only plays the seeds in ``seeds[i]``).
+        """
+        self._finished = []
+        self._active[:] = False
+        self._seeds[:] = -1
+
+        if seeds and not isinstance(seeds[0], (int, np.integer)):
+            if len(seeds) != self.num_envs:
+                raise ValueError(
+                    f"Expected {self.num_envs} per-env seed lists, got {len(seeds)}"
+                )
+            self._env_queues = [deque(int(s) for s in env) for env in seeds]
+            self._shared_queue = deque()
+        else:
+            self._env_queues = None
+            self._shared_queue = deque(int(s) for s in seeds)
+
+        for i in range(self.num_envs):
+            self._start_next(i)
+
+        return self._observation(
+            done=np.zeros(self.num_envs, dtype=bool),
+            reward=np.zeros(self.num_envs, dtype=np.float64),
+        )
+
+    def _next_seed(self, env_index: int) -> Optional[int]:
+        queue = (
+            self._env_queues[env_index]
+            if self._env_queues is not None
+            else self._shared_queue
+        )
+        return queue.popleft() if queue else None
+
+    def _start_next(self, env_index: int) -> None:
+        seed = self._next_seed(env_index)
+        if seed is None:
+            self._active[env_index] = False
+            self._seeds[env_index] = -1
+            return
+        self._bridges[env_index].start_episode(seed)
+        self._seeds[env_index] = seed
+        self._active[env_index] = True
+        self._read_state(env_index)
+
+    def _read_state(self, env_index: int) -> GameState:
+        state = self._bridges[env_index].get_game_state()
+        self._health[env_index] = state.health
+        self._ammo[env_index] = state.ammo
+        self._kills[env_index] = state.kills
+        return state
+
+    # ------------------------------------------------------------------
+    # Stepping
+    # ------------------------------------------------------------------
+
+    def step(self, actions: Sequence[Any]) -> VecObservation:
+        """Apply one action per environment and advance all games.
+
+        Args:
+            actions: ``num_envs`` actions (int index, multi-hot list, or an
+                ``(action, repeat_count)`` plan held for that many tics);
+                entries for inactive environments are ignored.
+        """
+        if len(actions) != self.num_envs:
+            raise ValueError(f"Expected {self.num_envs} actions, got {len(actions)}")
+
+        done = np.zeros(self.num_envs, dtype=bool)
+        reward = np.zeros(self.num_envs, dtype=np.float64)
+
+        for i in np.flatnonzero(self._active):
+            bridge = self._bridges[i]
+            action = actions[i]
+            if isinstance(action, tuple):
+                reward[i] = bridge.make_action(action[0], tics=action[1])
+            else:
+                reward[i] = bridge.make_action(action)
+            if bridge.is_episode_finished() or self._read_state(i).is_dead:
+                done[i] = True
+                self._finished.append(
+                    FinishedEpisode(
+                        env_index=int(i),
+                        seed=int(self._seeds[i]),
+                        metrics=bridge.get_episode_metrics(),
+                    )
+                )
+                self._start_next(i)
+
+        return self._observation(done=done, reward=reward)
+
+    def _observation(self, done: np.ndarray, reward: np.ndarray) -> VecObservation:
+        return VecObservation(
+            health=self._health.copy(),
+            ammo=self._ammo.copy(),
+            kills=self._kills.copy(),
+            done=done,
+            active=self._active.copy(),
+            reward=reward,
+        )
+
+    def get_game_states(self) -> list[Optional[GameState]]:
+        """Per-env GameState for per-genome policies (None if inactive)."""
+        return [
+            self._bridges[i].get_game_state() if self._active[i] else None
+            for i in range(self.num_envs)
+        ]
+
+    @property
+    def seeds(self) -> np.ndarray:
+        """Seed currently played by each env (-1 if inactive)."""
+        return self._seeds.copy()
+
+    @property
+    def all_done(self) -> bool:
+        return not self._active.any()
+
+    def pop_finished(self) -> list[FinishedEpisode]:
+        """Return and clear episodes completed since the last call."""
+        finished, self._finished = self._finished, []
+        return finished
+
+    # ------------------------------------------------------------------
+    # Convenience: per-env policies
+    # ------------------------------------------------------------------
+
+    def run_policies(
+        self,
+        action_fns: Sequence[Any],
+        seeds: Sequence[Sequence[int]],
+        decision_level: int = -1,
+    ) -> list[list[FinishedEpisode]]:
+        """Evaluate one policy per environment on its own seed list.
+
+        Env i plays every seed in ``seeds[i]`` with ``action_fns[i]``; envs
+        beyond ``len(action_fns)`` stay idle. The policy is reset with the
+        episode seed at each episode start and decision latencies/levels
+        are recorded per decision, as in EpisodeRunner.run_episode, so
+        ``FinishedEpisode.to_result()`` matches a serial run. Returns
+        finished episodes grouped by policy.
+        """
+        n = len(action_fns)
+        if n > self.num_envs or len(seeds) != n:
+            raise ValueError(
+                f"Expected at most {self.num_envs} action functions with one "
+                f"seed list each, got {n} and {len(seeds)}"
+            )
+
+        decide = [
+            fn.kernel if isinstance(fn, CompiledPolicy) else fn for fn in action_fns
+        ]
+        dynamic = [hasattr(fn, "last_decision_level") for fn in action_fns]
+        latencies: list[list[float]] = [[] for _ in range(n)]
+        levels: list[list[int]] = [[] for _ in range(n)]
+        results: list[list[FinishedEpisode]] = [[] for _ in range(n)]
+        self.reset(list(seeds) + [[] for _ in range(self.num_envs - n)])
+        for i in np.flatnonzero(self._active):
+            if hasattr(action_fns[i], "reset"):
+                action_fns[i].reset(seed=int(self._seeds[i]))
+
+        start = time.monotonic()
+        ticks = 0
+        actions: list[Any] = [0] * self.num_envs
+        while not self.all_done:
+            states = self.get_game_states()
+            for i in range(n):
+                if states[i] is None:
+                    continue
+                t0 = time.perf_counter_ns()
+                actions[i] = decide[i](states[i])
+                t1 = time.perf_counter_ns()
+                latencies[i].append((t1 - t0) / 1e6)
+                levels[i].append(
+                    action_fns[i].last_decision_level if dynamic[i] else decision_level
+                )
+            obs = self.step(actions)
+            ticks += int(obs.active.sum() + obs.done.sum())
+
+            if obs.done.any():
+                for ep in self.pop_finished():
+                    i = ep.env_index
+                    ep.decision_latencies, latencies[i] = latencies[i], []
+                    ep.decision_levels, levels[i] = levels[i], []
+                    results[i].append(ep)
+                    if self._active[i] and hasattr(action_fns[i], "reset"):
+                        action_fns[i].reset(seed=int(self._seeds[i]))
+
+        logger.debug(
+            "run_policies: %d envs, %d ticks in %.1fs",
+            self.num_envs,
+            ticks,
+            time.monotonic() - start,
+        )
+        return results
+
+    def close(self) -> None:
+        for bridge in self._bridges:
+            bridge.close()
@@ -59,9 +59,22 @@ NUM_ACTIONS = 3
 
 
 class VizDoomBridge:
-    """Wraps VizDoom for controlled experiment execution."""
-
-    def __init__(self, scenario: str = "defend_the_center.cfg", episode_timeout: int = 2100, num_actions: int = 3, doom_skill: int = 3):
+    """Wraps VizDoom for controlled experiment execution.
+
+    Game variables are fetched once per tick (after each action) and cached;
+    the delta tracker in make_action() and get_game_state() both read the
+    cache instead of calling DoomGame.get_state() again.
+
+    Args:
+        screen_buffer: Keep the 320x240 GRAY8 screen buffer available via
+            get_screen_buffer(). When False (default), no policy needs pixels:
+            the bridge never calls get_state(), reads KILLCOUNT/HEALTH/AMMO2
+            with get_game_variable() and renders at the smallest resolution.
+            Game dynamics do not depend on resolution, so episodes are
+            identical either way.
+    """
+
+    def __init__(self, scenario: str = "defend_the_center.cfg", episode_timeout: int = 2100, num_actions: int = 3, doom_skill: int = 3, screen_buffer: bool = False):
         try:
             import vizdoom
         except ImportError:
@@ -74,6 +87,7 @@ class VizDoomBridge:
         self._episode_timeout = episode_timeout
         self._num_actions = num_actions
         self._doom_skill = doom_skill
+        self._screen_buffer = screen_buffer
 
         # Find scenario path
         scenario_path = Path(vizdoom.scenarios_path) / scenario
@@ -95,6 +109,11 @@ class VizDoomBridge:
         self._visited_positions: set[tuple[int, int]] = set()
         self._tick = 0
 
+        # Per-tick state cache: (KILLCOUNT, HEALTH, AMMO2) of the current
+        # frame, or None when no state is available (episode finished).
+        self._vars: Optional[tuple[int, int, int]] = None
+        self._state = None  # full vizdoom.GameState, only if screen_buffer
+
         # NOTE on AMMO2 tracking limitations:
         # - Pistol scenarios use AMMO5 (clips), not AMMO2 (cells), so shots_fired
         #   via AMMO2 delta won't work for pistol-only scenarios.
@@ -109,6 +128,8 @@ class VizDoomBridge:
         self._game.set_sound_enabled(False)
         self._game.set_screen_resolution(
             self._vizdoom.ScreenResolution.RES_320X240
+            if self._screen_buffer
+            else self._vizdoom.ScreenResolution.RES_160X120
         )
         self._game.set_screen_format(self._vizdoom.ScreenFormat.GRAY8)
         self._game.set_mode(self._vizdoom.Mode.PLAYER)
@@ -147,22 +168,50 @@ class VizDoomBridge:
         self._tick = 0
 
         # Detect starting ammo dynamically from first frame
-        state = self._game.get_state()
-        if state and state.game_variables is not None:
-            self._prev_ammo = int(state.game_variables[2])  # AMMO2 at index 2
+        self._refresh_state()
+        if self._vars is not None:
+            self._prev_ammo = self._vars[2]  # AMMO2
         else:
             self._prev_ammo = 26  # fallback
 
+    def _refresh_state(self) -> None:
+        """Fetch the current frame's game variables into the cache.
+
+        Called exactly once per tick. Mirrors get_state() semantics: once the
+        episode is finished there is no state, so the cache is cleared.
+        """
+        if self._game.is_episode_finished():
+            self._vars = None
+            self._state = None
+            return
+
+        if self._screen_buffer:
+            state = self._game.get_state()
+            self._state = state
+            if state is None or state.game_variables is None:
+                self._vars = None
+                return
+            gv = state.game_variables  # [KILLCOUNT, HEALTH, AMMO2]
+            self._vars = (
+                int(gv[0]) if len(gv) > 0 else 0,
+                int(gv[1]) if len(gv) > 1 else 100,
+                int(gv[2]) if len(gv) > 2 else 26,
+            )
+        else:
+            get_var = self._game.get_game_variable
+            gv_enum = self._vizdoom.GameVariable
+            self._vars = (
+                int(get_var(gv_enum.KILLCOUNT)),
+                int(get_var(gv_enum.HEALTH)),
+                int(get_var(gv_enum.AMMO2)),
+            )
+
     def get_game_state(self) -> GameState:
-        """Extract current game state."""
-        state = self._game.get_state()
-        if state is None:
+        """Extract current game state (from the per-tick cache)."""
+        if self._vars is None:
             return GameState(is_dead=True, tick=self._tick)
 
-        game_vars = state.game_variables  # [KILLCOUNT, HEALTH, AMMO2]
-        kills = int(game_vars[0]) if len(game_vars) > 0 else 0
-        health = int(game_vars[1]) if len(game_vars) > 1 else 0
-        ammo = int(game_vars[2]) if len(game_vars) > 2 else 0
+        kills, health, ammo = self._vars
 
         return GameState(
             health=health,
@@ -173,11 +222,27 @@ class VizDoomBridge:
             tick=self._tick,
         )
 
-    def make_action(self, action_index) -> float:
-        """Execute action. Returns step reward.
+    def get_button_names(self) -> list[str]:
+        """Names of the available buttons, in action-index order."""
+        return [button.name for button in self._game.get_available_buttons()]
+
+    def get_screen_buffer(self):
+        """Screen buffer of the current frame (requires screen_buffer=True)."""
+        if not self._screen_buffer:
+            raise RuntimeError(
+                "Screen buffer disabled. Create VizDoomBridge(screen_buffer=True)."
+            )
+        return self._state.screen_buffer if self._state is not None else None
+
+    def make_action(self, action_index, tics: int = 1) -> float:
+        """Execute action, optionally repeated for several tics. Returns step reward.
 
         Args:
             action_index: Either an int (one-hot encoded) or a list (multi-hot direct).
+            tics: Number of tics to hold the action (action repeat / frame skip).
+                Game variables are read after every tic so kill, damage and
+                ammo deltas are exactly those of ``tics`` single-tic calls.
+                Stops early if the episode ends or the player dies.
         """
         # Encode action vector
         if isinstance(action_index, list):
@@ -189,27 +254,38 @@ class VizDoomBridge:
             if 0 <= action_index < self._num_actions:
                 action[action_index] = 1
 
-        # Track pre-action state for delta computation
-        pre_state = self._game.get_state()
-        pre_kills = 0
-        pre_ammo = 26
-        pre_health = 100
-        if pre_state and pre_state.game_variables is not None:
-            gv = pre_state.game_variables
-            pre_kills = int(gv[0]) if len(gv) > 0 else 0
-            pre_health = int(gv[1]) if len(gv) > 1 else 100
-            pre_ammo = int(gv[2]) if len(gv) > 2 else 26
+        if tics <= 1:
+            reward = self._game.make_action(action)
+            self._tick += 1
+            self._track_deltas()
+            return reward
+
+        # Hold the action and advance one tic at a time (with state update,
+        # otherwise game variables are not refreshed between tics)
+        reward = 0.0
+        self._game.set_action(action)
+        for _ in range(tics):
+            self._game.advance_action(1, True)
+            reward += self._game.get_last_reward()
+            self._tick += 1
+            self._track_deltas()
+            if self._vars is None or self._game.is_player_dead():
+                break
+
+        return reward
 
-        reward = self._game.make_action(action)
-        self._tick += 1
+    def _track_deltas(self) -> None:
+        """Refresh the per-tick cache and accumulate deltas vs. the previous tick."""
+        # Pre-action state for delta computation (cached from last tick)
+        if self._vars is not None:
+            pre_kills, pre_health, pre_ammo = self._vars
+        else:
+            pre_kills, pre_health, pre_ammo = 0, 100, 26
 
         # Track deltas
-        post_state = self._game.get_state()
-        if post_state and post_state.game_variables is not None:
-            gv = post_state.game_variables
-            post_kills = int(gv[0]) if len(gv) > 0 else 0
-            post_health = int(gv[1]) if len(gv) > 1 else 100
-            post_ammo = int(gv[2]) if len(gv) > 2 else 26
+        self._refresh_state()
+        if self._vars is not None:
+            post_kills, post_health, post_ammo = self._vars
 
             # Track kills
             new_kills = post_kills - pre_kills
@@ -231,8 +307,6 @@ class VizDoomBridge:
             self._prev_health = post_health
             self._prev_ammo = post_ammo
 
-        return reward
-
     def is_episode_finished(self) -> bool:
         return self._game.is_episode_finished()
 
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""Cold-start import-time benchmark for the glue entry points.
+
+Short resumption jobs spend most of their wall time importing modules, so
+each target is measured in a fresh interpreter: the median wall time of
+``python -c "import <module>"`` (or of a CLI invocation such as
+``--help``) over several repetitions, plus the slowest imports reported by
+``python -X importtime``. Results are written to
+``scripts/benchmarks/results/import_time_results.md``.
+
+Usage:
+    python scripts/benchmarks/import_time_bench.py
+    python scripts/benchmarks/import_time_bench.py --repeat 10
+    python scripts/benchmarks/import_time_bench.py --budget-ms 250   # exit 1 if over
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+# ---------------------------------------------------------------------------
+# Configuration
+# ---------------------------------------------------------------------------
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+REPEAT = 5
+TOP_IMPORTS = 5
+
+# (label, interpreter arguments)
+TARGETS: list[tuple[str, list[str]]] = [
+    ("python (baseline)", ["-c", "pass"]),
+    ("doe_executor --help", ["-m", "glue.doe_executor", "--help"]),
+    ("doe_executor --dry-run", ["-m", "glue.doe_executor", "--experiment", "DOE-027", "--dry-run"]),
+    ("import glue.doe_executor", ["-c", "import glue.doe_executor"]),
+    ("import glue.action_registry", ["-c", "import glue.action_registry"]),
+    ("import glue.episode_runner", ["-c", "import glue.episode_runner"]),
+    ("import glue.analysis.statistical_tests", ["-c", "import glue.analysis.statistical_tests"]),
+    ("import glue.analysis.report_generator", ["-c", "import glue.analysis.report_generator"]),
+    ("import glue.doe021_analysis", ["-c", "import glue.doe021_analysis"]),
+]
+
+# Modules a fast-startup path must not load
+HEAVY_MODULES = ("scipy", "statsmodels", "pandas", "duckdb", "vizdoom", "grpc")
+
+
+# ---------------------------------------------------------------------------
+# Measurement
+# ---------------------------------------------------------------------------
+
+def _env() -> dict[str, str]:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        p for p in (str(PROJECT_ROOT), env.get("PYTHONPATH")) if p
+    )
+    return env
+
+
+def wall_time_ms(args: list[str], repeat: int) -> list[float]:
+    """Wall time of ``python <args>`` in a fresh interpreter, per repetition."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, *args],
+            cwd=PROJECT_ROOT,
+            env=_env(),
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=True,
+        )
+        times.append((time.perf_counter() - start) * 1000)
+    return times
+
+
+def import_profile(args: list[str]) -> tuple[list[tuple[float, str]], set[str]]:
+    """Slowest top-level imports (cumulative ms) and all imported modules."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        cwd=PROJECT_ROOT,
+        env=_env(),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        check=True,
+    )
+    top_level = []
+    modules = set()
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|", 2)
+        if not cumulative.strip().isdigit():
+            continue  # header row
+        modules.add(name.strip())
+        if not name.startswith("  "):  # depth 0
+            top_level.append((int(cumulative) / 1000, name.strip()))
+    top_level.sort(reverse=True)
+    return top_level[:TOP_IMPORTS], modules
+
+
+# ---------------------------------------------------------------------------
+# Report
+# ---------------------------------------------------------------------------
+
+def format_results(results: list[dict], timestamp: str, repeat: int) -> str:
+    """Format benchmark results as a markdown report."""
+    lines = [
+        "# Import-Time Benchmark Results",
+        "",
+        f"**Timestamp**: {timestamp}",
+        f"**Python**: {sys.version.split()[0]}",
+        f"**Repetitions**: {repeat} (fresh interpreter each)",
+        "",
+        "## Wall Time",
+        "",
+        "| Target | median (ms) | min (ms) | heavy modules loaded |",
+        "|:-------|------------:|---------:|:---------------------|",
+    ]
+    for r in results:
+        heavy = ", ".join(r["heavy"]) or "-"
+        lines.append(
+            f"| {r['label']} | {r['median_ms']:.1f} | {r['min_ms']:.1f} | {heavy} |"
+        )
+    lines.extend(["", "## Slowest Top-Level Imports", ""])
+    for r in results:
+        if not r["top"]:
+            continue
+        lines.append(f"- **{r['label']}**: " + ", ".join(
+            f"{name} {ms:.1f} ms" for ms, name in r["top"]
+        ))
+    lines.append("")
+    return "\n".join(lines)
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Cold-start import-time benchmark for glue entry points",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=REPEAT,
+        help=f"Fresh-interpreter runs per target (default: {REPEAT})",
+    )
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=None,
+        help="Exit with status 1 if a doe_executor CLI target's median "
+        "exceeds this many ms",
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
+
+    results = []
+    for label, target_args in TARGETS:
+        times = wall_time_ms(target_args, args.repeat)
+        top, modules = import_profile(target_args)
+        heavy = sorted(
+            m for m in HEAVY_MODULES if m in modules
+        )
+        results.append({
+            "label": label,
+            "median_ms": statistics.median(times),
+            "min_ms": min(times),
+            "top": top,
+            "heavy": heavy,
+        })
+        print(f"  {label:<42} {statistics.median(times):8.1f} ms  {', '.join(heavy)}")
+
+    report = format_results(results, timestamp, args.repeat)
+    results_dir = Path(__file__).parent / "results"
+    results_dir.mkdir(parents=True, exist_ok=True)
+    results_path = results_dir / "import_time_results.md"
+    results_path.write_text(report)
+    print(f"\nResults saved to {results_path}")
+
+    if args.budget_ms is not None:
+        over = [
+            r for r in results
+            if r["label"].startswith("doe_executor") and r["median_ms"] > args.budget_ms
+        ]
+        for r in over:
+            print(f"OVER BUDGET: {r['label']} {r['median_ms']:.1f} ms > {args.budget_ms} ms")
+        if over:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()